@@ -20,10 +20,19 @@ class Filepaths:
 
     LOCAL_INDEX_SQLITE_FILE = LOCAL_ENVIRONMENT_DIR / Path("sqlite_index.db")
     TEI_INDEX_DIR = LOCAL_ENVIRONMENT_DIR / Path(".tei_index/")
+    TEI_CACHE_DIR = LOCAL_ENVIRONMENT_DIR / Path(".tei_cache/")
 
     REGISTRY_FILE = LOCAL_ENVIRONMENT_DIR.joinpath(Path("registry.json"))
 
     PREP_REQUESTS_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path("prep_requests_cache")
+    OPERATION_TIMINGS_FILE = LOCAL_ENVIRONMENT_DIR / Path("operation_timings.json")
+    URL_STATUS_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path("url_status_cache.sqlite")
+    PACKAGE_REGISTRY_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path("package_registry.json")
+    ENVIRONMENT_STATUS_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path(
+        "environment_status.json"
+    )
+    REMOTE_STATUS_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path("remote_status.json")
+    VERSION_INFO_CACHE_FILE = LOCAL_ENVIRONMENT_DIR / Path("version_info.json")
 
     COVERPAGES = LOCAL_ENVIRONMENT_DIR / Path(".coverpages")
     LASTPAGES = LOCAL_ENVIRONMENT_DIR / Path(".lastpages")
@@ -5,19 +5,116 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import time
 import typing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
 from pathlib import Path
 
 import git
 import yaml
 
 import colrev.exceptions as colrev_exceptions
-import colrev.ops.check
 from colrev.constants import Fields
 from colrev.constants import FieldValues
 from colrev.constants import Filepaths
+from colrev.env.utils import atomic_write_json
 from colrev.env.utils import dict_set_nested
 from colrev.env.utils import get_by_path
+from colrev.paths import PathManager
+
+# Note : the status summaries of the registered repositories are cached
+# (Filepaths.ENVIRONMENT_STATUS_CACHE_FILE) by HEAD commit. Stale summaries are
+# computed in parallel (worker processes). Checking whether a repository is
+# behind its remote requires a fetch, which is repeated after REMOTE_CHECK_INTERVAL.
+REMOTE_CHECK_INTERVAL = timedelta(days=1)
+
+
+def _get_head_sha(repo_source_path: str) -> str:
+    try:
+        return git.Repo(repo_source_path).head.commit.hexsha
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError, ValueError):
+        return ""
+
+
+def _behind_remote(git_repo: git.Repo) -> bool:
+    # Note : GitPython (colrev.git_repo imports the environment_manager)
+    if "origin" not in [remote.name for remote in git_repo.remotes]:
+        return False
+    origin = git_repo.remotes.origin
+    if not origin.exists():
+        return False
+    try:
+        origin.fetch()
+    except git.GitCommandError:
+        return False
+    tracking_branch = git_repo.active_branch.tracking_branch()
+    if tracking_branch is None:
+        return False
+    commits_behind = git_repo.iter_commits(
+        f"{git_repo.active_branch}..{tracking_branch}"
+    )
+    return any(True for _ in commits_behind)
+
+
+def _get_repo_status(repo_source_path: str) -> dict:
+    """Get the status summary of a repository (empty if the link is broken)."""
+    try:
+        git_repo = git.Repo(repo_source_path)
+        with open(
+            Path(repo_source_path) / PathManager.STATUS_FILE, encoding="utf8"
+        ) as stream:
+            repo_stat = yaml.safe_load(stream)
+        progress = -1.0
+        if repo_stat["atomic_steps"] != 0:
+            progress = round(
+                repo_stat["completed_atomic_steps"] / repo_stat["atomic_steps"], 2
+            )
+        return {
+            "head": git_repo.head.commit.hexsha,
+            "checked": time.time(),
+            "size": repo_stat["overall"]["md_processed"],
+            "progress": progress,
+            "remote": bool(git_repo.remotes),
+            "behind_remote": _behind_remote(git_repo),
+        }
+    except (
+        colrev_exceptions.CoLRevException,
+        git.InvalidGitRepositoryError,
+        git.NoSuchPathError,
+        OSError,
+        KeyError,
+        TypeError,
+        ValueError,
+        yaml.YAMLError,
+    ):  # pragma: no cover
+        return {}
+
+
+def _scan_curated_outlet(repo_source_path: str) -> typing.Tuple[str, typing.List[str]]:
+    """Get the outlet (readme) and the journals/booktitles of a curated repository."""
+    with open(f"{repo_source_path}/readme.md", encoding="utf-8") as file:
+        first_line = file.readline()
+    outlet = first_line.lstrip("# ").replace("\n", "")
+
+    with open(f"{repo_source_path}/data/records.bib", encoding="utf-8") as file:
+        outlets = []
+        for line in file.readlines():
+            # Note : the second part ("journal:"/"booktitle:")
+            # ensures that data provenance fields are skipped
+            if Fields.JOURNAL == line.lstrip()[:7] and "journal:" != line.lstrip()[:8]:
+                journal = line[line.find("{") + 1 : line.rfind("}")]
+                if journal != FieldValues.UNKNOWN:
+                    outlets.append(journal)
+            if (
+                line.lstrip()[:9] == Fields.BOOKTITLE
+                and line.lstrip()[:10] != "booktitle:"
+            ):
+                booktitle = line[line.find("{") + 1 : line.rfind("}")]
+                if booktitle != FieldValues.UNKNOWN:
+                    outlets.append(booktitle)
+    return outlet, sorted(set(outlets))
 
 
 class EnvironmentManager:
@@ -142,16 +239,6 @@ class EnvironmentManager:
         except git.GitCommandNotFound as exc:
             print(exc)
 
-    def _get_status(self, review_manager: colrev.review_manager.ReviewManager) -> dict:
-        status_dict = {}
-        status_yml = review_manager.paths.status
-        with open(status_yml, encoding="utf8") as stream:
-            try:
-                status_dict = yaml.safe_load(stream)
-            except yaml.YAMLError as exc:  # pragma: no cover
-                print(exc)
-        return status_dict
-
     def get_environment_details(self) -> dict:
         """Get the environment details."""
         environment_details = {}
@@ -175,80 +262,116 @@ class EnvironmentManager:
         }
         return environment_details
 
+    def _load_status_cache(self) -> dict:
+        try:
+            return json.loads(
+                Filepaths.ENVIRONMENT_STATUS_CACHE_FILE.read_text(encoding="utf-8")
+            )
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_status_cache(self, status_cache: dict) -> None:
+        try:
+            atomic_write_json(Filepaths.ENVIRONMENT_STATUS_CACHE_FILE, status_cache)
+        except OSError:
+            pass
+
+    def _is_status_current(self, repo_status: dict, repo_source_path: str) -> bool:
+        if not repo_status or repo_status["head"] != _get_head_sha(repo_source_path):
+            return False
+        if not repo_status["remote"]:
+            return True
+        return (
+            time.time() - repo_status["checked"] < REMOTE_CHECK_INTERVAL.total_seconds()
+        )
+
+    def _get_repo_statuses(self, repo_source_paths: typing.List[str]) -> dict:
+        if len(repo_source_paths) == 1:
+            return {repo_source_paths[0]: _get_repo_status(repo_source_paths[0])}
+        with ProcessPoolExecutor(
+            max_workers=min(len(repo_source_paths), os.cpu_count() or 1)
+        ) as executor:
+            return dict(
+                zip(
+                    repo_source_paths,
+                    executor.map(_get_repo_status, repo_source_paths),
+                )
+            )
+
     def _get_environment_stats(self) -> dict:
         """Get the environment stats."""
         local_repos = self.local_repos()
+        status_cache = self._load_status_cache()
+        stale_paths = [
+            repo["repo_source_path"]
+            for repo in local_repos
+            if not self._is_status_current(
+                status_cache.get(repo["repo_source_path"], {}),
+                repo["repo_source_path"],
+            )
+        ]
+        if stale_paths:
+            status_cache.update(self._get_repo_statuses(stale_paths))
+            # Note : broken links are not cached
+            status_cache = {
+                path: repo_status
+                for path, repo_status in status_cache.items()
+                if repo_status
+            }
+            self._save_status_cache(status_cache)
+
         repos = []
         broken_links = []
         for repo in local_repos:
-            try:
-                cp_review_manager = colrev.review_manager.ReviewManager(
-                    path_str=repo["repo_source_path"]
-                )
-                check_operation = colrev.ops.check.CheckOperation(cp_review_manager)
-                repo_stat = self._get_status(cp_review_manager)
-                repo["size"] = repo_stat["overall"]["md_processed"]
-                repo["progress"] = -1
-                if repo_stat["atomic_steps"] != 0:
-                    repo["progress"] = round(
-                        repo_stat["completed_atomic_steps"] / repo_stat["atomic_steps"],
-                        2,
-                    )
-
-                git_repo = check_operation.review_manager.dataset.git_repo.repo
-                repo["remote"] = bool(git_repo.remotes)
-                repo["behind_remote"] = (
-                    check_operation.review_manager.dataset.git_repo.behind_remote()
-                )
-
-                repos.append(repo)
-            except (
-                colrev_exceptions.CoLRevException,
-                git.InvalidGitRepositoryError,
-            ):  # pragma: no cover
+            repo_status = status_cache.get(repo["repo_source_path"], {})
+            if not repo_status:
                 broken_links.append(repo)
+                continue
+            for key in ["size", "progress", "remote", "behind_remote"]:
+                repo[key] = repo_status[key]
+            repos.append(repo)
         return {"repos": repos, "broken_links": broken_links}
 
+    def register_curated_outlets(
+        self, curated_outlets: typing.Dict[str, typing.Tuple[str, typing.List[str]]]
+    ) -> None:
+        """Store the outlets of curated repositories in the registry (when indexing).
+
+        curated_outlets: {repo_source_path: (outlet, record_outlets)}
+        (the registry is saved once)
+        """
+        self.environment_registry = self.load_environment_registry()
+        for repo in self.environment_registry.get("local_index", {}).get("repos", []):
+            if repo["repo_source_path"] not in curated_outlets:
+                continue
+            outlet, record_outlets = curated_outlets[repo["repo_source_path"]]
+            repo["curated_outlet"] = outlet
+            # Note : the registry only stores strings
+            repo["curated_record_outlets"] = ";".join(sorted(set(record_outlets)))
+        self.save_environment_registry(self.environment_registry)
+
     def get_curated_outlets(self) -> list:
         """Get the curated outlets."""
         curated_outlets: typing.List[str] = []
-        for repo_source_path in [
-            x["repo_source_path"]
-            for x in self.local_repos()
-            if ".colrev/curated_metadata/" in x["repo_source_path"]
-        ]:
+        for repo in self.local_repos():
+            repo_source_path = repo["repo_source_path"]
+            if ".colrev/curated_metadata/" not in repo_source_path:
+                continue
             try:
-                with open(f"{repo_source_path}/readme.md", encoding="utf-8") as file:
-                    first_line = file.readline()
-                curated_outlets.append(first_line.lstrip("# ").replace("\n", ""))
-
-                with open(
-                    f"{repo_source_path}/data/records.bib", encoding="utf-8"
-                ) as file:
-                    outlets = []
-                    for line in file.readlines():
-                        # Note : the second part ("journal:"/"booktitle:")
-                        # ensures that data provenance fields are skipped
-                        if (
-                            Fields.JOURNAL == line.lstrip()[:7]
-                            and "journal:" != line.lstrip()[:8]
-                        ):
-                            journal = line[line.find("{") + 1 : line.rfind("}")]
-                            if journal != FieldValues.UNKNOWN:
-                                outlets.append(journal)
-                        if (
-                            line.lstrip()[:9] == Fields.BOOKTITLE
-                            and line.lstrip()[:10] != "booktitle:"
-                        ):
-                            booktitle = line[line.find("{") + 1 : line.rfind("}")]
-                            if booktitle != FieldValues.UNKNOWN:
-                                outlets.append(booktitle)
-
-                    if len(set(outlets)) > 1:  # pragma: no cover
-                        raise colrev_exceptions.CuratedOutletNotUnique(
-                            "Error: Duplicate outlets in curated_metadata of "
-                            f"{repo_source_path} : {','.join(list(set(outlets)))}"
-                        )
+                if "curated_outlet" in repo:
+                    outlet = repo["curated_outlet"]
+                    outlets = [
+                        x for x in repo["curated_record_outlets"].split(";") if x
+                    ]
+                else:
+                    outlet, outlets = _scan_curated_outlet(repo_source_path)
+                curated_outlets.append(outlet)
+
+                if len(set(outlets)) > 1:  # pragma: no cover
+                    raise colrev_exceptions.CuratedOutletNotUnique(
+                        "Error: Duplicate outlets in curated_metadata of "
+                        f"{repo_source_path} : {','.join(list(set(outlets)))}"
+                    )
             except FileNotFoundError as exc:  # pragma: no cover
                 print(exc)
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import logging
 import time
+import typing
 
 import docker
 import requests
@@ -22,15 +23,23 @@ class GrobidService:
 
     def __init__(self) -> None:
         """Initialize the instance."""
+        self._version: typing.Optional[str] = None
         colrev.env.docker_manager.DockerManager.build_docker_image(
             imagename=self.GROBID_IMAGE
         )
         self.start()
         self.check_grobid_availability()
 
+    def get_version(self) -> str:
+        """Get the version of the running GROBID service (queried once)."""
+        if self._version is None:
+            response = requests.get(self.GROBID_URL + "/api/version", timeout=10)
+            self._version = str(response.json()["version"])
+        return self._version
+
     def _ensure_correct_version(self) -> None:
-        response = requests.get(self.GROBID_URL + "/api/version", timeout=10)
-        running_version = response.json()["version"]
+        self._version = None
+        running_version = self.get_version()
         if running_version != self.GROBID_IMAGE.split(":")[1]:
             logging.warning(
                 "GROBID version mismatch. Expected: %s, currently running: %s",
@@ -115,6 +115,26 @@ class LanguageService:
 
         return predictions_unified
 
+    def compute_language_confidence_values_batch(self, *, texts: list) -> list:
+        """Compute the confidence values for a list of strings (in parallel)."""
+        # Note : lingua distributes the texts across threads (Rust, without the GIL)
+        detector = self._lingua_language_detector
+        predictions_list = detector.compute_language_confidence_values_in_parallel(
+            texts
+        )
+        predictions_unified_list = []
+        for text, predictions in zip(texts, predictions_list):
+            if text.lower() in self._eng_false_negatives:
+                predictions_unified_list.append([("eng", 1.0)])
+                continue
+            predictions_unified_list.append(
+                [
+                    (prediction.language.iso_code_639_3.name.lower(), prediction.value)
+                    for prediction in predictions
+                ]
+            )
+        return predictions_unified_list
+
     def validate_iso_639_3_language_codes(self, *, lang_code_list: list) -> None:
         """Validates whether a list of language codes complies with the ISO 639-3 standard."""
         if not isinstance(lang_code_list, list):
@@ -6,6 +6,7 @@ from __future__ import annotations
 import collections
 import io
 import os
+import time
 import typing
 from copy import deepcopy
 from datetime import timedelta
@@ -21,6 +22,7 @@ import colrev.env.environment_manager
 import colrev.env.local_index_sqlite
 import colrev.env.resources
 import colrev.env.tei_parser
+import colrev.env.timing_model
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.load_utils
@@ -29,6 +31,7 @@ import colrev.record.record
 import colrev.review_manager
 from colrev.constants import Colors
 from colrev.constants import Fields
+from colrev.constants import FieldValues
 from colrev.constants import Filepaths
 from colrev.constants import LocalIndexFields
 from colrev.env.local_index_prep import prepare_record_for_indexing
@@ -50,6 +53,16 @@ class LocalIndexBuilder:
         self._index_tei = index_tei
         self.thread_lock = Lock()
 
+        # Note : timings of previous runs (to estimate durations)
+        self._timing_model = colrev.env.timing_model.TimingModel("local_index")
+        self._throughput_monitor: typing.Optional[
+            colrev.env.timing_model.ThroughputMonitor
+        ] = None
+        # Note : curated outlets are collected in index() (to save the registry once)
+        self._curated_outlets: typing.Optional[
+            typing.Dict[str, typing.Tuple[str, typing.List[str]]]
+        ] = None
+
     def reinitialize_sqlite_db(self) -> None:
         """Reinitialize the SQLITE database ()."""
         Filepaths.LOCAL_INDEX_SQLITE_FILE.unlink(missing_ok=True)
@@ -260,6 +273,27 @@ class LocalIndexBuilder:
 
         return masterdata_curations
 
+    def _register_curated_outlet(
+        self, *, repo_source_path: Path, records: dict, readme: Path
+    ) -> None:
+        # Note : stored in the registry (get_curated_outlets() does not parse records)
+        if not readme.is_file():
+            return
+        with open(readme, encoding="utf-8") as file:
+            outlet = file.readline().lstrip("# ").replace("\n", "")
+        record_outlets = [
+            record_dict[key]
+            for record_dict in records.values()
+            for key in [Fields.JOURNAL, Fields.BOOKTITLE]
+            if record_dict.get(key, FieldValues.UNKNOWN) != FieldValues.UNKNOWN
+        ]
+        if self._curated_outlets is not None:
+            self._curated_outlets[str(repo_source_path)] = (outlet, record_outlets)
+            return
+        self.environment_manager.register_curated_outlets(
+            {str(repo_source_path): (outlet, record_outlets)}
+        )
+
     def index_colrev_project(self, repo_source_path: Path) -> None:  # pragma: no cover
         """Index a CoLRev project."""
         try:
@@ -284,6 +318,12 @@ class LocalIndexBuilder:
             if not records_file.is_file():
                 return
             records = check_operation.review_manager.dataset.load_records_dict()
+            if ".colrev/curated_metadata/" in str(repo_source_path):
+                self._register_curated_outlet(
+                    repo_source_path=repo_source_path,
+                    records=records,
+                    readme=check_operation.review_manager.paths.readme,
+                )
 
             curation_endpoints = [
                 x
@@ -315,6 +355,13 @@ class LocalIndexBuilder:
                 curated_masterdata=curated_masterdata,
             )
 
+            if self._throughput_monitor:
+                summary = self._throughput_monitor.record_completed(
+                    nr_records=len(records)
+                )
+                if summary:
+                    print(f"Throughput: {summary}")
+
         # TypeErrors are thrown when a repo is in interactive rebase mode
         except (colrev_exceptions.CoLRevException, TypeError) as exc:
             print(exc)
@@ -353,8 +400,32 @@ class LocalIndexBuilder:
                 x["repo_source_path"] for x in self.environment_manager.local_repos()
             ]
 
+        self._print_estimated_time(repo_source_paths)
+        # Note : the number of records is not known before loading the repositories
+        self._throughput_monitor = colrev.env.timing_model.ThroughputMonitor(
+            nr_records=0, timing_model=self._timing_model
+        )
+        self._curated_outlets = {}
         for repo_source_path in repo_source_paths:
+            start_time = time.monotonic()
             self.index_colrev_project(repo_source_path)
+            self._timing_model.add(
+                "repositories", str(repo_source_path), time.monotonic() - start_time
+            )
+        if self._curated_outlets:
+            self.environment_manager.register_curated_outlets(self._curated_outlets)
+        self._curated_outlets = None
+        print(f"Throughput: {self._throughput_monitor.get_summary()}")
+        self._timing_model.save()
+
+    def _print_estimated_time(self, repo_source_paths: list) -> None:
+        estimate, _ = self._timing_model.estimate(
+            "repositories", [str(x) for x in repo_source_paths], default=0.0
+        )
+        if estimate == 0:
+            # Note : no timings of previous runs
+            return
+        print("Estimated time".ljust(38) + str(timedelta(seconds=int(estimate))))
 
     def _index_tei_document(self, recs_to_index: list) -> None:
         if not self._index_tei:
@@ -6,8 +6,6 @@ from __future__ import annotations
 import sqlite3
 import typing
 
-import pandas as pd
-
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.load_utils
 import colrev.record.record
@@ -15,6 +13,9 @@ from colrev.constants import Fields
 from colrev.constants import Filepaths
 from colrev.constants import LocalIndexFields
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
 # Note : records are indexed by id = hash(colrev_id)
 # to ensure that the indexing-ids do not exceed limits
 # such as the opensearch limit of 512 bytes.
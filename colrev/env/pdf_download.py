@@ -0,0 +1,240 @@
+#! /usr/bin/env python
+"""Streaming (bounded-memory) PDF downloads with resumable transfers."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import typing
+from pathlib import Path
+
+import pymupdf
+import requests
+
+# Note : downloads are streamed in chunks to a partial file next to the target
+# (<target>.part). Responses that do not start with the PDF magic bytes
+# (e.g., HTML login pages) are aborted after the first chunk. Interrupted or
+# truncated transfers are resumed with HTTP Range requests (also in later runs).
+# The URL and the validator (ETag or Last-Modified) of the partial file are stored
+# in <target>.part.json. Range requests are conditional (If-Range): when the PDF
+# changed (or no validator is available), the download restarts from zero.
+# The target is only created (atomic rename) when the PDF can be opened.
+
+CHUNK_SIZE = 64 * 1024
+# Note : the PDF header may be preceded by up to 1024 bytes
+MAGIC_BYTES_RANGE = 1024
+PDF_MAGIC_BYTES = b"%PDF-"
+
+
+class _NotAPDFError(Exception):
+    """The response is not a PDF."""
+
+
+def get_partial_path(target: Path) -> Path:
+    """Get the path of the partial download."""
+    return target.with_name(target.name + ".part")
+
+
+def _get_partial_info_path(partial_path: Path) -> Path:
+    return partial_path.with_name(partial_path.name + ".json")
+
+
+def _load_partial_info(partial_path: Path) -> dict:
+    try:
+        return json.loads(
+            _get_partial_info_path(partial_path).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_partial_info(partial_path: Path, *, url: str, validator: str) -> None:
+    _get_partial_info_path(partial_path).write_text(
+        json.dumps({"url": url, "validator": validator}), encoding="utf-8"
+    )
+
+
+def _remove_partial(partial_path: Path) -> None:
+    partial_path.unlink(missing_ok=True)
+    _get_partial_info_path(partial_path).unlink(missing_ok=True)
+
+
+def _get_validator(response: requests.Response) -> str:
+    # Note : weak ETags cannot be used in If-Range requests
+    etag = response.headers.get("ETag", "")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified", "")
+
+
+def _get_resume_point(partial_path: Path, *, url: str) -> typing.Tuple[int, str]:
+    """Get the offset and validator to resume the partial download (0 to restart)."""
+    if not partial_path.is_file() or partial_path.stat().st_size == 0:
+        return 0, ""
+    partial_info = _load_partial_info(partial_path)
+    validator = partial_info.get("validator", "")
+    if partial_info.get("url", "") != url or not validator:
+        # Note : the partial file cannot be validated (restart from zero)
+        _remove_partial(partial_path)
+        return 0, ""
+    return partial_path.stat().st_size, validator
+
+
+def _is_pdf_start(data: bytes) -> bool:
+    return PDF_MAGIC_BYTES in data[: MAGIC_BYTES_RANGE + len(PDF_MAGIC_BYTES)]
+
+
+def _is_valid_pdf(path: Path) -> bool:
+    with open(path, "rb") as file:
+        if not _is_pdf_start(file.read(MAGIC_BYTES_RANGE + len(PDF_MAGIC_BYTES))):
+            return False
+    try:
+        with pymupdf.open(path) as doc:
+            return doc.page_count > 0
+    except (pymupdf.FileDataError, RuntimeError, ValueError):
+        return False
+
+
+def _get_resume_offset(response: requests.Response, offset: int) -> int:
+    """Get the offset at which the response content starts (0 if restarted)."""
+    if response.status_code != 206:
+        return 0
+    match = re.match(
+        r"bytes (\d+)-", response.headers.get("Content-Range", ""), re.IGNORECASE
+    )
+    if not match or int(match.group(1)) != offset:
+        return 0
+    return offset
+
+
+def _get_total_size(response: requests.Response) -> int:
+    """Get the total size of a 416 response (Content-Range: bytes */size)."""
+    match = re.match(
+        r"bytes \*/(\d+)", response.headers.get("Content-Range", ""), re.IGNORECASE
+    )
+    return int(match.group(1)) if match else -1
+
+
+def _has_changed(response: requests.Response, *, offset: int, validator: str) -> bool:
+    """Check whether the PDF changed since the partial download (If-Range ignored)."""
+    if response.status_code not in [206, 416]:
+        return False
+    if _get_validator(response) not in ["", validator]:
+        return True
+    if response.status_code == 416:
+        return _get_total_size(response) not in [-1, offset]
+    return False
+
+
+def _download_chunks(
+    response: requests.Response, *, partial_path: Path, offset: int
+) -> int:
+    """Write the response content to the partial file (returns the size)."""
+    size = offset
+    header_window = MAGIC_BYTES_RANGE + len(PDF_MAGIC_BYTES)
+    # Note : the magic bytes are checked before writing to disk
+    checked = offset > 0
+    pending = b""
+    with open(partial_path, "ab" if offset else "wb") as file:
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if not checked:
+                pending += chunk
+                if len(pending) < header_window and not _is_pdf_start(pending):
+                    continue
+                if not _is_pdf_start(pending):
+                    raise _NotAPDFError
+                checked = True
+                chunk, pending = pending, b""
+            file.write(chunk)
+            size += len(chunk)
+        if not checked:
+            if not _is_pdf_start(pending):
+                raise _NotAPDFError
+            file.write(pending)
+            size += len(pending)
+    return size
+
+
+def _get_expected_size(response: requests.Response, offset: int) -> int:
+    content_length = response.headers.get("Content-Length", "")
+    if not content_length.isdigit() or response.headers.get("Content-Encoding", ""):
+        return -1
+    return offset + int(content_length)
+
+
+def download_pdf(
+    url: str,
+    target: Path,
+    *,
+    headers: typing.Optional[dict] = None,
+    timeout: float = 60,
+    max_attempts: int = 3,
+    logger: logging.Logger = logging.getLogger(__name__),
+) -> bool:
+    """Download a PDF (streamed, resumable, verified) and return whether it succeeded."""
+    # pylint: disable=too-many-arguments
+    partial_path = get_partial_path(target)
+    target.parent.mkdir(exist_ok=True, parents=True)
+    request_headers = dict(headers or {})
+    # Note : Range offsets refer to the encoded content (PDFs are compressed anyway)
+    request_headers["Accept-Encoding"] = "identity"
+
+    complete = False
+    for _ in range(max_attempts):
+        offset, validator = _get_resume_point(partial_path, url=url)
+        if offset:
+            request_headers["Range"] = f"bytes={offset}-"
+            request_headers["If-Range"] = validator
+        else:
+            request_headers.pop("Range", None)
+            request_headers.pop("If-Range", None)
+        try:
+            with requests.get(
+                url, headers=request_headers, stream=True, timeout=timeout
+            ) as response:
+                if offset and _has_changed(
+                    response, offset=offset, validator=validator
+                ):
+                    logger.debug("PDF changed (restart the download): %s", url)
+                    _remove_partial(partial_path)
+                    continue
+                if response.status_code == 416 and offset:
+                    # Note : range not satisfiable (the partial file may be complete)
+                    complete = True
+                    break
+                if response.status_code not in [200, 206]:
+                    logger.debug("Download failed (%s): %s", response.status_code, url)
+                    return False
+                offset = _get_resume_offset(response, offset)
+                if not offset:
+                    _save_partial_info(
+                        partial_path, url=url, validator=_get_validator(response)
+                    )
+                expected_size = _get_expected_size(response, offset)
+                size = _download_chunks(
+                    response, partial_path=partial_path, offset=offset
+                )
+        except _NotAPDFError:
+            logger.debug("Not a PDF: %s", url)
+            _remove_partial(partial_path)
+            return False
+        except requests.RequestException as exc:
+            logger.debug("Download interrupted (%s): %s", exc, url)
+            continue
+        if expected_size == -1 or size >= expected_size:
+            complete = True
+            break
+        logger.debug("Download truncated (%s/%s bytes): %s", size, expected_size, url)
+
+    if not complete:
+        # Note : the partial file is kept (to resume)
+        return False
+    if not _is_valid_pdf(partial_path):
+        logger.debug("Invalid PDF: %s", url)
+        _remove_partial(partial_path)
+        return False
+    os.replace(partial_path, target)
+    _get_partial_info_path(partial_path).unlink(missing_ok=True)
+    return True
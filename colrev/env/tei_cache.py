@@ -0,0 +1,79 @@
+#! /usr/bin/env python
+"""Content-addressed cache for TEI documents (created by GROBID)."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import typing
+from pathlib import Path
+
+from colrev.constants import Filepaths
+
+# Note : TEIs are stored by content (sha256 of the PDF bytes), not by filename.
+# Renamed, moved, or duplicate PDFs (across projects in the local environment)
+# therefore resolve to the same cache entry and are not sent to GROBID again.
+# The GROBID version and the processing options are part of the key because
+# they change the resulting TEI.
+
+
+class TEICache:
+    """Environment service storing compressed TEIs keyed by PDF content."""
+
+    _CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, *, cache_dir: typing.Optional[Path] = None) -> None:
+        """Initialize the instance."""
+        self.cache_dir = cache_dir if cache_dir is not None else Filepaths.TEI_CACHE_DIR
+
+    @classmethod
+    def get_pdf_hash(cls, pdf_path: Path) -> str:
+        """Get the sha256 hash of the PDF contents."""
+        sha256 = hashlib.sha256()
+        with open(pdf_path, "rb") as file:
+            for chunk in iter(lambda: file.read(cls._CHUNK_SIZE), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    @staticmethod
+    def get_key(*, pdf_hash: str, grobid_version: str, options: dict) -> str:
+        """Get the cache key for a PDF hash, GROBID version and options."""
+        key_str = json.dumps(
+            {"pdf": pdf_hash, "grobid": grobid_version, "options": options},
+            sort_keys=True,
+        )
+        return hashlib.sha256(key_str.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / Path(f"{key[:2]}/{key[2:]}.tei.xml.gz")
+
+    def get(self, key: str) -> typing.Optional[bytes]:
+        """Get the TEI content (or None if it is not cached)."""
+        path = self._get_path(key)
+        if not path.is_file():
+            return None
+        try:
+            with gzip.open(path, "rb") as file:
+                return file.read()
+        except (OSError, EOFError):  # pragma: no cover
+            # Corrupted entries are discarded and recreated
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, tei_content: bytes) -> None:
+        """Store the TEI content."""
+        path = self._get_path(key)
+        path.parent.mkdir(exist_ok=True, parents=True)
+        # Write to a temporary file and rename atomically to ensure that
+        # concurrent processes never read partially written entries
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                with gzip.GzipFile(fileobj=tmp_file, mode="wb", mtime=0) as gz_file:
+                    gz_file.write(tei_content)
+            os.replace(tmp_name, path)
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
@@ -15,6 +15,7 @@ from defusedxml import ElementTree as DefusedET
 from defusedxml.common import DefusedXmlException
 
 import colrev.env.grobid_service
+import colrev.env.tei_cache
 import colrev.exceptions as colrev_exceptions
 import colrev.record.record
 import colrev.record.record_pdf
@@ -51,12 +52,14 @@ class TEIParser:
         *,
         pdf_path: typing.Optional[typing.Union[Path, str]] = None,
         tei_path: typing.Optional[typing.Union[Path, str]] = None,
+        grobid_service: typing.Optional[colrev.env.grobid_service.GrobidService] = None,
     ):
         """Creates a TEI file
         modes of operation:
         - pdf_path: create TEI and temporarily store in self.data
         - pfd_path and tei_path: create TEI and save in tei_path
         - tei_path: read TEI from file.
+        A grobid_service can be passed to reuse it across TEIParsers.
         """
         # pylint: disable=consider-using-with
         if pdf_path is None and tei_path is None:
@@ -71,6 +74,7 @@ class TEIParser:
 
         self.pdf_path = pdf_path
         self.tei_path = tei_path
+        self.grobid_service = grobid_service
         if pdf_path is not None and not pdf_path.is_file():
             raise FileNotFoundError
 
@@ -82,8 +86,6 @@ class TEIParser:
         if pdf_path is not None and not load_from_tei:
             # Do not run in continuous-integration environment
             # if not utils.in_ci_environment():
-            grobid_service = colrev.env.grobid_service.GrobidService()
-            grobid_service.start()
             self._create_tei()
 
         elif tei_path is not None:
@@ -100,13 +102,48 @@ class TEIParser:
         return DefusedET.fromstring(xslt_content)
 
     def _create_tei(self) -> None:
-        """Create the TEI (based on GROBID)."""
-        grobid_service = colrev.env.grobid_service.GrobidService()
-        grobid_service.start()
+        """Create the TEI (based on GROBID or the TEI cache)."""
         # Note: we have more control and transparency over the consolidation
         # if we do it in the colrev process
         options = {"consolidateHeader": "0", "consolidateCitations": "0"}
 
+        if self.grobid_service is None:
+            self.grobid_service = colrev.env.grobid_service.GrobidService()
+
+        tei_cache = colrev.env.tei_cache.TEICache()
+        cache_key = tei_cache.get_key(
+            pdf_hash=tei_cache.get_pdf_hash(self.pdf_path),  # type: ignore
+            grobid_version=self.grobid_service.get_version(),
+            options=options,
+        )
+        cached_tei_content = tei_cache.get(cache_key)
+        if cached_tei_content is not None:
+            tei_content = cached_tei_content
+        else:
+            tei_content = self._run_grobid(options=options)
+        self.root = DefusedET.fromstring(tei_content)
+        if cached_tei_content is None:
+            tei_cache.put(cache_key, tei_content)
+
+        if self.tei_path is not None:
+            self.tei_path.parent.mkdir(exist_ok=True, parents=True)
+            with open(self.tei_path, "wb") as file:
+                file.write(tei_content)
+
+            # Note : reopen/write to prevent format changes in the enhancement
+            with open(self.tei_path, "rb") as file:
+                xml_fstring = file.read()
+            self.root = DefusedET.fromstring(xml_fstring)
+
+            with open(self.tei_path, "wb") as file:
+                file.write(DefusedET.tostring(self.root, encoding="utf-8"))
+
+    def _run_grobid(self, *, options: dict) -> bytes:
+        grobid_service = typing.cast(
+            colrev.env.grobid_service.GrobidService, self.grobid_service
+        )
+        grobid_service.start()
+
         # Note: Grobid offers direct export of Bibtex:
         # r = requests.post(
         #     GROBID_SERVICE.GROBID_URL() + "/api/processHeaderDocument",
@@ -135,20 +172,8 @@ class TEIParser:
             if b"[TIMEOUT]" in ret.content:  # pragma: no cover
                 raise colrev_exceptions.TEITimeoutException()
 
-            self.root = DefusedET.fromstring(ret.content)
-
-            if self.tei_path is not None:
-                self.tei_path.parent.mkdir(exist_ok=True, parents=True)
-                with open(self.tei_path, "wb") as file:
-                    file.write(ret.content)
+            return ret.content
 
-                # Note : reopen/write to prevent format changes in the enhancement
-                with open(self.tei_path, "rb") as file:
-                    xml_fstring = file.read()
-                self.root = DefusedET.fromstring(xml_fstring)
-
-                with open(self.tei_path, "wb") as file:
-                    file.write(DefusedET.tostring(self.root, encoding="utf-8"))
         except requests.exceptions.ConnectionError as exc:  # pragma: no cover
             print(exc)
             print(str(self.pdf_path))
@@ -693,28 +718,22 @@ class TEIParser:
 
     def mark_references(self, *, records: dict):  # type: ignore
         """Mark references with the additional record ID."""
-        tei_records = self.get_references()
-        for record_dict in tei_records:
-            if Fields.TITLE not in record_dict:
-                continue
-
-            max_sim = 0.9
-            max_sim_record = {}
-            for local_record_dict in records.values():
-                if local_record_dict[Fields.STATUS] not in [
-                    RecordState.rev_included,
-                    RecordState.rev_synthesized,
-                ]:
-                    continue
-                rec_sim = colrev.record.record.Record.get_record_similarity(
-                    colrev.record.record.Record(record_dict),
-                    colrev.record.record.Record(local_record_dict),
-                )
-                if rec_sim > max_sim:
-                    max_sim_record = local_record_dict
-                    max_sim = rec_sim
-            if len(max_sim_record) == 0:
+        tei_records = [r for r in self.get_references() if Fields.TITLE in r]
+        local_records = [
+            r
+            for r in records.values()
+            if r[Fields.STATUS]
+            in [RecordState.rev_included, RecordState.rev_synthesized]
+        ]
+        # Note : many-vs-many comparison (vectorized)
+        similarities = colrev.record.record.Record.get_record_similarities(
+            [colrev.record.record.Record(r) for r in tei_records],
+            [colrev.record.record.Record(r) for r in local_records],
+        )
+        for record_dict, record_similarities in zip(tei_records, similarities):
+            if len(record_similarities) == 0 or record_similarities.max() <= 0.9:
                 continue
+            max_sim_record = local_records[int(record_similarities.argmax())]
 
             # Record found: mark in tei
             bibliography = self.root.find(f".//{self.ns['tei']}listBibl")
@@ -0,0 +1,225 @@
+#! /usr/bin/env python
+"""Timing model (histograms of previous runs) to estimate durations and throughput."""
+
+from __future__ import annotations
+
+import bisect
+import json
+import threading
+import time
+import typing
+from datetime import timedelta
+from pathlib import Path
+
+import colrev.env.utils
+from colrev.constants import Filepaths
+
+# Note : upper bounds of the histogram buckets (in seconds, log-scale)
+BUCKETS = [0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0, 30.0, 100.0, 300.0]
+
+# Note : older observations are down-weighted when the number of observations
+# exceeds MAX_COUNT (to adapt to changing APIs and machines)
+MAX_COUNT = 10000
+
+
+class _Histogram:
+    """Histogram of durations (with the count and the total)."""
+
+    def __init__(self, data: typing.Optional[dict] = None) -> None:
+        """Initialize the instance."""
+        data = data or {}
+        self.buckets: typing.List[float] = data.get(
+            "buckets", [0.0] * (len(BUCKETS) + 1)
+        )
+        self.count: float = data.get("count", 0.0)
+        self.total: float = data.get("total", 0.0)
+
+    def add(self, seconds: float) -> None:
+        """Add an observation."""
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def merge(self, other: _Histogram) -> None:
+        """Merge another histogram."""
+        self.buckets = [x + y for x, y in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.total += other.total
+        if self.count > MAX_COUNT:
+            factor = MAX_COUNT / self.count
+            self.buckets = [x * factor for x in self.buckets]
+            self.count *= factor
+            self.total *= factor
+
+    def mean(self) -> typing.Optional[float]:
+        """Get the mean duration."""
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    def to_dict(self) -> dict:
+        """Get the histogram as a dict."""
+        return {"buckets": self.buckets, "count": self.count, "total": self.total}
+
+
+class TimingModel:
+    """Timing histograms per operation (by endpoint and by source).
+
+    Histograms of previous runs are stored in the local environment and used
+    to predict the duration of the next run.
+    """
+
+    def __init__(self, operation: str, *, path: typing.Optional[Path] = None) -> None:
+        """Initialize the instance."""
+        self.operation = operation
+        self.path = path or Filepaths.OPERATION_TIMINGS_FILE
+        self._lock = threading.Lock()
+        # Note : histograms of previous runs and of the current run
+        self._previous = self._load()
+        self._current: typing.Dict[str, typing.Dict[str, _Histogram]] = {}
+
+    def _load(self) -> typing.Dict[str, typing.Dict[str, _Histogram]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return {
+            category: {key: _Histogram(value) for key, value in histograms.items()}
+            for category, histograms in data.get(self.operation, {}).items()
+        }
+
+    def add(self, category: str, key: str, seconds: float) -> None:
+        """Add an observation (e.g., category "endpoints", key "colrev.crossref")."""
+        with self._lock:
+            self._current.setdefault(category, {}).setdefault(key, _Histogram()).add(
+                seconds
+            )
+
+    def mean(self, category: str, key: str) -> typing.Optional[float]:
+        """Get the mean duration (current run, or previous runs if not available)."""
+        with self._lock:
+            for histograms in [self._current, self._previous]:
+                histogram = histograms.get(category, {}).get(key, None)
+                if histogram and histogram.count > 0:
+                    return histogram.mean()
+        return None
+
+    def get_current_means(self, category: str) -> typing.Dict[str, float]:
+        """Get the mean durations of the current run."""
+        with self._lock:
+            return {
+                key: histogram.total / histogram.count
+                for key, histogram in self._current.get(category, {}).items()
+                if histogram.count > 0
+            }
+
+    def estimate(
+        self,
+        category: str,
+        keys: typing.List[str],
+        *,
+        default: float,
+    ) -> typing.Tuple[float, typing.Dict[str, float]]:
+        """Estimate the total duration of keys (e.g., the endpoints for each record)."""
+        breakdown: typing.Dict[str, float] = {}
+        for key in keys:
+            mean = self.mean(category, key)
+            breakdown[key] = breakdown.get(key, 0.0) + (
+                default if mean is None else mean
+            )
+        return sum(breakdown.values()), breakdown
+
+    def save(self) -> None:
+        """Merge the current run into the histograms in the local environment."""
+        with self._lock:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            operation_data = data.setdefault(self.operation, {})
+            for category, histograms in self._current.items():
+                category_data = operation_data.setdefault(category, {})
+                for key, histogram in histograms.items():
+                    merged = _Histogram(category_data.get(key, None))
+                    merged.merge(histogram)
+                    category_data[key] = merged.to_dict()
+            try:
+                colrev.env.utils.atomic_write_json(self.path, data)
+            except OSError:
+                pass
+            self._previous = {
+                category: {key: _Histogram(value) for key, value in histograms.items()}
+                for category, histograms in operation_data.items()
+            }
+            self._current = {}
+
+
+class ThroughputMonitor:
+    """Live throughput (records/sec), cache hit rate, and slowest endpoint."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self, *, nr_records: int, timing_model: TimingModel, interval: float = 10.0
+    ) -> None:
+        """Initialize the instance."""
+        self.nr_records = nr_records
+        self.timing_model = timing_model
+        self.interval = interval
+        self._nr_completed = 0
+        self._start = time.monotonic()
+        self._last_report = self._start
+        self._cache_stats_start = get_cache_stats()
+        self._lock = threading.Lock()
+
+    def record_completed(self, *, nr_records: int = 1) -> str:
+        """Count completed records (returns a progress summary once per interval)."""
+        with self._lock:
+            self._nr_completed += nr_records
+            now = time.monotonic()
+            if now - self._last_report < self.interval:
+                return ""
+            self._last_report = now
+        return self.get_summary()
+
+    def get_summary(self) -> str:
+        """Get a summary of the throughput."""
+        elapsed = max(time.monotonic() - self._start, 1e-6)
+        records_per_sec = self._nr_completed / elapsed
+        summary = f"{records_per_sec:.2f} records/s"
+        if records_per_sec > 0 and self.nr_records > self._nr_completed:
+            remaining = (self.nr_records - self._nr_completed) / records_per_sec
+            summary += f", ETA {timedelta(seconds=int(remaining))}"
+
+        hits, requests = get_cache_stats()
+        hits -= self._cache_stats_start[0]
+        requests -= self._cache_stats_start[1]
+        if requests > 0:
+            summary += f", cache hits {hits / requests:.0%}"
+
+        endpoint_means = self.timing_model.get_current_means("endpoints")
+        if endpoint_means:
+            slowest = max(endpoint_means, key=endpoint_means.__getitem__)
+            summary += f", slowest: {slowest} ({endpoint_means[slowest]:.2f}s)"
+        return summary
+
+
+_CACHE_STATS = {"hits": 0, "requests": 0}
+_CACHE_STATS_LOCK = threading.Lock()
+
+
+def count_cache_hits(
+    response: typing.Any, *args: typing.Any, **kwargs: typing.Any
+) -> None:
+    """Response hook counting the requests served from the (requests-)cache."""
+    # pylint: disable=unused-argument
+    with _CACHE_STATS_LOCK:
+        _CACHE_STATS["requests"] += 1
+        if getattr(response, "from_cache", False):
+            _CACHE_STATS["hits"] += 1
+
+
+def get_cache_stats() -> typing.Tuple[int, int]:
+    """Get the number of cache hits and requests (cached sessions)."""
+    with _CACHE_STATS_LOCK:
+        return _CACHE_STATS["hits"], _CACHE_STATS["requests"]
@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Collection of utility functions."""
 
+import json
 import operator
+import os
 import pkgutil
 import re
+import tempfile
 import typing
 import unicodedata
 from enum import Enum
@@ -80,9 +83,12 @@ def remove_accents(input_str: str) -> str:
     return "".join(wo_ac_list)
 
 
+_NON_LETTERS_PATTERN = re.compile(r"[^a-zA-Z]")
+
+
 def percent_upper_chars(input_string: str) -> float:
     """Get the percentage of upper-case characters in a string."""
-    input_string = re.sub(r"[^a-zA-Z]", "", input_string)
+    input_string = _NON_LETTERS_PATTERN.sub("", input_string)
     if len(input_string) == 0:
         return 0.0
     return sum(map(str.isupper, input_string)) / len(input_string)
@@ -156,3 +162,18 @@ def dict_set_nested(root: dict, keys: typing.List[str], value: typing.Any) -> No
     for key in keys[:-1]:
         root = root.setdefault(key, {})
     root[keys[-1]] = value
+
+
+def atomic_write_json(path: Path, data: typing.Any) -> None:
+    """Write data to a JSON file atomically (temporary file and rename).
+
+    Raises OSError if the file cannot be written (the temporary file is removed).
+    """
+    path.parent.mkdir(exist_ok=True, parents=True)
+    file_descriptor, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(tmp_name, path)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
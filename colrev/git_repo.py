@@ -236,6 +236,16 @@ class GitRepo:
 
         return [nr_commits_behind, nr_commits_ahead]
 
+    def get_remote_commit_differences(
+        self,
+    ) -> typing.Tuple[int, int]:  # pragma: no cover
+        """Get the number of commits behind and ahead of the remote (fetches)."""
+        connected_remote = 0 != len(self.repo.remotes)
+        if not connected_remote or not self.repo.remotes.origin.exists():
+            return 0, 0
+        nr_commits_behind, nr_commits_ahead = self._get_remote_commit_differences()
+        return nr_commits_behind, nr_commits_ahead
+
     def behind_remote(self) -> bool:  # pragma: no cover
         """Check whether the repository is behind the remote."""
         nr_commits_behind = 0
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Merge driver for the records file of CoLRev repositories."""
+
+import sys
+from pathlib import Path
+
+import colrev.ops.merge
+
+
+def main() -> int:
+    """Main entrypoint for the merge driver (colrev-hooks-merge %O %A %B)."""
+    base_path, ours_path, theirs_path = (Path(arg) for arg in sys.argv[1:4])
+    conflicting_ids = colrev.ops.merge.merge_records_files(
+        base_path=base_path, ours_path=ours_path, theirs_path=theirs_path
+    )
+    if conflicting_ids:
+        print(f"Conflicting changes in records: {', '.join(conflicting_ids)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -135,8 +135,6 @@ import tempfile
 import typing
 from pathlib import Path
 
-import pandas as pd
-
 import colrev.loader.bib
 import colrev.loader.enl
 import colrev.loader.json
@@ -147,6 +145,9 @@ import colrev.loader.table
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
 # pylint: disable=too-many-arguments
 # flake8: noqa: E501
 
@@ -264,6 +265,9 @@ def load_df(
     filename: Path,
 ) -> pd.DataFrame:
     """Load a file and return records as a DataFrame."""
+    # Note : pandas is imported when needed (startup time, e.g., of colrev status)
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     if not isinstance(filename, Path):
         raise TypeError(f"filename must be a Path object, not {type(filename)}")
     record_dict = load(filename)
@@ -7,8 +7,6 @@ import logging
 import typing
 from pathlib import Path
 
-import pandas as pd
-
 import colrev.exceptions as colrev_exceptions
 import colrev.loader.loader
 
@@ -44,6 +42,8 @@ class TableLoader(colrev.loader.loader.Loader):
     @classmethod
     def get_nr_records(cls, filename: Path) -> int:
         """Get the number of records in the file."""
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         if filename.name.endswith(".csv"):
             data = pd.read_csv(filename, dtype=str, keep_default_na=False)
         elif filename.name.endswith((".xls", ".xlsx")):
@@ -54,6 +54,9 @@ class TableLoader(colrev.loader.loader.Loader):
         return count
 
     def load_records_list(self) -> list:
+        # Note : pandas is imported when needed (startup time)
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
         try:
             if self.filename.name.endswith(".csv"):
                 data = pd.read_csv(self.filename)
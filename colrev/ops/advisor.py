@@ -3,8 +3,12 @@
 
 from __future__ import annotations
 
+import json
+import time
 import typing
 from collections import Counter
+from datetime import timedelta
+from importlib.metadata import version
 from multiprocessing.dummy import Pool as ThreadPool
 from pathlib import Path
 
@@ -12,10 +16,13 @@ import git
 from git.exc import InvalidGitRepositoryError
 from git.exc import NoSuchPathError
 
+import colrev.env.utils
 import colrev.ops.check
+import colrev.process.status
 from colrev.constants import EndpointType
 from colrev.constants import Fields
 from colrev.constants import FieldValues
+from colrev.constants import Filepaths
 from colrev.constants import RecordState
 from colrev.env.environment_manager import EnvironmentManager
 from colrev.package_manager.package_manager import PackageManager
@@ -23,6 +30,17 @@ from colrev.package_manager.package_manager import PackageManager
 if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.review_manager
 
+SUMMARY_PATH = Path(".colrev/advisor_summary.json")
+REMOTE_CHECK_TTL = timedelta(hours=1)
+
+# Note : the advisor runs for every colrev status (and in the pre-commit hooks).
+# Loading the records (parsing data/records.bib) dominates its runtime.
+# The project summary (status statistics, outlet counts, linked and missing files)
+# is stored in .colrev/ and keyed by the size and mtime of the records, settings,
+# and search results files. The records are only loaded when these files change.
+# Remote states (commits behind/ahead) of the project and the registered repos
+# are cached in the local environment (per HEAD commit) for remote_check_ttl.
+
 
 class Advisor:
     """The CoLRev advisor guides users through the review process."""
@@ -47,13 +65,156 @@ class Advisor:
         self,
         *,
         review_manager: colrev.review_manager.ReviewManager,
+        remote_check_ttl: timedelta = REMOTE_CHECK_TTL,
     ) -> None:
         """Initialize the instance."""
         self.review_manager = review_manager
+        self.remote_check_ttl = remote_check_ttl
         colrev.ops.check.CheckOperation(self.review_manager)
-        self.records = self.review_manager.dataset.load_records_dict()
-        self.status_stats = review_manager.get_status_stats(records=self.records)
+        self._records: typing.Optional[dict] = None
+        self._summary = self._get_summary()
+        self.status_stats = colrev.process.status.StatusStats.model_validate(
+            {
+                **self._summary["status_stats"],
+                "origin_states_dict": {
+                    origin: RecordState(state)
+                    for origin, state in self._summary["status_stats"][
+                        "origin_states_dict"
+                    ].items()
+                },
+            }
+        )
         self.environment_manager = EnvironmentManager()
+        self._remote_status_cache = self._load_remote_status_cache()
+
+    @property
+    def records(self) -> dict:
+        """The records (loaded on demand)."""
+        if self._records is None:
+            self._records = self.review_manager.dataset.load_records_dict()
+        return self._records
+
+    def _get_summary_key(self) -> list:
+        paths = [
+            self.review_manager.paths.records,
+            self.review_manager.paths.settings,
+        ] + [
+            self.review_manager.path / source.search_results_path
+            for source in self.review_manager.settings.sources
+        ]
+        key: list = [version("colrev")]
+        for path in paths:
+            try:
+                stat = path.stat()
+                key.append([str(path), stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                key.append([str(path), None, None])
+        return key
+
+    def _compute_summary(self) -> dict:
+        status_stats = colrev.process.status.get_status_stats(
+            review_manager=self.review_manager, records=self.records
+        )
+        outlets = Counter(
+            record_dict[field]
+            for record_dict in self.records.values()
+            for field in [Fields.JOURNAL, Fields.BOOKTITLE]
+            if field in record_dict
+        )
+        return {
+            "status_stats": status_stats.model_dump(mode="json"),
+            "outlets": dict(outlets),
+            "missing_files": [
+                record_dict[Fields.ID]
+                for record_dict in self.records.values()
+                if (
+                    record_dict[Fields.STATUS]
+                    in RecordState.get_states_requiring_file()
+                    and Fields.FILE not in record_dict
+                )
+            ],
+            "linked_files": [
+                record_dict[Fields.FILE]
+                for record_dict in self.records.values()
+                if Fields.FILE in record_dict
+            ],
+        }
+
+    def _get_summary(self) -> dict:
+        """Get the project summary (recomputed when the underlying files change)."""
+        summary_path = self.review_manager.path / SUMMARY_PATH
+        key = self._get_summary_key()
+        try:
+            summary = json.loads(summary_path.read_text(encoding="utf-8"))
+            if summary.get("key") == key:
+                return summary
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        summary = {"key": key, **self._compute_summary()}
+        try:
+            colrev.env.utils.atomic_write_json(summary_path, summary)
+        except OSError:
+            pass
+        return summary
+
+    def _load_remote_status_cache(self) -> dict:
+        try:
+            return json.loads(
+                Filepaths.REMOTE_STATUS_CACHE_FILE.read_text(encoding="utf-8")
+            )
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_remote_status_cache(self) -> None:
+        try:
+            colrev.env.utils.atomic_write_json(
+                Filepaths.REMOTE_STATUS_CACHE_FILE, self._remote_status_cache
+            )
+        except OSError:
+            pass
+
+    def _get_cached_remote_status(
+        self, category: str, repo_path: Path, *, head: str
+    ) -> typing.Any:
+        """Get a cached remote status (None if it is not available or expired)."""
+        entry = self._remote_status_cache.get(category, {}).get(str(repo_path), {})
+        if (
+            not entry
+            or entry["head"] != head
+            or time.time() - entry["checked"] > self.remote_check_ttl.total_seconds()
+        ):
+            return None
+        return entry["value"]
+
+    def _set_cached_remote_status(
+        self, category: str, repo_path: Path, *, head: str, value: typing.Any
+    ) -> None:
+        self._remote_status_cache.setdefault(category, {})[str(repo_path)] = {
+            "head": head,
+            "checked": time.time(),
+            "value": value,
+        }
+
+    def _get_remote_commit_differences(self) -> typing.Tuple[int, int]:
+        git_repo = self.review_manager.dataset.git_repo
+        head = git_repo.repo.head.commit.hexsha
+        differences = self._get_cached_remote_status(
+            "commit_differences", self.review_manager.path, head=head
+        )
+        if differences is None:
+            differences = git_repo.get_remote_commit_differences()
+            # Note : failed fetches (-1) are not cached
+            if -1 not in differences:
+                self._set_cached_remote_status(
+                    "commit_differences",
+                    self.review_manager.path,
+                    head=head,
+                    value=differences,
+                )
+                self._save_remote_status_cache()
+        nr_commits_behind, nr_commits_ahead = differences
+        return nr_commits_behind, nr_commits_ahead
 
     def _append_merge_conflict_warning(
         self, collaboration_instructions: dict, *, git_repo: git.Repo
@@ -102,7 +263,8 @@ class Advisor:
         share_stat_req = self.review_manager.settings.project.share_stat_req
         collaboration_instructions["SHARE_STAT_REQ"] = share_stat_req
 
-        if self.review_manager.dataset.git_repo.behind_remote():
+        nr_commits_behind, nr_commits_ahead = self._get_remote_commit_differences()
+        if nr_commits_behind > 0:
             item = {
                 "title": "Remote changes available on the server",
                 "level": "WARNING",
@@ -113,7 +275,7 @@ class Advisor:
             }
             collaboration_instructions["items"].append(item)
 
-        if self.review_manager.dataset.git_repo.remote_ahead():
+        if nr_commits_ahead > 0:
             item = {
                 "title": "Local changes not yet on the server",
                 "level": "WARNING",
@@ -240,8 +402,7 @@ class Advisor:
         return collaboration_instructions
 
     def _append_initial_load_instruction(self, review_instructions: list) -> None:
-        current_origin_states_dict = self.review_manager.dataset.get_origin_state_dict()
-        if len(current_origin_states_dict) == 0:
+        if len(self.status_stats.origin_states_dict) == 0:
             instruction = {
                 "msg": "To import, copy search results to the search directory.",
                 "cmd": "colrev load",
@@ -420,14 +581,7 @@ class Advisor:
         self._append_data_operation_advice(review_instructions)
 
     def _get_missing_files(self) -> list:
-        return [
-            record_dict[Fields.ID]
-            for record_dict in self.records.values()
-            if (
-                record_dict[Fields.STATUS] in RecordState.get_states_requiring_file()
-                and Fields.FILE not in record_dict
-            )
-        ]
+        return self._summary["missing_files"]
 
     def _append_pdf_issue_instructions(self, review_instructions: list) -> None:
         # Check pdf files
@@ -446,13 +600,11 @@ class Advisor:
                     }
                 )
 
-        pdfs_no_longer_available = []
-        for record_dict in self.records.values():
-            if Fields.FILE in record_dict:
-                if not (
-                    self.review_manager.path / Path(record_dict[Fields.FILE])
-                ).is_file():
-                    pdfs_no_longer_available.append(record_dict[Fields.FILE])
+        pdfs_no_longer_available = [
+            linked_file
+            for linked_file in self._summary["linked_files"]
+            if not (self.review_manager.path / Path(linked_file)).is_file()
+        ]
         if pdfs_no_longer_available:
             review_instructions.append(
                 {
@@ -545,35 +697,65 @@ class Advisor:
             pass
         return instruction
 
-    def _extract_outlet_count(self) -> typing.Tuple[list, list]:
-        with open(self.review_manager.paths.records, encoding="utf8") as file:
-            outlets = []
-            for line in file.readlines():
-                if line.lstrip()[:8] == "journal ":
-                    journal = line[line.find("{") + 1 : line.rfind("}")]
-                    outlets.append(journal)
-                if line.lstrip()[:10] == "booktitle ":
-                    booktitle = line[line.find("{") + 1 : line.rfind("}")]
-                    outlets.append(booktitle)
+    def _get_registered_repo_instructions(self) -> list:
+        instructions: typing.Dict[str, dict] = {}
+        heads: typing.Dict[str, str] = {}
+        for local_repo in self.environment_manager.local_repos():
+            registered_path = local_repo["repo_source_path"]
+            try:
+                heads[registered_path] = git.Repo(registered_path).head.commit.hexsha
+            except (NoSuchPathError, InvalidGitRepositoryError, ValueError):
+                heads[registered_path] = ""
+            instruction = self._get_cached_remote_status(
+                "registered_repo_instructions",
+                Path(registered_path),
+                head=heads[registered_path],
+            )
+            if instruction is not None:
+                instructions[registered_path] = instruction
+
+        stale_paths = [Path(path) for path in heads if path not in instructions]
+        if stale_paths:
+            # Note : we can use many parallel processes
+            # because _append_registered_repo_instructions mainly waits for git
+            # it does not use a lot of CPU capacity
+            with ThreadPool(min(50, len(stale_paths))) as pool:
+                add_instructions = pool.map(
+                    self._append_registered_repo_instructions, stale_paths
+                )
+            for registered_path, instruction in zip(stale_paths, add_instructions):
+                instructions[str(registered_path)] = instruction
+                if heads[str(registered_path)]:
+                    self._set_cached_remote_status(
+                        "registered_repo_instructions",
+                        registered_path,
+                        head=heads[str(registered_path)],
+                        value=instruction,
+                    )
+            self._save_remote_status_cache()
+
+        return [instructions[path] for path in heads if instructions[path]]
 
+    def _extract_outlet_count(self) -> typing.Tuple[int, list]:
+        outlets = Counter(self._summary["outlets"])
         outlet_counter: typing.List[typing.Tuple[str, int]] = [
-            (j, x) for j, x in Counter(outlets).most_common(10) if x > 5
+            (j, x) for j, x in outlets.most_common(10) if x > 5
         ]
 
-        return outlets, outlet_counter
+        return outlets.total(), outlet_counter
 
     def _append_download_outlets_instruction(
         self,
         environment_instructions: list,
     ) -> None:
         """Get instructions related to downloading outlets (resources)."""
-        outlets, outlet_counter = self._extract_outlet_count()
+        nr_outlets, outlet_counter = self._extract_outlet_count()
 
         selected = []
         cumulative = 0.0
         for candidate, freq in outlet_counter:
             selected.append((candidate, freq))
-            cumulative += freq / len(outlets)
+            cumulative += freq / nr_outlets
             if cumulative > 0.7:
                 break
         if len(selected) > 0:
@@ -586,7 +768,7 @@ class Advisor:
 
             journals = "\n   - " + "\n   - ".join(
                 [
-                    f"{candidate} ({round((freq/len(outlets))*100, 2)}%)"
+                    f"{candidate} ({round((freq/nr_outlets)*100, 2)}%)"
                     for candidate, freq in selected_journals
                 ]
             )
@@ -607,17 +789,7 @@ class Advisor:
         if self.status_stats.currently.md_imported > 10:
             self._append_download_outlets_instruction(environment_instructions)
 
-        local_repos = self.environment_manager.local_repos()
-        registered_paths = [Path(x["repo_source_path"]) for x in local_repos]
-        # Note : we can use many parallel processes
-        # because __append_registered_repo_instructions mainly waits for the network
-        # it does not use a lot of CPU capacity
-        pool = ThreadPool(50)
-        add_instructions = pool.map(
-            self._append_registered_repo_instructions, registered_paths
-        )
-
-        environment_instructions += list(filter(None, add_instructions))
+        environment_instructions += self._get_registered_repo_instructions()
 
         corrections_path = self.review_manager.paths.corrections
         if len(list(corrections_path.glob("*.json"))) > 0:
@@ -4,25 +4,117 @@
 from __future__ import annotations
 
 import importlib
+import json
+import os
 import shutil
+import socket
 import sys
 import typing
 from importlib.metadata import version
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import git
 import gitdb.exc
+import requests
 from docker import errors as docker_errors
 from docker import from_env as docker_from_env
 
 import colrev.env.environment_manager
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
+from colrev.constants import Filepaths
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.review_manager
     import colrev.ops.status
 
+NOT_INSTALLED = "Not installed"
+DOCKER_TIMEOUT = 5  # seconds
+DOCKER_CONNECT_TIMEOUT = 0.5  # seconds
+DOCKER_SOCKET = Path("/var/run/docker.sock")
+
+# Note : the version information is the same for all commits of a session
+# (dozens of commits in prep or screen). It is memoized per process and stored
+# in the local environment, keyed by the paths and mtimes of the binaries
+# (changing when git or docker are updated).
+# Before the (cached) docker version is used, a connection to the daemon is
+# opened (DOCKER_HOST or the default socket, with a short timeout) because the
+# daemon may have been stopped. Unavailable versions are not stored.
+
+_VERSION_INFO: typing.Dict[str, str] = {}
+
+
+def _get_binary_key(*names: str) -> list:
+    key = []
+    for name in names:
+        path = shutil.which(name)
+        try:
+            mtime = os.stat(path).st_mtime_ns if path else None
+        except OSError:
+            mtime = None
+        key.append([name, path, mtime])
+    return key
+
+
+def _docker_daemon_reachable() -> bool:
+    """Check whether the docker daemon accepts connections."""
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if not docker_host and sys.platform == "win32":
+        # Note : named pipes are not checked
+        return True
+    if docker_host and not docker_host.startswith(("unix://", "tcp://")):
+        # Note : other hosts (e.g., ssh://) are not checked
+        return True
+    try:
+        if docker_host.startswith("tcp://"):
+            url = urlsplit(docker_host)
+            default_port = 2376 if os.environ.get("DOCKER_TLS_VERIFY", "") else 2375
+            with socket.create_connection(
+                (url.hostname or "localhost", url.port or default_port),
+                timeout=DOCKER_CONNECT_TIMEOUT,
+            ):
+                return True
+        socket_path = docker_host[len("unix://") :] or str(DOCKER_SOCKET)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as unix_socket:
+            unix_socket.settimeout(DOCKER_CONNECT_TIMEOUT)
+            unix_socket.connect(socket_path)
+        return True
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+def _get_version_info(
+    name: str, *, key: list, get_version: typing.Callable[[], str]
+) -> str:
+    """Get the version information (memoized and cached in the local environment)."""
+    if name in _VERSION_INFO:
+        return _VERSION_INFO[name]
+
+    path = Filepaths.VERSION_INFO_CACHE_FILE
+    try:
+        version_cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        version_cache = {}
+    if version_cache.get(name, {}).get("key") == key:
+        version_info = version_cache[name]["version"]
+    else:
+        version_info = get_version()
+        if version_info != NOT_INSTALLED:
+            version_cache[name] = {"key": key, "version": version_info}
+            try:
+                colrev.env.utils.atomic_write_json(path, version_cache)
+            except OSError:
+                pass
+    _VERSION_INFO[name] = version_info
+    return version_info
+
+
+def _get_colrev_version() -> str:
+    if "colrev" not in _VERSION_INFO:
+        _VERSION_INFO["colrev"] = version("colrev")
+    return _VERSION_INFO["colrev"]
+
 
 class Commit:
     """Create commits."""
@@ -85,16 +177,25 @@ class Commit:
         return saved_args_str
 
     def _set_versions(self) -> None:
-        self.colrev_version = f'version {version("colrev")}'
+        self.colrev_version = f"version {_get_colrev_version()}"
         sys_v = sys.version
         self.python_version = f'version {sys_v[: sys_v.find(" ")]}'
-        self.git_version = self._get_git_version()
-        self.docker_version = self._get_docker_version()
+        self.git_version = _get_version_info(
+            "git", key=_get_binary_key("git"), get_version=self._get_git_version
+        )
+        self.docker_version = NOT_INSTALLED
+        if _docker_daemon_reachable():
+            self.docker_version = _get_version_info(
+                "docker",
+                key=_get_binary_key("docker", "dockerd")
+                + [os.environ.get("DOCKER_HOST", str(DOCKER_SOCKET))],
+                get_version=self._get_docker_version,
+            )
 
     def _get_git_version(self) -> str:
         git_executable = shutil.which("git")
         if git_executable is None:
-            return "Not installed"
+            return NOT_INSTALLED
 
         try:
             # Use the resolved absolute executable path to avoid partial-path execution.
@@ -102,20 +203,20 @@ class Commit:
             version_info = git.cmd.Git().version_info
             return "version " + ".".join(map(str, version_info))
         except (git.exc.GitError, TypeError, ValueError):
-            return "Not installed"
+            return NOT_INSTALLED
 
     def _get_docker_version(self) -> str:
         # This validates Docker daemon availability/version through the Docker SDK,
         # not just whether the docker CLI binary exists on PATH.
         client = None
         try:
-            client = docker_from_env()
+            client = docker_from_env(timeout=DOCKER_TIMEOUT)
             docker_version = client.version().get("Version", "")
             if docker_version == "":  # pragma: no cover
-                return "Not installed"
+                return NOT_INSTALLED
             return f"version {docker_version}"
-        except docker_errors.DockerException:
-            return "Not installed"
+        except (docker_errors.DockerException, requests.exceptions.RequestException):
+            return NOT_INSTALLED
         finally:
             if client is not None:
                 client.close()
@@ -144,7 +245,7 @@ class Commit:
 
     def _get_version_flag(self) -> str:
         flag = ""
-        if "dirty" in version("colrev"):  # pragma: no cover
+        if "dirty" in _get_colrev_version():  # pragma: no cover
             flag = "*"
         return flag
 
@@ -3,12 +3,17 @@
 
 from __future__ import annotations
 
+import bisect
 import json
+import re
 import typing
+from collections import defaultdict
 from pathlib import Path
 
+import git
 from dictdiffer import diff
 
+import colrev.loader.load_utils
 from colrev.constants import Fields
 
 if typing.TYPE_CHECKING:  # pragma: no cover
@@ -175,21 +180,113 @@ class Corrections:
         with open(filepath, "w", encoding="utf8") as corrections_file:
             json.dump(dict_to_save, corrections_file, indent=4)
 
+    @staticmethod
+    def _get_changed_lines(diff_output: str) -> typing.Tuple[set, set]:
+        """Get the line numbers changed in the prior and the staged file."""
+        prior_lines: typing.Set[int] = set()
+        staged_lines: typing.Set[int] = set()
+        for match in re.finditer(
+            r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", diff_output, re.MULTILINE
+        ):
+            for start, count, lines in [
+                (int(match.group(1)), match.group(2), prior_lines),
+                (int(match.group(3)), match.group(4), staged_lines),
+            ]:
+                count = 1 if count is None else int(count)
+                if count == 0:
+                    # Lines were only removed/added at this position
+                    lines.update([start, start + 1])
+                lines.update(range(start, start + count))
+        return prior_lines, staged_lines
+
+    @staticmethod
+    def _get_entries(content: str, line_numbers: set) -> str:
+        """Get the bib entries that contain the given (1-based) line numbers."""
+        lines = content.split("\n")
+        entry_starts = [i for i, line in enumerate(lines) if line.startswith("@")]
+        selected_starts = set()
+        for line_number in line_numbers:
+            position = bisect.bisect_right(entry_starts, line_number - 1) - 1
+            if position >= 0:
+                selected_starts.add(position)
+        entries = []
+        for position in sorted(selected_starts):
+            end = (
+                entry_starts[position + 1]
+                if position + 1 < len(entry_starts)
+                else len(lines)
+            )
+            entries.append("\n".join(lines[entry_starts[position] : end]))
+        return "\n".join(entries)
+
+    def _get_changed_records(self) -> typing.Optional[typing.Tuple[dict, dict]]:
+        """Get the records whose entries changed in the staged diff (and their prior versions).
+
+        Returns None if the staged diff is not available.
+        """
+        git_repo = self.review_manager.dataset.git_repo.repo
+        records_file = self.review_manager.paths.RECORDS_FILE_GIT
+        try:
+            diff_output = git_repo.git.diff(
+                "--cached", "-U0", "HEAD", "--", records_file
+            )
+            prior_content = git_repo.git.show(f"HEAD:{records_file}")
+            staged_content = git_repo.git.show(f":{records_file}")
+        except git.exc.GitCommandError:
+            return None
+
+        prior_lines, staged_lines = self._get_changed_lines(diff_output)
+        records: typing.Dict[str, dict] = {}
+        prior_records: typing.Dict[str, dict] = {}
+        for content, line_numbers, target in [
+            (staged_content, staged_lines, records),
+            (prior_content, prior_lines, prior_records),
+        ]:
+            entries = self._get_entries(content, line_numbers)
+            if entries:
+                target.update(
+                    colrev.loader.load_utils.loads(
+                        load_string=entries,
+                        implementation="bib",
+                        logger=self.review_manager.logger,
+                    )
+                )
+        return records, prior_records
+
     def check_corrections_of_records(self) -> None:
         """Check for corrections of records."""
         # to test run
         # colrev-hooks-report .report.log
 
-        records = self.review_manager.dataset.load_records_dict()
-        prior_records_dict = next(
-            self.review_manager.dataset.load_records_from_history(), {}
-        )
+        # Note : only records whose entries changed in the staged diff are checked
+        # (the check scales with the size of the change, not with the size of the repo)
+        changed_records = self._get_changed_records()
+        if changed_records is None:
+            records = self.review_manager.dataset.load_records_dict()
+            prior_records_dict = next(
+                self.review_manager.dataset.load_records_from_history(), {}
+            )
+        else:
+            records, prior_records_dict = changed_records
+
+        prior_ids_by_origin: typing.Dict[str, typing.List[str]] = defaultdict(list)
+        for prior_id, prior_r in prior_records_dict.items():
+            for origin in prior_r[Fields.ORIGIN]:
+                prior_ids_by_origin[origin].append(prior_id)
+        prior_positions = {
+            prior_id: position for position, prior_id in enumerate(prior_records_dict)
+        }
+
         for record_dict in records.values():
             # identify curated records for which essential metadata is changed
+            prior_ids = {
+                prior_id
+                for origin in record_dict[Fields.ORIGIN]
+                for prior_id in prior_ids_by_origin.get(origin, [])
+            }
             record_prior = [
-                x
-                for x in prior_records_dict.values()
-                if any(y in record_dict[Fields.ORIGIN] for y in x[Fields.ORIGIN])
+                prior_records_dict[prior_id]
+                for prior_id in sorted(prior_ids, key=prior_positions.__getitem__)
             ]
 
             if len(record_prior) == 0:
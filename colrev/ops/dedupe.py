@@ -4,14 +4,17 @@
 from __future__ import annotations
 
 import string
+import time
 import typing
 from collections import defaultdict
+from datetime import timedelta
 from itertools import combinations
 from pathlib import Path
 
 import pandas as pd
 from bib_dedupe.bib_dedupe import prep
 
+import colrev.env.timing_model
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
 import colrev.record.record
@@ -51,6 +54,8 @@ def same_source_merge(
 class Dedupe(colrev.process.operation.Operation):
     """Deduplicate records (entity resolution)."""
 
+    # pylint: disable=too-many-instance-attributes
+
     NON_DUPLICATE_FILE_XLSX = Path("non_duplicates_to_validate.xlsx")
     NON_DUPLICATE_FILE_TXT = Path("non_duplicates_to_validate.txt")
     DUPLICATES_TO_VALIDATE = Path("duplicates_to_validate.xlsx")
@@ -83,6 +88,9 @@ class Dedupe(colrev.process.operation.Operation):
         )
         self.dedupe_dir.mkdir(exist_ok=True, parents=True)
 
+        # Note : timings of previous runs (to estimate durations)
+        self._timing_model = colrev.env.timing_model.TimingModel("dedupe")
+
     @classmethod
     def _dfs(cls, node: str, graph: dict, visited: dict, component: list) -> None:
         visited[node] = True
@@ -665,6 +673,45 @@ class Dedupe(colrev.process.operation.Operation):
         else:
             print()
 
+    def _print_estimated_time(self, *, nr_records: int) -> None:
+        if nr_records == 0:
+            return
+        endpoints = [
+            e["endpoint"]
+            for e in self.review_manager.settings.dedupe.dedupe_package_endpoints
+        ]
+        # Note : durations per record (the endpoints dedupe all records at once)
+        record_time, _ = self._timing_model.estimate(
+            "endpoints", endpoints, default=0.0  # type: ignore
+        )
+        if record_time == 0:
+            # Note : no timings of previous runs
+            return
+        self.review_manager.logger.info(
+            "Estimated time".ljust(38)
+            + str(timedelta(seconds=int(record_time * nr_records)))
+        )
+
+    def _run_endpoint(
+        self, *, endpoint: typing.Any, endpoint_name: str, nr_records: int
+    ) -> None:
+        throughput_monitor = colrev.env.timing_model.ThroughputMonitor(
+            nr_records=nr_records, timing_model=self._timing_model
+        )
+        start_time = time.monotonic()
+        endpoint.run_dedupe()
+        if nr_records == 0:
+            return
+        self._timing_model.add(
+            "endpoints",
+            endpoint_name,
+            (time.monotonic() - start_time) / nr_records,
+        )
+        throughput_monitor.record_completed(nr_records=nr_records)
+        self.review_manager.logger.info(
+            f"Throughput: {throughput_monitor.get_summary()}"
+        )
+
     @colrev.process.operation.Operation.decorate()
     def main(self, *, debug: bool = False) -> None:
         """Dedupe records (main entrypoint)."""
@@ -680,6 +727,18 @@ class Dedupe(colrev.process.operation.Operation):
         if not self.review_manager.high_level_operation:
             print()
 
+        records_headers = self.review_manager.dataset.load_records_dict(
+            header_only=True
+        )
+        nr_records = len(
+            [
+                x
+                for x in records_headers.values()
+                if x[Fields.STATUS] == RecordState.md_prepared
+            ]
+        )
+        self._print_estimated_time(nr_records=nr_records)
+
         package_manager = PackageManager()
         for (
             dedupe_package_endpoint
@@ -695,10 +754,16 @@ class Dedupe(colrev.process.operation.Operation):
                 dedupe_operation=self, settings=dedupe_package_endpoint
             )
 
-            endpoint.run_dedupe()  # type: ignore
+            self._run_endpoint(
+                endpoint=endpoint,
+                endpoint_name=dedupe_package_endpoint["endpoint"],
+                nr_records=nr_records,
+            )
             if not self.review_manager.high_level_operation:
                 print()
 
+        self._timing_model.save()
+
         dedupe_commit_id = self.review_manager.dataset.git_repo.repo.head.commit.hexsha
         self.review_manager.logger.info("To validate the changes, use")
 
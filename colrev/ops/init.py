@@ -23,6 +23,7 @@ import colrev.env.environment_manager
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
 import colrev.ops.check
+import colrev.ops.merge
 import colrev.review_manager
 import colrev.search_file
 import colrev.settings
@@ -329,6 +330,7 @@ class Initializer:
             colrev.env.utils.retrieve_package_file(
                 template_file=retrieval_path, target=target_path
             )
+        colrev.ops.merge.register_merge_driver(git.Repo(self.review_manager.path))
         files_dir_search_history = colrev.search_file.ExtendedSearchFile(
             platform="colrev.files_dir",
             search_results_path=Path("data/search/files.bib"),
@@ -3,10 +3,13 @@
 
 from __future__ import annotations
 
+import hashlib
 import itertools
+import json
 import re
 import shutil
 import string
+import typing
 from pathlib import Path
 
 import colrev.exceptions as colrev_exceptions
@@ -14,6 +17,7 @@ import colrev.loader.load_utils_formatter
 import colrev.package_manager.package_base_classes as base_classes
 import colrev.process.operation
 import colrev.record.record
+import colrev.search_file
 from colrev.constants import Colors
 from colrev.constants import EndpointType
 from colrev.constants import Fields
@@ -77,12 +81,20 @@ class Load(colrev.process.operation.Operation):
         ]
         return imported_origins
 
-    def ensure_append_only(self, filename: Path) -> None:
-        """Ensure that the file was only appended to.
+    def _get_committed_append_only_prefix(self, search_history_path: Path) -> dict:
+        git_repo = self.review_manager.dataset.git_repo.repo
+        try:
+            blob = git_repo.head.commit.tree / str(search_history_path).replace(
+                "\\", "/"
+            )
+            search_history = json.loads(blob.data_stream.read().decode("utf-8"))
+        except (KeyError, ValueError):
+            return {}
+        return search_history.get("append_only_prefix", {})
 
-        This method must be called for all packages that work
-        with an ex-post assignment of incremental IDs.
-        """
+    def _ensure_append_only_history(
+        self, filename: Path, current_contents: str
+    ) -> None:
         git_repo = self.review_manager.dataset.git_repo.repo
 
         # Ensure the path uses forward slashes, which is compatible with Git's path handling
@@ -101,13 +113,58 @@ class Load(colrev.process.operation.Operation):
                     f"{filename} was changed (commit: {commit})"
                 )
             prior_file_content = filecontents.decode("utf-8").replace("\r", "")
-        current_contents = filename.read_text(encoding="utf-8").replace("\r", "")
 
         if not current_contents.startswith(prior_file_content):
             raise colrev_exceptions.AppendOnlyViolation(
                 f"{filename} was changed (uncommitted file)"
             )
 
+    def ensure_append_only(
+        self,
+        filename: Path,
+        *,
+        search_source: typing.Optional[colrev.search_file.ExtendedSearchFile] = None,
+    ) -> None:
+        """Ensure that the file was only appended to.
+
+        This method must be called for all packages that work
+        with an ex-post assignment of incremental IDs.
+
+        If the search_source is passed, the length and hash of the (verified) file
+        are stored in its search history. Subsequent checks only compare the
+        current file with the prefix hash of the last commit
+        (instead of replaying the history of the file).
+        """
+        current_bytes = filename.read_bytes().replace(b"\r", b"")
+
+        if search_source is not None:
+            search_history_path = search_source.get_search_history_path()
+        else:
+            search_history_path = filename.with_name(
+                filename.stem + "_search_history.json"
+            )
+        append_only_prefix = self._get_committed_append_only_prefix(search_history_path)
+        if append_only_prefix:
+            prefix_length = append_only_prefix["length"]
+            if (
+                len(current_bytes) < prefix_length
+                or hashlib.sha256(current_bytes[:prefix_length]).hexdigest()
+                != append_only_prefix["sha256"]
+            ):
+                raise colrev_exceptions.AppendOnlyViolation(
+                    f"{filename} was changed (prefix hash mismatch)"
+                )
+        else:
+            self._ensure_append_only_history(filename, current_bytes.decode("utf-8"))
+
+        if search_source is not None:
+            # pylint: disable=attribute-defined-outside-init
+            search_source.append_only_prefix = {
+                "length": len(current_bytes),
+                "sha256": hashlib.sha256(current_bytes).hexdigest(),
+            }
+            search_source.save(git_repo=self.review_manager.dataset.git_repo)
+
     def _import_provenance(
         self,
         record: colrev.record.record.Record,
@@ -332,7 +389,10 @@ class Load(colrev.process.operation.Operation):
             self._rename_erroneous_extensions(source)
 
         if source.ensure_append_only(filename=source.search_source.search_results_path):
-            self.ensure_append_only(filename=source.search_source.search_results_path)
+            self.ensure_append_only(
+                filename=source.search_source.search_results_path,
+                search_source=source.search_source,
+            )
 
         source_records = source.load()
         source_records_list = list(source_records.values())  # type: ignore
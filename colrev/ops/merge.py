@@ -4,18 +4,278 @@
 from __future__ import annotations
 
 import copy
+import logging
+import os
+import re
+import tempfile
+import typing
+from pathlib import Path
 
 from dictdiffer import diff
 from git.exc import GitCommandError
 
+import colrev.loader.load_utils
 import colrev.process.operation
 import colrev.utils
+import colrev.writer.bib
 from colrev.constants import Colors
 from colrev.constants import Fields
 from colrev.constants import OperationsType
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import git
+
 # pylint: disable=too-few-public-methods
 
+MERGE_DRIVER_NAME = "colrev-records"
+_ENTRY_ID_PATTERN = re.compile(r"^@[^{]+\{([^,\s]+)")
+
+# Note : the merge driver is registered for data/records.bib (.gitattributes)
+# git calls it with the common ancestor (%O), the own version (%A, which
+# receives the result) and the other version (%B).
+# Records are merged by ID in a single pass over the three (sorted) files.
+# Only records that were changed in both branches are parsed and merged
+# field-by-field, using the common ancestor as the base.
+
+
+def _read_entries(path: Path) -> typing.Iterator[typing.Tuple[str, str]]:
+    """Read the (ID, entry) pairs of a bib file (streaming)."""
+    record_id, lines = "", []  # type: ignore
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.startswith("@"):
+                if record_id:
+                    yield record_id, "".join(lines).rstrip("\n") + "\n"
+                match = _ENTRY_ID_PATTERN.match(line)
+                if not match:
+                    raise ValueError(f"Invalid entry header: {line}")
+                record_id, lines = match.group(1), []
+            if record_id:
+                lines.append(line)
+    if record_id:
+        yield record_id, "".join(lines).rstrip("\n") + "\n"
+
+
+def _iter_sorted_entries(path: Path) -> typing.Iterator[typing.Tuple[str, str]]:
+    previous_id = ""
+    for record_id, entry in _read_entries(path):
+        if record_id <= previous_id:
+            raise ValueError(f"Records not sorted by ID: {path}")
+        previous_id = record_id
+        yield record_id, entry
+
+
+def _align_entries(
+    *paths: Path,
+) -> typing.Iterator[typing.Tuple[str, typing.List[typing.Optional[str]]]]:
+    """Yield the entries of the three versions for each ID (merge join)."""
+    iterators = [_iter_sorted_entries(path) for path in paths]
+    heads = [next(iterator, None) for iterator in iterators]
+    while any(head is not None for head in heads):
+        record_id = min(head[0] for head in heads if head is not None)
+        entries: typing.List[typing.Optional[str]] = []
+        for position, head in enumerate(heads):
+            if head is not None and head[0] == record_id:
+                entries.append(head[1])
+                heads[position] = next(iterators[position], None)
+            else:
+                entries.append(None)
+        yield record_id, entries
+
+
+def _align_entries_in_memory(
+    *paths: Path,
+) -> typing.Iterator[typing.Tuple[str, typing.List[typing.Optional[str]]]]:
+    """Fallback for files that are not sorted by ID."""
+    versions = [dict(_read_entries(path)) for path in paths]
+    for record_id in sorted(set().union(*versions)):
+        yield record_id, [version.get(record_id) for version in versions]
+
+
+def _parse_entry(entry: typing.Optional[str]) -> dict:
+    if entry is None:
+        return {}
+    records = colrev.loader.load_utils.loads(
+        load_string=entry,
+        implementation="bib",
+        logger=logging.getLogger(__name__),
+    )
+    return next(iter(records.values()))
+
+
+def _merge_values(
+    *,
+    key: str,
+    base: typing.Any,
+    ours: typing.Any,
+    theirs: typing.Any,
+    conflicts: typing.List[str],
+) -> typing.Tuple[typing.Any, typing.Any]:
+    """Merge a field (returns the values for ours and theirs)."""
+    if theirs in (ours, base):
+        return ours, ours
+    if ours == base:
+        return theirs, theirs
+    if isinstance(ours, dict) and isinstance(theirs, dict):
+        # e.g., provenance (merged per field)
+        base = base if isinstance(base, dict) else {}
+        merged_ours, merged_theirs = _merge_dicts(
+            base=base, ours=ours, theirs=theirs, conflicts=conflicts, prefix=f"{key}."
+        )
+        return merged_ours, merged_theirs
+    if key == Fields.ORIGIN and isinstance(ours, list) and isinstance(theirs, list):
+        base_origins = set(base or [])
+        merged = sorted(
+            (set(ours) | set(theirs))
+            - ((base_origins - set(ours)) | (base_origins - set(theirs)))
+        )
+        return merged, merged
+    conflicts.append(key)
+    return ours, theirs
+
+
+def _merge_dicts(
+    *,
+    base: dict,
+    ours: dict,
+    theirs: dict,
+    conflicts: typing.List[str],
+    prefix: str = "",
+) -> typing.Tuple[dict, dict]:
+    merged_ours, merged_theirs = {}, {}
+    for key in list(dict.fromkeys([*ours, *theirs, *base])):
+        value_ours, value_theirs = _merge_values(
+            key=f"{prefix}{key}",
+            base=base.get(key),
+            ours=ours.get(key),
+            theirs=theirs.get(key),
+            conflicts=conflicts,
+        )
+        if value_ours is not None:
+            merged_ours[key] = value_ours
+        if value_theirs is not None:
+            merged_theirs[key] = value_theirs
+    return merged_ours, merged_theirs
+
+
+def _format_conflict(ours: str, theirs: str) -> str:
+    return f"<<<<<<< ours\n{ours}=======\n{theirs}>>>>>>> theirs\n"
+
+
+def _merge_entry(
+    *,
+    record_id: str,
+    base: typing.Optional[str],
+    ours: typing.Optional[str],
+    theirs: typing.Optional[str],
+) -> typing.Tuple[typing.Optional[str], bool]:
+    """Three-way merge of an entry (returns the entry and whether it conflicts)."""
+    if theirs in (ours, base):
+        return ours, False
+    if ours == base:
+        return theirs, False
+    if ours is None or theirs is None:
+        # Removed in one branch and changed in the other
+        return _format_conflict(ours or "", theirs or ""), True
+
+    conflicts: typing.List[str] = []
+    merged_ours, merged_theirs = _merge_dicts(
+        base=_parse_entry(base),
+        ours=_parse_entry(ours),
+        theirs=_parse_entry(theirs),
+        conflicts=conflicts,
+    )
+    entry_ours = colrev.writer.bib.to_string(records_dict={record_id: merged_ours})
+    if not conflicts:
+        return entry_ours, False
+    entry_theirs = colrev.writer.bib.to_string(records_dict={record_id: merged_theirs})
+    return _format_conflict(entry_ours, entry_theirs), True
+
+
+def _write_merged_entries(
+    file: typing.TextIO,
+    *,
+    aligned_entries: typing.Iterator[
+        typing.Tuple[str, typing.List[typing.Optional[str]]]
+    ],
+) -> typing.List[str]:
+    conflicting_ids = []
+    first = True
+    for record_id, (base, ours, theirs) in aligned_entries:
+        entry, conflict = _merge_entry(
+            record_id=record_id, base=base, ours=ours, theirs=theirs
+        )
+        if conflict:
+            conflicting_ids.append(record_id)
+        if entry is None:
+            continue
+        if not first:
+            file.write("\n")
+        first = False
+        file.write(entry)
+    return conflicting_ids
+
+
+def merge_records_files(
+    *,
+    base_path: Path,
+    ours_path: Path,
+    theirs_path: Path,
+    target_path: typing.Optional[Path] = None,
+) -> typing.List[str]:
+    """Merge three versions of a records file (record-level, three-way).
+
+    The result is written to target_path (default: ours_path).
+    Returns the IDs of records with conflicting changes
+    (marked with conflict markers in the result).
+    """
+    target_path = target_path or ours_path
+    paths = (base_path, ours_path, theirs_path)
+
+    fd, tmp_name = tempfile.mkstemp(dir=target_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as file:
+            try:
+                conflicting_ids = _write_merged_entries(
+                    file, aligned_entries=_align_entries(*paths)
+                )
+            except ValueError:
+                # Records are not sorted by ID (e.g., edited manually)
+                file.seek(0)
+                file.truncate()
+                conflicting_ids = _write_merged_entries(
+                    file, aligned_entries=_align_entries_in_memory(*paths)
+                )
+        os.replace(tmp_name, target_path)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+    return conflicting_ids
+
+
+def register_merge_driver(git_repo: git.Repo) -> None:
+    """Register the record-level merge driver for data/records.bib."""
+    with git_repo.config_writer() as config:
+        section = f'merge "{MERGE_DRIVER_NAME}"'
+        config.set_value(section, "name", "CoLRev record-level merge")
+        config.set_value(section, "driver", "colrev-hooks-merge %O %A %B")
+
+    attribute = f"data/records.bib merge={MERGE_DRIVER_NAME}"
+    gitattributes = Path(git_repo.working_dir) / Path(".gitattributes")
+    if gitattributes.is_file() and attribute in gitattributes.read_text(
+        encoding="utf-8"
+    ):
+        return
+    # Note : projects created before the driver was available
+    # register it locally (without changing the shared .gitattributes)
+    info_attributes = Path(git_repo.git_dir) / Path("info/attributes")
+    if info_attributes.is_file() and attribute in info_attributes.read_text(
+        encoding="utf-8"
+    ):
+        return
+    info_attributes.parent.mkdir(exist_ok=True, parents=True)
+    with open(info_attributes, "a", encoding="utf-8") as file:
+        file.write(f"{attribute}\n")
+
 
 class Merge(colrev.process.operation.Operation):
     """Merge branches of CoLRev project."""
@@ -90,6 +350,7 @@ class Merge(colrev.process.operation.Operation):
         """Merge branches of a CoLRev project (main entrypoint)."""
         # pylint: disable=too-many-locals
         # pylint: disable=too-many-statements
+        # pylint: disable=too-many-branches
 
         git_repo = self.review_manager.dataset.git_repo.repo
         # our_index  = git_repo.index
@@ -97,6 +358,8 @@ class Merge(colrev.process.operation.Operation):
         for remote in git_repo.remotes:
             remote.fetch()
 
+        register_merge_driver(git_repo)
+
         branches = git_repo.heads
         if branch not in [b.name for b in branches]:
             raise ValueError(f"Branch does not exist: {branch!r}")
@@ -0,0 +1,99 @@
+#! /usr/bin/env python
+"""Catalogue of the PDFs in data/pdfs (relative path to colrev_pdf_id)."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import typing
+from pathlib import Path
+
+import colrev.env.utils
+import colrev.exceptions as colrev_exceptions
+import colrev.record.record_pdf
+
+CATALOGUE_PATH = Path(".colrev/pdf_cpid_catalogue.json")
+
+# Note : computing the colrev_pdf_id requires reading (and rendering) each PDF.
+# The catalogue stores the cpid with the size and mtime of each file so that
+# only new or modified files are processed. Directory mtimes are not sufficient
+# because PDFs may be replaced in place (e.g., by pdf-prep).
+
+
+class PDFCatalogue:
+    """Persisted (incrementally updated) catalogue of PDF paths and cpids."""
+
+    def __init__(
+        self, *, pdf_dir: Path, home_path: Path, logger: logging.Logger
+    ) -> None:
+        """Initialize the instance."""
+        self.pdf_dir = pdf_dir
+        self.home_path = home_path
+        self.logger = logger
+        self.path = home_path / CATALOGUE_PATH
+        self._entries: typing.Dict[str, dict] = {}
+
+    def _load(self) -> None:
+        try:
+            self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            self._entries = {}
+
+    def _save(self) -> None:
+        try:
+            colrev.env.utils.atomic_write_json(self.path, self._entries)
+        except OSError:
+            pass
+
+    def _scan(self, directory: Path) -> typing.Iterator[os.DirEntry]:
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._scan(Path(entry.path))
+            elif entry.name.endswith(".pdf"):
+                yield entry
+
+    def update(self) -> typing.Dict[str, str]:
+        """Update the catalogue (new or modified PDFs) and return {path: cpid}."""
+        self._load()
+        entries: typing.Dict[str, dict] = {}
+        nr_updated = 0
+        for dir_entry in self._scan(self.pdf_dir):
+            relative_path = str(Path(dir_entry.path).relative_to(self.home_path))
+            try:
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+            entry = self._entries.get(relative_path, {})
+            if (
+                entry.get("mtime") == stat.st_mtime_ns
+                and entry.get("size") == stat.st_size
+            ):
+                entries[relative_path] = entry
+                continue
+            try:
+                cpid = colrev.record.record_pdf.PDFRecord.get_colrev_pdf_id(
+                    Path(dir_entry.path)
+                )
+            except colrev_exceptions.InvalidPDFException:
+                continue
+            entries[relative_path] = {
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "cpid": cpid,
+            }
+            nr_updated += 1
+
+        if nr_updated or len(entries) != len(self._entries):
+            self.logger.info(f"Calculated CPIDs of {nr_updated} PDF file(s)")
+            self._entries = entries
+            self._save()
+        return {path: entry["cpid"] for path, entry in entries.items()}
+
+    def get_paths_by_cpid(self) -> typing.Dict[str, Path]:
+        """Get the (relative) paths of the PDFs by cpid."""
+        return {cpid: Path(path) for path, cpid in sorted(self.update().items())}
@@ -5,19 +5,28 @@ from __future__ import annotations
 
 import logging
 import shutil
+import time
 import typing
+from datetime import timedelta
 from glob import glob
 from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
+from rapidfuzz import fuzz
+
 import colrev.env.tei_parser
+import colrev.env.timing_model
 import colrev.exceptions as colrev_exceptions
+import colrev.ops.pdf_catalogue
 import colrev.process.operation
+import colrev.record.record
+import colrev.record.record_blocking
 import colrev.record.record_pdf
 from colrev import utils
 from colrev.constants import Colors
 from colrev.constants import EndpointType
 from colrev.constants import Fields
+from colrev.constants import FieldsRegex
 from colrev.constants import OperationsType
 from colrev.constants import PDFPathType
 from colrev.constants import RecordState
@@ -47,8 +56,7 @@ def relink_pdfs_in_source(
         filename=source.search_results_path,
         logger=logger,
     )
-    source_records = list(source_records_dict.values())
-    if len(source_records) == 0:
+    if len(source_records_dict) == 0:
         logger.info("No records to relink")
         return
 
@@ -59,7 +67,7 @@ def relink_pdfs_in_source(
         pdf_candidates = _relink_pdf_record(
             source=source,
             record=record,
-            source_records=source_records,
+            source_records=source_records_dict,
             corresponding_origin=corresponding_origin,
             home_path=home_path,
             logger=logger,
@@ -68,45 +76,36 @@ def relink_pdfs_in_source(
         )
 
     logger.info("Relinking completed. Save results.")
-    source_records_dict = {r[Fields.ID]: r for r in source_records}
     write_file(records_dict=source_records_dict, filename=source.search_results_path)
 
 
 def _get_source_record(
-    *, record: dict, source_records: list[dict], corresponding_origin: str
+    *, record: dict, source_records: dict[str, dict], corresponding_origin: str
 ) -> dict:
-    source_rec: dict = {}
     if corresponding_origin == "":
-        return source_rec
+        return {}
     source_origin_l = [o for o in record[Fields.ORIGIN] if corresponding_origin in o]
     if len(source_origin_l) != 1:
-        return source_rec
+        return {}
     source_origin = source_origin_l[0].replace(f"{corresponding_origin}/", "")
-    source_rec_l = [s for s in source_records if s[Fields.ID] == source_origin]
-    if len(source_rec_l) == 1:
-        source_rec = source_rec_l[0]
-    return source_rec
+    return source_records.get(source_origin, {})
 
 
 def _get_pdf_candidates(
     *, pdf_dir: Path, home_path: Path, logger: logging.Logger
 ) -> dict:
     logger.info("Calculate CPIDs to link PDF file(s)")
-    candidates: dict[str, Path] = {}
-    for pdf_candidate in pdf_dir.glob("**/*.pdf"):
-        colrev_pdf_id = colrev.record.record_pdf.PDFRecord.get_colrev_pdf_id(
-            pdf_candidate
-        )
-        relative_path = pdf_candidate.relative_to(home_path)
-        candidates[colrev_pdf_id] = relative_path
-    return candidates
+    # Note : cpids are only calculated for new or modified PDFs
+    return colrev.ops.pdf_catalogue.PDFCatalogue(
+        pdf_dir=pdf_dir, home_path=home_path, logger=logger
+    ).get_paths_by_cpid()
 
 
 def _relink_pdf_record(
     *,
     source: colrev.search_file.ExtendedSearchFile,
     record: dict,
-    source_records: list[dict],
+    source_records: dict[str, dict],
     corresponding_origin: str,
     home_path: Path,
     logger: logging.Logger,
@@ -128,23 +127,6 @@ def _relink_pdf_record(
             f"Primary record ({record[Fields.ID]}): "
             f"Broken file path {Colors.RED}{record[Fields.FILE]}{Colors.END}"
         )
-    if Fields.FILE not in source_rec:
-        logger.warning(f"Missing file in {source_rec}")
-        return pdf_candidates
-    source_file_exists = (home_path / Path(source_rec[Fields.FILE])).is_file()
-    if not source_file_exists:
-        logger.info(
-            f"Source record ({source.search_results_path}{source_rec[Fields.ID]}) "
-            f"of {record[Fields.ID]}: Broken file path {Colors.RED}{source_rec[Fields.FILE]}{Colors.END}"
-        )
-    if primary_file_exists and source_file_exists:
-        if record[Fields.FILE] != source_rec[Fields.FILE]:
-            logger.warning(
-                f"{Colors.ORANGE}Source record has {source_rec[Fields.FILE]} "
-                f"but primary record has {record[Fields.FILE]} (both exist) "
-                f"- Resolve manually.{Colors.END}"
-            )
-        return pdf_candidates
     if not source_rec and not primary_file_exists:
         if not pdf_candidates:
             pdf_candidates = _get_pdf_candidates(
@@ -163,6 +145,23 @@ def _relink_pdf_record(
                 f"{Colors.RED}- Primary record: Did not find the PDF file based on CPID.{Colors.END}"
             )
         return pdf_candidates
+    if Fields.FILE not in source_rec:
+        logger.warning(f"Missing file in {source_rec}")
+        return pdf_candidates
+    source_file_exists = (home_path / Path(source_rec[Fields.FILE])).is_file()
+    if not source_file_exists:
+        logger.info(
+            f"Source record ({source.search_results_path}{source_rec[Fields.ID]}) "
+            f"of {record[Fields.ID]}: Broken file path {Colors.RED}{source_rec[Fields.FILE]}{Colors.END}"
+        )
+    if primary_file_exists and source_file_exists:
+        if record[Fields.FILE] != source_rec[Fields.FILE]:
+            logger.warning(
+                f"{Colors.ORANGE}Source record has {source_rec[Fields.FILE]} "
+                f"but primary record has {record[Fields.FILE]} (both exist) "
+                f"- Resolve manually.{Colors.END}"
+            )
+        return pdf_candidates
     id_named_pdf = "data/pdfs/" + record[Fields.ID] + ".pdf"
     if not primary_file_exists and (home_path / Path(id_named_pdf)).is_file():
         logger.info(
@@ -188,6 +187,8 @@ def _relink_pdf_record(
 class PDFGet(colrev.process.operation.Operation):
     """Get the PDFs."""
 
+    # pylint: disable=too-many-instance-attributes
+
     to_retrieve: int
     retrieved: int
     not_retrieved: int
@@ -208,6 +209,13 @@ class PDFGet(colrev.process.operation.Operation):
         )
 
         self.package_manager = PackageManager()
+        self.cpus = 4
+
+        # Note : timings of previous runs (to estimate durations)
+        self._timing_model = colrev.env.timing_model.TimingModel("pdf_get")
+        self._throughput_monitor: typing.Optional[
+            colrev.env.timing_model.ThroughputMonitor
+        ] = None
 
         pdf_dir = self.review_manager.paths.pdf
         pdf_dir.mkdir(exist_ok=True, parents=True)
@@ -355,6 +363,7 @@ class PDFGet(colrev.process.operation.Operation):
             record_dict, path=self.review_manager.path
         )
 
+        record_start_time = time.monotonic()
         for (
             pdf_get_package_endpoint
         ) in self.review_manager.settings.pdf_get.pdf_get_package_endpoints:
@@ -367,7 +376,13 @@ class PDFGet(colrev.process.operation.Operation):
                 pdf_get_operation=self, settings=pdf_get_package_endpoint
             )
 
+            start_time = time.monotonic()
             endpoint.get_pdf(record)  # type: ignore
+            self._timing_model.add(
+                "endpoints",
+                pdf_get_package_endpoint["endpoint"],
+                time.monotonic() - start_time,
+            )
 
             if Fields.FILE in record.data:
                 self.review_manager.report_logger.info(
@@ -384,8 +399,28 @@ class PDFGet(colrev.process.operation.Operation):
 
         self._log_infos(record)
 
+        self._timing_model.add(
+            "records", "pdf_get", time.monotonic() - record_start_time
+        )
+        if self._throughput_monitor:
+            summary = self._throughput_monitor.record_completed()
+            if summary:
+                self.review_manager.logger.info(f"Throughput: {summary}")
+
         return record.get_data()
 
+    def _print_estimated_time(self, *, nr_tasks: int) -> None:
+        # Note : endpoints are skipped once a PDF is retrieved
+        # (the estimate is based on the durations per record)
+        record_time = self._timing_model.mean("records", "pdf_get")
+        if nr_tasks == 0 or not record_time:
+            # Note : no timings of previous runs
+            return
+        self.review_manager.logger.info(
+            "Estimated time".ljust(38)
+            + str(timedelta(seconds=int(record_time * nr_tasks / self.cpus)))
+        )
+
     def _fix_broken_symlinks(self) -> None:
 
         pdf_dir = self.review_manager.paths.pdf
@@ -431,16 +466,98 @@ class PDFGet(colrev.process.operation.Operation):
 
         self.review_manager.create_commit(msg="Relink PDFs")
 
+    def _match_unlinked_pdf_cheaply(
+        self,
+        *,
+        file: Path,
+        records: dict,
+        blocking_index: colrev.record.record_blocking.RecordBlockingIndex,
+    ) -> typing.Optional[dict]:
+        """Match based on the DOI (first page) or the embedded PDF metadata."""
+        pdf_record = colrev.record.record_pdf.PDFRecord(
+            {Fields.FILE: str(file)}, path=self.review_manager.path
+        )
+        try:
+            first_page_text = pdf_record.extract_text_by_page(pages=[0])
+            embedded_metadata = pdf_record.get_embedded_metadata()
+        except (colrev_exceptions.InvalidPDFException, RuntimeError, ValueError):
+            return None
+
+        # DOI printed on the first page (confirmed by the title tokens)
+        first_page_tokens = colrev.record.record_blocking.get_title_tokens(
+            first_page_text
+        )
+        for doi in dict.fromkeys(FieldsRegex.DOI.findall(first_page_text)):
+            candidate_ids = blocking_index.get_ids_by_doi(doi)
+            if len(candidate_ids) != 1:
+                continue
+            candidate_id = candidate_ids.pop()
+            title_tokens = blocking_index.title_tokens[candidate_id]
+            if not title_tokens:
+                continue
+            if len(title_tokens & first_page_tokens) / len(title_tokens) >= 0.7:
+                return records[candidate_id]
+
+        # Title embedded in the PDF metadata
+        if Fields.TITLE in embedded_metadata:
+            embedded_title = " ".join(
+                sorted(
+                    colrev.record.record_blocking.get_title_tokens(
+                        embedded_metadata[Fields.TITLE]
+                    )
+                )
+            )
+            matching_ids = [
+                candidate_id
+                for candidate_id in blocking_index.get_candidates(embedded_metadata)
+                if fuzz.ratio(
+                    embedded_title,
+                    " ".join(sorted(blocking_index.title_tokens[candidate_id])),
+                )
+                >= 95
+            ]
+            if len(matching_ids) == 1:
+                return records[matching_ids[0]]
+
+        return None
+
+    def _match_unlinked_pdf_grobid(
+        self,
+        *,
+        file: Path,
+        records: dict,
+        blocking_index: colrev.record.record_blocking.RecordBlockingIndex,
+    ) -> typing.Optional[dict]:
+        """Match based on the metadata extracted by GROBID (ambiguous cases)."""
+        tei = colrev.env.tei_parser.TEIParser(pdf_path=file)
+        pdf_record = tei.get_metadata()
+
+        if "error" in pdf_record:
+            return None
+
+        candidate_ids = list(blocking_index.get_candidates(pdf_record))
+        if not candidate_ids:
+            return None
+        # Note : one-vs-many comparison (normalized records are cached)
+        similarities = colrev.record.record.Record.get_record_similarities(
+            [colrev.record.record.Record(pdf_record)],
+            [colrev.record.record.Record(records[c]) for c in candidate_ids],
+        )[0]
+        max_index = int(similarities.argmax())
+        if similarities[max_index] > 0.5:
+            return records[candidate_ids[max_index]]
+        return None
+
     def check_existing_unlinked_pdfs(
         self,
         records: dict,
     ) -> dict[str, dict[str, typing.Any]]:
         """Check for PDFs that are in the pdfs directory but not linked in the record file."""
-        linked_pdfs = [
+        linked_pdfs = {
             str(Path(x[Fields.FILE]).resolve())
             for x in records.values()
             if Fields.FILE in x
-        ]
+        }
         pdf_dir = self.review_manager.paths.pdf
         pdf_files = glob(str(pdf_dir) + "/**.pdf", recursive=True)
         unlinked_pdfs = [
@@ -454,68 +571,50 @@ class PDFGet(colrev.process.operation.Operation):
             return records
 
         self.review_manager.logger.info("Check unlinked PDFs")
+        # Note : the blocking index is computed once. Candidates are retrieved
+        # cheaply (DOI on the first page, embedded metadata) and GROBID
+        # is only called for PDFs that cannot be matched otherwise.
+        blocking_index = colrev.record.record_blocking.RecordBlockingIndex(records)
         for file in unlinked_pdfs:
             msg = f"Check unlinked PDF: {file.relative_to(self.review_manager.path)}"
             self.review_manager.logger.info(msg)
-            if file.stem not in records.keys():
-                tei = colrev.env.tei_parser.TEIParser(pdf_path=file)
-                pdf_record = tei.get_metadata()
-
-                if "error" in pdf_record:
-                    continue
-
-                max_similarity = 0.0
-                max_sim_record = None
-                for record in records.values():
-                    sim = colrev.record.record_pdf.PDFRecord.get_record_similarity(
-                        colrev.record.record_pdf.PDFRecord(
-                            pdf_record, path=self.review_manager.path
-                        ),
-                        colrev.record.record_pdf.PDFRecord(
-                            record.copy(), path=self.review_manager.path
-                        ),
-                    )
-                    if sim > max_similarity:
-                        max_similarity = sim
-                        max_sim_record = record
-                if max_sim_record:
-                    if max_similarity > 0.5:
-                        if RecordState.pdf_prepared == max_sim_record[Fields.STATUS]:
-                            continue
-
-                        record = colrev.record.record_pdf.PDFRecord(
-                            max_sim_record, path=self.review_manager.path
-                        )
-                        record.update_field(
-                            key=Fields.FILE,
-                            value=str(file),
-                            source="linking-available-files",
-                        )
-                        self.import_pdf(record)
-                        if (
-                            RecordState.rev_prescreen_included
-                            == record.data[Fields.STATUS]
-                        ):
-                            record.set_status(RecordState.pdf_imported)
-
-                        self.review_manager.report_logger.info(
-                            "linked unlinked pdf:" f" {file.name}"
-                        )
-                        self.review_manager.logger.info(
-                            "linked unlinked pdf:" f" {file.name}"
-                        )
-                        # max_sim_record = \
-                        #     pdf_prep.validate_pdf_metadata(max_sim_record)
-                        # colrev_status = max_sim_record['colrev_status']
-                        # if RecordState.pdf_needs_manual_preparation == colrev_status:
-                        #     # revert?
-            else:
+            if file.stem in records.keys():
                 record = records[file.stem]
                 self.link_pdf(
                     colrev.record.record_pdf.PDFRecord(
                         record, path=self.review_manager.path
                     )
                 )
+                continue
+
+            max_sim_record = self._match_unlinked_pdf_cheaply(
+                file=file, records=records, blocking_index=blocking_index
+            )
+            if max_sim_record is None:
+                max_sim_record = self._match_unlinked_pdf_grobid(
+                    file=file, records=records, blocking_index=blocking_index
+                )
+            if max_sim_record is None:
+                continue
+            if RecordState.pdf_prepared == max_sim_record[Fields.STATUS]:
+                continue
+
+            record = colrev.record.record_pdf.PDFRecord(
+                max_sim_record, path=self.review_manager.path
+            )
+            record.update_field(
+                key=Fields.FILE,
+                value=str(file),
+                source="linking-available-files",
+            )
+            self.import_pdf(record)
+            if RecordState.rev_prescreen_included == record.data[Fields.STATUS]:
+                record.set_status(RecordState.pdf_imported)
+
+            self.review_manager.report_logger.info(
+                "linked unlinked pdf:" f" {file.name}"
+            )
+            self.review_manager.logger.info("linked unlinked pdf:" f" {file.name}")
 
         self.review_manager.dataset.save_records_dict(records)
 
@@ -749,10 +848,16 @@ class PDFGet(colrev.process.operation.Operation):
                 "PDFs to get".ljust(38) + f'{pdf_get_data["nr_tasks"]} PDFs'
             )
 
-            pool = Pool(4)
+            self._print_estimated_time(nr_tasks=pdf_get_data["nr_tasks"])
+            self._throughput_monitor = colrev.env.timing_model.ThroughputMonitor(
+                nr_records=pdf_get_data["nr_tasks"], timing_model=self._timing_model
+            )
+
+            pool = Pool(self.cpus)
             retrieved_record_list = pool.map(self.get_pdf, pdf_get_data["items"])
             pool.close()
             pool.join()
+            self._timing_model.save()
 
             self.review_manager.dataset.save_records_dict(
                 {r[Fields.ID]: r for r in retrieved_record_list}, partial=True
@@ -6,13 +6,18 @@ from __future__ import annotations
 import multiprocessing as mp
 import os
 import shutil
+import time
+import typing
+from datetime import timedelta
 from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
 import pymupdf
 import requests
 
+import colrev.env.timing_model
 import colrev.exceptions as colrev_exceptions
+import colrev.ops.prep_shards
 import colrev.packages.grobid_tei.src.grobid_tei
 import colrev.process.operation
 import colrev.record.record_pdf
@@ -28,6 +33,8 @@ from colrev.package_manager.package_manager import PackageManager
 class PDFPrep(colrev.process.operation.Operation):
     """Prepare PDFs."""
 
+    # pylint: disable=too-many-instance-attributes
+
     to_prepare: int
     pdf_prepared: int
     not_prepared: int
@@ -36,6 +43,9 @@ class PDFPrep(colrev.process.operation.Operation):
 
     type = OperationsType.pdf_prep
 
+    _shard: typing.Optional[typing.Tuple[int, int]] = None
+    _previous_branch = ""
+
     def __init__(
         self,
         *,
@@ -56,6 +66,12 @@ class PDFPrep(colrev.process.operation.Operation):
 
         self.pdf_qm = self.review_manager.get_pdf_qm()
 
+        # Note : timings of previous runs (to estimate durations)
+        self._timing_model = colrev.env.timing_model.TimingModel("pdf_prep")
+        self._throughput_monitor: typing.Optional[
+            colrev.env.timing_model.ThroughputMonitor
+        ] = None
+
     def _complete_successful_pdf_prep(
         self, *, record: colrev.record.record.Record, original_filename: str
     ) -> None:
@@ -116,43 +132,9 @@ class PDFPrep(colrev.process.operation.Operation):
                         ):
                             os.remove(fpath)
 
-    # Note : no named arguments (multiprocessing)
-    def prepare_pdf(self, item: dict) -> dict:
-        """Prepare a PDF (based on package_endpoints in the settings)."""
-        record_dict = item["record"]
-
-        if (
-            RecordState.pdf_imported != record_dict[Fields.STATUS]
-            or Fields.FILE not in record_dict
-        ):
-            return record_dict
-
-        pad = 50
-
-        pdf_path = self.review_manager.path / Path(record_dict[Fields.FILE])
-        if not Path(pdf_path).is_file():
-            self.review_manager.logger.error(
-                f"{record_dict[Fields.ID]}".ljust(46, " ")
-                + "Linked file/pdf does not exist"
-            )
-            return record_dict
-
-        record = colrev.record.record_pdf.PDFRecord(
-            record_dict, path=self.review_manager.path
-        )
-        if record_dict[Fields.FILE].endswith(".pdf"):
-            try:
-                record.set_text_from_pdf(first_pages=True)
-            except pymupdf.FileDataError:
-                record_dict[Fields.STATUS] = RecordState.pdf_needs_manual_preparation
-                return record_dict
-
-        original_filename = record_dict[Fields.FILE]
-
-        self.review_manager.logger.debug(f"Start PDF prep of {record_dict[Fields.ID]}")
-        # Note: if there are problems
-        # colrev_status is set to pdf_needs_manual_preparation
-        # if it remains 'imported', all preparation checks have passed
+    def _run_pdf_prep_endpoints(
+        self, record: colrev.record.record_pdf.PDFRecord, pad: int
+    ) -> typing.Tuple[colrev.record.record_pdf.PDFRecord, typing.List[str]]:
         detailed_msgs = []
         for (
             pdf_prep_package_endpoint
@@ -175,7 +157,13 @@ class PDFPrep(colrev.process.operation.Operation):
                     msg.ljust(50, " ") + "called"  # type: ignore
                 )
 
+                start_time = time.monotonic()
                 record = endpoint.prep_pdf(record, pad)
+                self._timing_model.add(
+                    "endpoints",
+                    pdf_prep_package_endpoint["endpoint"],
+                    time.monotonic() - start_time,
+                )
             except colrev_exceptions.PDFHashError:
                 record.add_field_provenance_note(key=Fields.FILE, note="pdf-hash-error")
 
@@ -202,6 +190,46 @@ class PDFPrep(colrev.process.operation.Operation):
             # Note: if we break, the teis will not be generated.
             # if failed:
             #     break
+        return record, detailed_msgs
+
+    # Note : no named arguments (multiprocessing)
+    def prepare_pdf(self, item: dict) -> dict:
+        """Prepare a PDF (based on package_endpoints in the settings)."""
+        record_dict = item["record"]
+
+        if (
+            RecordState.pdf_imported != record_dict[Fields.STATUS]
+            or Fields.FILE not in record_dict
+        ):
+            return record_dict
+
+        pad = 50
+
+        pdf_path = self.review_manager.path / Path(record_dict[Fields.FILE])
+        if not Path(pdf_path).is_file():
+            self.review_manager.logger.error(
+                f"{record_dict[Fields.ID]}".ljust(46, " ")
+                + "Linked file/pdf does not exist"
+            )
+            return record_dict
+
+        record = colrev.record.record_pdf.PDFRecord(
+            record_dict, path=self.review_manager.path
+        )
+        if record_dict[Fields.FILE].endswith(".pdf"):
+            try:
+                record.set_text_from_pdf(first_pages=True)
+            except pymupdf.FileDataError:
+                record_dict[Fields.STATUS] = RecordState.pdf_needs_manual_preparation
+                return record_dict
+
+        original_filename = record_dict[Fields.FILE]
+
+        self.review_manager.logger.debug(f"Start PDF prep of {record_dict[Fields.ID]}")
+        # Note: if there are problems
+        # colrev_status is set to pdf_needs_manual_preparation
+        # if it remains 'imported', all preparation checks have passed
+        record, detailed_msgs = self._run_pdf_prep_endpoints(record, pad)
 
         record.run_pdf_quality_model(self.pdf_qm, set_prepared=True)
 
@@ -236,13 +264,49 @@ class PDFPrep(colrev.process.operation.Operation):
         record.data.pop(Fields.TEXT_FROM_PDF, None)
         record.data.pop(Fields.NR_PAGES_IN_FILE, None)
 
+        if self._throughput_monitor:
+            summary = self._throughput_monitor.record_completed()
+            if summary:
+                self.review_manager.logger.info(f"Throughput: {summary}")
+
         return record.get_data()
 
+    def _print_estimated_time(self, *, nr_tasks: int) -> None:
+        if nr_tasks == 0:
+            return
+        endpoints = [
+            e["endpoint"]
+            for e in self.review_manager.settings.pdf_prep.pdf_prep_package_endpoints
+        ]
+        record_time, breakdown = self._timing_model.estimate(
+            "endpoints", endpoints, default=0.0  # type: ignore
+        )
+        if record_time == 0:
+            # Note : no timings of previous runs
+            return
+        self.review_manager.logger.info(
+            "Estimated time".ljust(38)
+            + str(timedelta(seconds=int(record_time * nr_tasks / self.cpus)))
+        )
+        if self.review_manager.verbose_mode:
+            for endpoint, seconds in sorted(
+                breakdown.items(), key=lambda x: x[1], reverse=True
+            ):
+                self.review_manager.logger.info(
+                    f" {endpoint}".ljust(38)
+                    + str(timedelta(seconds=int(seconds * nr_tasks / self.cpus)))
+                )
+
     def _get_data(self, *, batch_size: int) -> dict:
         records_headers = self.review_manager.dataset.load_records_dict(
             header_only=True
         )
-        record_header_list = list(records_headers.values())
+        record_header_list = [
+            x
+            for x in records_headers.values()
+            if not self._shard
+            or colrev.ops.prep_shards.in_shard(x[Fields.ID], self._shard)
+        ]
         nr_tasks = len(
             [
                 x
@@ -254,6 +318,12 @@ class PDFPrep(colrev.process.operation.Operation):
         items = self.review_manager.dataset.read_next_record(
             conditions=[{Fields.STATUS: RecordState.pdf_imported}],
         )
+        if self._shard:
+            items = (
+                item
+                for item in items
+                if colrev.ops.prep_shards.in_shard(item[Fields.ID], self._shard)
+            )
         self.to_prepare = nr_tasks
 
         prep_data = {
@@ -397,14 +467,63 @@ class PDFPrep(colrev.process.operation.Operation):
             except colrev_exceptions.TEIException:
                 self.review_manager.logger.error("Error generating TEI")
 
+    def _setup_shard(self, shard: str) -> None:
+        self._shard = colrev.ops.prep_shards.parse_shard(shard)
+        branch_name = colrev.ops.prep_shards.get_branch_name(
+            self._shard, operation=self.type
+        )
+        self.review_manager.logger.info(
+            f"Prepare PDFs of shard {self._shard[0]}/{self._shard[1]} "
+            f"(branch {branch_name})"
+        )
+        self._previous_branch = colrev.ops.prep_shards.checkout_shard_branch(
+            self.review_manager, self._shard, operation=self.type
+        )
+
+    def _merge_shards(self) -> None:
+        shards = colrev.ops.prep_shards.load_shards(
+            self.review_manager, operation=self.type
+        )
+        if not shards:
+            self.review_manager.logger.info("No pdf-prep shards to merge.")
+            return
+
+        records = self.review_manager.dataset.load_records_dict()
+        prepared_records = colrev.ops.prep_shards.merge_shard_records(
+            self.review_manager,
+            shards,
+            records=records,
+            states_to_prepare=[
+                RecordState.pdf_imported,
+                RecordState.pdf_needs_manual_preparation,
+            ],
+            operation=self.type,
+        )
+        if not prepared_records:
+            self.review_manager.logger.info("No prepared records in the shards.")
+            return
+
+        self.review_manager.dataset.save_records_dict(records)
+        self.review_manager.create_commit(msg=f"PDFs: merge shards ({len(shards)})")
+        colrev.ops.prep_shards.delete_shard_branches(
+            self.review_manager, list(shards), operation=self.type
+        )
+
     @colrev.process.operation.Operation.decorate()
     def main(
         self,
         *,
         reprocess: bool = False,
         batch_size: int = 0,
+        shard: str = "",
+        merge_shards: bool = False,
     ) -> None:
-        """Prepare PDFs (main entrypoint)."""
+        """Prepare PDFs (main entrypoint).
+
+        With shard="k/n", only the k-th of n shards (stable hash of the IDs)
+        is prepared on a separate branch (to distribute pdf-prep across machines).
+        With merge_shards, the prepared shards are merged into the records.
+        """
         if utils.in_ci_environment() and not self.review_manager.in_test_environment():
             raise colrev_exceptions.ServiceNotAvailableException(
                 dep="colrev pdf-prep",
@@ -426,6 +545,12 @@ class PDFPrep(colrev.process.operation.Operation):
         if not self.review_manager.high_level_operation:
             print()
 
+        if merge_shards:
+            self._merge_shards()
+            return
+        if shard:
+            self._setup_shard(shard)
+
         if reprocess:
             self._set_to_reprocess()
 
@@ -450,6 +575,10 @@ class PDFPrep(colrev.process.operation.Operation):
         self.review_manager.logger.info(
             "PDFs to prep".ljust(38) + f'{pdf_prep_data["nr_tasks"]} PDFs'
         )
+        self._print_estimated_time(nr_tasks=pdf_prep_data["nr_tasks"])
+        self._throughput_monitor = colrev.env.timing_model.ThroughputMonitor(
+            nr_records=pdf_prep_data["nr_tasks"], timing_model=self._timing_model
+        )
 
         if self.review_manager.verbose_mode:
             for item in pdf_prep_data["items"]:
@@ -478,7 +607,15 @@ class PDFPrep(colrev.process.operation.Operation):
 
             self._print_stats(pdf_prep_record_list=pdf_prep_record_list)
 
+        self._timing_model.save()
         self.review_manager.create_commit(msg="PDFs: prepare")
+        if self._shard:
+            colrev.ops.prep_shards.save_shard(
+                self.review_manager,
+                self._shard,
+                previous_branch=self._previous_branch,
+                operation=self.type,
+            )
         self.review_manager.logger.info(
             f"{Colors.GREEN}Completed pdf-prep operation{Colors.END}"
         )
@@ -8,22 +8,25 @@ import logging
 import multiprocessing as mp
 import random
 import shutil
+import time
 import typing
 from copy import deepcopy
 from datetime import datetime
 from datetime import timedelta
-from multiprocessing import Lock
+from functools import partial
 from multiprocessing import Value
-from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
 import git
 from requests.exceptions import ConnectionError as requests_ConnectionError
 from requests.exceptions import ReadTimeout
 
+import colrev.env.timing_model
 import colrev.env.utils
 import colrev.exceptions as colrev_exceptions
-import colrev.loader.load_utils
+import colrev.ops.prep_concurrency
+import colrev.ops.prep_journal
+import colrev.ops.prep_shards
 import colrev.process.operation
 import colrev.record.record_prep
 from colrev import utils
@@ -35,8 +38,6 @@ from colrev.constants import FieldSet
 from colrev.constants import OperationsType
 from colrev.constants import RecordState
 from colrev.package_manager.package_manager import PackageManager
-from colrev.writer.write_utils import to_string
-from colrev.writer.write_utils import write_file
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.package_manager.package_base_classes as base_classes
@@ -82,7 +83,11 @@ class Prep(colrev.process.operation.Operation):
     """Prepare records (metadata)."""
 
     timeout = 30
+    # Note : records exceeding the record_timeout remain to be prepared
+    record_timeout = 600
     max_retries_on_error = 3
+    # Note : estimated duration per record (if no timings are available)
+    default_record_time = 5.0
     pad: int = 0
 
     first_round: bool
@@ -94,6 +99,8 @@ class Prep(colrev.process.operation.Operation):
 
     _cpu = 1
     _prep_commit_id = "HEAD"
+    _shard: typing.Optional[typing.Tuple[int, int]] = None
+    _previous_branch = ""
 
     type = OperationsType.prep
 
@@ -117,12 +124,19 @@ class Prep(colrev.process.operation.Operation):
 
         self._stats: typing.Dict[str, typing.List[timedelta]] = {}
 
-        self.temp_prep_lock = Lock()
-        self.current_temp_records = self.review_manager.path / Path(
-            ".colrev/cur_temp_recs.bib"
+        self.journal_path = self.review_manager.path / Path(
+            ".colrev/prep_journal.jsonl"
         )
-
-        self.temp_records = self.review_manager.path / (Path(".colrev/temp_recs.bib"))
+        self._journal: typing.Optional[colrev.ops.prep_journal.PrepJournal] = None
+        self._concurrency_controller: typing.Optional[
+            colrev.ops.prep_concurrency.AdaptiveConcurrencyController
+        ] = None
+        self._resumed_records: typing.List[dict] = []
+        # Note : timings of previous runs (to estimate durations)
+        self._timing_model = colrev.env.timing_model.TimingModel("prep")
+        self._throughput_monitor: typing.Optional[
+            colrev.env.timing_model.ThroughputMonitor
+        ] = None
 
         self.quality_model = review_manager.get_qm()
         self.package_manager = PackageManager()
@@ -150,8 +164,22 @@ class Prep(colrev.process.operation.Operation):
             self._cpu = 1
 
     def _add_stats(
-        self, *, prep_round_package_endpoint: dict, start_time: datetime
+        self,
+        *,
+        prep_round_package_endpoint: dict,
+        start_time: datetime,
+        error: bool = False,
     ) -> None:
+        if colrev.ops.prep_concurrency.is_task_cancelled():
+            return
+        seconds = (datetime.now() - start_time).total_seconds()
+        self._timing_model.add(
+            "endpoints", prep_round_package_endpoint["endpoint"], seconds
+        )
+        if self._concurrency_controller:
+            self._concurrency_controller.observe_endpoint(
+                prep_round_package_endpoint["endpoint"], seconds, error=error
+            )
         if prep_round_package_endpoint["endpoint"] not in self._stats:
             self._stats[prep_round_package_endpoint["endpoint"]] = [
                 datetime.now() - start_time
@@ -249,6 +277,7 @@ class Prep(colrev.process.operation.Operation):
             self._add_stats(
                 start_time=start_time,
                 prep_round_package_endpoint=prep_round_package_endpoint,
+                error=True,
             )
             if self.review_manager.verbose_mode:
                 self.review_manager.logger.error(
@@ -261,6 +290,7 @@ class Prep(colrev.process.operation.Operation):
                 self._add_stats(
                     start_time=start_time,
                     prep_round_package_endpoint=prep_round_package_endpoint,
+                    error=True,
                 )
                 self.review_manager.logger.error(exc)
             else:
@@ -441,33 +471,17 @@ class Prep(colrev.process.operation.Operation):
                 record=record, item=item, prior_state=prior_state
             )
 
-    def _save_to_temp(self, record: colrev.record.record_prep.PrepRecord) -> None:
-        rec_str = to_string(
-            records_dict={record.data[Fields.ID]: record.get_data()},
-            implementation="bib",
-        )
-        self.temp_prep_lock.acquire(timeout=120)
-        self.current_temp_records.parent.mkdir(exist_ok=True)
-        with open(self.current_temp_records, "a", encoding="utf-8") as cur_temp_rec:
-            cur_temp_rec.write(rec_str)
-        try:
-            self.temp_prep_lock.release()
-        except ValueError:
-            pass
-
     def _complete_resumed_operation(self, prepared_records: list) -> None:
-        if self.temp_records.is_file():
-            temp_recs = colrev.loader.load_utils.load(
-                filename=self.temp_records,
-                logger=self.review_manager.logger,
-            )
-            prepared_records_ids = [x[Fields.ID] for x in prepared_records]
-            for record in temp_recs.values():
-                if record[Fields.ID] not in prepared_records_ids:
-                    prepared_records.append(record)
+        prepared_records_ids = {x[Fields.ID] for x in prepared_records}
+        for record in self._resumed_records:
+            if record[Fields.ID] not in prepared_records_ids:
+                prepared_records.append(record)
+        self._resumed_records = []
 
-        self.temp_records.unlink(missing_ok=True)
-        self.current_temp_records.unlink(missing_ok=True)
+    def _remove_journal(self) -> None:
+        if self._journal:
+            self._journal.remove()
+            self._journal = None
 
     def _validate_record(
         self,
@@ -508,6 +522,50 @@ class Prep(colrev.process.operation.Operation):
                 f" after {prep_round_package_endpoint}"
             )
 
+    def _run_package_preps(
+        self,
+        *,
+        item: dict,
+        record: colrev.record.record_prep.PrepRecord,
+        preparation_record: colrev.record.record_prep.PrepRecord,
+        resumed_state: typing.Optional[colrev.ops.prep_journal.RecordJournalState],
+    ) -> None:
+        for pos, prep_round_package_endpoint in enumerate(
+            deepcopy(item["prep_round_package_endpoints"])
+        ):
+            if resumed_state:
+                if resumed_state.preparation_break:
+                    break
+                if pos in resumed_state.completed_endpoints:
+                    continue
+            preparation_break = False
+            try:
+                self._package_prep(
+                    prep_round_package_endpoint,
+                    record,
+                    preparation_record,
+                )
+                self._validate_record(
+                    record=record,
+                    prep_round_package_endpoint=prep_round_package_endpoint,
+                )
+                # Note: ServiceNotAvailableException should be ignored
+                # in the packages if review_manager.force_mode
+            except PreparationBreak:
+                preparation_break = True
+            journal = self._get_journal()
+            if journal:
+                journal.log_endpoint(
+                    record_id=record.data[Fields.ID],
+                    pos=pos,
+                    endpoint=prep_round_package_endpoint["endpoint"],
+                    record_dict=record.data,
+                    preparation_record_dict=preparation_record.data,
+                    preparation_break=preparation_break,
+                )
+            if preparation_break:
+                break
+
     # Note : no named arguments for multiprocessing
     def prepare(self, item: dict) -> dict:
         """Prepare a record (based on package_endpoints in the settings)."""
@@ -523,12 +581,77 @@ class Prep(colrev.process.operation.Operation):
         if self.review_manager.verbose_mode:
             self.review_manager.logger.info(" prep " + record.data[Fields.ID])
 
+        start_time = time.monotonic()
+        prior_state = record.data[Fields.STATUS]
+        resumed_state: typing.Optional[colrev.ops.prep_journal.RecordJournalState] = (
+            item.get("resumed_state", None)
+        )
+        if resumed_state:
+            # Note : continue after the completed (record, endpoint) pairs
+            record.data = resumed_state.record
+            preparation_record = colrev.record.record_prep.PrepRecord(
+                resumed_state.preparation_record
+            )
+        else:
+            journal = self._get_journal()
+            if journal:
+                journal.start_record(record.data)
+            preparation_record = self._get_preparation_record(record)
+
+        self._run_package_preps(
+            item=item,
+            record=record,
+            preparation_record=preparation_record,
+            resumed_state=resumed_state,
+        )
+
+        self._post_package_prep(
+            record=record,
+            preparation_record=preparation_record,
+            item=item,
+            prior_state=prior_state,
+        )
+
+        journal = self._get_journal()
+        if journal:
+            journal.log_completed(
+                record_id=record.data[Fields.ID], record_dict=record.get_data()
+            )
+        self._add_record_timing(record, time.monotonic() - start_time)
+
+        return record.get_data()
+
+    def _get_journal(self) -> typing.Optional[colrev.ops.prep_journal.PrepJournal]:
+        # Note : records that exceeded the record_timeout are returned unchanged
+        # and their (still running) preparation must not be journaled
+        if colrev.ops.prep_concurrency.is_task_cancelled():
+            return None
+        return self._journal
+
+    def _add_record_timing(
+        self, record: colrev.record.record_prep.PrepRecord, seconds: float
+    ) -> None:
+        if colrev.ops.prep_concurrency.is_task_cancelled():
+            return
+        self._timing_model.add("sources", self._get_source_key(record.data), seconds)
+        if self._throughput_monitor:
+            summary = self._throughput_monitor.record_completed()
+            if summary:
+                self.review_manager.logger.info(f"Throughput: {summary}")
+
+    @staticmethod
+    def _get_source_key(record_dict: dict) -> str:
+        origins = record_dict.get(Fields.ORIGIN, [])
+        return origins[0].split("/")[0] if origins else ""
+
+    def _get_preparation_record(
+        self, record: colrev.record.record_prep.PrepRecord
+    ) -> colrev.record.record_prep.PrepRecord:
         record.require_prov()
 
         # preparation_record changes with each endpoint and
         # eventually replaces record (if md_prepared or endpoint.always_apply_changes)
         preparation_record = record.copy_prep_rec()
-        prior_state = record.data[Fields.STATUS]
 
         # Rerun quality model (in case there are manual prep changes)
         preparation_record.change_entrytype(new_entrytype=record.data[Fields.ENTRYTYPE])
@@ -546,35 +669,7 @@ class Prep(colrev.process.operation.Operation):
         preparation_record.run_quality_model(
             self.quality_model, set_prepared=not self.polish
         )
-
-        for prep_round_package_endpoint in deepcopy(
-            item["prep_round_package_endpoints"]
-        ):
-            try:
-                self._package_prep(
-                    prep_round_package_endpoint,
-                    record,
-                    preparation_record,
-                )
-                self._validate_record(
-                    record=record,
-                    prep_round_package_endpoint=prep_round_package_endpoint,
-                )
-                # Note: ServiceNotAvailableException should be ignored
-                # in the packages if review_manager.force_mode
-            except PreparationBreak:
-                break
-
-        self._post_package_prep(
-            record=record,
-            preparation_record=preparation_record,
-            item=item,
-            prior_state=prior_state,
-        )
-
-        self._save_to_temp(record)
-
-        return record.get_data()
+        return preparation_record
 
     def _rename_files(self, records: dict) -> None:
         def file_rename_condition(record_dict: dict) -> bool:
@@ -659,6 +754,12 @@ class Prep(colrev.process.operation.Operation):
                 conditions=[{Fields.STATUS: s} for s in r_states_to_prepare]
             )
         )
+        if self._shard:
+            items = [
+                item
+                for item in items
+                if colrev.ops.prep_shards.in_shard(item[Fields.ID], self._shard)
+            ]
         if self.polish and utils.in_ci_environment() and len(items) > 2000:
             items = random.choices(items, k=2000)  # nosec
 
@@ -670,54 +771,40 @@ class Prep(colrev.process.operation.Operation):
 
         return prep_data
 
-    def _load_temp_prep_to_resume(self, prepare_data: dict) -> None:
-        if self.current_temp_records.is_file():
-            # combine and remove redundant records
-
-            cur_temp_recs = colrev.loader.load_utils.load(
-                filename=self.current_temp_records,
-                logger=self.review_manager.logger,
-            )
-
-            temp_recs = {}
-            if self.temp_records.is_file():
-                temp_recs = colrev.loader.load_utils.load(
-                    filename=self.temp_records,
-                    logger=self.review_manager.logger,
-                )
-
-            combined_recs = {**temp_recs, **cur_temp_recs}
-            self.temp_records.parent.mkdir(exist_ok=True)
-
-            write_file(records_dict=combined_recs, filename=self.temp_records)
-
-            self.current_temp_records.unlink()
-
-        if self.temp_records.is_file():
-
-            temp_recs = colrev.loader.load_utils.load(
-                filename=self.temp_records,
-                logger=self.review_manager.logger,
-            )
+    def _load_journal_to_resume(
+        self, prepare_data: dict, prep_round: colrev.settings.PrepRound
+    ) -> None:
+        self._journal = colrev.ops.prep_journal.PrepJournal(self.journal_path)
+        commit = self.review_manager.dataset.git_repo.get_last_commit_sha()
+        states = self._journal.replay(
+            commit=commit,
+            prep_round=prep_round.name,
+            records={item[Fields.ID]: item for item in prepare_data["items"]},
+        )
+        self._journal.open(commit=commit, prep_round=prep_round.name, states=states)
+        if not states:
+            return
 
-            self.review_manager.logger.info("Continue with existing records")
-            skipped_items = 0
-            list_to_skip = []
-            for item in prepare_data["items"]:
-                if item[Fields.ID] not in temp_recs:
-                    continue
-                del temp_recs[item[Fields.ID]]
-                list_to_skip.append(item[Fields.ID])
-                skipped_items += 1
-            self.review_manager.logger.info(
-                f"{Colors.GREEN}Skipped {skipped_items} records{Colors.END}"
-            )
-            prepare_data["items"] = [
-                x for x in prepare_data["items"] if x[Fields.ID] not in list_to_skip
-            ]
+        self.review_manager.logger.info("Continue with existing records")
+        self._resumed_records = [
+            state.record for state in states.values() if state.completed
+        ]
+        items = []
+        for item in prepare_data["items"]:
+            state = states.get(item[Fields.ID], None)
+            if state and state.completed:
+                continue
+            if state:
+                item["resumed_state"] = state
+            items.append(item)
+        prepare_data["items"] = items
+        skipped_items = len(self._resumed_records)
+        self.review_manager.logger.info(
+            f"{Colors.GREEN}Skipped {skipped_items} records{Colors.END}"
+        )
 
-            with PREP_COUNTER.get_lock():
-                PREP_COUNTER.value += skipped_items  # type: ignore
+        with PREP_COUNTER.get_lock():
+            PREP_COUNTER.value += skipped_items  # type: ignore
 
     def _get_prep_data_tasks(
         self,
@@ -725,16 +812,18 @@ class Prep(colrev.process.operation.Operation):
     ) -> list:
 
         prepare_data = self._load_prep_data()
-        self._load_temp_prep_to_resume(prepare_data)
+        self._load_journal_to_resume(prepare_data, prep_round)
 
         self.pad = prepare_data["PAD"]
         items = prepare_data["items"]
         prep_data = []
         nr_items = len(prepare_data["items"])
         for item in items:
+            resumed_state = item.pop("resumed_state", None)
             prep_data.append(
                 {
                     "record": colrev.record.record_prep.PrepRecord(item),
+                    "resumed_state": resumed_state,
                     "nr_items": nr_items,
                     # Note : we cannot load endpoints here
                     # because pathos/multiprocessing
@@ -878,6 +967,11 @@ class Prep(colrev.process.operation.Operation):
                 + f" records ({nr_recs/len(prepared_records):.2%})"
             )
 
+    @staticmethod
+    def _get_timed_out_record(previous_preparation_data: list, index: int) -> dict:
+        # Note : the record remains unchanged (to be prepared)
+        return previous_preparation_data[index]["record"].get_data()
+
     def _print_startup_infos(self) -> None:
         if self.polish:
             self.review_manager.logger.info("Prep (polish mode)")
@@ -903,13 +997,23 @@ class Prep(colrev.process.operation.Operation):
 
     def _get_prep_pool(
         self, prep_round: colrev.settings.PrepRound
-    ) -> mp.pool.ThreadPool:
+    ) -> colrev.ops.prep_concurrency.AdaptiveThreadPool:
         if self._prep_packages_ram_heavy(prep_round=prep_round):
-            pool = Pool(mp.cpu_count() // 2)
+            nr_workers = max(1, mp.cpu_count() // 2)
         else:
-            # Note : if we use too many CPUS,
-            # a "too many open files" exception is thrown
-            pool = Pool(self._cpu)
+            nr_workers = self._cpu
+        # Note : the number of workers is adapted at runtime
+        # (e.g., to avoid "too many open files" exceptions)
+        self._concurrency_controller = (
+            colrev.ops.prep_concurrency.AdaptiveConcurrencyController(
+                initial=nr_workers, maximum=2 * nr_workers
+            )
+        )
+        pool = colrev.ops.prep_concurrency.AdaptiveThreadPool(
+            controller=self._concurrency_controller,
+            task_timeout=self.record_timeout,
+            logger=self.review_manager.logger,
+        )
         self.review_manager.logger.info(
             "Info: ✔ = quality-assured by CoLRev community curators"
         )
@@ -937,6 +1041,8 @@ class Prep(colrev.process.operation.Operation):
         self.review_manager.create_commit(
             msg="Prep: improve record metadata",
         )
+        # Note : remove the journal only after the records were saved and committed
+        self._remove_journal()
         self._prep_commit_id = (
             self.review_manager.dataset.git_repo.repo.head.commit.hexsha
         )
@@ -962,24 +1068,141 @@ class Prep(colrev.process.operation.Operation):
         if utils.in_ci_environment():
             print("\n\n")
 
+    def _setup_shard(self, shard: str) -> None:
+        self._shard = colrev.ops.prep_shards.parse_shard(shard)
+        self.review_manager.logger.info(
+            f"Prepare shard {self._shard[0]}/{self._shard[1]} "
+            f"(branch {colrev.ops.prep_shards.get_branch_name(self._shard)})"
+        )
+        self._previous_branch = colrev.ops.prep_shards.checkout_shard_branch(
+            self.review_manager, self._shard
+        )
+        # Note : separate journal (to resume the shard)
+        self.journal_path = self.review_manager.path / Path(
+            f".colrev/prep_journal_shard-{self._shard[0]}-of-{self._shard[1]}.jsonl"
+        )
+
+    def _merge_shards(self, *, keep_ids: bool) -> None:
+        shards = colrev.ops.prep_shards.load_shards(self.review_manager)
+        if not shards:
+            self.review_manager.logger.info("No prep shards to merge.")
+            return
+
+        r_states_to_prepare = [
+            RecordState.md_imported,
+            RecordState.md_needs_manual_preparation,
+        ]
+        if self.polish:
+            r_states_to_prepare = list(RecordState)
+        records = self.review_manager.dataset.load_records_dict()
+        prepared_records = colrev.ops.prep_shards.merge_shard_records(
+            self.review_manager,
+            shards,
+            records=records,
+            states_to_prepare=r_states_to_prepare,
+        )
+
+        if not prepared_records:
+            self.review_manager.logger.info("No prepared records in the shards.")
+            return
+
+        self.review_manager.dataset.save_records_dict(records)
+        self._log_commit_details(prepared_records)
+        self.review_manager.create_commit(
+            msg=f"Prep: merge shards ({len(shards)})",
+        )
+        colrev.ops.prep_shards.delete_shard_branches(self.review_manager, list(shards))
+        self._prep_commit_id = (
+            self.review_manager.dataset.git_repo.repo.head.commit.hexsha
+        )
+
+        if not keep_ids and not self.polish:
+            self.review_manager.logger.info("Set record IDs")
+            self.review_manager.dataset.set_ids()
+            self.review_manager.create_commit(msg="Set IDs")
+
+        self._post_prep()
+
     def _nothing_to_prepare_condition(self, preparation_data: list) -> bool:
-        return len(preparation_data) == 0 and not self.temp_records.is_file()
+        return len(preparation_data) == 0 and not self._resumed_records
+
+    def _estimate_time(
+        self, preparation_data: list, prep_round: colrev.settings.PrepRound
+    ) -> typing.Tuple[float, typing.Dict[str, float]]:
+        """Estimate the duration (based on the timings of previous runs)."""
+        endpoints = [
+            e["endpoint"]
+            for e in prep_round.prep_package_endpoints  # type: ignore
+            if e["endpoint"].lower() in self.prep_package_endpoints
+        ]
+        # Note : predicted duration of a record: mean of its source (if available),
+        # otherwise the sum of the endpoint means (default_record_time if unknown)
+        record_time, endpoint_breakdown = self._timing_model.estimate(
+            "endpoints",
+            endpoints,
+            default=self.default_record_time / max(1, len(endpoints)),
+        )
+        record_time = record_time or self.default_record_time
+        estimated_time = 0.0
+        for item in preparation_data:
+            source_time = self._timing_model.mean(
+                "sources", self._get_source_key(item["record"].data)
+            )
+            estimated_time += source_time if source_time is not None else record_time
+        nr_workers = max(1, self._cpu)
+        breakdown = {
+            endpoint: seconds * len(preparation_data) / nr_workers
+            for endpoint, seconds in endpoint_breakdown.items()
+        }
+        return estimated_time / nr_workers, breakdown
 
-    def _print_estimated_time(self, preparation_data: list) -> None:
+    def _print_estimated_time(
+        self, preparation_data: list, prep_round: colrev.settings.PrepRound
+    ) -> None:
         if self._nothing_to_prepare_condition(preparation_data):
             self.review_manager.logger.info("No records to prepare.")
             print()
             return
 
         self.review_manager.logger.info(f"Records to prepare: {len(preparation_data)}")
-        estimated_time = len(preparation_data) * 5
-        estimated_time_formatted = str(timedelta(seconds=estimated_time))
+        estimated_time, breakdown = self._estimate_time(preparation_data, prep_round)
+        estimated_time_formatted = str(timedelta(seconds=int(estimated_time)))
         self.review_manager.logger.info(f"Estimated time: {estimated_time_formatted}")
+        if self.review_manager.verbose_mode:
+            for endpoint, seconds in sorted(
+                breakdown.items(), key=lambda x: x[1], reverse=True
+            ):
+                self.review_manager.logger.info(
+                    f" {endpoint}".ljust(50) + f"{timedelta(seconds=int(seconds))}"
+                )
+
+    def _prefetch(self, preparation_data: list) -> None:
+        # Note : see PrepPackageBaseClass.prefetch() (no-op by default)
+        records = [item["record"] for item in preparation_data]
+        for endpoint_name, endpoint in self.prep_package_endpoints.items():
+            start_time = time.time()
+            endpoint.prefetch(records)
+            self.review_manager.logger.debug(
+                f"Prefetched {endpoint_name} ({time.time() - start_time:.2f}s)"
+            )
 
     @colrev.process.operation.Operation.decorate()
-    def main(self, *, keep_ids: bool = False) -> None:
-        """Preparation of records (main entrypoint)."""
+    def main(
+        self, *, keep_ids: bool = False, shard: str = "", merge_shards: bool = False
+    ) -> None:
+        """Preparation of records (main entrypoint).
+
+        With shard="k/n", only the k-th of n shards (stable hash of the IDs)
+        is prepared on a separate branch (to distribute prep across machines).
+        With merge_shards, the prepared shards are merged into the records.
+        """
+        # pylint: disable=too-many-branches
+        if merge_shards:
+            self._merge_shards(keep_ids=keep_ids)
+            return
         self._print_startup_infos()
+        if shard:
+            self._setup_shard(shard)
 
         try:
             for i, prep_round in enumerate(
@@ -990,10 +1213,21 @@ class Prep(colrev.process.operation.Operation):
                 preparation_data = self._get_prep_data_tasks(prep_round)
                 previous_preparation_data = deepcopy(preparation_data)
 
-                self._print_estimated_time(preparation_data)
+                self._print_estimated_time(preparation_data, prep_round)
                 if self._nothing_to_prepare_condition(preparation_data):
+                    self._remove_journal()
+                    if self._shard:
+                        colrev.ops.prep_shards.save_shard(
+                            self.review_manager,
+                            self._shard,
+                            previous_branch=self._previous_branch,
+                        )
                     return
 
+                self._throughput_monitor = colrev.env.timing_model.ThroughputMonitor(
+                    nr_records=len(preparation_data), timing_model=self._timing_model
+                )
+                self._prefetch(preparation_data)
                 if self._cpu == 1:
                     # Note: preparation_data is not turned into a list of records.
                     prepared_records = []
@@ -1002,9 +1236,18 @@ class Prep(colrev.process.operation.Operation):
                         prepared_records.append(record)
                 else:
                     pool = self._get_prep_pool(prep_round)
-                    prepared_records = pool.map(self.prepare, preparation_data)
-                    pool.close()
-                    pool.join()
+                    prepared_records = pool.map(
+                        self.prepare,
+                        preparation_data,
+                        on_timeout=partial(
+                            self._get_timed_out_record, previous_preparation_data
+                        ),
+                    )
+                    if pool.nr_timeouts:
+                        self.review_manager.logger.warning(
+                            f"{pool.nr_timeouts} records exceeded the timeout "
+                            f"({self.record_timeout}s) and remain to be prepared"
+                        )
 
                 self._complete_resumed_operation(prepared_records)
 
@@ -1029,6 +1272,22 @@ class Prep(colrev.process.operation.Operation):
                 ) from exc
             raise exc
 
+        finally:
+            # Note : flush the journal (to resume after exceptions)
+            if self._journal:
+                self._journal.close()
+            self._timing_model.save()
+
+        if self._shard:
+            # Note : IDs are set when the shards are merged
+            colrev.ops.prep_shards.save_shard(
+                self.review_manager,
+                self._shard,
+                previous_branch=self._previous_branch,
+            )
+            self._post_prep()
+            return
+
         if not keep_ids and not self.polish:
             self.review_manager.logger.info("Set record IDs")
             self.review_manager.dataset.set_ids()
@@ -0,0 +1,326 @@
+#! /usr/bin/env python
+"""Adaptive concurrency for the prep operation."""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import statistics
+import threading
+import time
+import typing
+from collections import deque
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore  # pylint: disable=invalid-name
+
+# Note : the number of concurrent records is adjusted at runtime (AIMD):
+# it is halved when file descriptors or memory become scarce, when the error
+# rate increases, or when latencies increase (e.g., rate-limited APIs),
+# and it is increased by one when the recent records were completed without
+# problems. Records exceeding the record_timeout are skipped (returned unchanged)
+# so that a stuck request does not block the round.
+# The thread of a timed-out task cannot be stopped: the task is cancelled and
+# should check is_task_cancelled() before it changes shared state
+# (e.g., the prep journal or the statistics).
+
+_PROC_FD_DIR = Path("/proc/self/fd")
+_TASK_STATE = threading.local()
+
+
+def is_task_cancelled() -> bool:
+    """Check whether the current task (of an AdaptiveThreadPool) was cancelled."""
+    cancelled: typing.Optional[threading.Event] = getattr(
+        _TASK_STATE, "cancelled", None
+    )
+    return cancelled is not None and cancelled.is_set()
+
+
+def get_resource_usage() -> typing.Tuple[float, float]:
+    """Get the ratios of open file descriptors and RSS (0 if not available)."""
+    fd_ratio, rss_ratio = 0.0, 0.0
+    try:
+        if resource is not None and _PROC_FD_DIR.is_dir():
+            soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+            if soft_limit > 0:
+                fd_ratio = len(os.listdir(_PROC_FD_DIR)) / soft_limit
+        with open("/proc/self/statm", encoding="utf-8") as file:
+            rss_pages = int(file.read().split()[1])
+        rss_ratio = rss_pages / os.sysconf("SC_PHYS_PAGES")
+    except (OSError, ValueError, AttributeError):  # pragma: no cover
+        pass
+    return fd_ratio, rss_ratio
+
+
+class AdaptiveConcurrencyController:
+    """Controller adjusting the number of concurrent tasks."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    max_fd_ratio = 0.7
+    max_rss_ratio = 0.8
+    max_error_rate = 0.2
+    max_latency_increase = 2.0
+
+    def __init__(
+        self,
+        *,
+        initial: int,
+        minimum: int = 1,
+        maximum: int,
+        window: int = 20,
+        resource_probe: typing.Callable[
+            [], typing.Tuple[float, float]
+        ] = get_resource_usage,
+    ) -> None:
+        """Initialize the instance."""
+        # pylint: disable=too-many-arguments
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self._window = window
+        self._resource_probe = resource_probe
+        self._latencies: typing.Deque[float] = deque(maxlen=window)
+        self._errors: typing.Deque[bool] = deque(maxlen=window)
+        self._baseline_latency = 0.0
+        self._endpoint_latencies: typing.Dict[str, typing.Deque[float]] = {}
+        self._endpoint_errors: typing.Dict[str, typing.Deque[bool]] = {}
+        self._lock = threading.Lock()
+
+    def observe_endpoint(self, endpoint: str, seconds: float, *, error: bool) -> None:
+        """Observe the latency (and error) of an endpoint."""
+        with self._lock:
+            self._endpoint_latencies.setdefault(
+                endpoint, deque(maxlen=self._window)
+            ).append(seconds)
+            self._endpoint_errors.setdefault(
+                endpoint, deque(maxlen=self._window)
+            ).append(error)
+
+    def get_slowest_endpoint(self) -> typing.Tuple[str, float]:
+        """Get the endpoint with the highest median latency."""
+        with self._lock:
+            medians = {
+                endpoint: statistics.median(latencies)
+                for endpoint, latencies in self._endpoint_latencies.items()
+                if latencies
+            }
+        if not medians:
+            return "", 0.0
+        slowest = max(medians, key=medians.__getitem__)
+        return slowest, medians[slowest]
+
+    def _endpoint_error_rate_exceeded(self) -> bool:
+        return any(
+            len(errors) >= 5 and sum(errors) / len(errors) > self.max_error_rate
+            for errors in self._endpoint_errors.values()
+        )
+
+    def _get_reason_to_decrease(self) -> str:
+        fd_ratio, rss_ratio = self._resource_probe()
+        if fd_ratio > self.max_fd_ratio:
+            return f"open files ({fd_ratio:.0%} of the limit)"
+        if rss_ratio > self.max_rss_ratio:
+            return f"memory ({rss_ratio:.0%})"
+        if self._errors and sum(self._errors) / len(self._errors) > self.max_error_rate:
+            return "error rate"
+        if self._endpoint_error_rate_exceeded():
+            return "endpoint error rate"
+        if (
+            len(self._latencies) == self._window
+            and self._baseline_latency > 0
+            and statistics.median(self._latencies)
+            > self.max_latency_increase * self._baseline_latency
+        ):
+            return "latency"
+        return ""
+
+    def observe(self, seconds: float, *, error: bool) -> str:
+        """Observe a completed task and adjust the limit (returns the reason)."""
+        with self._lock:
+            self._latencies.append(seconds)
+            self._errors.append(error)
+            reason = self._get_reason_to_decrease()
+            if reason:
+                if self.limit > self.minimum:
+                    self.limit = max(self.minimum, self.limit // 2)
+                    # Note : start a new observation window
+                    self._latencies.clear()
+                    self._errors.clear()
+                    return f"decrease to {self.limit} ({reason})"
+                return ""
+            if len(self._latencies) == self._window:
+                median_latency = statistics.median(self._latencies)
+                if (
+                    self._baseline_latency == 0
+                    or median_latency < self._baseline_latency
+                ):
+                    self._baseline_latency = median_latency
+                if self.limit < self.maximum:
+                    self.limit += 1
+                    self._latencies.clear()
+                    self._errors.clear()
+                    return f"increase to {self.limit}"
+            return ""
+
+
+class _MapState:
+    """State of an AdaptiveThreadPool.map() call (queues and worker counts)."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        """Initialize the instance."""
+        self.tasks: queue.Queue = queue.Queue()
+        self.results: queue.Queue = queue.Queue()
+        self.cancelled: typing.Dict[int, threading.Event] = {}
+        # Note : idle workers that are not reserved for a task
+        self.nr_idle_workers = 0
+        self.nr_workers = 0
+        self.lock = threading.Lock()
+
+
+class AdaptiveThreadPool:
+    """Thread pool with an adaptive number of concurrent tasks and task timeouts."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(
+        self,
+        *,
+        controller: AdaptiveConcurrencyController,
+        task_timeout: float,
+        logger: logging.Logger = logging.getLogger(__name__),
+    ) -> None:
+        """Initialize the instance."""
+        self.controller = controller
+        self.task_timeout = task_timeout
+        self.logger = logger
+        self.nr_timeouts = 0
+
+    @staticmethod
+    def _work(func: typing.Callable, state: _MapState) -> None:
+        while True:
+            task = state.tasks.get()
+            if task is None:
+                return
+            index, item, cancelled = task
+            _TASK_STATE.cancelled = cancelled
+            output: tuple
+            try:
+                output = (index, func(item), None)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                output = (index, None, exc)
+            finally:
+                _TASK_STATE.cancelled = None
+            with state.lock:
+                state.nr_idle_workers += 1
+            state.results.put(output)
+
+    @classmethod
+    def _start_task(
+        cls, func: typing.Callable, state: _MapState, index: int, item: typing.Any
+    ) -> None:
+        with state.lock:
+            start_worker = state.nr_idle_workers == 0
+            if start_worker:
+                state.nr_workers += 1
+            else:
+                state.nr_idle_workers -= 1
+        if start_worker:
+            # Note : daemon threads (stuck tasks must not block the interpreter exit)
+            threading.Thread(target=cls._work, args=(func, state), daemon=True).start()
+        state.cancelled[index] = threading.Event()
+        state.tasks.put((index, item, state.cancelled[index]))
+
+    def map(
+        self,
+        func: typing.Callable,
+        items: list,
+        *,
+        on_timeout: typing.Callable[[int], typing.Any],
+    ) -> list:
+        """Apply func to the items (results in the order of the items).
+
+        Items exceeding the task_timeout are replaced by on_timeout(index).
+        The first exception is raised after the running tasks are completed.
+        """
+        # Note : state per call (workers of previous calls may still be stuck)
+        state = _MapState()
+        try:
+            return self._map(func, items, state=state, on_timeout=on_timeout)
+        finally:
+            # Note : stop the workers (stuck workers stop after their task)
+            for _ in range(state.nr_workers):
+                state.tasks.put(None)
+
+    def _map(
+        self,
+        func: typing.Callable,
+        items: list,
+        *,
+        state: _MapState,
+        on_timeout: typing.Callable[[int], typing.Any],
+    ) -> list:
+        results: typing.List[typing.Any] = [None] * len(items)
+        pending = deque(enumerate(items))
+        running: typing.Dict[int, float] = {}
+        exception: typing.Optional[Exception] = None
+        while (pending and exception is None) or running:
+            while (
+                pending and exception is None and len(running) < self.controller.limit
+            ):
+                index, item = pending.popleft()
+                running[index] = time.monotonic()
+                self._start_task(func, state, index, item)
+
+            try:
+                index, result, exc = state.results.get(timeout=0.1)
+            except queue.Empty:
+                index = -1
+            if index in running:
+                seconds = time.monotonic() - running.pop(index)
+                if exc is not None:
+                    exception = exception or exc
+                else:
+                    results[index] = result
+                self._log_adjustment(
+                    self.controller.observe(seconds, error=exc is not None)
+                )
+
+            self._cancel_stuck_tasks(
+                state=state, running=running, results=results, on_timeout=on_timeout
+            )
+
+        if exception is not None:
+            raise exception
+        return results
+
+    def _cancel_stuck_tasks(
+        self,
+        *,
+        state: _MapState,
+        running: typing.Dict[int, float],
+        results: typing.List[typing.Any],
+        on_timeout: typing.Callable[[int], typing.Any],
+    ) -> None:
+        now = time.monotonic()
+        for stuck_index in [
+            i for i, start in running.items() if now - start > self.task_timeout
+        ]:
+            del running[stuck_index]
+            state.cancelled[stuck_index].set()
+            self.nr_timeouts += 1
+            results[stuck_index] = on_timeout(stuck_index)
+            self.logger.warning(
+                f"Task {stuck_index} exceeded the timeout ({self.task_timeout}s)"
+            )
+            self._log_adjustment(self.controller.observe(self.task_timeout, error=True))
+
+    def _log_adjustment(self, adjustment: str) -> None:
+        if adjustment:
+            self.logger.debug(f"Concurrency: {adjustment}")
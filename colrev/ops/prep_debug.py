@@ -21,6 +21,7 @@ from colrev.constants import Fields
 if typing.TYPE_CHECKING:  # pragma: no cover
     import colrev.package_manager.package_base_classes as base_classes
     import colrev.review_manager
+    import colrev.settings
 
 # logging.getLogger("urllib3").setLevel(logging.ERROR)
 logging.getLogger("requests_cache").setLevel(logging.ERROR)
@@ -100,7 +101,9 @@ class PrepDebug(colrev.ops.prep.Prep):
         original_records_ids = [r["ID"] for r in original_records]
         return [r for r in prior_records.values() if r["ID"] in original_records_ids]
 
-    def _load_temp_prep_to_resume(self, prepare_data: dict) -> None:
+    def _load_journal_to_resume(
+        self, prepare_data: dict, prep_round: colrev.settings.PrepRound
+    ) -> None:
         pass
 
     # overrides _load_prep_data
@@ -143,7 +146,7 @@ class PrepDebug(colrev.ops.prep.Prep):
                 self._setup_prep_round(i=i, prep_round=prep_round)
                 preparation_data = self._get_prep_data_tasks(prep_round)
 
-                if len(preparation_data) == 0 and not self.temp_records.is_file():
+                if len(preparation_data) == 0:
                     self.review_manager.logger.info("No records to prepare.")
                     print()
                     return
@@ -0,0 +1,243 @@
+#! /usr/bin/env python
+"""Write-ahead journal of the prep operation (to resume interrupted rounds)."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import typing
+from copy import deepcopy
+from enum import Enum
+from pathlib import Path
+
+from colrev.constants import Fields
+from colrev.constants import RecordState
+
+# Note : the journal is an append-only JSONL file. Each line corresponds to
+# - a header (commit and prep round, which must match to resume),
+# - a completed (record, endpoint) pair with the field diffs of the record
+#   and the preparation record (relative to the previous entry of the record), or
+# - a completed record (diff of the final record).
+# Diffs are relative to the record in the RECORDS_FILE (at the commit of the header).
+
+
+def _json_default(value: typing.Any) -> typing.Any:
+    if isinstance(value, Enum):
+        return value.name
+    return str(value)
+
+
+def _get_diff(prior: dict, current: dict) -> dict:
+    diff: dict = {}
+    changed = {
+        key: value
+        for key, value in current.items()
+        if key not in prior or prior[key] != value
+    }
+    if changed:
+        diff["set"] = changed
+    removed = [key for key in prior if key not in current]
+    if removed:
+        diff["unset"] = removed
+    return diff
+
+
+def _apply_diff(data: dict, diff: dict) -> None:
+    for key in diff.get("unset", []):
+        data.pop(key, None)
+    for key, value in diff.get("set", {}).items():
+        if key == Fields.STATUS:
+            value = RecordState[value]
+        data[key] = value
+
+
+class RecordJournalState:
+    """State of a record (replayed from the journal)."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, record_dict: dict) -> None:
+        """Initialize the instance."""
+        self.record = deepcopy(record_dict)
+        self.preparation_record = deepcopy(record_dict)
+        self.completed_endpoints: typing.Set[int] = set()
+        self.preparation_break = False
+        self.completed = False
+
+
+class PrepJournal:
+    """Append-only journal of completed (record, endpoint) pairs (with fsync batching)."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        fsync_batch_size: int = 100,
+        fsync_interval: float = 2.0,
+    ) -> None:
+        """Initialize the instance."""
+        self.path = path
+        self._fsync_batch_size = fsync_batch_size
+        self._fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._file: typing.Optional[typing.TextIO] = None
+        self._nr_pending = 0
+        self._last_fsync = time.monotonic()
+        # Note : last journaled state of (record_id, "record"/"preparation_record")
+        self._states: typing.Dict[typing.Tuple[str, str], dict] = {}
+
+    def _read_entries(self) -> list:
+        entries = []
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Note : the last line may be incomplete (crash during write)
+                    break
+        return entries
+
+    def replay(
+        self, *, commit: str, prep_round: str, records: dict
+    ) -> typing.Dict[str, RecordJournalState]:
+        """Replay the journal (if it corresponds to the commit and prep round)."""
+        states: typing.Dict[str, RecordJournalState] = {}
+        if not self.path.is_file():
+            return states
+        entries = self._read_entries()
+        if not entries or entries[0] != {
+            "type": "header",
+            "commit": commit,
+            "round": prep_round,
+        }:
+            return states
+
+        for entry in entries[1:]:
+            record_id = entry["id"]
+            if record_id not in records:
+                continue
+            if record_id not in states:
+                states[record_id] = RecordJournalState(records[record_id])
+            state = states[record_id]
+            _apply_diff(state.record, entry["record"])
+            if entry["type"] == "endpoint":
+                _apply_diff(state.preparation_record, entry["preparation_record"])
+                state.completed_endpoints.add(entry["pos"])
+                state.preparation_break = entry.get("break", False)
+            elif entry["type"] == "completed":
+                state.completed = True
+        return states
+
+    def open(
+        self,
+        *,
+        commit: str,
+        prep_round: str,
+        states: typing.Dict[str, RecordJournalState],
+    ) -> None:
+        """Open the journal for appending (starting a new one if it cannot be resumed)."""
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        if not states:
+            self.path.unlink(missing_ok=True)
+        for record_id, state in states.items():
+            self._states[(record_id, "record")] = deepcopy(state.record)
+            self._states[(record_id, "preparation_record")] = deepcopy(
+                state.preparation_record
+            )
+        # pylint: disable=consider-using-with
+        self._file = open(self.path, "a", encoding="utf-8")
+        if not states:
+            self._write(
+                {"type": "header", "commit": commit, "round": prep_round}, sync=True
+            )
+
+    def _write(self, entry: dict, *, sync: bool = False) -> None:
+        line = json.dumps(entry, default=_json_default) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self._nr_pending += 1
+            if (
+                sync
+                or self._nr_pending >= self._fsync_batch_size
+                or time.monotonic() - self._last_fsync > self._fsync_interval
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        assert self._file is not None
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._nr_pending = 0
+        self._last_fsync = time.monotonic()
+
+    def _diff(self, record_id: str, kind: str, data: dict) -> dict:
+        prior = self._states.get((record_id, kind), {})
+        diff = _get_diff(prior, data)
+        self._states[(record_id, kind)] = deepcopy(data)
+        return diff
+
+    def start_record(self, record_dict: dict) -> None:
+        """Set the initial state of a record (as in the RECORDS_FILE)."""
+        record_id = record_dict[Fields.ID]
+        self._states[(record_id, "record")] = deepcopy(record_dict)
+        self._states[(record_id, "preparation_record")] = deepcopy(record_dict)
+
+    def log_endpoint(
+        self,
+        *,
+        record_id: str,
+        pos: int,
+        endpoint: str,
+        record_dict: dict,
+        preparation_record_dict: dict,
+        preparation_break: bool,
+    ) -> None:
+        """Log a completed (record, endpoint) pair."""
+        # pylint: disable=too-many-arguments
+        entry = {
+            "type": "endpoint",
+            "id": record_id,
+            "pos": pos,
+            "endpoint": endpoint,
+            "ts": time.time(),
+            "record": self._diff(record_id, "record", record_dict),
+            "preparation_record": self._diff(
+                record_id, "preparation_record", preparation_record_dict
+            ),
+        }
+        if preparation_break:
+            entry["break"] = True
+        self._write(entry)
+
+    def log_completed(self, *, record_id: str, record_dict: dict) -> None:
+        """Log a completed record."""
+        self._write(
+            {
+                "type": "completed",
+                "id": record_id,
+                "ts": time.time(),
+                "record": self._diff(record_id, "record", record_dict),
+            }
+        )
+        self._states.pop((record_id, "record"), None)
+        self._states.pop((record_id, "preparation_record"), None)
+
+    def close(self) -> None:
+        """Flush and close the journal."""
+        with self._lock:
+            if self._file is None:
+                return
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    def remove(self) -> None:
+        """Close and remove the journal."""
+        self.close()
+        self.path.unlink(missing_ok=True)
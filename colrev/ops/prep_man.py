@@ -7,7 +7,6 @@ import csv
 from pathlib import Path
 
 import pandas as pd
-from tqdm import tqdm
 
 import colrev.env.language_service
 import colrev.exceptions as colrev_exceptions
@@ -45,89 +44,88 @@ class PrepMan(colrev.process.operation.Operation):
         )
 
     def _get_crosstab_df(self) -> pd.DataFrame:
-        # pylint: disable=too-many-branches
         # pylint: disable=duplicate-code
 
         records = self.review_manager.dataset.load_records_dict()
 
         self.review_manager.logger.info("Calculate statistics")
-        stats: dict = {Fields.ENTRYTYPE: {}}
-        overall_types: dict = {Fields.ENTRYTYPE: {}}
-        prep_man_hints, origins, crosstab = [], [], []
-        for record_dict in records.values():
-            if RecordState.md_imported != record_dict[Fields.STATUS]:
-                if record_dict[Fields.ENTRYTYPE] in overall_types[Fields.ENTRYTYPE]:
-                    overall_types[Fields.ENTRYTYPE][record_dict[Fields.ENTRYTYPE]] = (
-                        overall_types[Fields.ENTRYTYPE][record_dict[Fields.ENTRYTYPE]]
-                        + 1
-                    )
-                else:
-                    overall_types[Fields.ENTRYTYPE][record_dict[Fields.ENTRYTYPE]] = 1
-
-            if RecordState.md_needs_manual_preparation != record_dict[Fields.STATUS]:
-                continue
+        # Note : single (columnar) pass over the records
+        records_df = pd.DataFrame(
+            [
+                (record_dict[Fields.STATUS], record_dict[Fields.ENTRYTYPE])
+                for record_dict in records.values()
+            ],
+            columns=[Fields.STATUS, Fields.ENTRYTYPE],
+        )
+        overall_types = (
+            records_df.loc[
+                records_df[Fields.STATUS] != RecordState.md_imported, Fields.ENTRYTYPE
+            ]
+            .value_counts(sort=False)
+            .to_dict()
+        )
+        entrytype_stats = (
+            records_df.loc[
+                records_df[Fields.STATUS] == RecordState.md_needs_manual_preparation,
+                Fields.ENTRYTYPE,
+            ]
+            .value_counts(sort=False)
+            .to_dict()
+        )
 
-            if record_dict[Fields.ENTRYTYPE] in stats[Fields.ENTRYTYPE]:
-                stats[Fields.ENTRYTYPE][record_dict[Fields.ENTRYTYPE]] = (
-                    stats[Fields.ENTRYTYPE][record_dict[Fields.ENTRYTYPE]] + 1
-                )
-            else:
-                stats[Fields.ENTRYTYPE][record_dict[Fields.ENTRYTYPE]] = 1
-
-            if Fields.MD_PROV in record_dict:
-                record = colrev.record.record_prep.PrepRecord(record_dict)
-                prov_d = record.data[Fields.MD_PROV]
-                hints = []
-                for key, value in prov_d.items():
-                    if value["note"] != "":
-                        hints.append(f'{key} - {value["note"]}')
-
-                prep_man_hints.append([hint.lstrip() for hint in hints])
-                for hint in hints:
-                    if "change-score" in hint:
-                        continue
-                    # Note: if something causes the needs_manual_preparation
-                    # it is caused by all colrev_origins
-                    for orig in record_dict.get(Fields.ORIGIN, ["NA"]):
-                        crosstab.append([orig[: orig.rfind("/")], hint.lstrip()])
-
-            origins.append(
-                [x[: x.rfind("/")] for x in record_dict.get(Fields.ORIGIN, ["NA"])]
-            )
+        # Note: if something causes the needs_manual_preparation
+        # it is caused by all colrev_origins
+        crosstab = [
+            (origin[: origin.rfind("/")], f"{key} - {value['note']}".lstrip())
+            for record_dict in records.values()
+            if RecordState.md_needs_manual_preparation == record_dict[Fields.STATUS]
+            for key, value in record_dict.get(Fields.MD_PROV, {}).items()
+            if value["note"] != "" and "change-score" not in f"{key} - {value['note']}"
+            for origin in record_dict.get(Fields.ORIGIN, ["NA"])
+        ]
 
         print("Entry type statistics overall:")
-        utils.p_print(overall_types[Fields.ENTRYTYPE])
+        utils.p_print(overall_types)
 
         print("Entry type statistics (needs_manual_preparation):")
-        utils.p_print(stats[Fields.ENTRYTYPE])
+        utils.p_print(entrytype_stats)
 
         return pd.DataFrame(crosstab, columns=[Fields.ORIGIN, "hint"])
 
     def _export_prep_man_langs(self, records: dict) -> None:
         language_service = colrev.env.language_service.LanguageService()
 
-        missing_lang_recs = []
         self.review_manager.logger.info(
             "Calculate most likely languages for records without language field"
         )
-        for record in tqdm(records.values()):
-            if Fields.TITLE not in record:
-                continue
-            if Fields.LANGUAGE not in record:
-                confidence_values = language_service.compute_language_confidence_values(
-                    text=record[Fields.TITLE]
-                )
-                predicted_language, conf = confidence_values.pop(0)
-
-                lang_rec = {
+        missing_lang_recs = [
+            record
+            for record in records.values()
+            if Fields.TITLE in record and Fields.LANGUAGE not in record
+        ]
+        # Note : batch detection (instead of one title at a time)
+        confidence_values_list = (
+            language_service.compute_language_confidence_values_batch(
+                texts=[record[Fields.TITLE] for record in missing_lang_recs]
+            )
+        )
+        missing_lang_recs_df = pd.DataFrame(
+            [
+                {
                     Fields.ID: record[Fields.ID],
                     Fields.TITLE: record[Fields.TITLE],
                     "most_likely_language": predicted_language,
                     "confidence": conf,
                 }
-                missing_lang_recs.append(lang_rec)
-
-        missing_lang_recs_df = pd.DataFrame(missing_lang_recs)
+                for record, (predicted_language, conf) in zip(
+                    missing_lang_recs,
+                    (
+                        confidence_values[0] if confidence_values else ("", 0.0)
+                        for confidence_values in confidence_values_list
+                    ),
+                )
+            ]
+        )
         missing_lang_recs_df.to_csv(
             self.lang_prep_csv_path, index=False, quoting=csv.QUOTE_ALL
         )
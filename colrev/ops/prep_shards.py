@@ -0,0 +1,286 @@
+#! /usr/bin/env python
+"""Shards to distribute the prep and pdf-prep operations across machines (git branches)."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import typing
+from pathlib import Path
+
+import git
+
+import colrev.exceptions as colrev_exceptions
+import colrev.loader.load_utils
+from colrev.constants import Fields
+from colrev.constants import OperationsType
+from colrev.constants import RecordState
+from colrev.process.model import ProcessModel
+from colrev.writer.write_utils import write_file
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.review_manager
+
+COMMIT_PREFIXES = {OperationsType.prep: "Prep", OperationsType.pdf_prep: "PDFs"}
+
+# Note : workers (k/n) prepare the records of their shard on a separate branch
+# and commit them to data/<operation>/shards/shard-k-of-n.bib. The shards are merged
+# into records.bib (main(merge_shards=True)) and the merged shard branches
+# are deleted (locally and in the remotes).
+# PDFs are not versioned: pdf-prep workers need access to the same data/pdfs.
+
+
+def parse_shard(shard: str) -> typing.Tuple[int, int]:
+    """Parse a shard parameter (k/n, with 1 <= k <= n)."""
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", shard)
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise colrev_exceptions.ParameterError(
+            parameter="shard", value=shard, options=["k/n (e.g., 1/4)"]
+        )
+    return int(match.group(1)), int(match.group(2))
+
+
+def get_shard(record_id: str, nr_shards: int) -> int:
+    """Get the shard of a record (stable hash of the ID, 1-based)."""
+    digest = hashlib.sha1(record_id.encode("utf-8")).digest()  # nosec
+    return int.from_bytes(digest[:8], "big") % nr_shards + 1
+
+
+def in_shard(record_id: str, shard: typing.Tuple[int, int]) -> bool:
+    """Check whether a record belongs to the shard (k, n)."""
+    return get_shard(record_id, shard[1]) == shard[0]
+
+
+def get_branch_prefix(operation: OperationsType) -> str:
+    """Get the prefix of the shard branches of an operation."""
+    return f"colrev-{operation.value.replace('_', '-')}-shard"
+
+
+def get_branch_name(
+    shard: typing.Tuple[int, int],
+    *,
+    operation: OperationsType = OperationsType.prep,
+) -> str:
+    """Get the name of the branch of a shard."""
+    return f"{get_branch_prefix(operation)}-{shard[0]}-of-{shard[1]}"
+
+
+def get_shard_path(
+    shard: typing.Tuple[int, int],
+    *,
+    operation: OperationsType = OperationsType.prep,
+) -> Path:
+    """Get the (relative) path of the shard file."""
+    return Path(f"data/{operation.value}/shards/shard-{shard[0]}-of-{shard[1]}.bib")
+
+
+def is_legal_successor(
+    previous_state: RecordState,
+    state: RecordState,
+    *,
+    operation: OperationsType,
+) -> bool:
+    """Check whether a (shard) state may replace the previous state (in the records)."""
+    if state == previous_state:
+        return True
+    transitions = [t for t in ProcessModel.transitions if t["trigger"] == operation]
+    # Note : records in destination states (e.g., md_needs_manual_preparation)
+    # may be prepared again
+    operation_states = {t["source"] for t in transitions} | {
+        t["dest"] for t in transitions
+    }
+    return previous_state in operation_states and state in {
+        t["dest"] for t in transitions
+    }
+
+
+def checkout_shard_branch(
+    review_manager: colrev.review_manager.ReviewManager,
+    shard: typing.Tuple[int, int],
+    *,
+    operation: OperationsType = OperationsType.prep,
+) -> str:
+    """Check out the branch of a shard (created from HEAD).
+
+    Returns the previous branch (or commit if the HEAD was detached).
+    """
+    git_repo = review_manager.dataset.git_repo.repo
+    if git_repo.head.is_detached:
+        previous_branch = git_repo.head.commit.hexsha
+    else:
+        previous_branch = git_repo.active_branch.name
+    git_repo.git.checkout("-B", get_branch_name(shard, operation=operation))
+    return previous_branch
+
+
+def save_shard(
+    review_manager: colrev.review_manager.ReviewManager,
+    shard: typing.Tuple[int, int],
+    *,
+    previous_branch: str,
+    operation: OperationsType = OperationsType.prep,
+) -> None:
+    """Save the prepared records of a shard, commit, and push the branch.
+
+    Afterwards, the previous branch is checked out again.
+    """
+    records = review_manager.dataset.load_records_dict()
+    shard_records = {
+        record_id: record_dict
+        for record_id, record_dict in records.items()
+        if in_shard(record_id, shard)
+    }
+    shard_path = get_shard_path(shard, operation=operation)
+    (review_manager.path / shard_path).parent.mkdir(exist_ok=True, parents=True)
+    write_file(records_dict=shard_records, filename=review_manager.path / shard_path)
+    review_manager.dataset.git_repo.add_changes(shard_path)
+    review_manager.create_commit(
+        msg=f"{COMMIT_PREFIXES[operation]}: shard {shard[0]}/{shard[1]}"
+    )
+
+    git_repo = review_manager.dataset.git_repo.repo
+    if "origin" in [remote.name for remote in git_repo.remotes]:
+        git_repo.git.push(
+            "--force", "origin", get_branch_name(shard, operation=operation)
+        )
+    git_repo.git.checkout(previous_branch)
+
+
+def _get_shard_refs(git_repo: git.Repo, branch_prefix: str) -> typing.Dict[str, str]:
+    """Get the shard branches (local and remote) as {branch_name: ref}."""
+    shard_refs = {}
+    for remote in git_repo.remotes:
+        try:
+            remote.fetch(prune=True)
+        except git.GitCommandError:
+            continue
+        for ref in remote.refs:
+            if ref.remote_head.startswith(branch_prefix):
+                shard_refs[ref.remote_head] = ref.name
+    # Note : local branches take precedence
+    for head in git_repo.heads:
+        if head.name.startswith(branch_prefix):
+            shard_refs[head.name] = head.name
+    return shard_refs
+
+
+def _get_shard_branches(
+    git_repo: git.Repo,
+    *,
+    operation: OperationsType,
+) -> typing.Dict[typing.Tuple[int, int], str]:
+    """Get the shard branches as {(k, n): ref} (all shards must have the same n)."""
+    branch_prefix = get_branch_prefix(operation)
+    shard_branches = {}
+    for branch_name, ref in sorted(_get_shard_refs(git_repo, branch_prefix).items()):
+        match = re.fullmatch(rf"{branch_prefix}-(\d+)-of-(\d+)", branch_name)
+        if match:
+            shard_branches[(int(match.group(1)), int(match.group(2)))] = ref
+
+    nr_shards = sorted({n for _, n in shard_branches})
+    if len(nr_shards) > 1:
+        # Note : branches of a previous run (with another n) would prepare
+        # records twice (or overwrite records with outdated versions)
+        raise colrev_exceptions.ParameterError(
+            parameter="merge_shards",
+            value=f"shard branches with different numbers of shards ({nr_shards})",
+            options=[
+                "delete the shard branches of the other runs "
+                f"({get_branch_name((1, n), operation=operation)}, ...)"
+                for n in nr_shards
+            ],
+        )
+    return shard_branches
+
+
+def load_shards(
+    review_manager: colrev.review_manager.ReviewManager,
+    *,
+    operation: OperationsType = OperationsType.prep,
+) -> typing.Dict[typing.Tuple[int, int], dict]:
+    """Load the shard files from the shard branches."""
+    git_repo = review_manager.dataset.git_repo.repo
+    shards = {}
+    for shard, ref in _get_shard_branches(git_repo, operation=operation).items():
+        shard_path = get_shard_path(shard, operation=operation)
+        try:
+            shard_str = git_repo.git.show(f"{ref}:{shard_path.as_posix()}")
+        except git.GitCommandError:
+            review_manager.logger.info(f"Shard {shard[0]}/{shard[1]} not completed")
+            continue
+        shards[shard] = colrev.loader.load_utils.loads(
+            load_string=shard_str + "\n",
+            implementation="bib",
+            logger=review_manager.logger,
+            unique_id_field=Fields.ID,
+        )
+
+    if shards:
+        nr_shards = next(iter(shards))[1]
+        for k in range(1, nr_shards + 1):
+            if (k, nr_shards) not in shards:
+                review_manager.logger.warning(
+                    f"Shard {k}/{nr_shards} missing (records remain to be prepared)"
+                )
+    return shards
+
+
+def merge_shard_records(
+    review_manager: colrev.review_manager.ReviewManager,
+    shards: typing.Dict[typing.Tuple[int, int], dict],
+    *,
+    records: dict,
+    states_to_prepare: typing.List[RecordState],
+    operation: OperationsType = OperationsType.prep,
+) -> list:
+    """Merge the shard records into the records (returns the merged records).
+
+    Shard records are only merged if their status is a legal successor
+    of the status in the records (e.g., not for records changed in the meantime).
+    """
+    merged_records = []
+    for shard_records in shards.values():
+        for record_id, record_dict in shard_records.items():
+            if record_id not in records:
+                continue
+            previous_state = records[record_id][Fields.STATUS]
+            if previous_state not in states_to_prepare:
+                continue
+            if not is_legal_successor(
+                previous_state, record_dict[Fields.STATUS], operation=operation
+            ):
+                review_manager.logger.warning(
+                    f"Skip {record_id} (shard): invalid status transition "
+                    f"({previous_state} → {record_dict[Fields.STATUS]})"
+                )
+                continue
+            records[record_id] = record_dict
+            merged_records.append(record_dict)
+    return merged_records
+
+
+def delete_shard_branches(
+    review_manager: colrev.review_manager.ReviewManager,
+    shards: typing.List[typing.Tuple[int, int]],
+    *,
+    operation: OperationsType = OperationsType.prep,
+) -> None:
+    """Delete the branches of (merged) shards (locally and in the remotes)."""
+    git_repo = review_manager.dataset.git_repo.repo
+    branch_names = [get_branch_name(shard, operation=operation) for shard in shards]
+    active_branch = "" if git_repo.head.is_detached else git_repo.active_branch.name
+    for head in git_repo.heads:
+        if head.name in branch_names and head.name != active_branch:
+            git_repo.git.branch("-D", head.name)
+    for remote in git_repo.remotes:
+        remote_branch_names = [
+            ref.remote_head for ref in remote.refs if ref.remote_head in branch_names
+        ]
+        if not remote_branch_names:
+            continue
+        try:
+            git_repo.git.push(remote.name, "--delete", *remote_branch_names)
+        except git.GitCommandError:
+            review_manager.logger.warning(
+                f"Could not delete the shard branches in {remote.name}"
+            )
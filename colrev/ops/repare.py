@@ -5,6 +5,10 @@ from __future__ import annotations
 
 import os
 import shutil
+import time
+import typing
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
 
 import colrev.env.local_index
@@ -25,6 +29,8 @@ from colrev.writer.write_utils import write_file
 class Repare(colrev.process.operation.Operation):
     """Repare a CoLRev project."""
 
+    # pylint: disable=too-many-instance-attributes
+
     type = OperationsType.check
 
     def __init__(
@@ -44,6 +50,61 @@ class Repare(colrev.process.operation.Operation):
             notify_state_transition_operation=False
         )
         self.load_formatter = colrev.loader.load_utils_formatter.LoadFormatter()
+        self.dry_run = False
+        self._fix_summary: typing.Dict[str, dict] = {}
+        # Note : records that would be fixed (fixes that are not applied in dry-run mode)
+        self._dry_run_fixes: typing.Set[str] = set()
+        # Note : origin -> record ID (built once, instead of scanning all records
+        # for every origin)
+        self._origin_index: typing.Dict[str, str] = {}
+        # Note : origin prefix (feed) -> origins
+        self._prefix_index: typing.Dict[str, typing.List[str]] = defaultdict(list)
+        self._feed_prefixes: typing.Tuple[str, ...] = ()
+
+    def _build_origin_index(self, records: dict) -> None:
+        self._origin_index = {
+            origin: record_id
+            for record_id, record_dict in records.items()
+            for origin in record_dict[Fields.ORIGIN]
+        }
+        self._prefix_index = defaultdict(list)
+        for origin in self._origin_index:
+            self._prefix_index[origin.split("/")[0]].append(origin)
+
+    @contextmanager
+    def _fix_category(self, name: str, records: dict) -> typing.Iterator[None]:
+        """Time a category of fixes (and count the changed records in dry-run mode)."""
+        fingerprints = {}
+        if self.dry_run:
+            fingerprints = {
+                record_id: repr(record_dict)
+                for record_id, record_dict in records.items()
+            }
+            self._dry_run_fixes = set()
+        start = time.perf_counter()
+        yield
+        summary = {"seconds": time.perf_counter() - start}
+        if self.dry_run:
+            changed_records = {
+                record_id
+                for record_id, record_dict in records.items()
+                if fingerprints.get(record_id) != repr(record_dict)
+            }
+            summary["changed_records"] = len(
+                changed_records | self._dry_run_fixes
+            ) + len(fingerprints.keys() - records.keys())
+        self._fix_summary[name] = summary
+
+    def _print_fix_summary(self) -> None:
+        mode = " (dry-run: no changes saved)" if self.dry_run else ""
+        self.review_manager.logger.info(f"Repare summary{mode}:")
+        for name, summary in self._fix_summary.items():
+            changed = ""
+            if "changed_records" in summary:
+                changed = f"{summary['changed_records']} records".rjust(15)
+            self.review_manager.logger.info(
+                f" {name.ljust(30)}{changed}{summary['seconds']:10.2f}s"
+            )
 
     def _fix_broken_symlink_based_on_local_index(
         self, *, record: colrev.record.record.Record, full_path: Path
@@ -83,6 +144,14 @@ class Repare(colrev.process.operation.Operation):
         for record_id, record_dict in self._records_with_file_references(
             records=records
         ):
+            if self.dry_run:
+                full_path = self._full_file_path(record_dict=record_dict)
+                if not full_path.is_file():
+                    self.review_manager.logger.info(
+                        f" fix missing file: {record_id} ({record_dict[Fields.FILE]})"
+                    )
+                    self._dry_run_fixes.add(record_id)
+                continue
             self._fix_record_file_reference(
                 record_id=record_id, record_dict=record_dict
             )
@@ -101,21 +170,18 @@ class Repare(colrev.process.operation.Operation):
                 verbose_mode=self.review_manager.verbose_mode,
             )
             prefix = search_source.get_origin_prefix()
-            for record_dict in records.values():
+            for origin in self._prefix_index.get(prefix, []):
+                record_dict = records.get(self._origin_index.get(origin, ""), {})
                 if Fields.FILE not in record_dict:
                     continue
-                for origin in record_dict[Fields.ORIGIN]:
-                    if origin.startswith(prefix):
-                        feed_id = origin[len(prefix) + 1 :]
-                        feed_record = files_dir_feed.feed_records[feed_id]
-                        if (
-                            feed_record.get(Fields.FILE, "a")
-                            != record_dict[Fields.FILE]
-                        ):
-                            feed_record[Fields.FILE] = record_dict[Fields.FILE]
-                            files_dir_feed.feed_records[feed_id] = feed_record
-
-            files_dir_feed.save()
+                feed_id = origin[len(prefix) + 1 :]
+                feed_record = files_dir_feed.feed_records[feed_id]
+                if feed_record.get(Fields.FILE, "a") != record_dict[Fields.FILE]:
+                    feed_record[Fields.FILE] = record_dict[Fields.FILE]
+                    files_dir_feed.feed_records[feed_id] = feed_record
+
+            if not self.dry_run:
+                files_dir_feed.save()
 
     def _records_with_file_references(self, *, records: dict) -> list[tuple[str, dict]]:
         return [
@@ -240,9 +306,8 @@ class Repare(colrev.process.operation.Operation):
         self, *, record: colrev.record.record.Record, key: str, source_feeds: dict
     ) -> None:
         if key in record.data[Fields.D_PROV]:
-            if not any(
-                record.data[Fields.D_PROV][key]["source"].startswith(sf)
-                for sf in list(source_feeds.keys())
+            if not record.data[Fields.D_PROV][key]["source"].startswith(
+                self._feed_prefixes
             ):
                 del record.data[Fields.D_PROV][key]
         if key not in record.data[Fields.D_PROV]:
@@ -329,9 +394,8 @@ class Repare(colrev.process.operation.Operation):
         source_feeds: dict,
     ) -> None:
         if key in record.data[Fields.MD_PROV]:
-            if not any(
-                record.data[Fields.MD_PROV][key]["source"].startswith(sf)
-                for sf in list(source_feeds.keys())
+            if not record.data[Fields.MD_PROV][key]["source"].startswith(
+                self._feed_prefixes
             ):
                 del record.data[Fields.MD_PROV][key]
         if key not in record.data[Fields.MD_PROV]:
@@ -389,6 +453,8 @@ class Repare(colrev.process.operation.Operation):
 
     def _fix_provenance(self, records: dict) -> None:
         source_feeds = self._get_source_feeds()
+        # Note : str.startswith(tuple) corresponds to any(startswith(...))
+        self._feed_prefixes = tuple(source_feeds.keys())
         for record_dict in records.values():
             record = colrev.record.record.Record(record_dict)
             self._remove_fields(record)
@@ -416,14 +482,9 @@ class Repare(colrev.process.operation.Operation):
                         main_record_origin = (
                             search_source.get_origin_prefix() + "/" + record_id
                         )
-                        main_record_l = [
-                            r
-                            for r in records.values()
-                            if main_record_origin in r[Fields.ORIGIN]
-                        ]
-                        if not main_record_l:
+                        main_record_id = self._origin_index.pop(main_record_origin, "")
+                        if main_record_id not in records:
                             continue
-                        main_record_id = main_record_l[0][Fields.ID]
                         if 1 == len(records[main_record_id][Fields.ORIGIN]):
                             del records[main_record_id]
                         else:
@@ -432,6 +493,8 @@ class Repare(colrev.process.operation.Operation):
                             )
                         del curation_recs[record_id]
 
+            if self.dry_run:
+                continue
             write_file(
                 records_dict=curation_recs, filename=search_source.search_results_path
             )
@@ -467,8 +530,13 @@ class Repare(colrev.process.operation.Operation):
             self.load_formatter.run(record)
 
     @colrev.process.operation.Operation.decorate()
-    def main(self) -> None:
-        """Repare a CoLRev project (main entrypoint)."""
+    def main(self, *, dry_run: bool = False) -> None:
+        """Repare a CoLRev project (main entrypoint).
+
+        In dry-run mode, the planned fixes are reported (without saving changes).
+        """
+        self.dry_run = dry_run
+        self._fix_summary = {}
         # Try: open settings, except: notify & start repare
 
         # ...
@@ -500,14 +568,20 @@ class Repare(colrev.process.operation.Operation):
                     record_str += line
                     line = file.readline()
 
-            write_file(records_dict=separated_records, filename=Path("extracted.bib"))
+            if not self.dry_run:
+                write_file(
+                    records_dict=separated_records, filename=Path("extracted.bib")
+                )
 
             try:
                 records = self.review_manager.dataset.load_records_dict()
             except AttributeError:
                 return
 
-        self._fix_curated_sources(records)
+        self._build_origin_index(records)
+
+        with self._fix_category("curated sources", records):
+            self._fix_curated_sources(records)
 
         # removing specific fields
         # for record_dict in records.values():
@@ -520,12 +594,20 @@ class Repare(colrev.process.operation.Operation):
         #             key="colrev_local_index"
         #         )
 
-        self._update_field_names(records)
+        with self._fix_category("field names", records):
+            self._update_field_names(records)
+
+        with self._fix_category("provenance", records):
+            self._fix_provenance(records)
 
-        self._fix_provenance(records)
+        with self._fix_category("field values", records):
+            self._fix_field_values(records)
 
-        self._fix_field_values(records)
+        with self._fix_category("files", records):
+            self._fix_files(records)
 
-        self._fix_files(records)
+        self._print_fix_summary()
+        if self.dry_run:
+            return
 
         self.review_manager.dataset.save_records_dict(records)
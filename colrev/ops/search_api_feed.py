@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import typing
 from copy import deepcopy
 from pathlib import Path
@@ -14,6 +15,7 @@ import colrev.loader.load_utils
 import colrev.loader.load_utils_formatter
 import colrev.record.record_merger
 import colrev.utils
+import colrev.writer.bib
 from colrev.constants import Colors
 from colrev.constants import DefectCodes
 from colrev.constants import EndpointType
@@ -23,9 +25,19 @@ from colrev.constants import FieldSet
 from colrev.constants import FieldValues
 from colrev.constants import SearchType
 from colrev.package_manager.package_manager import PackageManager
-from colrev.writer.write_utils import to_string
+from colrev.writer.bib import RECORDS_FIELD_ORDER
 from colrev.writer.write_utils import write_file
 
+# Entry headers of the bib writer (e.g., "@article{000001,")
+_ENTRY_HEADER_PATTERN = re.compile(rb"^@[^{\n]+\{([^,\n]+),$", re.MULTILINE)
+
+
+def _copy_record_dict(record_dict: dict) -> dict:
+    return {
+        key: deepcopy(value) if isinstance(value, (dict, list)) else value
+        for key, value in record_dict.items()
+    }
+
 
 def create_api_source(
     *, platform: str, path: Path
@@ -108,6 +120,11 @@ class SearchAPIFeed:
 
         self.origin_prefix = self.source.get_origin_prefix()
 
+        self._feed_snapshot: typing.Dict[str, dict] = {}
+        self._feed_ids: typing.List[str] = []
+        self._feed_offsets: typing.List[int] = []
+        self._feed_size = 0
+        self._feed_mtime_ns = 0
         self._load_feed()
 
         if prep_mode:
@@ -116,8 +133,46 @@ class SearchAPIFeed:
         self.verbose_mode = verbose_mode
         self.prep_mode = prep_mode
         self._retrieved_records_for_saving = False
+        self._origin_index: typing.Dict[str, str] = {}
+        self._indexed_record_ids: typing.Set[str] = set()
         self.records = records or {}
 
+    @property
+    def records(self) -> dict:
+        """Get the (primary) records."""
+        return self._records
+
+    @records.setter
+    def records(self, value: dict) -> None:
+        self._records = value
+        self._build_origin_index()
+
+    def _build_origin_index(self) -> None:
+        # Note : maps the feed origins to the IDs of the main records
+        # (instead of scanning all records for every retrieved record)
+        self._origin_index = {}
+        self._indexed_record_ids = set()
+        for record_id in self._records:
+            self._index_record(record_id)
+
+    def _index_record(self, record_id: str) -> None:
+        self._indexed_record_ids.add(record_id)
+        for origin in self._records[record_id].get(Fields.ORIGIN, []):
+            if origin.startswith(f"{self.origin_prefix}/"):
+                self._origin_index[origin] = record_id
+
+    def _index_added_records(self) -> None:
+        # Note : dicts preserve the insertion order, i.e., records added
+        # (outside the feed) are usually at the end of the records
+        # (other changes are covered by the linear scan in _get_main_record)
+        added_record_ids = []
+        for record_id in reversed(self._records):
+            if record_id in self._indexed_record_ids:
+                break
+            added_record_ids.append(record_id)
+        for record_id in reversed(added_record_ids):
+            self._index_record(record_id)
+
     @property
     def source_identifier(self) -> str:
         """Get the source identifier."""
@@ -138,12 +193,15 @@ class SearchAPIFeed:
             self._available_ids = {}
             self._next_incremental_id = 1
             self.feed_records = {}
+            self._set_feed_index(b"")
             return
+        feed_bytes = self.feed_file.read_bytes()
         self.feed_records = colrev.loader.load_utils.loads(
-            load_string=self.feed_file.read_text(encoding="utf8"),
+            load_string=feed_bytes.decode("utf-8").replace("\r\n", "\n"),
             implementation="bib",
             logger=self.logger,
         )
+        self._set_feed_index(feed_bytes)
         self._available_ids = {
             x[self.source_identifier]: x[Fields.ID]
             for x in self.feed_records.values()
@@ -161,19 +219,131 @@ class SearchAPIFeed:
             + 1
         )
 
-    def _set_id(self, record: colrev.record.record.Record) -> None:
-        """Set incremental record ID
-        If self.source_identifier is in record_dict, it is updated, otherwise added as a new record.
+    def _set_feed_index(self, feed_bytes: bytes) -> None:
+        # Note : the offset index maps the (sorted) feed records to the byte
+        # offsets of their entries in the feed file. It allows save() to append
+        # new entries and to rewrite the file from the first changed entry
+        # (instead of rewriting the whole file).
+        self._feed_snapshot = {
+            record_id: _copy_record_dict(record_dict)
+            for record_id, record_dict in self.feed_records.items()
+        }
+        self._feed_ids = []
+        self._feed_offsets = []
+        self._feed_size = len(feed_bytes)
+        self._feed_mtime_ns = (
+            self.feed_file.stat().st_mtime_ns if self.feed_file.is_file() else 0
+        )
+        if b"\r" in feed_bytes:
+            return
+        feed_ids, feed_offsets = [], []
+        for match in _ENTRY_HEADER_PATTERN.finditer(feed_bytes):
+            if match.start() > 1 and feed_bytes[match.start() - 2] != ord("\n"):
+                continue
+            feed_ids.append(match.group(1).decode("utf-8"))
+            feed_offsets.append(match.start())
+        # Only use the index if the file corresponds to the bib writer's layout
+        if feed_ids != sorted(self.feed_records) or (
+            feed_offsets and feed_offsets[0] != 0
+        ):
+            return
+        self._feed_ids, self._feed_offsets = feed_ids, feed_offsets
+
+    def _feed_file_is_unchanged(self) -> bool:
+        if not self.feed_file.is_file():
+            return False
+        stat = self.feed_file.stat()
+        return (
+            stat.st_size == self._feed_size and stat.st_mtime_ns == self._feed_mtime_ns
+        )
+
+    # pylint: disable=too-many-locals
+    def _write_feed_incrementally(self) -> bool:
+        """Append new entries and rewrite changed entries (in place).
+
+        Returns False if the feed file must be rewritten completely.
         """
+        if not self._feed_ids or not self._feed_file_is_unchanged():
+            return False
+        new_ids = sorted(self.feed_records.keys() - self._feed_snapshot.keys())
+        if len(self.feed_records) - len(new_ids) != len(self._feed_ids):
+            # Records were removed
+            return False
+        if new_ids and new_ids[0] <= self._feed_ids[-1]:
+            # New records would not be at the end of the (sorted) file
+            return False
+        changed_positions = [
+            position
+            for position, record_id in enumerate(self._feed_ids)
+            if self.feed_records[record_id] != self._feed_snapshot[record_id]
+        ]
+        if not changed_positions and not new_ids:
+            return True
+
+        if changed_positions:
+            first_position = changed_positions[0]
+            start = self._feed_offsets[first_position]
+        else:
+            first_position = len(self._feed_ids)
+            start = self._feed_size
+        changed_ids = {self._feed_ids[position] for position in changed_positions}
+
+        with open(self.feed_file, "r+b") as file:
+            file.seek(start)
+            tail = file.read() if changed_positions else b""
+            entries = []
+            for position in range(first_position, len(self._feed_ids)):
+                record_id = self._feed_ids[position]
+                if record_id in changed_ids:
+                    entries.append(self._get_entry_bytes(record_id))
+                    continue
+                entry_start = self._feed_offsets[position] - start
+                if position + 1 < len(self._feed_ids):
+                    # Note : exclude the newline separating the entries
+                    entry_end = self._feed_offsets[position + 1] - start - 1
+                else:
+                    entry_end = len(tail)
+                entries.append(tail[entry_start:entry_end])
+            entries.extend(self._get_entry_bytes(record_id) for record_id in new_ids)
+
+            separator = b"\n" if not changed_positions else b""
+            file.seek(start)
+            file.write(separator + b"\n".join(entries))
+            file.truncate()
+
+        offset = start + len(separator)
+        offsets = []
+        for entry in entries:
+            offsets.append(offset)
+            offset += len(entry) + 1
+        self._feed_offsets = self._feed_offsets[:first_position] + offsets
+        self._feed_ids.extend(new_ids)
+        for record_id in list(changed_ids) + new_ids:
+            self._feed_snapshot[record_id] = _copy_record_dict(
+                self.feed_records[record_id]
+            )
+        self._feed_size = offset - 1
+        self._feed_mtime_ns = self.feed_file.stat().st_mtime_ns
+        return True
+
+    def _get_entry_bytes(self, record_id: str) -> bytes:
+        return colrev.writer.bib.to_string(
+            records_dict={record_id: self.feed_records[record_id]}
+        ).encode("utf-8")
+
+    def _get_id(self, record: colrev.record.record.Record) -> str:
         if self.source_identifier not in record.data:
             raise colrev_exceptions.NotFeedIdentifiableException()
 
         if record.data[self.source_identifier] in self._available_ids:
-            record.data[Fields.ID] = self._available_ids[
-                record.data[self.source_identifier]
-            ]
-        else:
-            record.data[Fields.ID] = str(self._next_incremental_id).rjust(6, "0")
+            return self._available_ids[record.data[self.source_identifier]]
+        return str(self._next_incremental_id).rjust(6, "0")
+
+    def _set_id(self, record: colrev.record.record.Record) -> None:
+        """Set incremental record ID
+        If self.source_identifier is in record_dict, it is updated, otherwise added as a new record.
+        """
+        record.data[Fields.ID] = self._get_id(record)
 
     def add_record_to_feed(
         self,
@@ -219,39 +389,46 @@ class SearchAPIFeed:
                 )
         return added_new
 
+    @staticmethod
+    def _get_comparable_value(key: str, value: typing.Any) -> str:
+        # Normalize values like saving/loading the feed records would
+        # (lines are stripped and joined, DOIs are upper-cased)
+        value_str = " ".join(
+            line.strip() for line in re.split(r"\r\n|\r|\n", str(value)) if line.strip()
+        )
+        if key == Fields.DOI:
+            return value_str.strip(" {},").upper()
+        if key == Fields.ENTRYTYPE and value_str not in ENTRYTYPES.get_all():
+            return ENTRYTYPES.MISC
+        return value_str.strip()
+
+    def _get_comparable_fields(self, record: colrev.record.record.Record) -> dict:
+        comparable_fields = {}
+        for key, value in record.data.items():
+            if key in FieldSet.PROVENANCE_KEYS + [Fields.ID, Fields.CURATION_ID]:
+                continue
+            comparable_value = self._get_comparable_value(key, value)
+            # Empty values of ordered fields are not saved
+            if comparable_value == "" and key in RECORDS_FIELD_ORDER:
+                continue
+            comparable_fields[key] = comparable_value
+        return comparable_fields
+
     def _have_changed(
         self,
         record_a: colrev.record.record.Record,
         record_b: colrev.record.record.Record,
     ) -> bool:
-
-        def tostr_and_load(record: colrev.record.record.Record) -> dict:
-            record_dict = deepcopy(record.data)
-            bibtex_str = to_string(
-                records_dict={record_dict[Fields.ID]: record_dict}, implementation="bib"
-            )
-            record_dict = list(
-                colrev.loader.load_utils.loads(
-                    load_string=bibtex_str,
-                    implementation="bib",
-                    logger=self.logger,
-                ).values()
-            )[0]
-            return record_dict
-
         # To ignore changes introduced by saving/loading the feed-records,
-        # we parse and load them in the following.
-        record_a_dict = tostr_and_load(record_a)
-        record_b_dict = tostr_and_load(record_b)
+        # we compare the normalized field values.
+        record_a_dict = self._get_comparable_fields(record_a)
+        record_b_dict = self._get_comparable_fields(record_b)
 
         # Note : record_a can have more keys (that's ok)
-        changed = False
         for key, value in record_b_dict.items():
-            if key in FieldSet.PROVENANCE_KEYS + [Fields.ID, Fields.CURATION_ID]:
-                continue
             if key not in record_a_dict or record_a_dict[key] != value:
                 return True
-        return changed
+        return False
 
     def _update_record_retract(
         self,
@@ -374,16 +551,21 @@ class SearchAPIFeed:
 
     def _get_main_record(self, colrev_origin: str) -> colrev.record.record.Record:
 
-        main_record_dict: dict = {}
-        for record_dict in self.records.values():
-            if colrev_origin in record_dict[Fields.ORIGIN]:
-                main_record_dict = record_dict
-                break
-
-        if main_record_dict == {}:
-            raise colrev_exceptions.RecordNotFoundException(
-                f"Could not find/update {colrev_origin}"
-            )
+        self._index_added_records()
+
+        record_id = self._origin_index.get(colrev_origin, "")
+        main_record_dict = self._records.get(record_id, {})
+        if colrev_origin not in main_record_dict.get(Fields.ORIGIN, []):
+            # Note : the record was removed or its origins were changed
+            # (outside the feed, e.g., merged into another record):
+            # one linear scan (re-indexing the records)
+            self._build_origin_index()
+            record_id = self._origin_index.get(colrev_origin, "")
+            main_record_dict = self._records.get(record_id, {})
+            if colrev_origin not in main_record_dict.get(Fields.ORIGIN, []):
+                raise colrev_exceptions.RecordNotFoundException(
+                    f"Could not find/update {colrev_origin}"
+                )
         return colrev.record.record.Record(main_record_dict)
 
     def _update_record(
@@ -458,11 +640,11 @@ class SearchAPIFeed:
         self, record: colrev.record.record.Record
     ) -> colrev.record.record.Record:
         """Get the previous record dict version."""
-        record = deepcopy(record)
-        self._set_id(record)
+        feed_id = self._get_id(record)
         prev_feed_record_dict = {}
-        if record.data[Fields.ID] in self.feed_records:
-            prev_feed_record_dict = deepcopy(self.feed_records[record.data[Fields.ID]])
+        if feed_id in self.feed_records:
+            # Note : feed records are replaced (not modified) in add_record_to_feed()
+            prev_feed_record_dict = self.feed_records[feed_id].copy()
         return colrev.record.record.Record(prev_feed_record_dict)
 
     def _prep_retrieved_record(
@@ -514,9 +696,10 @@ class SearchAPIFeed:
         if not skip_print and not self.prep_mode:
             self._print_post_run_search_infos()
 
-        if len(self.feed_records) > 0:
+        if len(self.feed_records) > 0 and not self._write_feed_incrementally():
             self.feed_file.parents[0].mkdir(parents=True, exist_ok=True)
             write_file(records_dict=self.feed_records, filename=self.feed_file)
+            self._set_feed_index(self.feed_file.read_bytes())
 
         if not skip_print:
             self._nr_added = 0
@@ -3,16 +3,31 @@
 
 from __future__ import annotations
 
-import io
+import json
 import typing
+from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore
+
 import colrev.env.utils
 import colrev.process.operation
 from colrev.constants import Colors
 from colrev.constants import OperationsType
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import git
+
+ANALYTICS_CACHE_PATH = Path(".colrev/status_analytics.json")
+
+# Note : the analytics rows are derived from the STATUS_FILE of each commit.
+# Commits are immutable, so the rows are cached by commit SHA and only
+# new commits are parsed. The C-based YAML loader (libyaml) is used if available.
+
 
 class Status(colrev.process.operation.Operation):
     """Determine the status of the project."""
@@ -26,51 +41,66 @@ class Status(colrev.process.operation.Operation):
             operations_type=self.type,
         )
 
+    def _load_analytics_cache(self) -> dict:
+        try:
+            return json.loads(
+                (self.review_manager.path / ANALYTICS_CACHE_PATH).read_text(
+                    encoding="utf-8"
+                )
+            )
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_analytics_cache(self, analytics_cache: dict) -> None:
+        path = self.review_manager.path / ANALYTICS_CACHE_PATH
+        try:
+            colrev.env.utils.atomic_write_json(path, analytics_cache)
+        except OSError:
+            pass
+
+    def _get_analytics_row(self, commit: git.Commit) -> dict:
+        filecontents = (
+            commit.tree / str(self.review_manager.paths.STATUS_FILE)
+        ).data_stream.read()
+
+        # TBD: we could simply include the whole STATUS_FILE
+        # (to create a general-purpose status analyzer)
+        # -> flatten nested structures (e.g., overall/currently)
+        # -> integrate with get_status (current data) -
+        # and get_prior? (levels: aggregated_statistics vs. record-level?)
+
+        data_loaded = yaml.load(filecontents, Loader=SafeLoader)  # nosec
+        return {
+            "atomic_steps": data_loaded["atomic_steps"],
+            "completed_atomic_steps": data_loaded["completed_atomic_steps"],
+            "commit_id": commit.hexsha,
+            "commit_message": str(commit.message).split("\n", maxsplit=1)[0],
+            "commit_author": commit.author.name,
+            "committed_date": commit.committed_date,
+            "search": data_loaded["overall"]["md_retrieved"],
+            "included": data_loaded["overall"]["rev_included"],
+        }
+
     def get_analytics(self) -> dict:
         """Get status analytics."""
         analytics_dict = {}
         git_repo = self.review_manager.dataset.git_repo.repo
 
-        revlist = list(
-            (
-                commit.hexsha,
-                commit.message,
-                commit.author.name,
-                commit.committed_date,
-                (
-                    commit.tree / str(self.review_manager.paths.STATUS_FILE)
-                ).data_stream.read(),
-            )
-            for commit in git_repo.iter_commits(
-                paths=str(self.review_manager.paths.STATUS_FILE)
-            )
+        analytics_cache = self._load_analytics_cache()
+        commits = list(
+            git_repo.iter_commits(paths=str(self.review_manager.paths.STATUS_FILE))
         )
-        for ind, (
-            commit_id,
-            commit_msg,
-            commit_author,
-            committed_date,
-            filecontents,
-        ) in enumerate(revlist):
-            var_t = io.StringIO(filecontents.decode("utf-8"))
-
-            # TBD: we could simply include the whole STATUS_FILE
-            # (to create a general-purpose status analyzer)
-            # -> flatten nested structures (e.g., overall/currently)
-            # -> integrate with get_status (current data) -
-            # and get_prior? (levels: aggregated_statistics vs. record-level?)
-
-            data_loaded = yaml.safe_load(var_t)
-            analytics_dict[len(revlist) - ind] = {
-                "atomic_steps": data_loaded["atomic_steps"],
-                "completed_atomic_steps": data_loaded["completed_atomic_steps"],
-                "commit_id": commit_id,
-                "commit_message": commit_msg.split("\n")[0],
-                "commit_author": commit_author,
-                "committed_date": committed_date,
-                "search": data_loaded["overall"]["md_retrieved"],
-                "included": data_loaded["overall"]["rev_included"],
-            }
+        cached_shas = set(analytics_cache)
+        for ind, commit in enumerate(commits):
+            if commit.hexsha not in analytics_cache:
+                analytics_cache[commit.hexsha] = self._get_analytics_row(commit)
+            analytics_dict[len(commits) - ind] = dict(analytics_cache[commit.hexsha])
+        # Note : drop commits that are no longer in the history (e.g., after rebases)
+        analytics_cache = {
+            commit.hexsha: analytics_cache[commit.hexsha] for commit in commits
+        }
+        if set(analytics_cache) != cached_shas:
+            self._save_analytics_cache(analytics_cache)
 
         # keys = list(analytics_dict.values())[0].keys()
         # with open("analytics.csv", "w", newline="", encoding="utf8") as output_file:
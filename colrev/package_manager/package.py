@@ -22,6 +22,24 @@ from colrev.constants import EndpointType
 BASECLASS_OVERVIEW = base_classes.BASECLASS_OVERVIEW
 
 
+def load_endpoint_class(
+    endpoint_path: str, endpoint_type: EndpointType, identifier: str
+) -> typing.Any:
+    """Load (and verify) an endpoint class (module:class)."""
+    module_name, class_name = endpoint_path.split(":")
+    module = importlib.import_module(module_name)
+    endpoint_class = getattr(module, class_name)
+    baseclass_definition = typing.cast(
+        typing.Type, BASECLASS_OVERVIEW[endpoint_type]["import_name"]
+    )
+    if not issubclass(endpoint_class, baseclass_definition):
+        raise TypeError(
+            f"{identifier}({endpoint_class}) must implement "
+            f"all abstract methods of {baseclass_definition}!"
+        )
+    return endpoint_class
+
+
 class Package:
     """A Python package for CoLRev."""
 
@@ -69,23 +87,6 @@ class Package:
             0
         ].value
 
-    def _verify_endpoint(
-        self,
-        endpoint_class: typing.Any,
-        endpoint_type: EndpointType,
-        identifier: str,
-    ) -> None:
-        # baseclass_definition = BASECLASS_OVERVIEW[endpoint_type]["import_name"]
-
-        baseclass_definition = typing.cast(
-            typing.Type, BASECLASS_OVERVIEW[endpoint_type]["import_name"]
-        )
-        if not issubclass(endpoint_class, baseclass_definition):
-            raise TypeError(
-                f"{identifier}({endpoint_class}) must implement "
-                f"all abstract methods of {baseclass_definition}!"
-            )
-
     def get_endpoint_class(self, package_type: EndpointType) -> typing.Any:
         """Get the endpoint class for a package type."""
         if not self.has_endpoint(package_type):
@@ -93,12 +94,9 @@ class Package:
                 f"Package {self.name} does not have a {package_type} endpoint"
             )
 
-        endpoint_path = self.get_endpoint(package_type)
-        module_name, class_name = endpoint_path.split(":")
-        module = importlib.import_module(module_name)
-        cls = getattr(module, class_name)
-        self._verify_endpoint(cls, package_type, self.name)
-        return cls
+        return load_endpoint_class(
+            self.get_endpoint(package_type), package_type, self.name
+        )
 
     def add_to_type_identifier_endpoint_dict(
         self, type_identifier_endpoint_dict: dict
@@ -158,6 +158,14 @@ class PrepPackageBaseClass(ABC):
     ) -> colrev.record.record.Record:
         """Run the prep operation."""
 
+    # pylint: disable=unused-argument
+    def prefetch(self, records: typing.Sequence[colrev.record.record.Record]) -> None:
+        """Retrieve data for all records at once before prepare() is called.
+
+        Optional: the default does nothing. Packages can override it to
+        request data for a batch of records (e.g., concurrently).
+        """
+
 
 class PrepManPackageBaseClass(ABC):
     """The base class for PrepMan packages.
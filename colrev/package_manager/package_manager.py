@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import importlib.metadata
 import json
 import shutil
 
@@ -17,9 +16,9 @@ from pathlib import Path
 from packaging.requirements import InvalidRequirement
 from packaging.requirements import Requirement
 
-import colrev.exceptions as colrev_exceptions
 import colrev.package_manager.colrev_internal_packages
 import colrev.package_manager.package
+import colrev.package_manager.package_registry
 from colrev.package_manager.colrev_internal_packages import get_internal_packages_dict
 from colrev.constants import Colors
 from colrev.constants import EndpointType
@@ -85,31 +84,28 @@ def _run_uv_pip_list() -> subprocess.CompletedProcess[str]:
     )
 
 
+# Note : endpoint classes are resolved once per process
+_ENDPOINT_CLASSES: typing.Dict[typing.Tuple[EndpointType, str], typing.Any] = {}
+
+
 class PackageManager:
     """The PackageManager provides functionality for package lookup and discovery."""
 
     def _get_package_identifiers(self) -> list:
-        group = "colrev"
-        return [
-            dist.metadata["name"]
-            for dist in importlib.metadata.distributions()
-            for ep in dist.entry_points
-            if ep.group == group
-        ]
+        return list(colrev.package_manager.package_registry.get_packages())
 
     def _load_type_identifier_endpoint_dict(self) -> dict:
         type_identifier_endpoint_dict: typing.Dict[
             EndpointType, typing.Dict[str, typing.Any]
         ] = {endpoint_type: {} for endpoint_type in EndpointType}
 
-        for package_identifier in self._get_package_identifiers():
-            try:
-                package = colrev.package_manager.package.Package(package_identifier)
-                package.add_to_type_identifier_endpoint_dict(
-                    type_identifier_endpoint_dict
-                )
-            except colrev_exceptions.MissingDependencyError as exc:
-                print(exc)
+        packages = colrev.package_manager.package_registry.get_packages()
+        for package_identifier, endpoints in packages.items():
+            for endpoint_type in EndpointType:
+                if endpoint_type.value in endpoints:
+                    type_identifier_endpoint_dict[endpoint_type][package_identifier] = (
+                        endpoints[endpoint_type.value]
+                    )
 
         return type_identifier_endpoint_dict
 
@@ -137,8 +133,24 @@ class PackageManager:
         self, *, package_type: EndpointType, package_identifier: str
     ):
         """Load a package endpoint."""
-        package = colrev.package_manager.package.Package(package_identifier)
-        return package.get_endpoint_class(package_type)
+        key = (package_type, package_identifier)
+        if key in _ENDPOINT_CLASSES:
+            return _ENDPOINT_CLASSES[key]
+
+        endpoints = colrev.package_manager.package_registry.get_packages().get(
+            package_identifier, {}
+        )
+        try:
+            endpoint_class = colrev.package_manager.package.load_endpoint_class(
+                endpoints[package_type.value], package_type, package_identifier
+            )
+        except (KeyError, ImportError, AttributeError):
+            # Note : the registry may be outdated (e.g., packages installed
+            # in editable mode): fall back to the package metadata
+            package = colrev.package_manager.package.Package(package_identifier)
+            endpoint_class = package.get_endpoint_class(package_type)
+        _ENDPOINT_CLASSES[key] = endpoint_class
+        return endpoint_class
 
     def is_installed(self, package_name: str, *, uv: bool = False) -> bool:
         """Check if a package is installed."""
@@ -161,25 +173,8 @@ class PackageManager:
                 FileNotFoundError,
             ):
                 pass
-        else:
-            try:
-                if sys.version_info >= (3, 10):
-                    # Use packages_distributions in Python 3.10+
-                    # pylint: disable=import-outside-toplevel
-                    from importlib.metadata import distributions
-
-                    installed_packages = [
-                        dist.metadata["Name"].replace("_", "-").replace(".", "-")
-                        for dist in distributions()
-                    ]
-                    if fixed_package_name in installed_packages:
-                        return True
-                else:
-                    # Fallback for Python < 3.10 using the distribution method
-                    importlib.metadata.distribution(package_name.replace("-", "_"))
-                    return True
-            except importlib.metadata.PackageNotFoundError:
-                pass
+        elif colrev.package_manager.package_registry.is_installed(package_name):
+            return True
         return False
 
     def _get_packages_to_install(
@@ -291,3 +286,4 @@ class PackageManager:
             ) as exc:
                 print(f"Installation failed: {safe_selected_package}")
                 print(exc)
+        colrev.package_manager.package_registry.clear_cache()
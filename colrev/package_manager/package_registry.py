@@ -0,0 +1,111 @@
+#! /usr/bin/env python
+"""Cached registry of the installed (CoLRev) packages."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import typing
+from importlib.metadata import distributions
+from pathlib import Path
+
+import colrev.env.utils
+from colrev.constants import Filepaths
+
+# Note : scanning the installed distributions (importlib.metadata) requires
+# reading the metadata and entry points of every distribution.
+# The registry snapshot is stored in the local environment and keyed by a
+# fingerprint of the sys.path directories (mtimes and *.dist-info entries),
+# which changes when packages are installed, upgraded, or removed.
+# Within a process, the snapshot is loaded once (see clear_cache()).
+
+COLREV_ENTRY_POINT_GROUP = "colrev"
+
+_SNAPSHOT: typing.Optional[dict] = None
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a distribution name (for comparisons)."""
+    return name.lower().replace("_", "-").replace(".", "-")
+
+
+def _get_fingerprint() -> str:
+    fingerprint = hashlib.sha256()
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or ".").st_mtime_ns
+            metadata_dirs = sorted(
+                name
+                for name in os.listdir(path or ".")
+                if name.endswith((".dist-info", ".egg-info"))
+            )
+        except OSError:
+            continue
+        fingerprint.update(f"{path}:{mtime}:{metadata_dirs}\n".encode("utf-8"))
+    return fingerprint.hexdigest()
+
+
+def _scan() -> dict:
+    """Scan the installed distributions and the CoLRev entry points."""
+    installed: typing.Dict[str, str] = {}
+    packages: typing.Dict[str, typing.Dict[str, str]] = {}
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        if not name:
+            continue
+        installed.setdefault(normalize_name(name), dist.metadata["Version"])
+        if name in packages:
+            continue
+        entry_points = {
+            entry_point.name: entry_point.value
+            for entry_point in dist.entry_points
+            if entry_point.group == COLREV_ENTRY_POINT_GROUP
+        }
+        # Note : packages without files are not CoLRev packages
+        if entry_points and dist.files:
+            packages[name] = entry_points
+    return {"installed": installed, "packages": packages}
+
+
+def _save(snapshot: dict, path: Path) -> None:
+    try:
+        colrev.env.utils.atomic_write_json(path, snapshot)
+    except OSError:
+        pass
+
+
+def get_snapshot() -> dict:
+    """Get the registry snapshot (installed distributions and CoLRev packages)."""
+    global _SNAPSHOT  # pylint: disable=global-statement
+    if _SNAPSHOT is not None:
+        return _SNAPSHOT
+
+    path = Filepaths.PACKAGE_REGISTRY_CACHE_FILE
+    fingerprint = _get_fingerprint()
+    try:
+        snapshot = json.loads(path.read_text(encoding="utf-8"))
+        if snapshot.get("fingerprint") != fingerprint:
+            raise ValueError
+    except (OSError, ValueError):
+        snapshot = {"fingerprint": fingerprint, **_scan()}
+        _save(snapshot, path)
+    _SNAPSHOT = snapshot
+    return snapshot
+
+
+def clear_cache() -> None:
+    """Clear the in-process snapshot (e.g., after installing packages)."""
+    global _SNAPSHOT  # pylint: disable=global-statement
+    _SNAPSHOT = None
+
+
+def get_packages() -> typing.Dict[str, typing.Dict[str, str]]:
+    """Get the CoLRev packages and their endpoints ({name: {type: module:class}})."""
+    return get_snapshot()["packages"]
+
+
+def is_installed(package_name: str) -> bool:
+    """Check whether a distribution is installed."""
+    return normalize_name(package_name) in get_snapshot()["installed"]
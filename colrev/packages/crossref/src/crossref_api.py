@@ -16,6 +16,7 @@ import requests
 import requests_cache
 from rapidfuzz import fuzz
 
+import colrev.env.timing_model
 import colrev.exceptions as colrev_exceptions
 import colrev.record.record_prep
 import colrev.utils
@@ -32,6 +33,7 @@ SESSION = requests_cache.CachedSession(
     backend="sqlite",
     expire_after=timedelta(days=30),
 )
+SESSION.hooks["response"].append(colrev.env.timing_model.count_cache_hits)
 
 
 class CrossrefAPIError(Exception):
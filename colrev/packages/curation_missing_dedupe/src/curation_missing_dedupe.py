@@ -162,12 +162,12 @@ class CurationMissingDedupe(base_classes.DedupePackageBaseClass):
     def _print_same_toc_recs(
         self, *, same_toc_recs: list, record: colrev.record.record.Record
     ) -> list:
-        for same_toc_rec in same_toc_recs:
-            same_toc_rec["similarity"] = (
-                colrev.record.record_prep.PrepRecord.get_record_similarity(
-                    colrev.record.record.Record(same_toc_rec), record
-                )
+        if same_toc_recs:
+            similarities = colrev.record.record_prep.PrepRecord.get_record_similarities(
+                [colrev.record.record.Record(r) for r in same_toc_recs], [record]
             )
+            for same_toc_rec, similarity in zip(same_toc_recs, similarities[:, 0]):
+                same_toc_rec["similarity"] = float(similarity)
 
         same_toc_recs = sorted(
             same_toc_recs, key=lambda d: d["similarity"], reverse=True
@@ -12,6 +12,7 @@ import requests
 from bs4 import BeautifulSoup
 from pydantic import Field
 
+import colrev.env.pdf_download
 import colrev.package_manager.package_base_classes as base_classes
 import colrev.package_manager.package_settings
 import colrev.record.record
@@ -50,6 +51,14 @@ class WebsiteDownload(base_classes.PDFGetPackageBaseClass):
         self.review_manager = pdf_get_operation.review_manager
         self.pdf_get_operation = pdf_get_operation
 
+    def _download_pdf(self, *, pdf_url: str, pdf_filepath: Path) -> None:
+        if colrev.env.pdf_download.download_pdf(
+            pdf_url, pdf_filepath, timeout=60, logger=self.logger
+        ):
+            self.logger.debug("PDF downloaded successfully as %s", pdf_filepath)
+        else:
+            self.logger.debug("Failed to download PDF: %s", pdf_url)
+
     def _download_from_jmir(
         self, *, record: colrev.record.record.Record, pdf_filepath: Path
     ) -> None:
@@ -66,19 +75,7 @@ class WebsiteDownload(base_classes.PDFGetPackageBaseClass):
 
                 paper_title_tag = soup.find("meta", {"name": "citation_title"})
                 if paper_title_tag:
-                    pdf_response = requests.get(pdf_url, timeout=60)
-
-                    if pdf_response.status_code == 200:
-                        with open(pdf_filepath, "wb") as pdf_file:
-                            pdf_file.write(pdf_response.content)
-                        self.logger.debug(
-                            "PDF downloaded successfully as %s", pdf_filepath
-                        )
-                    else:
-                        self.logger.debug(
-                            "Failed to download PDF. Status code: %s",
-                            pdf_response.status_code,
-                        )
+                    self._download_pdf(pdf_url=pdf_url, pdf_filepath=pdf_filepath)
                 else:
                     self.logger.debug("Paper title not found on the page.")
             else:
@@ -107,20 +104,7 @@ class WebsiteDownload(base_classes.PDFGetPackageBaseClass):
                     if not pdf_url.startswith(("http:", "https:")):
                         pdf_url = urljoin(url, pdf_url)
 
-                    pdf_response = requests.get(pdf_url, timeout=60)
-
-                    if pdf_response.status_code == 200:
-                        with open(pdf_filepath, "wb") as pdf_file:
-                            pdf_file.write(pdf_response.content)
-
-                        self.logger.debug(
-                            "PDF downloaded successfully as %s", pdf_filepath
-                        )
-                    else:
-                        self.logger.debug(
-                            "Failed to download PDF. Status code: %s",
-                            pdf_response.status_code,
-                        )
+                    self._download_pdf(pdf_url=str(pdf_url), pdf_filepath=pdf_filepath)
                 else:
                     self.logger.debug("PDF URL not found on the page.")
             else:
@@ -153,20 +137,7 @@ class WebsiteDownload(base_classes.PDFGetPackageBaseClass):
                     if not pdf_url.startswith(("http:", "https:")):
                         pdf_url = urljoin(url, pdf_url)
 
-                    pdf_response = requests.get(pdf_url, timeout=60)
-
-                    if pdf_response.status_code == 200:
-                        with open(pdf_filepath, "wb") as pdf_file:
-                            pdf_file.write(pdf_response.content)
-
-                        self.logger.debug(
-                            "PDF downloaded successfully as %s", pdf_filepath
-                        )
-                    else:
-                        self.logger.debug(
-                            "Failed to download PDF. Status code: %s",
-                            pdf_response.status_code,
-                        )
+                    self._download_pdf(pdf_url=str(pdf_url), pdf_filepath=pdf_filepath)
                 else:
                     self.logger.debug("PDF URL not found on the page.")
             else:
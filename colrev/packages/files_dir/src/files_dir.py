@@ -5,7 +5,9 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 import typing
+from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
 import pymupdf
@@ -25,6 +27,7 @@ from colrev import utils
 from colrev.constants import Colors
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
+from colrev.constants import FieldsRegex
 from colrev.constants import FieldValues
 from colrev.constants import RecordState
 from colrev.constants import SearchSourceHeuristicStatus
@@ -37,6 +40,9 @@ from colrev.writer.write_utils import write_file
 # pylint: disable=duplicate-code
 # pylint: disable=too-many-instance-attributes
 
+# PyMuPDF is not thread-safe
+_PYMUPDF_LOCK = threading.Lock()
+
 
 class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
     """Files directories (PDFs based on GROBID)."""
@@ -51,6 +57,7 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
     heuristic_status = SearchSourceHeuristicStatus.supported
 
     _batch_size = 20
+    _nr_workers = 4
     rerun: bool
 
     def __init__(
@@ -84,6 +91,8 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
                 self.r_subdir_pattern = re.compile("([0-9]{1,4})")
 
         self.local_index = colrev.env.local_index.LocalIndex()
+        self._feed_file_paths: typing.Set[Path] = set()
+        self._md_string_index: typing.Dict[str, typing.Set[str]] = {}
 
         # SearchSource only supported in the context of a CoLRev project
         # pylint: disable=import-outside-toplevel
@@ -268,59 +277,14 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
 
         try:
             record_dict = colrev.env.tei_parser.get_record_from_pdf(
-                self.review_manager.path / file_path, add_doi_from_pdf=True
+                self.review_manager.path / file_path
             )
             record_dict[Fields.FILE] = file_path
 
-            self._get_missing_fields_from_doc_info(record_dict=record_dict)
-
-            if Fields.ABSTRACT in record_dict:
-                del record_dict[Fields.ABSTRACT]
-            if Fields.KEYWORDS in record_dict:
-                del record_dict[Fields.KEYWORDS]
-
-            with pymupdf.open(file_path) as doc:
-                pages_in_file = doc.page_count
-                record = colrev.record.record_pdf.PDFRecord(
-                    record_dict, path=self.review_manager.path
-                )
-                record.set_text_from_pdf(first_pages=True)
-                record_dict = record.get_data()
-                if Fields.TEXT_FROM_PDF in record_dict:
-                    text: str = record_dict[Fields.TEXT_FROM_PDF]
-                    if "conference" in text.replace(" ", "").lower():
-                        record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.INPROCEEDINGS
-                    if "journal" in text.replace(" ", "").lower():
-                        record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.ARTICLE
-
-                    if pages_in_file < 6:
-                        if "bookreview" in text.replace(" ", "").lower():
-                            record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
-                            record_dict["note"] = "Book review"
-                        if "erratum" in text.replace(" ", "").lower():
-                            record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
-                            record_dict["note"] = "Erratum"
-                        if "correction" in text.replace(" ", "").lower():
-                            record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
-                            record_dict["note"] = "Correction"
-                        if "contents" in text.replace(" ", "").lower():
-                            record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
-                            record_dict["note"] = "Contents"
-                        if "withdrawal" in text.replace(" ", "").lower():
-                            record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
-                            record_dict["note"] = "Withdrawal"
-                    # else:
-                    #     print(f'text extraction error in {record_dict[Fields.ID]}')
-
-                    record_dict.pop(Fields.TEXT_FROM_PDF, None)
-                    record_dict.pop(Fields.NR_PAGES_IN_FILE, None)
-
-                record_dict = {k: v for k, v in record_dict.items() if v is not None}
-                record_dict = {k: v for k, v in record_dict.items() if v != "NA"}
-
-                # add details based on path
-                record_dict = self._update_fields_based_on_pdf_dirs(
-                    record_dict=record_dict, params=self.search_source.search_parameters
+            # Note : GROBID requests run in parallel
+            with _PYMUPDF_LOCK:
+                record_dict = self._get_pdf_metadata(
+                    record_dict=record_dict, file_path=file_path
                 )
 
         except colrev_exceptions.TEIException:
@@ -328,6 +292,65 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
 
         return record_dict
 
+    # pylint: disable=too-many-branches
+    def _get_pdf_metadata(self, *, record_dict: dict, file_path: Path) -> dict:
+        self._get_missing_fields_from_doc_info(record_dict=record_dict)
+
+        if Fields.ABSTRACT in record_dict:
+            del record_dict[Fields.ABSTRACT]
+        if Fields.KEYWORDS in record_dict:
+            del record_dict[Fields.KEYWORDS]
+
+        with pymupdf.open(file_path) as doc:
+            pages_in_file = doc.page_count
+            record = colrev.record.record_pdf.PDFRecord(
+                record_dict, path=self.review_manager.path
+            )
+            record.set_text_from_pdf(first_pages=True)
+            record_dict = record.get_data()
+            if Fields.TEXT_FROM_PDF in record_dict:
+                text: str = record_dict[Fields.TEXT_FROM_PDF]
+                if Fields.DOI not in record_dict:
+                    res = re.findall(FieldsRegex.DOI, text)
+                    if res:
+                        record_dict[Fields.DOI] = res[0].upper()
+                if "conference" in text.replace(" ", "").lower():
+                    record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.INPROCEEDINGS
+                if "journal" in text.replace(" ", "").lower():
+                    record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.ARTICLE
+
+                if pages_in_file < 6:
+                    if "bookreview" in text.replace(" ", "").lower():
+                        record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
+                        record_dict["note"] = "Book review"
+                    if "erratum" in text.replace(" ", "").lower():
+                        record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
+                        record_dict["note"] = "Erratum"
+                    if "correction" in text.replace(" ", "").lower():
+                        record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
+                        record_dict["note"] = "Correction"
+                    if "contents" in text.replace(" ", "").lower():
+                        record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
+                        record_dict["note"] = "Contents"
+                    if "withdrawal" in text.replace(" ", "").lower():
+                        record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
+                        record_dict["note"] = "Withdrawal"
+                # else:
+                #     print(f'text extraction error in {record_dict[Fields.ID]}')
+
+                record_dict.pop(Fields.TEXT_FROM_PDF, None)
+                record_dict.pop(Fields.NR_PAGES_IN_FILE, None)
+
+            record_dict = {k: v for k, v in record_dict.items() if v is not None}
+            record_dict = {k: v for k, v in record_dict.items() if v != "NA"}
+
+            # add details based on path
+            record_dict = self._update_fields_based_on_pdf_dirs(
+                record_dict=record_dict, params=self.search_source.search_parameters
+            )
+
+        return record_dict
+
     def _is_broken_filepath(
         self,
         file_path: Path,
@@ -382,10 +405,10 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
             )
         self.logger.debug("SearchSource %s validated", source.search_results_path)
 
-    def _add_md_string(self, *, record_dict: dict) -> dict:
+    def _get_md_string(self, *, record_dict: dict) -> str:
         # To identify potential duplicates
         if Path(record_dict[Fields.FILE]).suffix != ".pdf":
-            return record_dict
+            return ""
 
         md_copy = record_dict.copy()
         try:
@@ -400,8 +423,27 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
             if key in md_copy:
                 md_copy.pop(key)
         md_string = ",".join([f"{k}:{v}" for k, v in md_copy.items()])
-        record_dict["md_string"] = str(fsize) + md_string
-        return record_dict
+        return str(fsize) + md_string
+
+    def _add_to_feed_indices(self, record_dict: dict) -> None:
+        if Fields.FILE not in record_dict:
+            return
+        self._feed_file_paths.add(Path(record_dict[Fields.FILE]))
+        md_string = self._get_md_string(record_dict=record_dict)
+        if md_string:
+            self._md_string_index.setdefault(md_string, set()).add(
+                str(record_dict[Fields.FILE])
+            )
+
+    def _build_feed_indices(
+        self, files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed
+    ) -> None:
+        # Note : the path->record and md_string->record indices are built once
+        # (instead of scanning the feed records for every file)
+        self._feed_file_paths = set()
+        self._md_string_index = {}
+        for record_dict in files_dir_feed.feed_records.values():
+            self._add_to_feed_indices(record_dict)
 
     def prep_link_md(
         self,
@@ -413,25 +455,34 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
         """Not implemented."""
         return record
 
-    def _index_file(
-        self,
-        *,
-        file_path: Path,
-        files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
-        linked_file_paths: list,
-    ) -> dict:
+    def _skip_file(self, *, file_path: Path, linked_file_paths: set) -> bool:
+        if file_path.suffix != ".pdf":
+            return False
+
+        relative_path = file_path.relative_to(self.review_manager.path)
+        if self._is_broken_filepath(file_path=relative_path):
+            return True
+
+        if not self.review_manager.force_mode:
+            # note: for curations, we want all pdfs indexed/merged separately,
+            # in other projects, it is generally sufficient if the pdf is linked
+            if not self.review_manager.settings.is_curated_masterdata_repo():
+                if file_path in linked_file_paths:
+                    # Otherwise: skip linked PDFs
+                    return True
+
+        if not self.rerun:
+            if relative_path in self._feed_file_paths:
+                return True
+        # otherwise: reindex all
+        return False
+
+    def _index_file(self, file_path: Path) -> dict:
+        # Note : runs in the worker pool (must not modify the feed)
         if file_path.suffix == ".pdf":
-            return self._index_pdf(
-                file_path=file_path,
-                files_dir_feed=files_dir_feed,
-                linked_file_paths=linked_file_paths,
-            )
+            return self._index_pdf(file_path=file_path)
         if file_path.suffix == ".mp4":
-            return self._index_mp4(
-                file_path=file_path,
-                files_dir_feed=files_dir_feed,
-                linked_file_paths=linked_file_paths,
-            )
+            return self._index_mp4(file_path=file_path)
         raise NotImplementedError
 
     def _fix_grobid_errors(self, new_record: dict) -> None:
@@ -483,45 +534,19 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
             ):
                 new_record.pop(Fields.TITLE)
 
-    def _index_pdf(
-        self,
-        *,
-        file_path: Path,
-        files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
-        linked_file_paths: list,
-    ) -> dict:
+    def _index_pdf(self, *, file_path: Path) -> dict:
         new_record: dict = {}
         relative_path = file_path.relative_to(self.review_manager.path)
-
         file_path_abs = self.review_manager.path / file_path
-        if self._is_broken_filepath(file_path=relative_path):
-            return new_record
-
-        if not self.review_manager.force_mode:
-            # note: for curations, we want all pdfs indexed/merged separately,
-            # in other projects, it is generally sufficient if the pdf is linked
-            if not self.review_manager.settings.is_curated_masterdata_repo():
-                if file_path in linked_file_paths:
-                    # Otherwise: skip linked PDFs
-                    return new_record
-
-        if not self.rerun:
-
-            if relative_path in [
-                Path(r[Fields.FILE])
-                for r in files_dir_feed.feed_records.values()
-                if Fields.FILE in r
-            ]:
-                return new_record
-        # otherwise: reindex all
 
         self.logger.info(" extract metadata from %s", relative_path)
         try:
             if not self.review_manager.settings.is_curated_masterdata_repo():
                 # retrieve_based_on_colrev_pdf_id
-                colrev_pdf_id = colrev.record.record.Record.get_colrev_pdf_id(
-                    pdf_path=file_path_abs
-                )
+                with _PYMUPDF_LOCK:
+                    colrev_pdf_id = colrev.record.record.Record.get_colrev_pdf_id(
+                        pdf_path=file_path_abs
+                    )
                 new_record_object = self.local_index.retrieve_based_on_colrev_pdf_id(
                     colrev_pdf_id=colrev_pdf_id
                 )
@@ -543,14 +568,15 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
 
         self._fix_grobid_errors(new_record)
         new_record[Fields.FILE] = str(relative_path)
-        new_record = self._add_md_string(record_dict=new_record)
+        return new_record
 
+    def _warn_potential_duplicates(self, new_record: dict) -> None:
         # Note: identical md_string as a heuristic for duplicates
+        md_string = self._get_md_string(record_dict=new_record)
         potential_duplicates = [
-            r
-            for r in files_dir_feed.feed_records.values()
-            if r["md_string"] == new_record["md_string"]
-            and not r[Fields.FILE] == new_record[Fields.FILE]
+            file
+            for file in self._md_string_index.get(md_string, set())
+            if file != new_record[Fields.FILE]
         ]
         if potential_duplicates:
             self.logger.warning(
@@ -569,29 +595,28 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
             self.logger.warning(
                 " %s %s %s",
                 Colors.RED,
-                ",".join([r["file"] for r in potential_duplicates]),
+                ",".join(sorted(potential_duplicates)),
                 Colors.END,
             )
 
-        return new_record
-
-    def _index_mp4(
-        self,
-        *,
-        file_path: Path,
-        files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
-        linked_file_paths: list,
-    ) -> dict:
+    def _index_mp4(self, *, file_path: Path) -> dict:
         record_dict = {Fields.ENTRYTYPE: "online", Fields.FILE: file_path}
         return record_dict
 
-    def _get_file_batches(self) -> list:
+    def _get_file_batches(self, *, linked_file_paths: set) -> list:
         types = ("**/*.pdf", "**/*.mp4")
         files_grabbed: typing.List[Path] = []
         for suffix in types:
             files_grabbed.extend(self.pdfs_path.glob(suffix))
 
-        files_to_index = [self.review_manager.path / x for x in files_grabbed]
+        files_to_index = [
+            self.review_manager.path / x
+            for x in files_grabbed
+            if not self._skip_file(
+                file_path=self.review_manager.path / x,
+                linked_file_paths=linked_file_paths,
+            )
+        ]
 
         file_batches = [
             files_to_index[i * self._batch_size : (i + 1) * self._batch_size]
@@ -601,56 +626,61 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
         ]
         return file_batches
 
-    # pylint: disable=too-many-arguments
-    # pylint: disable=too-many-nested-blocks
-    # pylint: disable=too-many-locals
+    def _add_to_feed(
+        self,
+        *,
+        new_record: dict,
+        files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
+    ) -> None:
+        # Note : runs in the (single) writer thread
+        if Path(new_record[Fields.FILE]).suffix == ".pdf":
+            self._warn_potential_duplicates(new_record)
+
+        retrieved_record = colrev.record.record.Record(new_record)
+
+        # Generally: add to feed but do not "update" records
+        prev_feed_record = files_dir_feed.get_prev_feed_record(retrieved_record)
+        files_dir_feed.add_record_to_feed(retrieved_record, prev_feed_record)
+        self._add_to_feed_indices(new_record)
+
+        if self.rerun:
+            # If rerun: fix_grobid_fields: in feed and records (if only pdf-file origin)
+            prefix = self.search_source.get_origin_prefix()
+            origin = f"{prefix}/{retrieved_record.data['ID']}"
+            for record_dict in files_dir_feed.records.values():
+                if origin in record_dict[Fields.ORIGIN]:
+                    if len(record_dict[Fields.ORIGIN]) == 1:
+                        self._fix_grobid_errors(record_dict)
+                        if Fields.TITLE not in record_dict:
+                            record_dict[Fields.STATUS] = (
+                                RecordState.md_needs_manual_preparation
+                            )
+
     def _run_dir_search(
         self,
         *,
         files_dir_feed: colrev.ops.search_api_feed.SearchAPIFeed,
-        linked_file_paths: list,
+        linked_file_paths: set,
     ) -> None:
-        file_batches = self._get_file_batches()
+        self._build_feed_indices(files_dir_feed)
+        file_batches = self._get_file_batches(linked_file_paths=linked_file_paths)
         if not file_batches:
             files_dir_feed.save()
             return
-        for i, file_batch in enumerate(file_batches):
-            for record in files_dir_feed.feed_records.values():
-                record = self._add_md_string(record_dict=record)
-
-            for file_path in file_batch:
-                new_record = self._index_file(
-                    file_path=file_path,
-                    files_dir_feed=files_dir_feed,
-                    linked_file_paths=linked_file_paths,
-                )
-                if new_record == {}:
-                    continue
-
-                retrieved_record = colrev.record.record.Record(new_record)
-
-                # Generally: add to feed but do not "update" records
-                prev_feed_record = files_dir_feed.get_prev_feed_record(retrieved_record)
-                files_dir_feed.add_record_to_feed(retrieved_record, prev_feed_record)
-
-                if self.rerun:
-                    # If rerun: fix_grobid_fields: in feed and records (if only pdf-file origin)
-                    prefix = self.search_source.get_origin_prefix()
-                    origin = f"{prefix}/{retrieved_record.data['ID']}"
-                    for record_dict in files_dir_feed.records.values():
-                        if origin in record_dict[Fields.ORIGIN]:
-                            if len(record_dict[Fields.ORIGIN]) == 1:
-                                self._fix_grobid_errors(record_dict)
-                                if Fields.TITLE not in record_dict:
-                                    record_dict[Fields.STATUS] = (
-                                        RecordState.md_needs_manual_preparation
-                                    )
-
-            for record in files_dir_feed.feed_records.values():
-                record.pop("md_string")
-
-            last_round = i == len(file_batches) - 1
-            files_dir_feed.save(skip_print=not last_round)
+
+        # Metadata is extracted in the worker pool (GROBID, local index, cpids)
+        # while the feed is only updated in the main (writer) thread
+        with Pool(self._nr_workers) as pool:
+            for i, file_batch in enumerate(file_batches):
+                for new_record in pool.imap(self._index_file, file_batch):
+                    if new_record == {}:
+                        continue
+                    self._add_to_feed(
+                        new_record=new_record, files_dir_feed=files_dir_feed
+                    )
+
+                last_round = i == len(file_batches) - 1
+                files_dir_feed.save(skip_print=not last_round)
 
     def search(self, rerun: bool) -> None:
         """Run a search of a Files directory."""
@@ -692,9 +722,9 @@ class FilesSearchSource(base_classes.SearchSourcePackageBaseClass):
             verbose_mode=self.verbose_mode,
         )
 
-        linked_file_paths = [
+        linked_file_paths = {
             Path(r[Fields.FILE]) for r in records.values() if Fields.FILE in r
-        ]
+        }
 
         self._run_dir_search(
             files_dir_feed=files_dir_feed,
@@ -60,6 +60,9 @@ class GeneralPolishPrep(base_classes.PrepPackageBaseClass):
         """Initialize the instance."""
         self.logger = logger or logging.getLogger(__name__)
         self.settings = self.settings_class(**settings)
+        self.protected_acronyms = (
+            prep_operation.review_manager.settings.prep.protected_acronyms
+        )
 
     def prepare(
         self,
@@ -69,10 +72,18 @@ class GeneralPolishPrep(base_classes.PrepPackageBaseClass):
         ] = None,
     ) -> colrev.record.record.Record:
         """Prepare the record by applying polishing rules."""
+        record.format_if_mostly_upper(
+            Fields.TITLE, case="sentence", protected_acronyms=self.protected_acronyms
+        )
+        for key in [Fields.JOURNAL, Fields.BOOKTITLE]:
+            record.format_if_mostly_upper(
+                key, case="title", protected_acronyms=self.protected_acronyms
+            )
+
         if Fields.TITLE in record.data:
             acronyms = [
                 x
-                for x in self.frequent_acronyms
+                for x in self.frequent_acronyms + self.protected_acronyms
                 if x.lower() in record.data[Fields.TITLE].lower().split()
             ]
             for acronym in acronyms:
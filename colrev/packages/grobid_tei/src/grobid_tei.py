@@ -9,6 +9,7 @@ from pathlib import Path
 
 from pydantic import Field
 
+import colrev.env.grobid_service
 import colrev.env.tei_parser
 import colrev.package_manager.package_base_classes as base_classes
 import colrev.package_manager.package_settings
@@ -40,6 +41,9 @@ class GROBIDTEI(base_classes.PDFPrepPackageBaseClass):
         self.logger = logger or logging.getLogger(__name__)
         self.settings = self.settings_class(**settings)
         self.review_manager = pdf_prep_operation.review_manager
+        self._grobid_service: typing.Optional[
+            colrev.env.grobid_service.GrobidService
+        ] = None
 
         if not utils.in_ci_environment():
             self.tei_path = (
@@ -58,9 +62,12 @@ class GROBIDTEI(base_classes.PDFPrepPackageBaseClass):
 
         if not record.get_tei_filename().is_file():
             self.logger.debug(f" creating tei: {record.data['ID']}")
+            if self._grobid_service is None:
+                self._grobid_service = colrev.env.grobid_service.GrobidService()
             _ = colrev.env.tei_parser.TEIParser(
                 pdf_path=Path(record.data[Fields.FILE]),
                 tei_path=record.get_tei_filename(),
+                grobid_service=self._grobid_service,
             )
 
         return record
@@ -71,7 +78,6 @@ def convert(pdf_dir: Path, tei_dir: Path) -> None:
     print(f"Converting PDFs in {pdf_dir} to TEI in {tei_dir}...")
 
     # pylint: disable=import-outside-toplevel
-    import colrev.env.grobid_service
     import colrev.env.environment_manager
 
     colrev.env.environment_manager.EnvironmentManager()
@@ -87,5 +93,6 @@ def convert(pdf_dir: Path, tei_dir: Path) -> None:
             colrev.env.tei_parser.TEIParser(
                 pdf_path=pdf_file,
                 tei_path=tei_file,
+                grobid_service=grobid_service,
             )
             break
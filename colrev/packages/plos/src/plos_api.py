@@ -14,6 +14,7 @@ import requests_cache
 from rapidfuzz import fuzz
 
 import colrev.env.environment_manager
+import colrev.env.timing_model
 import colrev.exceptions as colrev_exceptions
 import colrev.record.record
 import colrev.record.record_prep
@@ -35,6 +36,7 @@ SESSION = requests_cache.CachedSession(
     backend="sqlite",
     expire_after=timedelta(days=30),
 )
+SESSION.hooks["response"].append(colrev.env.timing_model.count_cache_hits)
 
 
 class PlosAPIError(Exception):
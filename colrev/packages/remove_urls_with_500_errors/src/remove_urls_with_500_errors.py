@@ -6,14 +6,13 @@ from __future__ import annotations
 import logging
 import typing
 
-import requests
 from pydantic import Field
 
 import colrev.package_manager.package_base_classes as base_classes
 import colrev.package_manager.package_settings
 import colrev.record.record
-import colrev.utils
 from colrev.constants import Fields
+from colrev.packages.remove_urls_with_500_errors.src import url_validator
 
 # pylint: disable=too-few-public-methods
 # pylint: disable=duplicate-code
@@ -46,6 +45,18 @@ class RemoveError500URLsPrep(base_classes.PrepPackageBaseClass):
         self.settings = self.settings_class(**settings)
         self.prep_operation = prep_operation
         self.review_manager = prep_operation.review_manager
+        self.url_validator = url_validator.URLValidator(
+            timeout=prep_operation.timeout, headers=self.requests_headers
+        )
+
+    def prefetch(self, records: typing.Sequence[colrev.record.record.Record]) -> None:
+        """Validate the URLs of the records (concurrently, before prepare)."""
+        self.url_validator.validate(
+            record.data[key]
+            for record in records
+            for key in [Fields.URL, Fields.FULLTEXT]
+            if key in record.data
+        )
 
     # pylint: disable=unused-argument
     def prepare(
@@ -56,31 +67,10 @@ class RemoveError500URLsPrep(base_classes.PrepPackageBaseClass):
         ] = None,
     ) -> colrev.record.record.Record:
         """Prepare the record by removing URLs with 500 errors."""
-        session = colrev.utils.get_cached_session()
-
-        try:
-            if Fields.URL in record.data:
-                ret = session.request(
-                    "GET",
-                    record.data[Fields.URL],
-                    headers=self.requests_headers,
-                    timeout=60,
-                )
-                if ret.status_code >= 500:
-                    record.remove_field(key=Fields.URL)
-        except requests.exceptions.RequestException:
-            pass
-        try:
-            if Fields.FULLTEXT in record.data:
-                ret = session.request(
-                    "GET",
-                    record.data[Fields.FULLTEXT],
-                    headers=self.requests_headers,
-                    timeout=self.prep_operation.timeout,
-                )
-                if ret.status_code >= 500:
-                    record.remove_field(key=Fields.FULLTEXT)
-        except requests.exceptions.RequestException:
-            pass
+        for key in [Fields.URL, Fields.FULLTEXT]:
+            if key not in record.data:
+                continue
+            if self.url_validator.get_status(record.data[key]) >= 500:
+                record.remove_field(key=key)
 
         return record
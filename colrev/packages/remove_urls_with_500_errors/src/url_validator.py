@@ -0,0 +1,166 @@
+#! /usr/bin/env python
+"""Concurrent URL validation (status codes) with a persisted cache."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import typing
+from collections import defaultdict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import zip_longest
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+
+from colrev.constants import Filepaths
+
+# Note : the status is requested with HEAD (no content is downloaded).
+# Servers that do not support HEAD (or return errors for HEAD) are checked
+# with a ranged GET (first byte). Identical URLs are requested once and
+# the number of concurrent requests per host is limited.
+# Connection errors (status 0) are not persisted.
+
+CONNECTION_ERROR = 0
+
+
+class URLValidator:
+    """Validate URLs (concurrently, per-host limits, persisted status cache)."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        *,
+        cache_path: typing.Optional[Path] = None,
+        ttl: timedelta = timedelta(days=7),
+        timeout: float = 30,
+        headers: typing.Optional[dict] = None,
+        per_host_limit: int = 4,
+        max_workers: int = 32,
+    ) -> None:
+        """Initialize the instance."""
+        # pylint: disable=too-many-arguments
+        self.cache_path = cache_path or Filepaths.URL_STATUS_CACHE_FILE
+        self.ttl = ttl
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.per_host_limit = per_host_limit
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._statuses: typing.Dict[str, int] = {}
+        self._in_flight: typing.Dict[str, Future] = {}
+        self._host_semaphores: typing.Dict[str, threading.BoundedSemaphore] = {}
+        self.cache_path.parent.mkdir(exist_ok=True, parents=True)
+        self._connection = sqlite3.connect(
+            str(self.cache_path), check_same_thread=False
+        )
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS url_status "
+                "(url TEXT PRIMARY KEY, status INTEGER, checked REAL)"
+            )
+
+    def _get_cached(self, url: str) -> typing.Optional[int]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, checked FROM url_status WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl.total_seconds():
+            return None
+        return int(row[0])
+
+    def _store(self, url: str, status: int) -> None:
+        if status == CONNECTION_ERROR:
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO url_status VALUES (?, ?, ?)",
+                (url, status, time.time()),
+            )
+
+    def _get_host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.BoundedSemaphore(
+                    self.per_host_limit
+                )
+            return self._host_semaphores[host]
+
+    def _request_status(self, url: str) -> int:
+        with self._get_host_semaphore(url):
+            try:
+                response = requests.head(
+                    url,
+                    headers=self.headers,
+                    timeout=self.timeout,
+                    allow_redirects=True,
+                )
+                if response.status_code < 400:
+                    return response.status_code
+            except requests.exceptions.RequestException:
+                pass
+            # Note : fallback for servers that do not support HEAD
+            try:
+                with requests.get(
+                    url,
+                    headers={**self.headers, "Range": "bytes=0-0"},
+                    timeout=self.timeout,
+                    stream=True,
+                ) as response:
+                    return response.status_code
+            except requests.exceptions.RequestException:
+                return CONNECTION_ERROR
+
+    def get_status(self, url: str) -> int:
+        """Get the status code of a URL (0 for connection errors)."""
+        with self._lock:
+            if url in self._statuses:
+                return self._statuses[url]
+            future = self._in_flight.get(url, None)
+            owner = future is None
+            if future is None:
+                future = Future()
+                self._in_flight[url] = future
+        if not owner:
+            return future.result()
+
+        try:
+            status = self._get_cached(url)
+            if status is None:
+                status = self._request_status(url)
+                self._store(url, status)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            future.set_exception(exc)
+            with self._lock:
+                del self._in_flight[url]
+            raise
+        with self._lock:
+            self._statuses[url] = status
+            del self._in_flight[url]
+        future.set_result(status)
+        return status
+
+    def validate(self, urls: typing.Iterable[str]) -> typing.Dict[str, int]:
+        """Get the status codes of the URLs (concurrently, grouped by host)."""
+        urls_by_host: typing.Dict[str, typing.List[str]] = defaultdict(list)
+        for url in dict.fromkeys(urls):
+            urls_by_host[urlparse(url).netloc.lower()].append(url)
+        # Note : interleave the hosts (workers are not blocked by one host)
+        ordered_urls = [
+            url
+            for urls_of_hosts in zip_longest(*urls_by_host.values())
+            for url in urls_of_hosts
+            if url is not None
+        ]
+        if not ordered_urls:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(ordered_urls))
+        ) as executor:
+            return dict(zip(ordered_urls, executor.map(self.get_status, ordered_urls)))
@@ -5,14 +5,12 @@ from __future__ import annotations
 
 import json
 import logging
-import os
 import typing
-from pathlib import Path
 
-import pymupdf
 import requests
 from pydantic import Field
 
+import colrev.env.pdf_download
 import colrev.package_manager.package_base_classes as base_classes
 import colrev.package_manager.package_settings
 import colrev.record.record
@@ -87,14 +85,6 @@ class Unpaywall(base_classes.PDFGetPackageBaseClass):
 
         return best_loc["url_for_pdf"]
 
-    def _is_pdf(self, *, path_to_file: Path) -> bool:
-        try:
-            with pymupdf.open(path_to_file) as doc:
-                doc.load_page(0).get_text()
-        except pymupdf.FileDataError:
-            return False
-        return True
-
     def get_pdf(
         self, record: colrev.record.record.Record
     ) -> colrev.record.record.Record:
@@ -110,47 +100,31 @@ class Unpaywall(base_classes.PDFGetPackageBaseClass):
         if "Invalid/unknown DOI" in url:
             return record
 
-        try:
-            res = requests.get(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.95 Safari/537.36"
-                },
-                stream=True,
-                timeout=30,
-            )
-
-            if 200 == res.status_code:
-                pdf_filepath.parents[0].mkdir(exist_ok=True, parents=True)
-                with open(pdf_filepath, "wb") as file:
-                    file.write(res.content)
-                if self._is_pdf(path_to_file=pdf_filepath):
-                    self.review_manager.report_logger.debug(
-                        "Retrieved pdf (unpaywall):" f" {pdf_filepath.name}"
-                    )
-                    source = (
-                        f"https://api.unpaywall.org/v2/{record.data['doi']}"
-                        + f"?email={self.email}"
-                    )
-                    record.update_field(
-                        key=Fields.FILE, value=str(pdf_filepath), source=source
-                    )
-                    self.pdf_get_operation.import_pdf(record)
-
-                else:
-                    os.remove(pdf_filepath)
-            else:
-                if Fields.FULLTEXT not in record.data:
-                    record.data[Fields.FULLTEXT] = url
-                if self.verbose_mode:
-                    self.logger.info(
-                        "Unpaywall retrieval error " f"{res.status_code} - {url}"
-                    )
-        except (
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
+        # Note : streamed to a partial file (resumed in later runs)
+        # and only moved to the pdf_filepath if it is a valid PDF
+        if colrev.env.pdf_download.download_pdf(
+            url,
+            pdf_filepath,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.95 Safari/537.36"
+            },
+            timeout=30,
+            logger=self.logger,
         ):
-            pass
+            self.review_manager.report_logger.debug(
+                "Retrieved pdf (unpaywall):" f" {pdf_filepath.name}"
+            )
+            source = (
+                f"https://api.unpaywall.org/v2/{record.data['doi']}"
+                + f"?email={self.email}"
+            )
+            record.update_field(key=Fields.FILE, value=str(pdf_filepath), source=source)
+            self.pdf_get_operation.import_pdf(record)
+        else:
+            if Fields.FULLTEXT not in record.data:
+                record.data[Fields.FULLTEXT] = url
+            if self.verbose_mode:
+                self.logger.info(f"Unpaywall retrieval error - {url}")
 
         return record
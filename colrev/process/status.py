@@ -11,6 +11,7 @@ import colrev.loader.load_utils
 from colrev.constants import Fields
 from colrev.constants import RecordState
 from colrev.process.model import ProcessModel
+from colrev.process.status_cache import StatusCache
 
 if typing.TYPE_CHECKING:
     import colrev.review_manager
@@ -208,13 +209,18 @@ def _get_cumulative_freq(*, status_list: list, colrev_status: RecordState) -> in
     )
 
 
-def _get_md_retrieved(sources: list) -> int:
+def _get_md_retrieved(
+    sources: list, *, status_cache: typing.Optional[StatusCache] = None
+) -> int:
     md_retrieved = 0
     for source in sources:
         if not source.is_md_source():
-            nr_in_file = colrev.loader.load_utils.get_nr_records(
-                source.search_results_path
-            )
+            if status_cache is not None:
+                nr_in_file = status_cache.get_nr_records(source.search_results_path)
+            else:
+                nr_in_file = colrev.loader.load_utils.get_nr_records(
+                    source.search_results_path
+                )
             md_retrieved += nr_in_file
     return md_retrieved
 
@@ -364,9 +370,22 @@ def _get_atomic_steps(
 def get_status_stats(
     *,
     review_manager: colrev.review_manager.ReviewManager,
-    records: dict,
+    records: typing.Optional[dict] = None,
+    use_cache: bool = True,
 ) -> StatusStats:
-    """Get the status statistics."""
+    """Get the status statistics.
+
+    Without records, the status fields of the records are retrieved from the
+    status cache (only entries that changed are parsed).
+    """
+    status_cache = None
+    if use_cache:
+        status_cache = StatusCache(review_manager=review_manager)
+    if records is None:
+        if status_cache is not None:
+            records = status_cache.get_records()
+        else:
+            records = review_manager.dataset.load_records_dict()
     origin_states_dict = _get_origin_states_dict(records)
 
     screening_statistics = _get_screening_statistics(
@@ -374,7 +393,9 @@ def get_status_stats(
     )
     status_list = [x[Fields.STATUS] for x in records.values()]
     sources = review_manager.settings.sources
-    md_retrieved = _get_md_retrieved(sources)
+    md_retrieved = _get_md_retrieved(sources, status_cache=status_cache)
+    if status_cache is not None:
+        status_cache.save()
     currently = _get_status_stats_currently(
         status_list, records, screening_statistics, md_retrieved
     )
@@ -0,0 +1,160 @@
+#! /usr/bin/env python3
+"""Incrementally updated cache for the status statistics."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import re
+import typing
+from pathlib import Path
+
+import colrev.env.utils
+import colrev.loader.bib
+import colrev.loader.load_utils
+from colrev.constants import Fields
+from colrev.constants import FieldValues
+from colrev.constants import RecordState
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.review_manager
+
+CACHE_PATH = Path(".colrev/status_cache.json")
+
+# Note : the status statistics only require a few fields per record
+# (ID, colrev_origin, colrev_status, screening_criteria, and whether the
+# masterdata are curated). The cache stores these status rows for each entry
+# of the records file (keyed by a hash of the entry) so that only entries
+# that changed since the last update are parsed.
+# The number of records in the search results files is cached by the
+# git blob hash of the file.
+
+
+def _get_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_blob_hash(path: Path) -> str:
+    """Get the git blob hash of a file."""
+    content = path.read_bytes()
+    return hashlib.sha1(
+        b"blob %d\0" % len(content) + content, usedforsecurity=False
+    ).hexdigest()
+
+
+def _split_entries(text: str) -> typing.List[str]:
+    return [
+        entry
+        for entry in re.split(r"^(?=@)", text, flags=re.MULTILINE)
+        if entry.startswith("@")
+    ]
+
+
+def _get_status_row(record_dict: dict) -> dict:
+    status_row = {
+        Fields.ID: record_dict[Fields.ID],
+        Fields.STATUS: record_dict[Fields.STATUS].name,
+        Fields.ORIGIN: record_dict[Fields.ORIGIN],
+    }
+    if Fields.SCREENING_CRITERIA in record_dict:
+        status_row[Fields.SCREENING_CRITERIA] = record_dict[Fields.SCREENING_CRITERIA]
+    if FieldValues.CURATED in record_dict.get(Fields.MD_PROV, {}):
+        status_row[Fields.MD_PROV] = {
+            FieldValues.CURATED: record_dict[Fields.MD_PROV][FieldValues.CURATED]
+        }
+    return status_row
+
+
+def _get_status_record(status_row: dict) -> dict:
+    return {**status_row, Fields.STATUS: RecordState[status_row[Fields.STATUS]]}
+
+
+class StatusCache:
+    """Cache of the status rows (per entry) and the number of records (per file)."""
+
+    def __init__(
+        self,
+        *,
+        review_manager: colrev.review_manager.ReviewManager,
+    ) -> None:
+        """Initialize the instance."""
+        self.review_manager = review_manager
+        self.path = review_manager.path / CACHE_PATH
+        self.nr_parsed_entries = 0
+        self._changed = False
+        self._used_blobs: typing.Set[str] = set()
+        try:
+            self._cache = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            self._cache = {}
+
+    def get_nr_records(self, filename: Path) -> int:
+        """Get the number of records in a (search results) file."""
+        filename = self.review_manager.path / filename
+        if not filename.is_file():
+            return 0
+        blob_hash = _get_blob_hash(filename)
+        self._used_blobs.add(blob_hash)
+        record_counts = self._cache.setdefault("record_counts", {})
+        if blob_hash not in record_counts:
+            record_counts[blob_hash] = colrev.loader.load_utils.get_nr_records(filename)
+            self._changed = True
+        return record_counts[blob_hash]
+
+    def get_records(self) -> dict:
+        """Get the records with the fields required for the status statistics."""
+        records_path = self.review_manager.paths.records
+        if not records_path.is_file():
+            return {}
+        text = records_path.read_text(encoding="utf-8")
+        file_hash = _get_hash(text)
+        cached_records = self._cache.get("records", {})
+        if cached_records.get("hash") == file_hash:
+            entries = cached_records["entries"]
+        else:
+            cached_entries = cached_records.get("entries", {})
+            entries = {}
+            for entry in _split_entries(text):
+                entry_hash = _get_hash(entry)
+                if entry_hash in cached_entries:
+                    entries[entry_hash] = cached_entries[entry_hash]
+                    continue
+                self.nr_parsed_entries += 1
+                entries[entry_hash] = [
+                    _get_status_row(record_dict)
+                    for record_dict in colrev.loader.bib.process_lines(
+                        io.StringIO(entry)
+                    )
+                    if Fields.STATUS in record_dict and Fields.ORIGIN in record_dict
+                ]
+            self._cache["records"] = {"hash": file_hash, "entries": entries}
+            self._changed = True
+
+        return {
+            status_row[Fields.ID]: _get_status_record(status_row)
+            for status_rows in entries.values()
+            for status_row in status_rows
+        }
+
+    def save(self) -> None:
+        """Save the cache (if it changed)."""
+        if not self._changed:
+            return
+        if self._used_blobs:
+            self._cache["record_counts"] = {
+                blob_hash: nr_records
+                for blob_hash, nr_records in self._cache["record_counts"].items()
+                if blob_hash in self._used_blobs
+            }
+        try:
+            colrev.env.utils.atomic_write_json(self.path, self._cache)
+        except OSError:
+            return
+        self._changed = False
+
+    def clear(self) -> None:
+        """Remove the cache (e.g., when it is inconsistent)."""
+        self._cache = {}
+        self._changed = False
+        self.path.unlink(missing_ok=True)
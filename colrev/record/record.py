@@ -13,7 +13,6 @@ import dictdiffer
 import colrev.exceptions as colrev_exceptions
 import colrev.record.record_identifier
 import colrev.record.record_merger
-import colrev.record.record_similarity
 from colrev.constants import Colors
 from colrev.constants import DefectCodes
 from colrev.constants import ENTRYTYPE_FIELD_REQUIREMENTS
@@ -24,6 +23,8 @@ from colrev.constants import FieldValues
 from colrev.constants import RecordState
 
 if typing.TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
     import colrev.record.qm.quality_model
     import colrev.record.record_prep
 
@@ -859,6 +860,10 @@ class Record:
         records, get_similarity will return a value > 1.0. The get_record_changes
         will return 0.0 (if all other fields are equal).
         """
+        # Note : imported when needed (bib_dedupe/pandas, startup time)
+        # pylint: disable=import-outside-toplevel
+        import colrev.record.record_similarity
+
         return colrev.record.record_similarity.get_record_change_score(
             record_a, record_b
         )
@@ -866,8 +871,23 @@ class Record:
     @classmethod
     def get_record_similarity(cls, record_a: Record, record_b: Record) -> float:
         """Determine the similarity between two records (their masterdata)."""
+        # pylint: disable=import-outside-toplevel
+        import colrev.record.record_similarity
+
         return colrev.record.record_similarity.get_record_similarity(record_a, record_b)
 
+    @classmethod
+    def get_record_similarities(
+        cls, records_a: typing.List[Record], records_b: typing.List[Record]
+    ) -> np.ndarray:
+        """Determine the similarities between records (records_a x records_b)."""
+        # pylint: disable=import-outside-toplevel
+        import colrev.record.record_similarity
+
+        return colrev.record.record_similarity.get_record_similarities(
+            records_a, records_b
+        )
+
     def merge(
         self,
         merging_record: Record,
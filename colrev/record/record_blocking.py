@@ -0,0 +1,130 @@
+#! /usr/bin/env python
+"""Blocking index to retrieve candidate records efficiently."""
+
+from __future__ import annotations
+
+import re
+import typing
+from collections import Counter
+from collections import defaultdict
+
+import colrev.env.utils
+from colrev.constants import Fields
+from colrev.constants import FieldValues
+
+TITLE_STOPWORDS = {
+    "and",
+    "are",
+    "for",
+    "from",
+    "how",
+    "into",
+    "its",
+    "not",
+    "the",
+    "their",
+    "through",
+    "towards",
+    "what",
+    "when",
+    "with",
+}
+
+
+def normalize_doi(doi: str) -> str:
+    """Normalize a DOI for comparison."""
+    doi = doi.strip().lower().rstrip(".;,)")
+    doi = re.sub(r"^(https?://(dx\.)?doi\.org/|doi:\s*)", "", doi)
+    return doi
+
+
+def get_title_tokens(title: str) -> typing.Set[str]:
+    """Get the normalized title tokens used for blocking."""
+    title = colrev.env.utils.remove_accents(str(title).lower())
+    return {
+        token
+        for token in re.findall(r"[a-z0-9]+", title)
+        if len(token) > 2 and token not in TITLE_STOPWORDS
+    }
+
+
+def get_first_author_key(author: str) -> str:
+    """Get the normalized last name of the first author."""
+    # Supports "Last, First and ..." as well as "First Last, First Last, ..."
+    last_name = str(author).split(" and ", maxsplit=1)[0].split(",")[0].strip()
+    if " " in last_name:
+        last_name = last_name.split(" ")[-1]
+    last_name = colrev.env.utils.remove_accents(last_name.lower())
+    return re.sub(r"[^a-z]", "", last_name)
+
+
+class RecordBlockingIndex:
+    """Blocking index over records (DOI, title tokens, and year/first-author keys).
+
+    The index is computed once and returns a small set of candidate records
+    for which detailed (pairwise) similarities can be computed.
+    """
+
+    def __init__(self, records: dict) -> None:
+        """Initialize the instance."""
+        self._doi_index: typing.Dict[str, typing.Set[str]] = defaultdict(set)
+        self._title_index: typing.Dict[str, typing.Set[str]] = defaultdict(set)
+        self._year_author_index: typing.Dict[str, typing.Set[str]] = defaultdict(set)
+        self.title_tokens: typing.Dict[str, typing.Set[str]] = {}
+        for record_dict in records.values():
+            self.add(record_dict)
+
+    @staticmethod
+    def _get_year_author_key(record_dict: dict) -> str:
+        year = str(record_dict.get(Fields.YEAR, ""))
+        author = str(record_dict.get(Fields.AUTHOR, ""))
+        if FieldValues.UNKNOWN in [year, author] or "" in [year, author]:
+            return ""
+        author_key = get_first_author_key(author)
+        if not author_key:
+            return ""
+        return f"{year}-{author_key}"
+
+    def add(self, record_dict: dict) -> None:
+        """Add a record to the index."""
+        record_id = record_dict[Fields.ID]
+        if record_dict.get(Fields.DOI, ""):
+            self._doi_index[normalize_doi(record_dict[Fields.DOI])].add(record_id)
+        title_tokens = get_title_tokens(record_dict.get(Fields.TITLE, ""))
+        self.title_tokens[record_id] = title_tokens
+        for token in title_tokens:
+            self._title_index[token].add(record_id)
+        year_author_key = self._get_year_author_key(record_dict)
+        if year_author_key:
+            self._year_author_index[year_author_key].add(record_id)
+
+    def get_ids_by_doi(self, doi: str) -> typing.Set[str]:
+        """Get the IDs of records with the given DOI."""
+        return set(self._doi_index.get(normalize_doi(doi), set()))
+
+    def get_candidates(self, record_dict: dict, *, max_candidates: int = 20) -> list:
+        """Get the IDs of candidate records (most promising first)."""
+        candidates: typing.List[str] = []
+        if record_dict.get(Fields.DOI, ""):
+            candidates.extend(sorted(self.get_ids_by_doi(record_dict[Fields.DOI])))
+
+        title_tokens = get_title_tokens(record_dict.get(Fields.TITLE, ""))
+        if title_tokens:
+            overlap: typing.Counter[str] = Counter()
+            for token in title_tokens:
+                overlap.update(self._title_index.get(token, set()))
+            min_overlap = max(1, len(title_tokens) // 2)
+            candidates.extend(
+                record_id
+                for record_id, count in overlap.most_common(max_candidates)
+                if count >= min_overlap
+            )
+
+        year_author_key = self._get_year_author_key(record_dict)
+        if year_author_key:
+            candidates.extend(
+                sorted(self._year_author_index.get(year_author_key, set()))
+            )
+
+        # Remove duplicates (preserving order)
+        return list(dict.fromkeys(candidates))[:max_candidates]
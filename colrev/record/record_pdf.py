@@ -94,6 +94,19 @@ class PDFRecord(colrev.record.record.Record):
         text_all = "".join(text_list)
         return self._fix_text_encoding_issues(text_all)
 
+    def get_embedded_metadata(self) -> dict:
+        """Get the metadata embedded in the PDF (title, author)."""
+        pdf_path = self._get_path()
+        embedded_metadata = {}
+        with pymupdf.open(pdf_path) as doc:
+            # pylint: disable=no-member
+            metadata = doc.metadata or {}
+        if metadata.get("title", "").strip():
+            embedded_metadata[Fields.TITLE] = metadata["title"].strip()
+        if metadata.get("author", "").strip():
+            embedded_metadata[Fields.AUTHOR] = metadata["author"].strip()
+        return embedded_metadata
+
     def set_nr_pages_in_pdf(self) -> None:
         """Set the pages_in_file field based on the PDF."""
         pdf_path = self._get_path()
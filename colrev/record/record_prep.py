@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import typing
 
 from nameparser import HumanName
 
@@ -18,29 +20,54 @@ ALL_CAPS = ["IEEE", "ACM", "M&A", "B2B", "B2C", "C2C", "I"]
 ALL_CAPS_DICT = {r"U\.S\.": "U.S."}
 
 
-def capitalize_entities(input_str: str) -> str:
-    """Utility function to capitalize entities."""
-    for all_cap in ALL_CAPS:
-        input_str = re.sub(
-            rf"\b{all_cap.lower()}\b", all_cap.upper(), input_str, flags=re.IGNORECASE
-        )
-
-    for all_cap, repl in ALL_CAPS_DICT.items():
-        input_str = re.sub(
-            rf"\b{all_cap.lower()}\b", repl, input_str, flags=re.IGNORECASE
-        )
-
-    for no_cap in NO_CAPS:
-        if input_str.lower().startswith(no_cap):
-            continue
-        input_str = re.sub(
-            rf"\b{no_cap.lower()}\b", no_cap, input_str, flags=re.IGNORECASE
-        )
+@functools.lru_cache(maxsize=32)
+def _get_casing_rules(
+    protected_acronyms: typing.Tuple[str, ...], skip_no_cap: str
+) -> typing.Tuple[typing.Pattern, typing.Dict[str, str]]:
+    # Note : the rules of ALL_CAPS, ALL_CAPS_DICT and NO_CAPS are compiled into
+    # one alternation (applied in a single pass).
+    # The replacements are retrieved based on the lower-case match
+    # (i.e., the keys of ALL_CAPS_DICT must be escaped literals).
+    rules = {all_cap.lower(): all_cap.upper() for all_cap in ALL_CAPS}
+    rules.update(
+        {re.escape(acronym.lower()): acronym.upper() for acronym in protected_acronyms}
+    )
+    rules.update({all_cap.lower(): repl for all_cap, repl in ALL_CAPS_DICT.items()})
+    rules.update(
+        {no_cap.lower(): no_cap for no_cap in NO_CAPS if no_cap != skip_no_cap}
+    )
+    pattern = re.compile(rf"\b(?:{'|'.join(rules)})\b", flags=re.IGNORECASE)
+    replacements = {re.sub(r"\\(.)", r"\1", rule): repl for rule, repl in rules.items()}
+    return pattern, replacements
+
+
+_IT_PATTERN = re.compile(r"it-(\w)", flags=re.IGNORECASE)
+_IS_PATTERN = re.compile(r"is-(\w)", flags=re.IGNORECASE)
+
+
+def capitalize_entities(
+    input_str: str, *, protected_acronyms: typing.Sequence[str] = ()
+) -> str:
+    """Utility function to capitalize entities.
+
+    The protected_acronyms (e.g., ["AIS", "ICIS"]) are capitalized like ALL_CAPS.
+    """
+    # NO_CAPS are not applied if the string starts with them
+    input_str_lower = input_str.lower()
+    skip_no_cap = next(
+        (no_cap for no_cap in NO_CAPS if input_str_lower.startswith(no_cap)), ""
+    )
+    pattern, replacements = _get_casing_rules(tuple(protected_acronyms), skip_no_cap)
+
+    input_str = pattern.sub(
+        lambda match: replacements[match.group().lower()], input_str
+    )
 
     input_str = input_str.replace(" i'", " I'").replace("'S ", "'s ")
 
-    input_str = re.sub(r"it-(\w)", r"IT-\1", input_str, flags=re.IGNORECASE)
-    input_str = re.sub(r"is-(\w)", r"IS-\1", input_str, flags=re.IGNORECASE)
+    if "-" in input_str:
+        input_str = _IT_PATTERN.sub(r"IT-\1", input_str)
+        input_str = _IS_PATTERN.sub(r"IS-\1", input_str)
 
     return input_str
 
@@ -111,7 +138,13 @@ class PrepRecord(colrev.record.record.Record):
 
         return author_string
 
-    def format_if_mostly_upper(self, key: str, *, case: str = "sentence") -> None:
+    def format_if_mostly_upper(
+        self,
+        key: str,
+        *,
+        case: str = "sentence",
+        protected_acronyms: typing.Sequence[str] = (),
+    ) -> None:
         """Format the field if it is mostly in upper case."""
         if key not in self.data or self.data[key] == FieldValues.UNKNOWN:
             return
@@ -132,7 +165,9 @@ class PrepRecord(colrev.record.record.Record):
                 parameter="case", value=case, options=["sentence", "title"]
             )
 
-        self.data[key] = capitalize_entities(self.data[key])
+        self.data[key] = capitalize_entities(
+            self.data[key], protected_acronyms=protected_acronyms
+        )
 
     def unify_pages_field(self) -> None:
         """Unify the format of the page field."""
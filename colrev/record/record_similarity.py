@@ -4,14 +4,17 @@
 from __future__ import annotations
 
 import re
+import threading
 import typing
 
 import bib_dedupe.exception as bib_dedupe_exception
+import numpy as np
 import pandas as pd
 from bib_dedupe.bib_dedupe import block
 from bib_dedupe.bib_dedupe import match
 from bib_dedupe.bib_dedupe import prep
 from rapidfuzz import fuzz
+from rapidfuzz import process
 
 import colrev.env.utils
 from colrev.constants import Fields
@@ -111,6 +114,18 @@ def _abbreviate_container_title(
         abbreviate_container(record, min_len=min_len)
 
 
+# Note : common (non-distinctive) titles
+_EDITORIAL_TITLES = [
+    "editorial",
+    "editorial introduction",
+    "editorial notes",
+    "editor's comments",
+    "book reviews",
+    "editorial note",
+    "reviewer ackowledgment",
+]
+
+
 def _get_similarity_detailed(record_a: dict, record_b: dict) -> float:
     """Determine the detailed similarities between records."""
     author_similarity = (
@@ -168,16 +183,7 @@ def _get_similarity_detailed(record_a: dict, record_b: dict) -> float:
         # The list is based on a large export of distinct papers, tabulated
         # according to titles and sorted by frequency
         if all(
-            title
-            in [
-                "editorial",
-                "editorial introduction",
-                "editorial notes",
-                "editor's comments",
-                "book reviews",
-                "editorial note",
-                "reviewer ackowledgment",
-            ]
+            title in _EDITORIAL_TITLES
             for title in [
                 record_a.get(Fields.TITLE, "").lower(),
                 record_b.get(Fields.TITLE, "").lower(),
@@ -211,9 +217,7 @@ def _get_similarity_detailed(record_a: dict, record_b: dict) -> float:
     return round(weighted_average, 4)
 
 
-def _ensure_mandatory_fields(
-    record_a: colrev.record.record.Record, record_b: colrev.record.record.Record
-) -> None:
+def _ensure_mandatory_fields(record: colrev.record.record.Record) -> None:
     mandatory_fields = [
         Fields.TITLE,
         Fields.AUTHOR,
@@ -226,33 +230,210 @@ def _ensure_mandatory_fields(
     ]
 
     for mandatory_field in mandatory_fields:
-        if (
-            record_a.data.get(mandatory_field, FieldValues.UNKNOWN)
-            == FieldValues.UNKNOWN
-        ):
-            record_a.data[mandatory_field] = ""
-        if (
-            record_b.data.get(mandatory_field, FieldValues.UNKNOWN)
-            == FieldValues.UNKNOWN
-        ):
-            record_b.data[mandatory_field] = ""
+        if record.data.get(mandatory_field, FieldValues.UNKNOWN) == FieldValues.UNKNOWN:
+            record.data[mandatory_field] = ""
+
+
+# Note : fields used in the (normalized) comparison
+_COMPARISON_FIELDS = (
+    Fields.AUTHOR,
+    Fields.TITLE,
+    Fields.YEAR,
+    Fields.JOURNAL,
+    Fields.BOOKTITLE,
+    Fields.SERIES,
+    Fields.CONTAINER_TITLE,
+    Fields.VOLUME,
+    Fields.NUMBER,
+)
+
+# Note : normalized records are cached (keyed by the ID and the comparison fields)
+# because the same records are compared many times (e.g., in pdf-get or dedupe)
+_NORMALIZED_CACHE_SIZE = 100000
+_normalized_cache: typing.Dict[tuple, dict] = {}
+_normalized_cache_lock = threading.Lock()
+
+
+def _get_normalized(record: colrev.record.record.Record) -> dict:
+    """Get the normalized comparison fields of a record (cached)."""
+    key = (record.data.get(Fields.ID, ""),) + tuple(
+        str(record.data.get(field, "")) for field in _COMPARISON_FIELDS
+    )
+    with _normalized_cache_lock:
+        normalized = _normalized_cache.get(key, None)
+    if normalized is not None:
+        return normalized
+
+    normalized_record = colrev.record.record.Record(
+        {
+            field: record.data[field]
+            for field in _COMPARISON_FIELDS
+            if field in record.data
+        }
+    )
+    _ensure_mandatory_fields(normalized_record)
+    _abbreviate_container_title(normalized_record)
+    _format_authors_string_for_comparison(normalized_record)
+    normalized = normalized_record.get_data()
+
+    with _normalized_cache_lock:
+        if len(_normalized_cache) >= _NORMALIZED_CACHE_SIZE:
+            _normalized_cache.clear()
+        _normalized_cache[key] = normalized
+    return normalized
+
+
+def clear_normalized_cache() -> None:
+    """Clear the cache of normalized records."""
+    with _normalized_cache_lock:
+        _normalized_cache.clear()
 
 
 def get_record_similarity(
     record_a: colrev.record.record.Record, record_b: colrev.record.record.Record
 ) -> float:
     """Determine the similarity between two records (their masterdata)."""
-    record_a = record_a.copy()
-    record_b = record_b.copy()
+    return _get_similarity_detailed(
+        _get_normalized(record_a), _get_normalized(record_b)
+    )
+
 
-    _ensure_mandatory_fields(record_a, record_b)
+def _get_field_similarities(
+    normalized_a: typing.List[dict],
+    normalized_b: typing.List[dict],
+    *,
+    value: typing.Callable[[dict], str],
+    workers: int,
+) -> np.ndarray:
+    return (
+        process.cdist(
+            [value(n) for n in normalized_a],
+            [value(n) for n in normalized_b],
+            scorer=fuzz.ratio,
+            dtype=np.float64,
+            workers=workers,
+        )
+        / 100
+    )
 
-    _abbreviate_container_title(record_a)
-    _abbreviate_container_title(record_b)
-    _format_authors_string_for_comparison(record_a)
-    _format_authors_string_for_comparison(record_b)
 
-    return _get_similarity_detailed(record_a.get_data(), record_b.get_data())
+def _get_outer(
+    normalized_a: typing.List[dict],
+    normalized_b: typing.List[dict],
+    *,
+    value: typing.Callable[[dict], typing.Any],
+    equal: bool = False,
+) -> np.ndarray:
+    """Pairwise equality of the values (or whether both values are truthy)."""
+    array_a = np.array([value(n) for n in normalized_a], dtype=object)
+    array_b = np.array([value(n) for n in normalized_b], dtype=object)
+    if equal:
+        return np.equal.outer(array_a, array_b).astype(np.float64)
+    return np.logical_and.outer(array_a.astype(bool), array_b.astype(bool))
+
+
+def _get_title_for_comparison(normalized: dict) -> str:
+    return normalized.get(Fields.TITLE, "").lower().replace(":", "").replace("-", "")
+
+
+_round_similarities = np.vectorize(
+    lambda similarity: round(float(similarity), 4), otypes=[float]
+)
+
+
+def get_record_similarities(
+    records_a: typing.List[colrev.record.record.Record],
+    records_b: typing.List[colrev.record.record.Record],
+    *,
+    workers: int = -1,
+) -> np.ndarray:
+    """Determine the similarities between records (matrix of records_a x records_b).
+
+    Equivalent to get_record_similarity for each pair (vectorized, with
+    workers=-1 using all cores). For one-vs-many comparisons, pass [record].
+    """
+    normalized_a = [_get_normalized(r) for r in records_a]
+    normalized_b = [_get_normalized(r) for r in records_b]
+    if not normalized_a or not normalized_b:
+        return np.zeros((len(normalized_a), len(normalized_b)))
+
+    similarities = [
+        _get_field_similarities(
+            normalized_a,
+            normalized_b,
+            value=lambda n: str(n.get(Fields.AUTHOR, "")),
+            workers=workers,
+        ),
+        _get_field_similarities(
+            normalized_a,
+            normalized_b,
+            value=_get_title_for_comparison,
+            workers=workers,
+        ),
+        _get_field_similarities(
+            normalized_a,
+            normalized_b,
+            value=lambda n: str(n.get(Fields.YEAR, "")),
+            workers=workers,
+        ),
+        np.where(
+            _get_outer(
+                normalized_a,
+                normalized_b,
+                value=lambda n: n.get(Fields.CONTAINER_TITLE, ""),
+            ),
+            _get_field_similarities(
+                normalized_a,
+                normalized_b,
+                value=lambda n: str(n.get(Fields.CONTAINER_TITLE, "")),
+                workers=workers,
+            ),
+            0.0,
+        ),
+        _get_outer(
+            normalized_a,
+            normalized_b,
+            value=lambda n: n.get(Fields.VOLUME, ""),
+            equal=True,
+        ),
+        _get_outer(
+            normalized_a,
+            normalized_b,
+            value=lambda n: n.get(Fields.NUMBER, ""),
+            equal=True,
+        ),
+    ]
+
+    # Note : same weights (and order of operations) as _get_similarity_detailed
+    def weighted_average(weights: typing.List[float]) -> np.ndarray:
+        weighted = similarities[0] * weights[0]
+        for similarity, weight in zip(similarities[1:], weights[1:]):
+            weighted = weighted + similarity * weight
+        return weighted
+
+    journal = _get_outer(
+        normalized_a,
+        normalized_b,
+        value=lambda n: n.get(Fields.JOURNAL, "") not in ["", FieldValues.UNKNOWN],
+    )
+    editorial = _get_outer(
+        normalized_a,
+        normalized_b,
+        value=lambda n: n.get(Fields.TITLE, "").lower() in _EDITORIAL_TITLES,
+    )
+    # Note : Python round (like get_record_similarity) instead of np.round,
+    # which scales the values and differs for some values (by 0.0001)
+    return _round_similarities(
+        np.where(
+            journal,
+            np.where(
+                editorial,
+                weighted_average([0.175, 0, 0.175, 0.175, 0.275, 0.2]),
+                weighted_average([0.2, 0.25, 0.13, 0.2, 0.12, 0.1]),
+            ),
+            weighted_average([0.15, 0.75, 0.05, 0.05]),
+        ),
+    )
 
 
 def matches(
@@ -220,10 +220,14 @@ class ReviewManager:
         return checker.get_colrev_versions()
 
     def update_status_yaml(
-        self, *, add_to_git: bool = True, records: typing.Optional[dict] = None
+        self,
+        *,
+        add_to_git: bool = True,
+        records: typing.Optional[dict] = None,
+        verify: bool = False,
     ) -> None:
         """Update the STATUS_FILE."""
-        status_stats = self.get_status_stats(records=records)
+        status_stats = self.get_status_stats(records=records, verify=verify)
         exported_dict = status_stats.model_dump()
         exported_dict.pop("origin_states_dict")
         exported_dict.pop("perc_curated")
@@ -285,18 +289,34 @@ class ReviewManager:
         )
 
     def get_status_stats(
-        self, *, records: typing.Optional[dict] = None
+        self, *, records: typing.Optional[dict] = None, verify: bool = False
     ) -> colrev.process.status.StatusStats:  # pragma: no cover
-        """Get a status stats object."""
+        """Get a status stats object.
+
+        Without records, the status stats are updated incrementally (status cache).
+        verify: compare with a full recomputation (the latter is returned)
+        """
         import colrev.process.status
+        import colrev.process.status_cache
 
         colrev.ops.check.CheckOperation(self)
 
-        if records is None:
-            records = self.dataset.load_records_dict()
-        return colrev.process.status.get_status_stats(
+        status_stats = colrev.process.status.get_status_stats(
             review_manager=self, records=records
         )
+        if verify:
+            if records is None:
+                records = self.dataset.load_records_dict()
+            expected_status_stats = colrev.process.status.get_status_stats(
+                review_manager=self, records=records, use_cache=False
+            )
+            if status_stats != expected_status_stats:
+                self.logger.warning(
+                    "Status cache inconsistent with the records (cache removed)"
+                )
+                colrev.process.status_cache.StatusCache(review_manager=self).clear()
+            status_stats = expected_status_stats
+        return status_stats
 
     def get_completeness_condition(self) -> bool:
         """Get the completeness condition."""
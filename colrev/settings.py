@@ -117,6 +117,9 @@ class PrepSettings(BaseModel):
 
     defects_to_ignore: list
 
+    # Acronyms that are capitalized when formatting (mostly) upper-case fields
+    protected_acronyms: typing.List[str] = Field(default_factory=list)
+
     def __str__(self) -> str:
         """Return a string representation."""
         return (
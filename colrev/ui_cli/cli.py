@@ -13,22 +13,9 @@ from functools import wraps
 from pathlib import Path
 
 import click
-import click_repl
-import inquirer
-import pandas as pd
-from git.exc import GitCommandError
-from search_query.exception import QuerySyntaxError
 
+import colrev
 import colrev.exceptions as colrev_exceptions
-import colrev.ops.check
-import colrev.package_manager.package_manager
-import colrev.record.record
-import colrev.review_manager
-import colrev.ui_cli.add_package_to_settings
-import colrev.ui_cli.cli_status_printer
-import colrev.ui_cli.cli_validation
-import colrev.ui_cli.dedupe_errors
-from colrev import utils
 from colrev.constants import Colors
 from colrev.constants import EndpointType
 from colrev.constants import Fields
@@ -36,8 +23,10 @@ from colrev.constants import Filepaths
 from colrev.constants import IDPattern
 from colrev.constants import RecordState
 from colrev.constants import ScreenCriterionType
-from colrev.env.environment_manager import EnvironmentManager
-from colrev.env.resources import Resources
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.ops.dedupe
+    import colrev.package_manager.package_manager
 
 # pylint: disable=too-many-lines
 # pylint: disable=redefined-outer-name
@@ -50,22 +39,32 @@ from colrev.env.resources import Resources
 # pylint: disable=import-outside-toplevel
 # pylint: disable=too-many-return-statements
 
+# Note: the dependencies (e.g., pandas, GitPython, the review_manager) are imported
+# in the commands (not at module level) so that the startup
+# (e.g., colrev --help, shell completion) remains fast.
+# See tests/0_core/cli_import_time_test.py
+
 # Note: autocompletion needs bash/... activation:
 # https://click.palletsprojects.com/en/7.x/bashcomplete/
 
 EXACT_CALL = "colrev " + subprocess.list2cmdline(sys.argv[1:])  # nosec
 
-PACKAGE_MANAGER = colrev.package_manager.package_manager.PackageManager()
-# TYPE_IDENTIFIER_ENDPOINT_DICT = PACKAGE_MANAGER.load_type_identifier_endpoint_dict()
-
 SHELL_MODE = False
 
 
+def _get_package_manager() -> colrev.package_manager.package_manager.PackageManager:
+    import colrev.package_manager.package_manager
+
+    return colrev.package_manager.package_manager.PackageManager()
+
+
 def _select_endpoint_interactively(add: str, endpoint_type: EndpointType) -> str:
     """Add package interactively."""
+    import inquirer
+
     if add != "add_interactively":
         return add
-    packages = PACKAGE_MANAGER.discover_packages(package_type=endpoint_type)
+    packages = _get_package_manager().discover_packages(package_type=endpoint_type)
     questions = [
         inquirer.List(
             "package",
@@ -76,9 +75,9 @@ def _select_endpoint_interactively(add: str, endpoint_type: EndpointType) -> str
     answers = inquirer.prompt(questions)
     endpoint = answers["package"]
 
-    if not PACKAGE_MANAGER.is_installed(endpoint):
+    if not _get_package_manager().is_installed(endpoint):
         print(f"{Colors.GREEN}Install package{Colors.END}")
-        PACKAGE_MANAGER.install(packages=[endpoint])
+        _get_package_manager().install(packages=[endpoint])
 
     return endpoint
 
@@ -87,6 +86,8 @@ def _select_source_interactively(
     selected: str, review_manager: colrev.review_manager.ReviewManager
 ) -> str:
     """Select a source interactively."""
+    import inquirer
+
     sources = [str(s.search_results_path) for s in review_manager.settings.sources]
     if selected is None:
         return ",".join(sources)
@@ -108,6 +109,10 @@ def _add_screen_criterion_interactively(
     add: str, screen_operation: colrev.ops.screen.Screen
 ) -> None:
     """Add screening criterion interactively."""
+    import inquirer
+
+    import colrev.settings
+
     if add != "add_interactively":
         if add.count(",") != 2:
             raise click.BadParameter(
@@ -151,6 +156,8 @@ def get_search_files() -> list:
     """Get the search files (for click choices)."""
     # Take the filenames from sources because there may be API searches
     # without files (yet)
+    import colrev.review_manager
+
     try:
         review_manager = colrev.review_manager.ReviewManager()
         return [str(x.filename) for x in review_manager.settings.sources]
@@ -206,6 +213,8 @@ def catch_exception(func=None, *, handle) -> typing.Any:  # type: ignore
     # pylint: disable=inconsistent-return-statements
     @wraps(func)
     def wrapper(*args, **kwargs) -> None:  # type: ignore
+        from search_query.exception import QuerySyntaxError
+
         try:
             return func(*args, **kwargs)
         except (colrev_exceptions.CoLRevException, QuerySyntaxError) as exc:
@@ -239,6 +248,8 @@ def main(ctx: click.core.Context) -> None:
 
     Documentation:  https://colrev-environment.github.io/colrev/
     """
+    import colrev.review_manager
+
     try:
         if ctx.invoked_subcommand == "shell":
             ctx.obj = {"review_manager": colrev.review_manager.ReviewManager()}
@@ -254,6 +265,8 @@ def get_review_manager(
     the given parameters. If params requires review_manager to be reloaded, will
     reload it.
     """
+    import colrev.review_manager
+
     review_manager_params["exact_call"] = ctx.command_path
     try:
         review_manager = ctx.obj["review_manager"]
@@ -287,6 +300,7 @@ def shell(
     ctx: click.core.Context,
 ) -> None:
     """Starts a interactive terminal."""
+    import click_repl
     from prompt_toolkit.history import FileHistory
 
     print(f"CoLRev version {colrev.__version__}")
@@ -308,6 +322,8 @@ def exit_command(
     ctx: click.core.Context,
 ) -> None:
     """Starts a interactive terminal."""
+    import click_repl
+
     import inspect
 
     curframe = inspect.currentframe()
@@ -393,6 +409,8 @@ def status(
     verbose: bool,
 ) -> None:
     """Show status."""
+    import colrev.ui_cli.cli_status_printer
+
     try:
         review_manager = get_review_manager(
             ctx,
@@ -566,6 +584,8 @@ def search(
 
     Docs: https://colrev-environment.github.io/colrev/manual/metadata_retrieval/search.html
     """
+    from colrev import utils
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -584,7 +604,7 @@ def search(
 
         add = _select_endpoint_interactively(add, EndpointType.search_source)
         source_dict = colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=search_operation,
             package_identifier=add,
             params=params,
@@ -746,6 +766,18 @@ def load(
     type=int,
     help="Number of cpus (parallel processes)",
 )
+@click.option(
+    "--shard",
+    type=str,
+    default="",
+    help="Prepare shard k/n of the records on a separate branch (e.g., 1/4).",
+)
+@click.option(
+    "--merge-shards",
+    is_flag=True,
+    default=False,
+    help="Merge the prepared shards (branches) into the records.",
+)
 @click.option(
     "-scs",
     "--setup_custom_script",
@@ -778,6 +810,8 @@ def prep(
     debug: str,
     commit_sha: str,
     cpu: int,
+    shard: str,
+    merge_shards: bool,
     setup_custom_script: bool,
     verbose: bool,
     force: bool,
@@ -786,6 +820,8 @@ def prep(
 
     Docs: https://colrev-environment.github.io/colrev/manual/metadata_retrieval/prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
+
     try:
         review_manager = get_review_manager(
             ctx,
@@ -823,14 +859,14 @@ def prep(
         if add:
             add = _select_endpoint_interactively(add, EndpointType.prep)
             colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-                PACKAGE_MANAGER,
+                _get_package_manager(),
                 operation=prep_operation,
                 package_identifier=add,
                 params=params,
             )
             return
 
-        prep_operation.main(keep_ids=keep_ids)
+        prep_operation.main(keep_ids=keep_ids, shard=shard, merge_shards=merge_shards)
 
     except colrev_exceptions.ServiceNotAvailableException as exc:
         print(exc)
@@ -896,6 +932,8 @@ def prep_man(
 
     Docs: https://colrev-environment.github.io/colrev/manual/metadata_retrieval/prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -911,7 +949,7 @@ def prep_man(
     if add:
         add = _select_endpoint_interactively(add, EndpointType.prep_man)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=prep_man_operation,
             package_identifier=add,
             params=params,
@@ -1014,6 +1052,9 @@ def dedupe(
 
     Docs: https://colrev-environment.github.io/colrev/manual/metadata_retrieval/dedupe.html
     """
+    import colrev.ui_cli.add_package_to_settings
+    import colrev.ui_cli.dedupe_errors
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -1025,7 +1066,7 @@ def dedupe(
     if add:
         add = _select_endpoint_interactively(add, EndpointType.dedupe)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=dedupe_operation,
             package_identifier=add,
             params=params,
@@ -1187,6 +1228,8 @@ def prescreen(
     """
     # pylint: disable=too-many-locals
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -1218,7 +1261,7 @@ def prescreen(
     elif add:
         add = _select_endpoint_interactively(add, EndpointType.prescreen)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=prescreen_operation,
             package_identifier=add,
             params=params,
@@ -1343,6 +1386,8 @@ def screen(
 
     Docs: https://colrev-environment.github.io/colrev/manual/pdf_screen/screen.html
     """
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx, {"verbose_mode": verbose, "force_mode": force, "exact_call": EXACT_CALL}
     )
@@ -1354,7 +1399,7 @@ def screen(
     if add:
         add = _select_endpoint_interactively(add, EndpointType.screen)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=screen_operation,
             package_identifier=add,
             params=params,
@@ -1577,6 +1622,8 @@ def pdf_get(
 
     Docs: https://colrev-environment.github.io/colrev/manual/pdf_retrieval/pdf_get.html
     """
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -1594,7 +1641,7 @@ def pdf_get(
     if add:
         add = _select_endpoint_interactively(add, EndpointType.pdf_get)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=pdf_get_operation,
             package_identifier=add,
             params=params,
@@ -1674,6 +1721,10 @@ def pdf_get_man(
 
     Docs: https://colrev-environment.github.io/colrev/manual/pdf_retrieval/pdf_get.html
     """
+    import pandas as pd
+
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -1687,7 +1738,7 @@ def pdf_get_man(
     if add:
         add = _select_endpoint_interactively(add, EndpointType.pdf_get_man)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=pdf_get_man_operation,
             package_identifier=add,
             params=params,
@@ -1796,6 +1847,18 @@ def _print_pdf_hashes(*, pdf_path: Path) -> None:
     default=False,
     help="Generate TEI documents.",
 )
+@click.option(
+    "--shard",
+    type=str,
+    default="",
+    help="Prepare the PDFs of shard k/n of the records on a separate branch (e.g., 1/4).",
+)
+@click.option(
+    "--merge-shards",
+    is_flag=True,
+    default=False,
+    help="Merge the prepared shards (branches) into the records.",
+)
 @click.option(
     "-scs",
     "--setup_custom_script",
@@ -1828,6 +1891,8 @@ def pdf_prep(
     reprocess: bool,
     setup_custom_script: bool,
     tei: bool,
+    shard: str,
+    merge_shards: bool,
     verbose: bool,
     force: bool,
 ) -> None:
@@ -1837,6 +1902,8 @@ def pdf_prep(
     """
     # pylint: disable=import-outside-toplevel
 
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -1850,7 +1917,7 @@ def pdf_prep(
     if add:
         add = _select_endpoint_interactively(add, EndpointType.pdf_prep)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=pdf_prep_operation,
             package_identifier=add,
             params=params,
@@ -1867,7 +1934,9 @@ def pdf_prep(
         elif tei:
             pdf_prep_operation.generate_tei()
         else:
-            pdf_prep_operation.main(batch_size=batch_size)
+            pdf_prep_operation.main(
+                batch_size=batch_size, shard=shard, merge_shards=merge_shards
+            )
 
     except KeyboardInterrupt:
         print("Stopped the process")
@@ -1876,6 +1945,8 @@ def pdf_prep(
 def _delete_first_pages_cli(
     pdf_prep_man_operation: colrev.ops.pdf_prep_man.PDFPrepMan, record_id: str
 ) -> None:
+    import colrev.record.record
+
     records = pdf_prep_man_operation.review_manager.dataset.load_records_dict()
     while True:
         if record_id in records:
@@ -1973,6 +2044,8 @@ def pdf_prep_man(
 
     Docs: https://colrev-environment.github.io/colrev/manual/pdf_retrieval/pdf_prep.html
     """
+    import colrev.ui_cli.add_package_to_settings
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -1986,7 +2059,7 @@ def pdf_prep_man(
     if add:
         add = _select_endpoint_interactively(add, EndpointType.pdf_prep_man)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=pdf_prep_man_operation,
             package_identifier=add,
             params=params,
@@ -2069,6 +2142,9 @@ def data(
 
     Docs: https://colrev-environment.github.io/colrev/manual/data/data.html
     """
+    import colrev.ui_cli.add_package_to_settings
+    from colrev import utils
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -2101,7 +2177,7 @@ def data(
     if add:
         add = _select_endpoint_interactively(add, EndpointType.data)
         colrev.ui_cli.add_package_to_settings.add_package_to_settings(
-            PACKAGE_MANAGER,
+            _get_package_manager(),
             operation=data_operation,
             package_identifier=add,
             params=params,
@@ -2188,6 +2264,8 @@ def validate(
     - HEAD~4 for commit 4 before HEAD
     - A contributor name
     """
+    import colrev.ui_cli.cli_validation
+
     review_manager = get_review_manager(
         ctx,
         {
@@ -2302,6 +2380,8 @@ def distribute(ctx: click.core.Context, path: Path, verbose: bool, force: bool)
 def _print_environment_status(
     review_manager: colrev.review_manager.ReviewManager,
 ) -> None:
+    from colrev.env.environment_manager import EnvironmentManager
+
     environment_manager = EnvironmentManager()
     environment_details = environment_manager.get_environment_details()
 
@@ -2419,6 +2499,11 @@ def env(
 ) -> None:
     """Manage the environment."""
     # pylint: disable=too-many-branches
+    # pylint: disable=too-many-statements
+    from git.exc import GitCommandError
+
+    from colrev.env.environment_manager import EnvironmentManager
+    from colrev.env.resources import Resources
 
     options_set = any(
         [index, install, pull, status, register, unregister, update_package_list]
@@ -2833,6 +2918,8 @@ def show(  # type: ignore
     callback=_validate_show,
 ) -> None:
     """Show aspects (sample, ...)."""
+    import colrev.ops.check
+
     import colrev.process.operation
     import colrev.ui_cli.show_printer
 
@@ -2926,6 +3013,8 @@ def upgrade(
     force: bool,
 ) -> None:
     """Upgrade to the latest CoLRev project version."""
+    import colrev.review_manager
+
     if disable_auto:
         review_manager = colrev.review_manager.ReviewManager(
             force_mode=True, verbose_mode=verbose, skip_upgrade=True
@@ -2957,11 +3046,18 @@ def upgrade(
     default=False,
     help="Force mode",
 )
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Report the planned fixes (without saving changes)",
+)
 @click.pass_context
 def repare(
     ctx: click.core.Context,
     verbose: bool,
     force: bool,
+    dry_run: bool,
 ) -> None:
     """Repare file formatting errors in the CoLRev project."""
     review_manager = get_review_manager(
@@ -2969,7 +3065,7 @@ def repare(
         {"verbose_mode": verbose, "force_mode": force},
     )
     repare_operation = review_manager.get_repare()
-    repare_operation.main()
+    repare_operation.main(dry_run=dry_run)
 
 
 @main.command(help_priority=29)
@@ -3068,6 +3164,8 @@ def merge(
     force: bool,
 ) -> None:
     """Merge git branches."""
+    import colrev.ops.check
+
     review_manager = get_review_manager(
         ctx,
         {"verbose_mode": verbose, "force_mode": force},
@@ -3108,6 +3206,8 @@ def undo(
     force: bool,
 ) -> None:
     """Undo operations."""
+    import colrev.ops.check
+
     review_manager = get_review_manager(
         ctx,
         {"verbose_mode": verbose, "force_mode": force},
@@ -3121,6 +3221,8 @@ def undo(
 
 def select_format() -> str:
     """Select the format."""
+    import inquirer
+
     questions = [
         inquirer.List(
             "format",
@@ -3157,6 +3259,8 @@ def convert(
 ) -> None:
     """Convert a file to the specified format."""
     # Example placeholder logic
+    import colrev.record.record_id_setter
+
     click.echo(f"Converting file: {input_file}")
     if output_format:
         click.echo(f"Output format: {output_format}")
@@ -3223,13 +3327,15 @@ def install(
     To install all internal packages, run\n
         colrev install all_internal_packages
     """
+    import colrev.review_manager
+
     if len(packages) == 1 and packages[0] == ".":
         review_manager = colrev.review_manager.ReviewManager()
-        PACKAGE_MANAGER.install_project(review_manager=review_manager, uv=uv)
+        _get_package_manager().install_project(review_manager=review_manager, uv=uv)
 
     else:
 
-        PACKAGE_MANAGER.install(
+        _get_package_manager().install(
             packages=packages,
             upgrade=upgrade,
             editable=editable,
@@ -19,6 +19,7 @@ from pathlib import Path
 
 import requests_cache
 
+import colrev.env.timing_model
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import Fields
 from colrev.constants import Filepaths
@@ -40,11 +41,14 @@ def p_print(obj: typing.Any) -> None:
 
 def get_cached_session() -> requests_cache.CachedSession:  # pragma: no cover
     """Get a cached session."""
-    return requests_cache.CachedSession(
+    session = requests_cache.CachedSession(
         str(Filepaths.PREP_REQUESTS_CACHE_FILE),
         backend="sqlite",
         expire_after=timedelta(days=30),
     )
+    # Note : count cache hits (reported in the live progress of long operations)
+    session.hooks["response"].append(colrev.env.timing_model.count_cache_hits)
+    return session
 
 
 def in_ci_environment() -> bool:
@@ -3,10 +3,13 @@
 
 from __future__ import annotations
 
-import pandas as pd
+import typing
 
 from colrev.constants import Fields
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
 FIELDS = [
     Fields.ID,
     Fields.ENTRYTYPE,
@@ -31,6 +34,9 @@ def to_dataframe(
     drop_empty_fields: bool = True,
 ) -> pd.DataFrame:
     """Convert a records dict to a pandas DataFrame."""
+    # Note : pandas is imported when needed (startup time)
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     all_keys = {k for v in records_dict.values() for k in v.keys()}
     additional_fields = sorted(all_keys - set(FIELDS))
     fields = FIELDS + additional_fields if sort_fields_first else sorted(all_keys)
@@ -63,6 +69,8 @@ def write_file(
         sort_fields_first=sort_fields_first,
         drop_empty_fields=drop_empty_fields,
     )
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
     writer = pd.ExcelWriter(filename, engine="xlsxwriter")
     data_frame.to_excel(writer, index=False)
 
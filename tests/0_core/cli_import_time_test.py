@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Test the startup (import time) of the command-line interface"""
+
+import subprocess
+import sys
+
+# Note : about 0.08s locally (1.6s when the dependencies were imported at module level)
+IMPORT_TIME_BUDGET = 0.15  # seconds
+
+HEAVY_MODULES = [
+    "pandas",
+    "git",
+    "inquirer",
+    "click_repl",
+    "colrev.review_manager",
+    "colrev.package_manager.package_manager",
+    "colrev.ui_cli.cli_status_printer",
+]
+
+
+def _get_import_time(module: str) -> float:
+    """Get the cumulative import time of a module (python -X importtime)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1e6
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+def test_cli_import_time() -> None:
+    """Test that the cli module stays within the import-time budget"""
+
+    # The first import may compile the module (bytecode cache)
+    _get_import_time("colrev.ui_cli.cli")
+    import_time = min(_get_import_time("colrev.ui_cli.cli") for _ in range(3))
+    assert import_time < IMPORT_TIME_BUDGET, (
+        f"Importing colrev.ui_cli.cli took {import_time:.2f}s "
+        f"(budget: {IMPORT_TIME_BUDGET}s). "
+        "Dependencies should be imported in the commands."
+    )
+
+
+def test_cli_lazy_imports() -> None:
+    """Test that heavy dependencies are not imported at startup (colrev --help)"""
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import colrev.ui_cli.cli; "
+            "print('\\n'.join(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported_modules = set(result.stdout.splitlines())
+    assert not imported_modules & set(HEAVY_MODULES)
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+"""Smoke tests of the command-line interface"""
+
+from click.testing import CliRunner
+
+import colrev
+import colrev.ui_cli.cli
+
+
+def test_cli_shell(mocker) -> None:  # type: ignore
+    """Test that the shell starts (and prints the banner)"""
+
+    repl = mocker.patch("click_repl.repl")
+    result = CliRunner().invoke(colrev.ui_cli.cli.main, ["shell"])
+    assert result.exit_code == 0, result.output
+    assert f"CoLRev version {colrev.__version__}" in result.output
+    repl.assert_called_once()
+
+
+def test_cli_exit() -> None:
+    """Test the exit command (outside the shell)"""
+
+    result = CliRunner().invoke(colrev.ui_cli.cli.main, ["exit"])
+    assert result.exit_code == 0, result.output
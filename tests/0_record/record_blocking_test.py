@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""Test the record blocking index"""
+
+import colrev.record.record_blocking
+from colrev.constants import Fields
+
+RECORDS = {
+    "Wagner2022": {
+        Fields.ID: "Wagner2022",
+        Fields.TITLE: "Artificial intelligence and the conduct of literature reviews",
+        Fields.AUTHOR: "Wagner, Gerit and Lukyanenko, Roman and Paré, Guy",
+        Fields.YEAR: "2022",
+        Fields.DOI: "10.1177/02683962211048201",
+    },
+    "Srivastava2015": {
+        Fields.ID: "Srivastava2015",
+        Fields.TITLE: "Bridging the service divide through digitally enabled "
+        "service innovations",
+        Fields.AUTHOR: "Srivastava, Shirish C. and Shainesh, G.",
+        Fields.YEAR: "2015",
+    },
+    "Other2015": {
+        Fields.ID: "Other2015",
+        Fields.TITLE: "Literature reviews in information systems",
+        Fields.AUTHOR: "Other, Author",
+        Fields.YEAR: "2015",
+    },
+}
+
+
+def test_get_title_tokens() -> None:
+    """Test the title normalization"""
+    assert colrev.record.record_blocking.get_title_tokens(
+        "The Conduct of Literature-Reviews: AI"
+    ) == {"conduct", "literature", "reviews"}
+
+
+def test_get_first_author_key() -> None:
+    """Test the first-author key"""
+    assert "pare" == colrev.record.record_blocking.get_first_author_key(
+        "Paré, Guy and Wagner, Gerit"
+    )
+    assert "wagner" == colrev.record.record_blocking.get_first_author_key(
+        "Gerit Wagner, Roman Lukyanenko, and Guy Paré"
+    )
+
+
+def test_blocking_index() -> None:
+    """Test the candidate retrieval"""
+    blocking_index = colrev.record.record_blocking.RecordBlockingIndex(RECORDS)
+
+    assert {"Wagner2022"} == blocking_index.get_ids_by_doi(
+        "https://doi.org/10.1177/02683962211048201."
+    )
+
+    candidates = blocking_index.get_candidates(
+        {Fields.TITLE: "Artificial Intelligence and the Conduct of Literature Reviews"}
+    )
+    assert candidates[0] == "Wagner2022"
+    assert "Srivastava2015" not in candidates
+
+    candidates = blocking_index.get_candidates(
+        {Fields.AUTHOR: "Srivastava, S.", Fields.YEAR: "2015"}
+    )
+    assert candidates == ["Srivastava2015"]
+
+    assert [] == blocking_index.get_candidates({Fields.TITLE: "Unrelated topic"})
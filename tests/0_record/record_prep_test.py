@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 """Tests of the PrepRecord class"""
 
+import time
+
 import pytest
 
 import colrev.exceptions as colrev_exceptions
@@ -133,6 +135,42 @@ def test_format_if_mostly_upper_case() -> None:
         record.format_if_mostly_upper(Fields.TITLE, case="xy")
 
 
+def test_capitalize_entities_protected_acronyms() -> None:
+    """Test capitalize_entities() with user-provided acronyms"""
+
+    assert (
+        colrev.record.record_prep.capitalize_entities("Papers at icis and ais")
+        == "Papers at icis and ais"
+    )
+    assert (
+        colrev.record.record_prep.capitalize_entities(
+            "Papers at icis and ais", protected_acronyms=["ICIS", "AIS"]
+        )
+        == "Papers at ICIS and AIS"
+    )
+
+    record = colrev.record.record_prep.PrepRecord(
+        {Fields.TITLE: "THE ICIS PAPER DEVELOPMENT WORKSHOP"}
+    )
+    record.format_if_mostly_upper(Fields.TITLE, protected_acronyms=["ICIS"])
+    assert record.data[Fields.TITLE] == "The ICIS paper development workshop"
+
+
+@pytest.mark.slow
+def test_capitalize_entities_benchmark() -> None:
+    """Benchmark capitalize_entities() (100k titles)"""
+
+    titles = [
+        f"A STUDY OF B2B IN M&A SETTINGS AND THE ROLE OF IT-GOVERNANCE {i}".capitalize()
+        for i in range(100000)
+    ]
+    start = time.time()
+    for title in titles:
+        colrev.record.record_prep.capitalize_entities(title)
+    duration = time.time() - start
+    print(f"capitalize_entities: {duration / len(titles) * 1e6:.2f} µs per title")
+
+
 def test_unify_pages_field() -> None:
     """Test record.unify_pages_field()"""
 
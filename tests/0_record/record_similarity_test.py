@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 """Tests of the record similarity functionality"""
 
+import random
+
 import pytest
 
+import colrev.record.record
 import colrev.record.record_prep
 import colrev.record.record_similarity
 from colrev.constants import ENTRYTYPES
@@ -81,3 +84,135 @@ def test_matches(input_dict_1: dict, input_dict_2: dict, matches: bool) -> None:
     record1 = colrev.record.record_prep.PrepRecord(input_dict_1)
     record2 = colrev.record.record_prep.PrepRecord(input_dict_2)
     assert colrev.record.record_similarity.matches(record1, record2) == matches
+
+
+SIMILARITY_RECORDS = [
+    {
+        Fields.ID: "r1",
+        Fields.YEAR: "2020",
+        Fields.TITLE: "EDITORIAL",
+        Fields.AUTHOR: "Rai, Arun",
+        Fields.JOURNAL: "MIS Quarterly",
+        Fields.VOLUME: "45",
+        Fields.NUMBER: "1",
+    },
+    {
+        Fields.ID: "r2",
+        Fields.YEAR: "2020",
+        Fields.TITLE: "Editorial",
+        Fields.AUTHOR: "Rai, A",
+        Fields.JOURNAL: "MISQ",
+        Fields.VOLUME: "45",
+        Fields.NUMBER: "1",
+    },
+    {
+        Fields.ID: "r3",
+        Fields.YEAR: "2011",
+        Fields.TITLE: "Analyzing the past to prepare for the future: Writing a review",
+        Fields.AUTHOR: "Webster, Jane and Watson, Richard T.",
+        Fields.JOURNAL: "MIS Quarterly",
+        Fields.VOLUME: "26",
+        Fields.NUMBER: "2",
+    },
+    {
+        Fields.ID: "r4",
+        Fields.YEAR: "2011",
+        Fields.TITLE: "Analyzing the past to prepare for the future - writing a review",
+        Fields.AUTHOR: "Webster, J and Watson, R",
+        Fields.BOOKTITLE: "Int. Conf. on Inf. Sys.",
+    },
+    {
+        Fields.ID: "r5",
+        Fields.YEAR: "UNKNOWN",
+        Fields.TITLE: "Analyzing the past",
+        Fields.AUTHOR: "UNKNOWN",
+        Fields.JOURNAL: "UNKNOWN",
+        Fields.VOLUME: "UNKNOWN",
+    },
+    {Fields.ID: "r6", Fields.TITLE: "A paper without other fields"},
+]
+
+
+def test_get_record_similarities() -> None:
+    """Bulk similarities correspond to the pairwise similarities"""
+
+    colrev.record.record_similarity.clear_normalized_cache()
+    records = [colrev.record.record.Record(r) for r in SIMILARITY_RECORDS]
+    similarities = colrev.record.record_similarity.get_record_similarities(
+        records, records
+    )
+    assert similarities.shape == (len(records), len(records))
+    for i, record_a in enumerate(records):
+        for j, record_b in enumerate(records):
+            assert similarities[i][j] == (
+                colrev.record.record_similarity.get_record_similarity(
+                    record_a, record_b
+                )
+            )
+    assert similarities[0][1] == 0.9074
+
+    # One-vs-many
+    one_vs_many = colrev.record.record_similarity.get_record_similarities(
+        [records[2]], records, workers=1
+    )
+    assert (one_vs_many[0] == similarities[2]).all()
+    assert colrev.record.record_similarity.get_record_similarities(
+        [], records
+    ).shape == (0, len(records))
+
+
+def test_get_record_similarities_randomized() -> None:
+    """Bulk similarities equal the pairwise similarities (randomized records)"""
+
+    rng = random.Random(42)
+    words = ["digital", "platform", "review", "literature", "trust", "systems"]
+    authors = ["Smith, John", "Doe, Jane", "Miller, A.", "Brown, B. and Lee, C."]
+    journals = ["MIS Quarterly", "MISQ", "Information Systems Research", ""]
+    records = []
+    for i in range(80):
+        record_dict = {
+            Fields.ID: f"r{i}",
+            Fields.TITLE: " ".join(rng.choices(words, k=rng.randint(2, 6))),
+            Fields.AUTHOR: rng.choice(authors),
+            Fields.YEAR: str(rng.randint(2018, 2021)),
+            Fields.VOLUME: str(rng.randint(1, 3)),
+        }
+        journal = rng.choice(journals)
+        if journal:
+            record_dict[Fields.JOURNAL] = journal
+        records.append(colrev.record.record.Record(record_dict))
+
+    colrev.record.record_similarity.clear_normalized_cache()
+    similarities = colrev.record.record_similarity.get_record_similarities(
+        records, records
+    )
+    for i, record_a in enumerate(records):
+        for j, record_b in enumerate(records):
+            assert similarities[i][j] == (
+                colrev.record.record_similarity.get_record_similarity(
+                    record_a, record_b
+                )
+            )
+
+
+def test_get_record_similarity_cache() -> None:
+    """Normalized records are cached (and updated when the fields change)"""
+
+    colrev.record.record_similarity.clear_normalized_cache()
+    record_a = colrev.record.record.Record(dict(SIMILARITY_RECORDS[0]))
+    record_b = colrev.record.record.Record(dict(SIMILARITY_RECORDS[1]))
+    assert 0.9074 == colrev.record.record_similarity.get_record_similarity(
+        record_a, record_b
+    )
+    # The records are not modified
+    assert record_b.data == SIMILARITY_RECORDS[1]
+    assert len(colrev.record.record_similarity._normalized_cache) == 2
+
+    colrev.record.record_similarity.get_record_similarity(record_a, record_b)
+    assert len(colrev.record.record_similarity._normalized_cache) == 2
+
+    record_b.data[Fields.VOLUME] = "46"
+    assert 0.9074 > colrev.record.record_similarity.get_record_similarity(
+        record_a, record_b
+    )
+    assert len(colrev.record.record_similarity._normalized_cache) == 3
@@ -186,3 +186,23 @@ def test_unify_to_iso_639_3_language_codes_missing(
     R1.data.pop(Fields.LANGUAGE, None)
     language_service.unify_to_iso_639_3_language_codes(record=R1)
     # No exception should be raised
+
+
+def test_compute_language_confidence_values_batch(
+    language_service: colrev.env.language_service.LanguageService,
+) -> None:
+    """Test the compute_language_confidence_values_batch (equivalent to single texts)"""
+    texts = [
+        "An Integrated Framework for Understanding Digital Work in Organizations",
+        "Editorial",
+        "Das Management von Informationssystemen",
+        "“Escaping the rat race”: Justifications in digital nomadism",
+    ]
+    confidence_values_list = language_service.compute_language_confidence_values_batch(
+        texts=texts
+    )
+    assert len(confidence_values_list) == len(texts)
+    for text, confidence_values in zip(texts, confidence_values_list):
+        expected = language_service.compute_language_confidence_values(text=text)
+        assert confidence_values[0][0] == expected[0][0]
+        assert confidence_values[0][1] == pytest.approx(expected[0][1])
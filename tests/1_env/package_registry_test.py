@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""Test the cached package registry"""
+
+import importlib.metadata
+import time
+import typing
+from pathlib import Path
+
+import pytest
+
+import colrev.package_manager.package
+import colrev.package_manager.package_manager
+import colrev.package_manager.package_registry
+from colrev.constants import EndpointType
+from colrev.constants import Filepaths
+
+
+@pytest.fixture(name="registry_path")
+def fixture_registry_path(tmp_path: Path, monkeypatch) -> typing.Iterator[Path]:  # type: ignore
+    """Registry cache in a temporary directory"""
+    path = tmp_path / Path("package_registry.json")
+    monkeypatch.setattr(Filepaths, "PACKAGE_REGISTRY_CACHE_FILE", path)
+    colrev.package_manager.package_registry.clear_cache()
+    yield path
+    colrev.package_manager.package_registry.clear_cache()
+
+
+def test_package_registry_cache(registry_path: Path, monkeypatch) -> None:  # type: ignore
+    """Test that the snapshot is stored and invalidated (fingerprint)"""
+
+    packages = colrev.package_manager.package_registry.get_packages()
+    assert registry_path.is_file()
+    assert packages["colrev.crossref"]["search_source"] == (
+        "colrev.packages.crossref.src.crossref_search_source:CrossrefSearchSource"
+    )
+    assert colrev.package_manager.package_registry.is_installed("colrev")
+    assert colrev.package_manager.package_registry.is_installed("colrev.crossref")
+    assert not colrev.package_manager.package_registry.is_installed("colrev.unknown")
+
+    # The next process uses the stored snapshot (no scan)
+    colrev.package_manager.package_registry.clear_cache()
+
+    def _scan() -> dict:
+        raise AssertionError("The installed distributions should not be scanned")
+
+    monkeypatch.setattr(colrev.package_manager.package_registry, "_scan", _scan)
+    assert colrev.package_manager.package_registry.get_packages() == packages
+
+    # Installed packages change the fingerprint
+    colrev.package_manager.package_registry.clear_cache()
+    monkeypatch.setattr(
+        colrev.package_manager.package_registry,
+        "_get_fingerprint",
+        lambda: "changed",
+    )
+    monkeypatch.setattr(
+        colrev.package_manager.package_registry,
+        "_scan",
+        lambda: {"installed": {}, "packages": {}},
+    )
+    assert colrev.package_manager.package_registry.get_packages() == {}
+
+
+@pytest.mark.usefixtures("registry_path")
+def test_package_manager_registry() -> None:
+    """Test that the package manager resolves the same endpoints (cached)"""
+
+    package_manager = colrev.package_manager.package_manager.PackageManager()
+
+    expected: dict = {endpoint_type: {} for endpoint_type in EndpointType}
+    for package_identifier in colrev.package_manager.package_registry.get_packages():
+        package = colrev.package_manager.package.Package(package_identifier)
+        package.add_to_type_identifier_endpoint_dict(expected)
+    for endpoint_type in EndpointType:
+        assert (
+            package_manager.discover_installed_packages(package_type=endpoint_type)
+            == expected[endpoint_type]
+        )
+
+    endpoint_class = package_manager.get_package_endpoint_class(
+        package_type=EndpointType.prep, package_identifier="colrev.crossref"
+    )
+    assert endpoint_class is colrev.package_manager.package.Package(
+        "colrev.crossref"
+    ).get_endpoint_class(EndpointType.prep)
+    assert endpoint_class is package_manager.get_package_endpoint_class(
+        package_type=EndpointType.prep, package_identifier="colrev.crossref"
+    )
+    assert package_manager.is_installed("colrev.crossref")
+    assert not package_manager.is_installed("colrev.unknown")
+
+
+@pytest.mark.slow
+@pytest.mark.usefixtures("registry_path")
+def test_package_registry_benchmark() -> None:
+    """Benchmark the endpoint lookups (metadata scans vs. cached registry)"""
+
+    package_manager = colrev.package_manager.package_manager.PackageManager()
+    identifiers = colrev.package_manager.package_registry.get_packages()
+
+    start = time.perf_counter()
+    for package_identifier in identifiers:
+        colrev.package_manager.package.Package(package_identifier)
+        assert package_identifier in [
+            dist.metadata["Name"] for dist in importlib.metadata.distributions()
+        ]
+    uncached = time.perf_counter() - start
+
+    colrev.package_manager.package_registry.clear_cache()
+    start = time.perf_counter()
+    for endpoint_type in EndpointType:
+        package_manager.discover_installed_packages(package_type=endpoint_type)
+    for package_identifier in identifiers:
+        package_manager.is_installed(package_identifier)
+    cached = time.perf_counter() - start
+    print(f"package lookups: {uncached:.3f}s (metadata) vs. {cached:.3f}s (registry)")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+"""Test the streaming PDF downloads (local HTTP server)"""
+
+import typing
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+import colrev.env.pdf_download
+
+PDF_CONTENT = (
+    Path(__file__).parent.parent / Path("data/WagnerLukyanenkoParEtAl2022.pdf")
+).read_bytes()
+OTHER_PDF_CONTENT = (
+    Path(__file__).parent.parent / Path("data/SrivastavaShainesh2015.pdf")
+).read_bytes()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves PDFs (optionally truncated), redirects, and HTML pages."""
+
+    requests: typing.List[typing.Tuple[str, str]] = []
+    truncate_next = 0
+    content = PDF_CONTENT
+    etag = '"v1"'
+    ignore_if_range = False
+
+    def log_message(self, format: str, *args: typing.Any) -> None:  # noqa: A002
+        """Do not log requests."""
+        # pylint: disable=redefined-builtin
+
+    def _send_pdf(self) -> None:
+        start = 0
+        pdf_content = _Handler.content
+        range_header = self.headers.get("Range", "")
+        if self.headers.get("If-Range", _Handler.etag) != _Handler.etag:
+            if not _Handler.ignore_if_range:
+                range_header = ""
+        if range_header:
+            start = int(range_header.replace("bytes=", "").split("-")[0])
+            if start >= len(pdf_content):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(pdf_content)}")
+                self.send_header("ETag", _Handler.etag)
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range",
+                f"bytes {start}-{len(pdf_content) - 1}/{len(pdf_content)}",
+            )
+        else:
+            self.send_response(200)
+        content = pdf_content[start:]
+        self.send_header("ETag", _Handler.etag)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self.path.startswith("/truncated") and _Handler.truncate_next > 0:
+            # Close the connection after sending part of the content
+            _Handler.truncate_next -= 1
+            self.wfile.write(content[: len(content) // 3])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(content)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Handle GET requests."""
+        _Handler.requests.append((self.path, self.headers.get("Range", "")))
+        if self.path.startswith("/redirect"):
+            self.send_response(302)
+            self.send_header("Location", "/paper.pdf")
+            self.end_headers()
+        elif self.path.startswith("/html"):
+            content = b"<html><body>Please log in" + b" " * 5000 + b"</body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+        elif self.path.startswith("/missing"):
+            self.send_response(404)
+            self.end_headers()
+        else:
+            self._send_pdf()
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url(local_http_server: typing.Callable) -> str:
+    """Local HTTP server"""
+    _Handler.requests = []
+    _Handler.truncate_next = 0
+    _Handler.content = PDF_CONTENT
+    _Handler.etag = '"v1"'
+    _Handler.ignore_if_range = False
+    return local_http_server(_Handler)
+
+
+def test_download_pdf(server_url: str, tmp_path: Path) -> None:
+    """Test a complete (and a redirected) download"""
+
+    target = tmp_path / Path("pdfs/paper.pdf")
+    assert colrev.env.pdf_download.download_pdf(f"{server_url}/paper.pdf", target)
+    assert target.read_bytes() == PDF_CONTENT
+    assert not colrev.env.pdf_download.get_partial_path(target).exists()
+
+    target = tmp_path / Path("redirected.pdf")
+    assert colrev.env.pdf_download.download_pdf(f"{server_url}/redirect", target)
+    assert target.read_bytes() == PDF_CONTENT
+
+
+def test_download_pdf_html(server_url: str, tmp_path: Path) -> None:
+    """Test that HTML responses (instead of PDFs) are discarded"""
+
+    target = tmp_path / Path("paper.pdf")
+    assert not colrev.env.pdf_download.download_pdf(f"{server_url}/html", target)
+    assert not target.exists()
+    assert not colrev.env.pdf_download.get_partial_path(target).exists()
+
+    assert not colrev.env.pdf_download.download_pdf(f"{server_url}/missing", target)
+    assert not target.exists()
+
+
+def test_download_pdf_resume(server_url: str, tmp_path: Path) -> None:
+    """Test that truncated downloads are resumed (Range requests)"""
+
+    target = tmp_path / Path("paper.pdf")
+    partial_path = colrev.env.pdf_download.get_partial_path(target)
+
+    # Truncated in the first attempt, resumed in the second attempt
+    _Handler.truncate_next = 1
+    assert colrev.env.pdf_download.download_pdf(f"{server_url}/truncated", target)
+    assert target.read_bytes() == PDF_CONTENT
+    assert _Handler.requests[0] == ("/truncated", "")
+    # Resumed after the chunks received before the connection was closed
+    resume_offset = int(_Handler.requests[1][1].replace("bytes=", "").rstrip("-"))
+    assert 0 < resume_offset <= len(PDF_CONTENT) // 3
+
+    # Truncated (attempts exhausted): the partial file is kept and resumed later
+    target.unlink()
+    _Handler.requests = []
+    _Handler.truncate_next = 1
+    assert not colrev.env.pdf_download.download_pdf(
+        f"{server_url}/truncated", target, max_attempts=1
+    )
+    assert not target.exists()
+    partial_size = partial_path.stat().st_size
+    assert 0 < partial_size <= len(PDF_CONTENT) // 3
+
+    assert colrev.env.pdf_download.download_pdf(f"{server_url}/truncated", target)
+    assert target.read_bytes() == PDF_CONTENT
+    assert _Handler.requests[-1][1] == f"bytes={partial_size}-"
+    assert not partial_path.exists()
+
+
+@pytest.mark.parametrize("ignore_if_range", [False, True])
+def test_download_pdf_resume_changed(
+    server_url: str, tmp_path: Path, ignore_if_range: bool
+) -> None:
+    """Test that downloads restart when the PDF changed (If-Range)"""
+
+    target = tmp_path / Path("paper.pdf")
+    partial_path = colrev.env.pdf_download.get_partial_path(target)
+    _Handler.truncate_next = 1
+    assert not colrev.env.pdf_download.download_pdf(
+        f"{server_url}/truncated", target, max_attempts=1
+    )
+    assert partial_path.stat().st_size > 0
+
+    _Handler.content = OTHER_PDF_CONTENT
+    _Handler.etag = '"v2"'
+    _Handler.ignore_if_range = ignore_if_range
+    _Handler.requests = []
+    assert colrev.env.pdf_download.download_pdf(f"{server_url}/truncated", target)
+    assert target.read_bytes() == OTHER_PDF_CONTENT
+    assert _Handler.requests[0][1].startswith("bytes=")
+    assert not partial_path.exists()
+
+    # Partial files without (matching) download information are not resumed
+    target.unlink()
+    partial_path.write_bytes(PDF_CONTENT[:1000])
+    _Handler.requests = []
+    assert colrev.env.pdf_download.download_pdf(f"{server_url}/paper.pdf", target)
+    assert target.read_bytes() == OTHER_PDF_CONTENT
+    assert _Handler.requests == [("/paper.pdf", "")]
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""Test the content-addressed TEI cache"""
+
+import shutil
+from pathlib import Path
+
+import colrev.env.grobid_service
+import colrev.env.tei_cache
+import colrev.env.tei_parser
+from colrev.constants import Filepaths
+
+
+def test_tei_cache_put_get(tmp_path: Path) -> None:
+    """Test storing and retrieving TEIs"""
+
+    tei_cache = colrev.env.tei_cache.TEICache(cache_dir=tmp_path)
+    key = tei_cache.get_key(
+        pdf_hash="abc", grobid_version="0.8.2", options={"consolidateHeader": "0"}
+    )
+    assert tei_cache.get(key) is None
+    tei_cache.put(key, b"<TEI></TEI>")
+    assert tei_cache.get(key) == b"<TEI></TEI>"
+
+    # The GROBID version and options are part of the key
+    assert key != tei_cache.get_key(
+        pdf_hash="abc", grobid_version="0.8.3", options={"consolidateHeader": "0"}
+    )
+    assert key != tei_cache.get_key(
+        pdf_hash="abc", grobid_version="0.8.2", options={"consolidateHeader": "1"}
+    )
+
+
+def test_tei_cache_renamed_pdf(tmp_path: Path, mocker, helpers) -> None:  # type: ignore
+    """Test that renamed PDFs are not sent to GROBID twice"""
+
+    mocker.patch.object(Filepaths, "TEI_CACHE_DIR", tmp_path / Path("cache"))
+    tei_content = helpers.retrieve_test_file_content(
+        source=Path("data/WagnerLukyanenkoParEtAl2022.tei.xml")
+    ).encode("utf-8")
+    run_grobid = mocker.patch.object(
+        colrev.env.tei_parser.TEIParser, "_run_grobid", return_value=tei_content
+    )
+    mocker.patch.object(
+        colrev.env.grobid_service.GrobidService, "__init__", return_value=None
+    )
+    get_version = mocker.patch.object(
+        colrev.env.grobid_service.GrobidService, "get_version", return_value="0.8.2"
+    )
+
+    pdf_path = tmp_path / Path("WagnerLukyanenkoParEtAl2022.pdf")
+    helpers.retrieve_test_file(
+        source=Path("data/WagnerLukyanenkoParEtAl2022.pdf"), target=pdf_path
+    )
+    tei = colrev.env.tei_parser.TEIParser(pdf_path=pdf_path)
+    assert run_grobid.call_count == 1
+
+    renamed_pdf_path = tmp_path / Path("other_dir/renamed.pdf")
+    renamed_pdf_path.parent.mkdir()
+    shutil.move(str(pdf_path), str(renamed_pdf_path))
+    tei_path = tmp_path / Path("other_dir/renamed.tei.xml")
+    cached_tei = colrev.env.tei_parser.TEIParser(
+        pdf_path=renamed_pdf_path, tei_path=tei_path
+    )
+    assert run_grobid.call_count == 1
+    assert tei_path.is_file()
+    assert cached_tei.get_metadata() == tei.get_metadata()
+
+    # TEIs created by other GROBID versions are not reused
+    get_version.return_value = "0.8.3"
+    colrev.env.tei_parser.TEIParser(pdf_path=renamed_pdf_path)
+    assert run_grobid.call_count == 2
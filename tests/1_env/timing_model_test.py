@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""Test the timing model"""
+
+import json
+from pathlib import Path
+
+import colrev.env.timing_model
+from colrev.constants import Filepaths
+
+
+def test_timing_model_persistence(tmp_path: Path) -> None:
+    """Test the timings of previous runs (saved in the local environment)"""
+
+    path = tmp_path / Path("operation_timings.json")
+    timing_model = colrev.env.timing_model.TimingModel("prep", path=path)
+    assert timing_model.mean("endpoints", "colrev.crossref") is None
+
+    timing_model.add("endpoints", "colrev.crossref", 1.0)
+    timing_model.add("endpoints", "colrev.crossref", 3.0)
+    timing_model.add("sources", "pubmed.bib", 0.5)
+    assert timing_model.mean("endpoints", "colrev.crossref") == 2.0
+    timing_model.save()
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    histogram = data["prep"]["endpoints"]["colrev.crossref"]
+    assert histogram["count"] == 2
+    assert sum(histogram["buckets"]) == 2
+
+    # The next run uses the previous timings and merges its own timings
+    timing_model = colrev.env.timing_model.TimingModel("prep", path=path)
+    assert timing_model.mean("endpoints", "colrev.crossref") == 2.0
+    assert timing_model.mean("sources", "pubmed.bib") == 0.5
+    timing_model.add("endpoints", "colrev.crossref", 5.0)
+    assert timing_model.mean("endpoints", "colrev.crossref") == 5.0
+    timing_model.save()
+    assert timing_model.mean("endpoints", "colrev.crossref") == 3.0
+
+    # Other operations are not affected
+    other_model = colrev.env.timing_model.TimingModel("pdf_prep", path=path)
+    assert other_model.mean("endpoints", "colrev.crossref") is None
+    other_model.add("endpoints", "colrev.ocrmypdf", 10.0)
+    other_model.save()
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert set(data) == {"prep", "pdf_prep"}
+
+
+def test_timing_model_estimate(tmp_path: Path, monkeypatch) -> None:  # type: ignore
+    """Test the estimated durations"""
+
+    monkeypatch.setattr(
+        Filepaths, "OPERATION_TIMINGS_FILE", tmp_path / Path("timings.json")
+    )
+    timing_model = colrev.env.timing_model.TimingModel("prep")
+    timing_model.add("endpoints", "colrev.crossref", 2.0)
+    timing_model.add("endpoints", "colrev.dblp", 0.5)
+    estimate, breakdown = timing_model.estimate(
+        "endpoints", ["colrev.crossref", "colrev.dblp", "colrev.unknown"], default=1.0
+    )
+    assert estimate == 3.5
+    assert breakdown == {
+        "colrev.crossref": 2.0,
+        "colrev.dblp": 0.5,
+        "colrev.unknown": 1.0,
+    }
+
+    timing_model.save()
+    assert (tmp_path / Path("timings.json")).is_file()
+
+
+def test_throughput_monitor(tmp_path: Path) -> None:
+    """Test the live throughput summary"""
+
+    timing_model = colrev.env.timing_model.TimingModel(
+        "prep", path=tmp_path / Path("timings.json")
+    )
+    timing_model.add("endpoints", "colrev.crossref", 2.0)
+    timing_model.add("endpoints", "colrev.dblp", 0.5)
+    monitor = colrev.env.timing_model.ThroughputMonitor(
+        nr_records=10, timing_model=timing_model, interval=0
+    )
+
+    class _Response:  # pylint: disable=too-few-public-methods
+        def __init__(self, from_cache: bool) -> None:
+            self.from_cache = from_cache
+
+    for from_cache in [True, True, True, False]:
+        colrev.env.timing_model.count_cache_hits(_Response(from_cache))
+
+    summary = monitor.record_completed()
+    assert "records/s" in summary
+    assert "ETA" in summary
+    assert "cache hits 75%" in summary
+    assert "slowest: colrev.crossref (2.00s)" in summary
+
+    monitor.interval = 3600
+    assert monitor.record_completed() == ""
+
+
+def test_throughput_monitor_eta_over_one_day(tmp_path: Path, monkeypatch) -> None:  # type: ignore
+    """Test the ETA of long runs (more than one day remaining)"""
+
+    timing_model = colrev.env.timing_model.TimingModel(
+        "prep", path=tmp_path / Path("timings.json")
+    )
+    monitor = colrev.env.timing_model.ThroughputMonitor(
+        nr_records=100001, timing_model=timing_model, interval=0
+    )
+    # One record per second: 100000 records remaining (1 day, 03:46:40)
+    monkeypatch.setattr(colrev.env.timing_model.time, "monotonic", lambda: 0.0)
+    monitor._start = -1.0  # pylint: disable=protected-access
+    monitor._nr_completed = 1  # pylint: disable=protected-access
+    assert "ETA 1 day, 3:46:40" in monitor.get_summary()
+
+    monitor.record_completed(nr_records=100000)
+    assert "ETA" not in monitor.get_summary()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """Testing environment manager settings"""
 
+import json
 from pathlib import Path
 
 import pytest
@@ -49,3 +50,16 @@ def test_remove_accents() -> None:
     assert colrev.env.utils.remove_accents("Á") == "A"
     assert colrev.env.utils.remove_accents("Paré") == "Pare"
     assert colrev.env.utils.remove_accents("Müller") == "Muller"
+
+
+def test_atomic_write_json(tmp_path: Path) -> None:
+    """Test the atomic JSON writes (temporary files are removed on errors)"""
+
+    path = tmp_path / Path("cache/data.json")
+    colrev.env.utils.atomic_write_json(path, {"a": [1, 2]})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": [1, 2]}
+
+    with pytest.raises(TypeError):
+        colrev.env.utils.atomic_write_json(path, {"a": object()})
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": [1, 2]}
+    assert list(path.parent.iterdir()) == [path]
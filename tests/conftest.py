@@ -5,7 +5,10 @@ from __future__ import annotations
 
 import os
 import shutil
+import threading
 import typing
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
@@ -161,6 +164,26 @@ def script_loc(request) -> Path:  # type: ignore
     return Path(request.fspath).parent
 
 
+@pytest.fixture(name="local_http_server")
+def fixture_local_http_server() -> (
+    typing.Iterator[typing.Callable[[typing.Type[BaseHTTPRequestHandler]], str]]
+):
+    """Start local HTTP servers (for a request handler) and return their URL"""
+    servers: typing.List[ThreadingHTTPServer] = []
+
+    def start(handler: typing.Type[BaseHTTPRequestHandler]) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
 @pytest.fixture(scope="function", name="_patch_registry")
 def patch_registry(mocker, tmp_path) -> None:  # type: ignore
     """Patch registry path in environment manager"""
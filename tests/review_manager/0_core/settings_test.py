@@ -45,6 +45,7 @@ def test_settings_load() -> None:
         "prep": {
             "fields_to_keep": [],
             "defects_to_ignore": [],
+            "protected_acronyms": [],
             "prep_rounds": [
                 {
                     "name": "prep",
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 """Tests for the status stats"""
 
+import colrev.loader.bib
+import colrev.loader.load_utils
 import colrev.process.status
+import colrev.process.status_cache
 from colrev.constants import Colors
 from colrev.constants import Fields
 from colrev.constants import OperationsType
@@ -260,3 +263,46 @@ def test_get_transitioned_records(  # type: ignore
             "type": "invalid_transition",
         }
     ]
+
+
+def test_status_stats_incremental(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+    mocker,
+) -> None:
+    """Test that the status stats are updated incrementally (status cache)"""
+
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="data_commit")
+    status_stats = base_repo_review_manager.get_status_stats()
+    assert (
+        base_repo_review_manager.path / colrev.process.status_cache.CACHE_PATH
+    ).is_file()
+    compare(base_repo_review_manager.get_status_stats(verify=True), status_stats)
+
+    # Unchanged records and search results are not parsed again
+    get_nr_records = mocker.spy(colrev.loader.load_utils, "get_nr_records")
+    process_lines = mocker.spy(colrev.loader.bib, "process_lines")
+    compare(base_repo_review_manager.get_status_stats(), status_stats)
+    assert get_nr_records.call_count == 0
+    assert process_lines.call_count == 0
+
+    # Only the changed record is parsed
+    base_repo_review_manager.get_dedupe_operation()
+    records = base_repo_review_manager.dataset.load_records_dict()
+    record_dict = list(records.values())[0]
+    record_dict[Fields.STATUS] = RecordState.rev_excluded
+    base_repo_review_manager.dataset.save_records_dict(records)
+    status_cache = colrev.process.status_cache.StatusCache(
+        review_manager=base_repo_review_manager
+    )
+    cached_records = status_cache.get_records()
+    assert status_cache.nr_parsed_entries == 1
+    assert cached_records[record_dict[Fields.ID]][Fields.STATUS] == (
+        RecordState.rev_excluded
+    )
+    compare(
+        colrev.process.status.get_status_stats(
+            review_manager=base_repo_review_manager, use_cache=False
+        ),
+        base_repo_review_manager.get_status_stats(),
+    )
@@ -307,3 +307,140 @@ def test_get_curated_outlets(
         "European Journal of Information Systems",
         "Information Systems Journal",
     ]
+
+
+def test_get_environment_stats_cache(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    _patch_registry,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    """Test the status summaries (cached by HEAD commit)"""
+
+    monkeypatch.setattr(
+        Filepaths, "ENVIRONMENT_STATUS_CACHE_FILE", tmp_path / Path("status.json")
+    )
+    repo_path = str(base_repo_review_manager.path)
+    broken_path = str(tmp_path / Path("missing_repo"))
+    env_man = colrev.env.environment_manager.EnvironmentManager()
+    env_man.save_environment_registry(
+        {
+            "local_index": {
+                "repos": [
+                    {"repo_name": "base_repo", "repo_source_path": repo_path},
+                    {"repo_name": "missing_repo", "repo_source_path": broken_path},
+                ]
+            }
+        }
+    )
+
+    ret = env_man.get_environment_details()
+    assert [x["repo_source_path"] for x in ret["local_repos"]["repos"]] == [repo_path]
+    assert [x["repo_source_path"] for x in ret["local_repos"]["broken_links"]] == [
+        broken_path
+    ]
+    repo = ret["local_repos"]["repos"][0]
+    assert repo["remote"] is False
+    assert repo["behind_remote"] is False
+    status_cache = json.loads((tmp_path / Path("status.json")).read_text())
+    assert status_cache[repo_path]["head"] == (
+        base_repo_review_manager.dataset.git_repo.repo.head.commit.hexsha
+    )
+    assert broken_path not in status_cache
+
+    # Current summaries are not computed again (only the broken link)
+    computed = []
+
+    def _get_repo_status(repo_source_path: str) -> dict:
+        computed.append(repo_source_path)
+        return {}
+
+    monkeypatch.setattr(
+        colrev.env.environment_manager, "_get_repo_status", _get_repo_status
+    )
+    ret = env_man.get_environment_details()
+    assert computed == [broken_path]
+    assert ret["local_repos"]["repos"][0]["size"] == repo["size"]
+
+    # Summaries are computed again (in parallel) when the HEAD commit changes
+    stale_paths = []
+
+    def _get_repo_statuses(repo_source_paths: list) -> dict:
+        stale_paths.extend(repo_source_paths)
+        return {}
+
+    monkeypatch.setattr(env_man, "_get_repo_statuses", _get_repo_statuses)
+    monkeypatch.setattr(
+        colrev.env.environment_manager, "_get_head_sha", lambda path: "new_commit"
+    )
+    env_man.get_environment_details()
+    assert stale_paths == [repo_path, broken_path]
+
+
+def test_get_curated_outlets_registry(_patch_registry) -> None:  # type: ignore
+    """Test the curated outlets stored in the registry (when indexing)"""
+
+    curated_path = str(Filepaths.CURATIONS_PATH / Path("journal-of-testing"))
+    env_man = colrev.env.environment_manager.EnvironmentManager()
+    env_man.save_environment_registry(
+        {
+            "local_index": {
+                "repos": [
+                    {
+                        "repo_name": "journal-of-testing",
+                        "repo_source_path": curated_path,
+                    }
+                ]
+            }
+        }
+    )
+    env_man.register_curated_outlets(
+        {
+            curated_path: (
+                "Journal of Testing",
+                ["Journal of Testing", "Journal of Testing"],
+            )
+        }
+    )
+    # The records.bib is not parsed (the repository does not exist)
+    assert env_man.get_curated_outlets() == ["Journal of Testing"]
+
+    env_man.register_curated_outlets(
+        {
+            curated_path: (
+                "Journal of Testing",
+                ["Journal of Testing", "Testing Letters"],
+            )
+        }
+    )
+    with pytest.raises(colrev_exceptions.CuratedOutletNotUnique):
+        env_man.get_curated_outlets()
+
+
+def test_register_curated_outlets_saved_once(_patch_registry, mocker) -> None:  # type: ignore
+    """Test that the curated outlets of several repositories are saved at once"""
+
+    curated_paths = [
+        str(Filepaths.CURATIONS_PATH / Path(name))
+        for name in ["journal-of-testing", "testing-letters"]
+    ]
+    env_man = colrev.env.environment_manager.EnvironmentManager()
+    env_man.save_environment_registry(
+        {
+            "local_index": {
+                "repos": [
+                    {"repo_name": Path(path).name, "repo_source_path": path}
+                    for path in curated_paths
+                ]
+            }
+        }
+    )
+    save_spy = mocker.spy(env_man, "save_environment_registry")
+    env_man.register_curated_outlets(
+        {
+            curated_paths[0]: ("Journal of Testing", ["Journal of Testing"]),
+            curated_paths[1]: ("Testing Letters", ["Testing Letters"]),
+        }
+    )
+    assert save_spy.call_count == 1
+    assert env_man.get_curated_outlets() == ["Journal of Testing", "Testing Letters"]
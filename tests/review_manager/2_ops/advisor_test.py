@@ -1,7 +1,13 @@
 #!/usr/bin/env python
 """Tests of the CoLRev check operation"""
 
+from datetime import timedelta
+from pathlib import Path
+
+import colrev.env.environment_manager
+import colrev.ops.advisor
 import colrev.review_manager
+from colrev.constants import Filepaths
 
 # flake8: noqa
 
@@ -167,3 +173,63 @@ def test_check_operation_precondition(  # type: ignore
             "title": "Versioning (not connected to shared repository)",
         },
     }
+
+
+def test_advisor_summary_cache(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+    mocker,
+) -> None:
+    """Test that the advisor reuses the project summary (until records change)"""
+
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+    advisor = base_repo_review_manager.get_advisor()
+    expected = advisor.get_review_instructions()
+    status_stats = advisor.status_stats
+    assert (base_repo_review_manager.path / colrev.ops.advisor.SUMMARY_PATH).is_file()
+
+    load_records_dict = mocker.spy(
+        base_repo_review_manager.dataset, "load_records_dict"
+    )
+    advisor = base_repo_review_manager.get_advisor()
+    assert advisor.get_review_instructions() == expected
+    assert advisor.status_stats == status_stats
+    assert load_records_dict.call_count == 0
+
+    # Changes in the records invalidate the summary
+    with open(base_repo_review_manager.paths.records, "a", encoding="utf-8") as file:
+        file.write("\n")
+    advisor = base_repo_review_manager.get_advisor()
+    assert advisor.status_stats == status_stats
+    assert load_records_dict.call_count == 1
+
+
+def test_advisor_remote_check_ttl(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    mocker,
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    """Test that the remote checks of registered repos are cached (ttl)"""
+
+    monkeypatch.setattr(
+        Filepaths, "REMOTE_STATUS_CACHE_FILE", tmp_path / Path("remote_status.json")
+    )
+    monkeypatch.setattr(
+        colrev.env.environment_manager.EnvironmentManager,
+        "local_repos",
+        lambda self: [{"repo_source_path": str(base_repo_review_manager.path)}],
+    )
+
+    def _count_remote_checks(remote_check_ttl: timedelta) -> int:
+        advisor = colrev.ops.advisor.Advisor(
+            review_manager=base_repo_review_manager,
+            remote_check_ttl=remote_check_ttl,
+        )
+        remote_check = mocker.spy(advisor, "_append_registered_repo_instructions")
+        advisor.get_instructions()
+        return remote_check.call_count
+
+    assert _count_remote_checks(timedelta(hours=1)) == 1
+    assert _count_remote_checks(timedelta(hours=1)) == 0
+    assert _count_remote_checks(timedelta(0)) == 1
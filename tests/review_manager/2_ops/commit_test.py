@@ -1,12 +1,17 @@
 #!/usr/bin/env python
 """Tests of the CoLRev commit operation"""
 
+import socket
+from pathlib import Path
+
 import git
 import pytest
 from docker import errors as docker_errors
 
 import colrev.exceptions as colrev_exceptions
 import colrev.ops.check
+import colrev.ops.commit
+from colrev.constants import Filepaths
 from colrev.ops.commit import Commit
 
 
@@ -100,3 +105,81 @@ def test_get_docker_version_failure(commit_fixture, mocker):  # type: ignore
     )
 
     assert commit_fixture._get_docker_version() == "Not installed"
+
+
+def test_set_versions_cache(commit_fixture, mocker, monkeypatch, tmp_path):  # type: ignore
+    """Test that the versions are cached (per process and environment)"""
+    monkeypatch.setattr(
+        Filepaths, "VERSION_INFO_CACHE_FILE", tmp_path / Path("version_info.json")
+    )
+    monkeypatch.setattr(colrev.ops.commit, "_VERSION_INFO", {})
+    monkeypatch.setattr(colrev.ops.commit, "_docker_daemon_reachable", lambda: True)
+    get_git_version = mocker.patch.object(
+        commit_fixture, "_get_git_version", return_value="version 2.44.0"
+    )
+    get_docker_version = mocker.patch.object(
+        commit_fixture, "_get_docker_version", return_value="version 27.1.0"
+    )
+
+    commit_fixture._set_versions()
+    commit_fixture._set_versions()
+    assert commit_fixture.git_version == "version 2.44.0"
+    assert commit_fixture.docker_version == "version 27.1.0"
+    assert get_git_version.call_count == 1
+    assert get_docker_version.call_count == 1
+
+    # The cached docker version is not used when the daemon was stopped
+    monkeypatch.setattr(colrev.ops.commit, "_docker_daemon_reachable", lambda: False)
+    commit_fixture._set_versions()
+    assert commit_fixture.docker_version == "Not installed"
+    monkeypatch.setattr(colrev.ops.commit, "_docker_daemon_reachable", lambda: True)
+
+    # Next process: cached in the local environment
+    monkeypatch.setattr(colrev.ops.commit, "_VERSION_INFO", {})
+    commit_fixture._set_versions()
+    assert commit_fixture.git_version == "version 2.44.0"
+    assert get_git_version.call_count == 1
+
+    # Updated binaries (mtime) invalidate the cache
+    monkeypatch.setattr(colrev.ops.commit, "_VERSION_INFO", {})
+    monkeypatch.setattr(
+        colrev.ops.commit, "_get_binary_key", lambda *names: [[*names, "updated"]]
+    )
+    get_git_version.return_value = "version 2.45.0"
+    commit_fixture._set_versions()
+    assert commit_fixture.git_version == "version 2.45.0"
+    assert get_git_version.call_count == 2
+    assert get_docker_version.call_count == 2
+
+
+def test_set_versions_docker_unavailable(  # type: ignore
+    commit_fixture, mocker, monkeypatch, tmp_path
+):
+    """Test that docker is not queried when the daemon is not reachable"""
+    monkeypatch.setattr(colrev.ops.commit, "_VERSION_INFO", {})
+    monkeypatch.delenv("DOCKER_HOST", raising=False)
+    monkeypatch.setattr(colrev.ops.commit.sys, "platform", "linux")
+    monkeypatch.setattr(
+        colrev.ops.commit, "DOCKER_SOCKET", tmp_path / Path("docker.sock")
+    )
+    docker_from_env = mocker.patch("colrev.ops.commit.docker_from_env")
+
+    commit_fixture._set_versions()
+    assert commit_fixture.docker_version == "Not installed"
+
+    # Socket file of a stopped daemon
+    (tmp_path / Path("docker.sock")).touch()
+    commit_fixture._set_versions()
+    assert commit_fixture.docker_version == "Not installed"
+    monkeypatch.setenv("DOCKER_HOST", "tcp://127.0.0.1:1")
+    commit_fixture._set_versions()
+    assert commit_fixture.docker_version == "Not installed"
+    docker_from_env.assert_not_called()
+
+    # Running daemon (listening socket)
+    monkeypatch.delenv("DOCKER_HOST")
+    (tmp_path / Path("docker.sock")).unlink()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as daemon_socket:
+        daemon_socket.bind(str(tmp_path / Path("docker.sock")))
+        daemon_socket.listen(1)
+        assert colrev.ops.commit._docker_daemon_reachable()
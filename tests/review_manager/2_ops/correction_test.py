@@ -63,3 +63,17 @@ def test_corrections_pre_commit_hooks(  # type: ignore
         encoding="utf-8"
     )
     assert expected == actual
+
+
+def test_corrections_changed_records(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, correction_fixture
+) -> None:
+    """Test that only records changed in the staged diff are checked"""
+    corrections_operation = colrev.ops.correct.Corrections(
+        review_manager=base_repo_review_manager
+    )
+    records, prior_records = corrections_operation._get_changed_records()  # type: ignore
+    assert list(records) == ["SrivastavaShainesh2015"]
+    assert list(prior_records) == ["SrivastavaShainesh2015"]
+    assert records["SrivastavaShainesh2015"]["title"] == "Changed-title"
+    assert prior_records["SrivastavaShainesh2015"]["title"] != "Changed-title"
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""Tests of the CoLRev load operation"""
+
+from pathlib import Path
+
+import git
+import pytest
+
+import colrev.exceptions as colrev_exceptions
+import colrev.review_manager
+import colrev.search_file
+from colrev.constants import SearchType
+
+RIS_ENTRY = """TY  - JOUR
+AU  - Wagner, Gerit
+TI  - Paper {nr}
+PY  - 2022
+ER  -
+
+"""
+
+
+def test_load_ensure_append_only(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager, mocker
+) -> None:
+    """Test the append-only check based on the prefix hash"""
+
+    search_results_path = Path("data/search/append_only.ris")
+    search_results_path.write_text(RIS_ENTRY.format(nr=1), encoding="utf-8")
+    search_source = colrev.search_file.ExtendedSearchFile(
+        platform="colrev.unknown_source",
+        search_results_path=search_results_path,
+        search_type=SearchType.DB,
+        search_string="",
+        comment="",
+        version="0.1.0",
+    )
+    load_operation = base_repo_review_manager.get_load_operation()
+
+    # The initial check replays the history and stores the prefix hash
+    load_operation.ensure_append_only(
+        filename=search_results_path, search_source=search_source
+    )
+    # pylint: disable=no-member
+    assert search_source.append_only_prefix["length"] == len(RIS_ENTRY.format(nr=1))
+    base_repo_review_manager.dataset.git_repo.add_changes(search_results_path)
+    base_repo_review_manager.create_commit(msg="add append_only.ris")
+
+    # Subsequent checks do not replay the history
+    iter_commits = mocker.spy(git.Repo, "iter_commits")
+    with open(search_results_path, "a", encoding="utf-8") as file:
+        file.write(RIS_ENTRY.format(nr=2))
+    load_operation.ensure_append_only(
+        filename=search_results_path, search_source=search_source
+    )
+    assert iter_commits.call_count == 0
+
+    search_results_path.write_text(
+        RIS_ENTRY.format(nr=3) + RIS_ENTRY.format(nr=2), encoding="utf-8"
+    )
+    with pytest.raises(colrev_exceptions.AppendOnlyViolation):
+        load_operation.ensure_append_only(
+            filename=search_results_path, search_source=search_source
+        )
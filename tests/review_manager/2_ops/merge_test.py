@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+"""Tests of the record-level merge (driver) for data/records.bib"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from copy import deepcopy
+from pathlib import Path
+
+import git
+import pytest
+
+import colrev.loader.load_utils
+import colrev.ops.merge
+from colrev.constants import Fields
+from colrev.constants import RecordState
+from colrev.writer.bib import write_file
+
+
+def _get_records(nr_records: int) -> dict:
+    return {
+        f"Rec{i:06d}": {
+            Fields.ID: f"Rec{i:06d}",
+            Fields.ENTRYTYPE: "article",
+            Fields.ORIGIN: [f"test.bib/{i:06d}"],
+            Fields.STATUS: RecordState.md_processed,
+            Fields.MD_PROV: {Fields.TITLE: {"source": f"test.bib/{i:06d}", "note": ""}},
+            Fields.TITLE: f"Title of the paper {i}",
+            Fields.AUTHOR: f"Author, {i}",
+            Fields.YEAR: str(2000 + i % 20),
+        }
+        for i in range(nr_records)
+    }
+
+
+def _load(path: Path) -> dict:
+    return colrev.loader.load_utils.load(
+        filename=path, logger=logging.getLogger(__name__)
+    )
+
+
+def _apply_random_changes(
+    rng: random.Random, records: dict, *, branch: str, other: dict
+) -> None:
+    """Change, add, and remove records (without touching the same fields as other)."""
+    for record_id in list(records):
+        change = rng.randint(0, 9)
+        if record_id not in other:
+            # Record was removed in the other branch
+            continue
+        if other[record_id] != records[record_id]:
+            # Record was already changed in the other branch
+            if change == 0:
+                records[record_id][f"note_{branch}"] = "changed"
+            continue
+        if change == 0:
+            records[record_id][Fields.STATUS] = rng.choice(
+                [RecordState.rev_prescreen_included, RecordState.rev_prescreen_excluded]
+            )
+        elif change == 1:
+            records[record_id][Fields.TITLE] += f" ({branch})"
+        elif change == 2:
+            del records[record_id]
+        elif change == 3:
+            records[record_id][Fields.MD_PROV][Fields.AUTHOR] = {
+                "source": branch,
+                "note": "",
+            }
+    for i in range(rng.randint(0, 3)):
+        record_id = f"Rec_{branch}_{i}"
+        records[record_id] = {
+            Fields.ID: record_id,
+            Fields.ENTRYTYPE: "book",
+            Fields.ORIGIN: [f"{branch}.bib/{i:06d}"],
+            Fields.STATUS: RecordState.md_processed,
+            Fields.TITLE: f"New record {i} ({branch})",
+        }
+
+
+def _get_expected(base: dict, ours: dict, theirs: dict) -> dict:
+    expected = {}
+    for record_id in sorted(set(base) | set(ours) | set(theirs)):
+        if record_id not in ours or record_id not in theirs:
+            if record_id in base:
+                # Removed in one of the branches
+                continue
+            expected[record_id] = ours.get(record_id, theirs.get(record_id))
+            continue
+        base_record = base.get(record_id, {})
+        record = deepcopy(base_record)
+        for changed in [ours[record_id], theirs[record_id]]:
+            for key in set(changed) | set(base_record):
+                if key == Fields.MD_PROV:
+                    record[key].update(
+                        (field, value)
+                        for field, value in changed[key].items()
+                        if base_record[key].get(field) != value
+                    )
+                elif key not in changed:
+                    record.pop(key, None)
+                elif base_record.get(key) != changed[key]:
+                    record[key] = changed[key]
+        expected[record_id] = record
+    return expected
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_merge_records_files_synthetic_divergence(tmp_path: Path, seed: int) -> None:
+    """Property: disjoint changes in both branches are merged without conflicts"""
+
+    rng = random.Random(seed)
+    base = _get_records(rng.randint(0, 60))
+    ours = deepcopy(base)
+    _apply_random_changes(rng, ours, branch="ours", other=base)
+    theirs = deepcopy(base)
+    _apply_random_changes(rng, theirs, branch="theirs", other=ours)
+
+    paths = {}
+    for name, records in [("base", base), ("ours", ours), ("theirs", theirs)]:
+        paths[name] = tmp_path / Path(f"{name}.bib")
+        write_file(records_dict=records, filename=paths[name])
+
+    conflicts = colrev.ops.merge.merge_records_files(
+        base_path=paths["base"], ours_path=paths["ours"], theirs_path=paths["theirs"]
+    )
+    assert not conflicts
+
+    expected_path = tmp_path / Path("expected.bib")
+    write_file(records_dict=_get_expected(base, ours, theirs), filename=expected_path)
+    assert _load(paths["ours"]) == _load(expected_path)
+
+
+def test_merge_records_files_conflicts(tmp_path: Path) -> None:
+    """Test conflicting changes of the same field"""
+
+    base = _get_records(3)
+    ours, theirs = deepcopy(base), deepcopy(base)
+    ours["Rec000001"][Fields.STATUS] = RecordState.rev_prescreen_included
+    theirs["Rec000001"][Fields.STATUS] = RecordState.rev_prescreen_excluded
+    theirs["Rec000001"][Fields.YEAR] = "1999"
+    ours["Rec000002"][Fields.TITLE] = "Changed title"
+    del theirs["Rec000002"]
+
+    paths = []
+    for name, records in [("base", base), ("ours", ours), ("theirs", theirs)]:
+        paths.append(tmp_path / Path(f"{name}.bib"))
+        write_file(records_dict=records, filename=paths[-1])
+
+    conflicts = colrev.ops.merge.merge_records_files(
+        base_path=paths[0], ours_path=paths[1], theirs_path=paths[2]
+    )
+    assert conflicts == ["Rec000001", "Rec000002"]
+    merged = paths[1].read_text(encoding="utf-8")
+    assert merged.count("<<<<<<< ours") == 2
+    assert "rev_prescreen_included" in merged
+    assert "rev_prescreen_excluded" in merged
+    # Non-conflicting changes are merged on both sides
+    assert merged.count("1999") == 2
+
+
+def test_merge_driver_git(tmp_path: Path) -> None:
+    """Test the merge driver (called by git merge)"""
+
+    git_repo = git.Repo.init(tmp_path)
+    with git_repo.config_writer() as config:
+        config.set_value("user", "name", "Tester")
+        config.set_value("user", "email", "tester@example.org")
+    colrev.ops.merge.register_merge_driver(git_repo)
+    records_path = tmp_path / Path("data/records.bib")
+    records_path.parent.mkdir()
+
+    base = _get_records(10)
+    write_file(records_dict=base, filename=records_path)
+    git_repo.index.add([str(records_path)])
+    git_repo.index.commit("base")
+    main_branch = git_repo.active_branch.name
+
+    git_repo.git.checkout("-b", "other")
+    theirs = deepcopy(base)
+    theirs["Rec000002"][Fields.STATUS] = RecordState.rev_prescreen_excluded
+    theirs["Rec000001"][Fields.MD_PROV][Fields.AUTHOR] = {"source": "other", "note": ""}
+    write_file(records_dict=theirs, filename=records_path)
+    git_repo.index.add([str(records_path)])
+    git_repo.index.commit("other")
+
+    git_repo.git.checkout(main_branch)
+    ours = deepcopy(base)
+    # Changes of adjacent lines (conflict in a line-based merge)
+    ours["Rec000001"][Fields.STATUS] = RecordState.rev_prescreen_included
+    ours["Rec000003"][Fields.TITLE] = "Changed title"
+    write_file(records_dict=ours, filename=records_path)
+    git_repo.index.add([str(records_path)])
+    git_repo.index.commit("ours")
+
+    git_repo.git.merge("other")
+    merged = _load(records_path)
+    assert merged["Rec000001"][Fields.STATUS] == RecordState.rev_prescreen_included
+    assert merged["Rec000001"][Fields.MD_PROV][Fields.AUTHOR]["source"] == "other"
+    assert merged["Rec000002"][Fields.STATUS] == RecordState.rev_prescreen_excluded
+    assert merged["Rec000003"][Fields.TITLE] == "Changed title"
+
+
+@pytest.mark.slow
+def test_merge_records_files_benchmark(tmp_path: Path) -> None:
+    """Benchmark the merge (synthetic records file with 50k records)"""
+
+    base = _get_records(50000)
+    ours, theirs = deepcopy(base), deepcopy(base)
+    for i in range(0, 50000, 10):
+        ours[f"Rec{i:06d}"][Fields.STATUS] = RecordState.rev_prescreen_included
+        theirs[f"Rec{i + 1:06d}"][Fields.STATUS] = RecordState.rev_prescreen_excluded
+    for i in range(0, 50000, 100):
+        theirs[f"Rec{i:06d}"][Fields.YEAR] = "1999"
+
+    paths = []
+    for name, records in [("base", base), ("ours", ours), ("theirs", theirs)]:
+        paths.append(tmp_path / Path(f"{name}.bib"))
+        write_file(records_dict=records, filename=paths[-1])
+
+    start = time.time()
+    conflicts = colrev.ops.merge.merge_records_files(
+        base_path=paths[0], ours_path=paths[1], theirs_path=paths[2]
+    )
+    duration = time.time() - start
+    print(f"Merged 50k records in {duration:.2f}s")
+    assert not conflicts
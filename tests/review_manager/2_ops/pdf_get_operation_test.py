@@ -1,10 +1,18 @@
 #!/usr/bin/env python
 """Tests of the CoLRev pdf-get operation"""
 
+import logging
+import shutil
 from pathlib import Path
 
+import colrev.ops.pdf_catalogue
+import colrev.ops.pdf_get
+import colrev.record.record_blocking
+import colrev.record.record_pdf
 import colrev.review_manager
+from colrev.constants import Fields
 from colrev.constants import PDFPathType
+from colrev.writer.write_utils import write_file
 
 # def test_pdf_get(  # type: ignore
 #     base_repo_review_manager: colrev.review_manager.ReviewManager, review_manager_helpers
@@ -187,3 +195,146 @@ def test_pdf_get_get_target_filepath(  # type: ignore
 #       )
 #   )
 #   base_repo_review_manager.settings.sources[0] = original_source
+
+
+def test_pdf_get_match_unlinked_pdf_cheaply(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+    helpers,
+    mocker,
+) -> None:
+    """Test that unlinked PDFs are matched without GROBID (DOI on first page)"""
+
+    review_manager_helpers.reset_commit(
+        base_repo_review_manager, commit="prescreen_commit"
+    )
+    pdf_get_operation = base_repo_review_manager.get_pdf_get_operation(
+        notify_state_transition_operation=True
+    )
+    tei_parser = mocker.patch("colrev.env.tei_parser.TEIParser")
+
+    helpers.retrieve_test_file(
+        source=Path("data/WagnerLukyanenkoParEtAl2022.pdf"),
+        target=Path("data/pdfs/renamed.pdf"),
+    )
+    records = {
+        "Wagner2022": {
+            Fields.ID: "Wagner2022",
+            Fields.TITLE: "Artificial intelligence and the conduct of literature reviews",
+            Fields.AUTHOR: "Wagner, Gerit and Lukyanenko, Roman and Paré, Guy",
+            Fields.YEAR: "2022",
+            Fields.DOI: "10.1177/02683962211048201",
+        },
+        "Srivastava2015": {
+            Fields.ID: "Srivastava2015",
+            Fields.TITLE: "Bridging the service divide",
+            Fields.YEAR: "2015",
+        },
+    }
+    blocking_index = colrev.record.record_blocking.RecordBlockingIndex(records)
+    actual = pdf_get_operation._match_unlinked_pdf_cheaply(
+        file=base_repo_review_manager.path / Path("data/pdfs/renamed.pdf"),
+        records=records,
+        blocking_index=blocking_index,
+    )
+    assert actual == records["Wagner2022"]
+
+    # Matching based on the embedded metadata (title)
+    del records["Wagner2022"][Fields.DOI]
+    blocking_index = colrev.record.record_blocking.RecordBlockingIndex(records)
+    actual = pdf_get_operation._match_unlinked_pdf_cheaply(
+        file=base_repo_review_manager.path / Path("data/pdfs/renamed.pdf"),
+        records=records,
+        blocking_index=blocking_index,
+    )
+    assert actual == records["Wagner2022"]
+    tei_parser.assert_not_called()
+
+
+def test_pdf_catalogue(tmp_path: Path, helpers, mocker) -> None:  # type: ignore
+    """Test the cpid catalogue (updated for new or modified PDFs only)"""
+
+    pdf_dir = tmp_path / Path("data/pdfs")
+    for source, target in [
+        ("SrivastavaShainesh2015.pdf", "a/Srivastava.pdf"),
+        ("WagnerLukyanenkoParEtAl2022.pdf", "Wagner.pdf"),
+        ("zero-size-pdf.pdf", "empty.pdf"),
+    ]:
+        helpers.retrieve_test_file(
+            source=Path("data") / Path(source), target=pdf_dir / Path(target)
+        )
+    get_cpid = mocker.spy(colrev.record.record_pdf.PDFRecord, "get_colrev_pdf_id")
+    catalogue = colrev.ops.pdf_catalogue.PDFCatalogue(
+        pdf_dir=pdf_dir, home_path=tmp_path, logger=logging.getLogger(__name__)
+    )
+
+    cpids = catalogue.update()
+    # Invalid PDFs (zero size) are skipped
+    assert set(cpids) == {"data/pdfs/a/Srivastava.pdf", "data/pdfs/Wagner.pdf"}
+    assert get_cpid.call_count == 3
+    assert (tmp_path / colrev.ops.pdf_catalogue.CATALOGUE_PATH).is_file()
+
+    # Unchanged PDFs are not processed again (across instances)
+    catalogue = colrev.ops.pdf_catalogue.PDFCatalogue(
+        pdf_dir=pdf_dir, home_path=tmp_path, logger=logging.getLogger(__name__)
+    )
+    assert catalogue.update() == cpids
+    assert get_cpid.call_count == 4
+
+    # Modified and removed PDFs
+    shutil.copy(pdf_dir / Path("Wagner.pdf"), pdf_dir / Path("a/Srivastava.pdf"))
+    (pdf_dir / Path("Wagner.pdf")).unlink()
+    paths_by_cpid = catalogue.get_paths_by_cpid()
+    assert paths_by_cpid == {
+        cpids["data/pdfs/Wagner.pdf"]: Path("data/pdfs/a/Srivastava.pdf")
+    }
+    assert get_cpid.call_count == 6
+
+
+def test_pdf_get_relink_pdfs_in_source(tmp_path: Path, helpers, mocker) -> None:  # type: ignore
+    """Test relinking PDFs based on cpids (after moving PDFs)"""
+
+    pdf_dir = tmp_path / Path("data/pdfs")
+    helpers.retrieve_test_file(
+        source=Path("data/WagnerLukyanenkoParEtAl2022.pdf"),
+        target=pdf_dir / Path("moved/Wagner2022.pdf"),
+    )
+    cpid = colrev.record.record_pdf.PDFRecord.get_colrev_pdf_id(
+        pdf_dir / Path("moved/Wagner2022.pdf")
+    )
+    search_results_path = tmp_path / Path("data/search/pdfs.bib")
+    search_results_path.parent.mkdir(parents=True)
+    write_file(
+        records_dict={
+            "0001": {
+                Fields.ID: "0001",
+                Fields.ENTRYTYPE: "article",
+                Fields.FILE: "data/pdfs/Srivastava2015.pdf",
+            }
+        },
+        filename=search_results_path,
+    )
+    source = mocker.Mock()
+    source.search_results_path = search_results_path
+    source.get_origin_prefix.return_value = "pdfs.bib"
+    records = {
+        "Wagner2022": {
+            Fields.ID: "Wagner2022",
+            Fields.ORIGIN: ["other.bib/0001"],
+            Fields.FILE: "data/pdfs/Wagner2022.pdf",
+            "colrev_pdf_id": cpid,
+        },
+        "Srivastava2015": {
+            Fields.ID: "Srivastava2015",
+            Fields.ORIGIN: ["pdfs.bib/0001"],
+            Fields.FILE: "data/pdfs/Srivastava2015.pdf",
+        },
+    }
+    colrev.ops.pdf_get.relink_pdfs_in_source(
+        source=source,
+        records=records,
+        pdf_dir=pdf_dir,
+        logger=logging.getLogger(__name__),
+    )
+    assert records["Wagner2022"][Fields.FILE] == "data/pdfs/moved/Wagner2022.pdf"
+    assert records["Srivastava2015"][Fields.FILE] == "data/pdfs/Srivastava2015.pdf"
@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 """Tests of the CoLRev pdf-prep operations"""
 
+from pathlib import Path
+
 import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import RecordState
 
 
 def test_pdf_prep(  # type: ignore
@@ -30,3 +34,46 @@ def test_pdf_discard(  # type: ignore
     )
     pdf_get_man_operation = base_repo_review_manager.get_pdf_get_man_operation()
     pdf_get_man_operation.discard()
+
+
+def test_pdf_prep_shards(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+    helpers,
+) -> None:
+    """Test pdf-prep shards (prepared on a separate branch and merged)"""
+
+    review_manager_helpers.reset_commit(
+        base_repo_review_manager, commit="pdf_get_commit"
+    )
+    helpers.retrieve_test_file(
+        source=Path("data/SrivastavaShainesh2015.pdf"),
+        target=base_repo_review_manager.path
+        / Path("data/pdfs/SrivastavaShainesh2015.pdf"),
+    )
+    pdf_prep_operation = base_repo_review_manager.get_pdf_prep_operation()
+    records = base_repo_review_manager.dataset.load_records_dict()
+    for record_dict in records.values():
+        record_dict[Fields.FILE] = "data/pdfs/SrivastavaShainesh2015.pdf"
+        record_dict[Fields.STATUS] = RecordState.pdf_imported
+    base_repo_review_manager.dataset.save_records_dict(records)
+    base_repo_review_manager.create_commit(msg="Add pdf_imported records")
+
+    base_repo = base_repo_review_manager.dataset.git_repo.repo
+    active_branch = base_repo.active_branch.name
+    pdf_prep_operation.main(shard="1/1")
+    assert base_repo.active_branch.name == active_branch
+    assert "colrev-pdf-prep-shard-1-of-1" in [head.name for head in base_repo.heads]
+    assert base_repo_review_manager.dataset.load_records_dict() == records
+
+    pdf_prep_operation = base_repo_review_manager.get_pdf_prep_operation()
+    pdf_prep_operation.main(merge_shards=True)
+    merged_records = base_repo_review_manager.dataset.load_records_dict()
+    assert all(
+        r[Fields.STATUS]
+        in [RecordState.pdf_prepared, RecordState.pdf_needs_manual_preparation]
+        for r in merged_records.values()
+    )
+    assert not [
+        head.name for head in base_repo.heads if head.name.startswith("colrev-pdf")
+    ]
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+"""Tests of the adaptive concurrency for the prep operation"""
+
+import threading
+import time
+
+import pytest
+
+import colrev.ops.prep_concurrency
+
+
+def _get_pool(  # type: ignore
+    *, initial: int = 4, task_timeout: float = 5.0, **kwargs
+) -> colrev.ops.prep_concurrency.AdaptiveThreadPool:
+    controller = colrev.ops.prep_concurrency.AdaptiveConcurrencyController(
+        initial=initial, maximum=2 * initial, window=5, **kwargs
+    )
+    return colrev.ops.prep_concurrency.AdaptiveThreadPool(
+        controller=controller, task_timeout=task_timeout
+    )
+
+
+def test_adaptive_pool_results_and_timeouts() -> None:
+    """Test that a stuck (fake) endpoint does not block the other records"""
+
+    stuck = threading.Event()
+    cancelled = []
+
+    def fake_endpoint(item: int) -> int:
+        if item == 3:
+            stuck.wait(10)
+        time.sleep(0.01)
+        cancelled.append(colrev.ops.prep_concurrency.is_task_cancelled())
+        return item * 2
+
+    pool = _get_pool(task_timeout=0.5)
+    start = time.time()
+    results = pool.map(fake_endpoint, list(range(20)), on_timeout=lambda i: -i)
+    stuck.set()
+    assert time.time() - start < 5
+    assert results == [-3 if i == 3 else i * 2 for i in range(20)]
+    assert pool.nr_timeouts == 1
+
+    # The timed-out task (still running) is cancelled
+    for _ in range(100):
+        if len(cancelled) == 20:
+            break
+        time.sleep(0.01)
+    assert cancelled == [False] * 19 + [True]
+    assert not colrev.ops.prep_concurrency.is_task_cancelled()
+
+
+def test_adaptive_pool_stuck_worker_of_previous_call() -> None:
+    """Test that a stuck worker of a previous call is not counted as idle"""
+
+    controller = colrev.ops.prep_concurrency.AdaptiveConcurrencyController(
+        initial=1, maximum=2, window=1
+    )
+    pool = colrev.ops.prep_concurrency.AdaptiveThreadPool(
+        controller=controller, task_timeout=0.5
+    )
+    release = threading.Event()
+
+    def stuck_endpoint(item: int) -> int:
+        release.wait(10)
+        return item
+
+    assert pool.map(stuck_endpoint, [0], on_timeout=lambda i: -1) == [-1]
+
+    def fake_endpoint(item: int) -> int:
+        if item == 0:
+            # The stuck worker (previous call) completes its task
+            release.set()
+            time.sleep(0.1)
+        time.sleep(0.3)
+        return item
+
+    # The limit increases to 2 after the first item: items 1 and 2 need two workers
+    results = pool.map(fake_endpoint, [0, 1, 2], on_timeout=lambda i: -1)
+    assert results == [0, 1, 2]
+    assert pool.nr_timeouts == 1
+
+
+def test_adaptive_pool_exception() -> None:
+    """Test that exceptions are raised (after the running tasks)"""
+
+    def failing_endpoint(item: int) -> int:
+        if item == 5:
+            raise ValueError("Failed")
+        return item
+
+    with pytest.raises(ValueError):
+        _get_pool().map(failing_endpoint, list(range(10)), on_timeout=lambda i: i)
+
+
+def test_adaptive_controller_latency_and_resources() -> None:
+    """Test the adaptation to latency, errors, and resource usage"""
+
+    resource_usage = {"fd_ratio": 0.1}
+    pool = _get_pool(
+        initial=4,
+        resource_probe=lambda: (resource_usage["fd_ratio"], 0.1),
+    )
+    controller = pool.controller
+    max_concurrency = []
+    running = []
+    lock = threading.Lock()
+
+    def fake_endpoint(item: float) -> float:
+        with lock:
+            running.append(item)
+            max_concurrency.append(len(running))
+        time.sleep(item)
+        with lock:
+            running.remove(item)
+        return item
+
+    # Fast responses: the limit increases
+    pool.map(fake_endpoint, [0.005] * 40, on_timeout=lambda i: 0)
+    assert controller.limit == 8
+    assert max(max_concurrency) <= 8
+
+    # Injected latency: the limit decreases
+    pool.map(fake_endpoint, [0.1] * 20, on_timeout=lambda i: 0)
+    assert controller.limit < 8
+
+    # File descriptors: the limit decreases to the minimum
+    resource_usage["fd_ratio"] = 0.9
+    pool.map(fake_endpoint, [0.005] * 10, on_timeout=lambda i: 0)
+    assert controller.limit == 1
+
+    for _ in range(10):
+        controller.observe_endpoint("colrev.slow", 2.0, error=False)
+        controller.observe_endpoint("colrev.fast", 0.1, error=True)
+    assert controller.get_slowest_endpoint() == ("colrev.slow", 2.0)
+    resource_usage["fd_ratio"] = 0.1
+    controller.limit = 4
+    assert "endpoint error rate" in controller.observe(0.1, error=False)
+
+
+def test_get_resource_usage() -> None:
+    """Test the resource usage probe"""
+
+    fd_ratio, rss_ratio = colrev.ops.prep_concurrency.get_resource_usage()
+    assert 0 <= fd_ratio < 1
+    assert 0 <= rss_ratio < 1
@@ -4,7 +4,10 @@
 import shutil
 from unittest.mock import patch
 
+import pandas as pd
+
 import colrev.review_manager
+from colrev.constants import Fields
 
 
 def test_prep_man(  # type: ignore
@@ -51,3 +54,24 @@ def test_prep_man_csv_on_linux(  # type: ignore
     test_prep_man(base_repo_review_manager, review_manager_helpers)
     path = base_repo_review_manager.paths.prep / "records_prep_man_info.csv"
     assert path.exists()
+
+
+def test_prep_man_langs(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+) -> None:
+    """Test the export of predicted languages (batch detection)"""
+
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+    prep_man_operation = base_repo_review_manager.get_prep_man_operation()
+    prep_man_operation.lang_prep_csv_path.unlink(missing_ok=True)
+    records = base_repo_review_manager.dataset.load_records_dict()
+    for record_dict in records.values():
+        record_dict.pop(Fields.LANGUAGE, None)
+    base_repo_review_manager.dataset.save_records_dict(records)
+
+    prep_man_operation.prep_man_langs()
+    languages_df = pd.read_csv(prep_man_operation.lang_prep_csv_path)
+    assert len(languages_df) == len([r for r in records.values() if Fields.TITLE in r])
+    assert set(languages_df["most_likely_language"]) == {"eng"}
+    prep_man_operation.lang_prep_csv_path.unlink()
@@ -1,7 +1,27 @@
 #!/usr/bin/env python
 """Tests of the CoLRev prep operation"""
 
+import json
+import multiprocessing
+import os
+from copy import deepcopy
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import git
+import pytest
+
+import colrev.exceptions as colrev_exceptions
+import colrev.ops.prep
+import colrev.ops.prep_journal
+import colrev.ops.prep_shards
+import colrev.record.record_prep
 import colrev.review_manager
+from colrev.constants import Fields
+from colrev.constants import Filepaths
+from colrev.constants import OperationsType
+from colrev.constants import RecordState
 
 
 def test_prep(  # type: ignore
@@ -51,3 +71,330 @@ def test_prep_with_polish_flag(  # type: ignore
     prep_operation.main()
 
     # Assertions can be added here based on expected outcomes
+
+
+def test_prep_shards_parse() -> None:
+    """Test the shard parameter and the stable assignment of records"""
+
+    assert colrev.ops.prep_shards.parse_shard("2/4") == (2, 4)
+    for shard in ["0/4", "5/4", "1", "a/b"]:
+        with pytest.raises(colrev_exceptions.ParameterError):
+            colrev.ops.prep_shards.parse_shard(shard)
+
+    record_ids = [f"Rec{i}" for i in range(200)]
+    shards = [colrev.ops.prep_shards.get_shard(r, 4) for r in record_ids]
+    assert set(shards) == {1, 2, 3, 4}
+    assert shards == [colrev.ops.prep_shards.get_shard(r, 4) for r in record_ids]
+
+
+def _prepare_shard(worker_path: Path, shard: str) -> None:
+    os.chdir(worker_path)
+    worker_review_manager = colrev.review_manager.ReviewManager(
+        path_str=str(worker_path)
+    )
+    worker_review_manager.get_prep_operation().main(shard=shard)
+
+
+def test_prep_shards(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+    tmp_path: Path,
+) -> None:
+    """Test prep shards (workers push branches to a bare remote, merge)"""
+
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+    base_repo = base_repo_review_manager.dataset.git_repo.repo
+    remote_path = tmp_path / Path("remote.git")
+    git.Repo.clone_from(base_repo_review_manager.path, remote_path, bare=True)
+
+    # Independent workers (processes with separate clones) prepare the shards
+    worker_paths = {k: tmp_path / Path(f"worker_{k}") for k in [1, 2]}
+    for worker_path in worker_paths.values():
+        git.Repo.clone_from(remote_path, worker_path)
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_prepare_shard, args=(worker_path, f"{k}/2"))
+        for k, worker_path in worker_paths.items()
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=300)
+        assert worker.exitcode == 0
+    os.chdir(base_repo_review_manager.path)
+    for worker_path in worker_paths.values():
+        worker_repo = git.Repo(worker_path)
+        assert worker_repo.active_branch.name == base_repo.active_branch.name
+        assert not worker_repo.is_dirty()
+    assert {head.name for head in git.Repo(remote_path).heads} >= {
+        "colrev-prep-shard-1-of-2",
+        "colrev-prep-shard-2-of-2",
+    }
+
+    remote = base_repo.create_remote("origin", str(remote_path))
+    try:
+        # Shard branches of another run (n=3) are not merged
+        stale_branch = base_repo.create_head("colrev-prep-shard-1-of-3")
+        prep_operation = base_repo_review_manager.get_prep_operation()
+        with pytest.raises(colrev_exceptions.ParameterError):
+            prep_operation.main(merge_shards=True, keep_ids=True)
+        base_repo.delete_head(stale_branch, force=True)
+
+        prep_operation = base_repo_review_manager.get_prep_operation()
+        prep_operation.main(merge_shards=True, keep_ids=True)
+        merged_records = base_repo_review_manager.dataset.load_records_dict()
+    finally:
+        base_repo.delete_remote(remote)
+
+    # The merged shard branches are deleted (locally and in the remote)
+    for repo in [base_repo, git.Repo(remote_path)]:
+        assert not [
+            head.name for head in repo.heads if head.name.startswith("colrev-prep")
+        ]
+
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+    prepared_records = base_repo_review_manager.dataset.load_records_dict()
+    assert {r[Fields.ID]: r[Fields.STATUS] for r in merged_records.values()} == {
+        r[Fields.ID]: r[Fields.STATUS] for r in prepared_records.values()
+    }
+
+
+def test_prep_merge_shards_status_transitions(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+    mocker,
+) -> None:
+    """Test that shard records are only merged for legal status transitions"""
+
+    assert colrev.ops.prep_shards.is_legal_successor(
+        RecordState.md_imported,
+        RecordState.md_prepared,
+        operation=OperationsType.prep,
+    )
+    assert colrev.ops.prep_shards.is_legal_successor(
+        RecordState.md_needs_manual_preparation,
+        RecordState.md_prepared,
+        operation=OperationsType.prep,
+    )
+    assert not colrev.ops.prep_shards.is_legal_successor(
+        RecordState.md_imported,
+        RecordState.rev_included,
+        operation=OperationsType.prep,
+    )
+    assert not colrev.ops.prep_shards.is_legal_successor(
+        RecordState.md_imported,
+        RecordState.pdf_prepared,
+        operation=OperationsType.pdf_prep,
+    )
+
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+    prep_operation = base_repo_review_manager.get_prep_operation()
+    records = base_repo_review_manager.dataset.load_records_dict()
+    record_id = list(records)[0]
+    shard_record = {**records[record_id], Fields.STATUS: RecordState.rev_included}
+    mocker.patch.object(
+        colrev.ops.prep_shards,
+        "load_shards",
+        return_value={(1, 1): {record_id: shard_record}},
+    )
+    prep_operation.main(merge_shards=True, keep_ids=True)
+    merged_records = base_repo_review_manager.dataset.load_records_dict()
+    assert merged_records[record_id][Fields.STATUS] == RecordState.md_imported
+
+    shard_record[Fields.STATUS] = RecordState.md_prepared
+    prep_operation = base_repo_review_manager.get_prep_operation()
+    prep_operation.main(merge_shards=True, keep_ids=True)
+    merged_records = base_repo_review_manager.dataset.load_records_dict()
+    assert merged_records[record_id][Fields.STATUS] == RecordState.md_prepared
+
+
+def test_prep_journal_replay(tmp_path: Path) -> None:
+    """Test the replay of the prep journal (incomplete last line, other commit)"""
+
+    journal_path = tmp_path / Path("prep_journal.jsonl")
+    records = {
+        "R1": {Fields.ID: "R1", Fields.STATUS: RecordState.md_imported, "a": "1"},
+        "R2": {Fields.ID: "R2", Fields.STATUS: RecordState.md_imported, "b": "1"},
+    }
+    journal = colrev.ops.prep_journal.PrepJournal(journal_path)
+    journal.open(commit="abc", prep_round="prep", states={})
+    for record_id, record_dict in records.items():
+        journal.start_record(record_dict)
+        changed = {**record_dict, "c": "2", Fields.STATUS: RecordState.md_prepared}
+        journal.log_endpoint(
+            record_id=record_id,
+            pos=0,
+            endpoint="colrev.source_specific_prep",
+            record_dict=changed,
+            preparation_record_dict=changed,
+            preparation_break=False,
+        )
+    del changed["b"]
+    journal.log_completed(record_id="R2", record_dict=changed)
+    journal.close()
+    with open(journal_path, "a", encoding="utf-8") as file:
+        file.write('{"type": "completed", "id": "R1", "rec')
+
+    states = colrev.ops.prep_journal.PrepJournal(journal_path).replay(
+        commit="abc", prep_round="prep", records=records
+    )
+    assert not states["R1"].completed
+    assert states["R1"].completed_endpoints == {0}
+    assert states["R1"].record[Fields.STATUS] == RecordState.md_prepared
+    assert states["R2"].completed
+    assert states["R2"].record == {
+        Fields.ID: "R2",
+        Fields.STATUS: RecordState.md_prepared,
+        "c": "2",
+    }
+    assert not colrev.ops.prep_journal.PrepJournal(journal_path).replay(
+        commit="other", prep_round="prep", records=records
+    )
+
+
+def test_prep_resume_journal(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+    mocker,
+) -> None:
+    """Test resuming an interrupted prep round (based on the journal)"""
+
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+    prep_operation = base_repo_review_manager.get_prep_operation(cpu=1)
+    record_dict = list(base_repo_review_manager.dataset.load_records_dict().values())[0]
+    records = {}
+    for i in range(6):
+        records[f"{record_dict[Fields.ID]}_{i}"] = {
+            **deepcopy(record_dict),
+            Fields.ID: f"{record_dict[Fields.ID]}_{i}",
+            Fields.TITLE: f"{record_dict[Fields.TITLE]} (part {i})",
+        }
+    base_repo_review_manager.dataset.save_records_dict(records)
+    base_repo_review_manager.create_commit(msg="Add md_imported records")
+    imported_commit = base_repo_review_manager.dataset.git_repo.get_last_commit_sha()
+    nr_records = len(records)
+
+    prep_operation = base_repo_review_manager.get_prep_operation(cpu=1)
+    prep_operation.main(keep_ids=True)
+    prepared_records = base_repo_review_manager.dataset.load_records_dict()
+    review_manager_helpers.reset_commit(
+        base_repo_review_manager, commit_sha=imported_commit
+    )
+
+    post_package_prep = colrev.ops.prep.Prep._post_package_prep  # type: ignore
+
+    nr_completed = []
+
+    def interrupted_post_package_prep(self, record, **kwargs):  # type: ignore
+        if len(nr_completed) == 2:
+            raise RuntimeError("Interrupted")
+        post_package_prep(self, record, **kwargs)
+        nr_completed.append(record)
+
+    with patch.object(
+        colrev.ops.prep.Prep, "_post_package_prep", interrupted_post_package_prep
+    ):
+        prep_operation = base_repo_review_manager.get_prep_operation(cpu=1)
+        with pytest.raises(RuntimeError):
+            prep_operation.main(keep_ids=True)
+    assert prep_operation.journal_path.is_file()
+
+    prep_operation = base_repo_review_manager.get_prep_operation(cpu=1)
+    package_prep = mocker.spy(colrev.ops.prep.Prep, "_package_prep")
+    prep_operation.main(keep_ids=True)
+    # Two records completed, the endpoint of the third record was completed
+    assert package_prep.call_count == nr_records - 3
+    assert not prep_operation.journal_path.is_file()
+
+    resumed_records = base_repo_review_manager.dataset.load_records_dict()
+    assert resumed_records == prepared_records
+
+    # The journal is kept when the prep commit fails
+    review_manager_helpers.reset_commit(
+        base_repo_review_manager, commit_sha=imported_commit
+    )
+    prep_operation = base_repo_review_manager.get_prep_operation(cpu=1)
+    mocker.patch.object(
+        base_repo_review_manager, "create_commit", side_effect=RuntimeError
+    )
+    with pytest.raises(RuntimeError):
+        prep_operation.main(keep_ids=True)
+    assert prep_operation.journal_path.is_file()
+    prep_operation.journal_path.unlink()
+
+
+def test_prep_cancelled_record(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """Test that records exceeding the timeout are not journaled (while running)"""
+
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+    prep_operation = base_repo_review_manager.get_prep_operation(cpu=1)
+    record_dict = list(base_repo_review_manager.dataset.load_records_dict().values())[0]
+    journal = colrev.ops.prep_journal.PrepJournal(tmp_path / Path("journal.jsonl"))
+    journal.open(commit="abc", prep_round="prep", states={})
+    prep_operation._journal = journal
+    mocker.patch.object(prep_operation, "_package_prep")
+    mocker.patch.object(prep_operation, "_post_package_prep")
+    mocker.patch("colrev.ops.prep_concurrency.is_task_cancelled", return_value=True)
+
+    prep_operation.prepare(
+        {
+            "record": colrev.record.record_prep.PrepRecord(deepcopy(record_dict)),
+            "prep_round_package_endpoints": [
+                {"endpoint": "colrev.source_specific_prep"}
+            ],
+        }
+    )
+    prep_operation._add_stats(
+        prep_round_package_endpoint={"endpoint": "colrev.source_specific_prep"},
+        start_time=datetime.now(),
+    )
+    journal.close()
+    assert not journal.replay(
+        commit="abc", prep_round="prep", records={record_dict[Fields.ID]: record_dict}
+    )
+    assert not prep_operation._stats
+
+
+def test_prep_timing_model(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    """Test the estimated time (based on the timings of previous runs)"""
+
+    timings_path = tmp_path / Path("operation_timings.json")
+    monkeypatch.setattr(Filepaths, "OPERATION_TIMINGS_FILE", timings_path)
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+
+    prep_operation = base_repo_review_manager.get_prep_operation()
+    prep_round = base_repo_review_manager.settings.prep.prep_rounds[0]
+    prep_operation._setup_prep_round(i=0, prep_round=prep_round)
+    preparation_data = prep_operation._get_prep_data_tasks(prep_round)
+    assert preparation_data
+    # Note : estimates are divided by the number of workers
+    prep_operation._cpu = 1
+
+    # Without timings: default time per record
+    estimated_time, _ = prep_operation._estimate_time(preparation_data, prep_round)
+    assert estimated_time == len(preparation_data) * prep_operation.default_record_time
+
+    prep_operation._timing_model.add("endpoints", "colrev.source_specific_prep", 0.5)
+    estimated_time, breakdown = prep_operation._estimate_time(
+        preparation_data, prep_round
+    )
+    assert estimated_time == len(preparation_data) * 0.5
+    assert breakdown == {"colrev.source_specific_prep": len(preparation_data) * 0.5}
+
+    # The timings of the run are saved (and used in the next runs)
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="load_commit")
+    prep_operation = base_repo_review_manager.get_prep_operation()
+    prep_operation.main()
+    data = json.loads(timings_path.read_text(encoding="utf-8"))
+    assert "colrev.source_specific_prep" in data["prep"]["endpoints"]
+    assert data["prep"]["sources"]
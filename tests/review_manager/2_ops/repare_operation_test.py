@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+"""Tests of the CoLRev repare operation"""
+
+import colrev.review_manager
+from colrev.constants import Fields
+
+
+def test_repare_dry_run(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+) -> None:
+    """Test the repare dry-run (fixes are reported but not saved)"""
+
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+    repare_operation = base_repo_review_manager.get_repare()
+    records = base_repo_review_manager.dataset.load_records_dict()
+    record_id = list(records.keys())[0]
+    del records[record_id][Fields.MD_PROV]
+    records[record_id][Fields.FILE] = "data/pdfs/missing.pdf"
+    base_repo_review_manager.dataset.save_records_dict(records)
+    records_path = base_repo_review_manager.paths.records
+    records_before = records_path.read_text(encoding="utf-8")
+
+    repare_operation.main(dry_run=True)
+    assert records_path.read_text(encoding="utf-8") == records_before
+    summary = repare_operation._fix_summary  # pylint: disable=protected-access
+    assert list(summary.keys()) == [
+        "curated sources",
+        "field names",
+        "provenance",
+        "field values",
+        "files",
+    ]
+    assert summary["provenance"]["changed_records"] >= 1
+    assert summary["files"]["changed_records"] >= 1
+
+    repare_operation.main()
+    records = base_repo_review_manager.dataset.load_records_dict()
+    assert Fields.MD_PROV in records[record_id]
+    assert records_path.read_text(encoding="utf-8") != records_before
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+import time
 import typing
 from copy import deepcopy
 from pathlib import Path
@@ -17,6 +18,7 @@ from colrev.constants import DefectCodes
 from colrev.constants import Fields
 from colrev.constants import FieldValues
 from colrev.constants import SearchType
+from colrev.writer.bib import to_string
 
 # flake8: noqa: E501
 
@@ -500,3 +502,226 @@ def test_search_feed_prep_mode(search_feed, caplog) -> None:  # type: ignore
     )
     assert record_dict[Fields.ORIGIN] == ["test.bib/000001"]
     search_feed.prep_mode = False
+
+
+@pytest.mark.parametrize(
+    "record_b, expected",
+    [
+        ({Fields.TITLE: "A title"}, False),
+        ({Fields.TITLE: "A title "}, False),
+        ({Fields.TITLE: "A\n   title"}, False),
+        ({Fields.TITLE: "A title", Fields.VOLUME: ""}, False),
+        ({Fields.TITLE: "A title", Fields.DOI: "10.111/2222"}, False),
+        ({Fields.TITLE: "A title", Fields.DOI: "10.111/3333"}, True),
+        ({Fields.TITLE: "Another title"}, True),
+        ({Fields.TITLE: "A title", Fields.PAGES: "1--2"}, True),
+    ],
+)
+def test_search_feed_have_changed(search_feed, record_b, expected) -> None:  # type: ignore
+    """Test the field-level change detection (without serialization)"""
+
+    record_a = colrev.record.record.Record(
+        {
+            Fields.ID: "000001",
+            Fields.ENTRYTYPE: "article",
+            Fields.TITLE: "A title",
+            Fields.DOI: "10.111/2222",
+        }
+    )
+    record_b = colrev.record.record.Record(
+        {Fields.ID: "000002", Fields.ENTRYTYPE: "article", **record_b}
+    )
+    assert expected == search_feed._have_changed(record_a, record_b)
+
+
+def test_search_feed_main_record_index(search_feed, mocker) -> None:  # type: ignore
+    """Test the origin index of the search feed"""
+
+    search_feed.records = {
+        "Rec1": {Fields.ID: "Rec1", Fields.ORIGIN: ["test.bib/000001"]},
+        "Rec2": {Fields.ID: "Rec2", Fields.ORIGIN: ["other.bib/000001"]},
+    }
+    assert search_feed._get_main_record("test.bib/000001").data[Fields.ID] == "Rec1"
+    build_spy = mocker.spy(search_feed, "_build_origin_index")
+
+    # Records added outside the feed (without rebuilding the index)
+    search_feed.records["Rec3"] = {
+        Fields.ID: "Rec3",
+        Fields.ORIGIN: ["test.bib/000002"],
+    }
+    search_feed.records["Rec4"] = {
+        Fields.ID: "Rec4",
+        Fields.ORIGIN: ["test.bib/000004"],
+    }
+    assert search_feed._get_main_record("test.bib/000002").data[Fields.ID] == "Rec3"
+    assert search_feed._get_main_record("test.bib/000004").data[Fields.ID] == "Rec4"
+    build_spy.assert_not_called()
+
+    # Records removed outside the feed are not found (after one linear scan)
+    del search_feed.records["Rec1"]
+    with pytest.raises(colrev.exceptions.RecordNotFoundException):
+        search_feed._get_main_record("test.bib/000001")
+    assert build_spy.call_count == 1
+
+    # Origins that move to an existing record (e.g., merged records) are found
+    search_feed.records["Rec2"][Fields.ORIGIN].append("test.bib/000002")
+    del search_feed.records["Rec3"]
+    assert search_feed._get_main_record("test.bib/000002").data[Fields.ID] == "Rec2"
+    assert search_feed._get_main_record("test.bib/000004").data[Fields.ID] == "Rec4"
+    assert build_spy.call_count == 2
+    with pytest.raises(colrev.exceptions.RecordNotFoundException):
+        search_feed._get_main_record("test.bib/000005")
+
+
+def test_search_feed_update_merged_record(search_feed) -> None:  # type: ignore
+    """Test updates of records whose origin moved to an existing record"""
+
+    record_dict = {
+        Fields.ID: "0001",
+        Fields.ENTRYTYPE: "article",
+        Fields.TITLE: "Analyzing the past to prepare for the future: Writing a literature review",
+        Fields.DOI: "10.111/2222",
+    }
+    search_feed.add_update_record(
+        retrieved_record=colrev.record.record.Record(deepcopy(record_dict))
+    )
+    search_feed.records = {
+        "Other2000": {
+            **deepcopy(record_dict),
+            Fields.ID: "Other2000",
+            Fields.ORIGIN: ["other.bib/000001"],
+        },
+        "Main2000": {
+            **deepcopy(record_dict),
+            Fields.ID: "Main2000",
+            Fields.ORIGIN: ["test.bib/000001"],
+        },
+    }
+    assert search_feed._get_main_record("test.bib/000001").data[Fields.ID] == "Main2000"
+
+    # Main2000 is merged into Other2000 (outside the feed)
+    search_feed.records["Other2000"][Fields.ORIGIN].append("test.bib/000001")
+    del search_feed.records["Main2000"]
+
+    record_dict[Fields.VOLUME] = "12"
+    search_feed.add_update_record(
+        retrieved_record=colrev.record.record.Record(deepcopy(record_dict))
+    )
+    assert search_feed.records["Other2000"][Fields.VOLUME] == "12"
+
+
+def test_search_feed_incremental_save(search_feed, mocker) -> None:  # type: ignore
+    """Test that saving appends new and rewrites changed feed entries"""
+
+    for i in range(1, 6):
+        search_feed.add_update_record(
+            retrieved_record=colrev.record.record.Record(
+                {
+                    Fields.ID: "tmp",
+                    Fields.ENTRYTYPE: "article",
+                    Fields.TITLE: f"Title of the paper {i}",
+                    Fields.DOI: f"10.111/{i}",
+                }
+            )
+        )
+    search_feed.save()
+
+    feed = colrev.ops.search_api_feed.SearchAPIFeed(
+        source_identifier="doi",
+        search_source=search_feed.source,
+        update_only=True,
+        logger=search_feed.logger,
+    )
+    write_file = mocker.spy(colrev.ops.search_api_feed, "write_file")
+
+    # Only appended
+    feed.add_update_record(
+        retrieved_record=colrev.record.record.Record(
+            {
+                Fields.ID: "tmp",
+                Fields.ENTRYTYPE: "article",
+                Fields.TITLE: "Title of the paper 6",
+                Fields.DOI: "10.111/6",
+            }
+        )
+    )
+    feed.save()
+    assert feed.feed_file.read_text(encoding="utf-8") == to_string(
+        records_dict=feed.feed_records
+    )
+
+    # Changed in-place (and appended)
+    feed.feed_records["000002"][Fields.TITLE] = "Changed title of the paper 2"
+    feed.feed_records["000004"][Fields.JOURNAL] = "Journal"
+    feed.add_update_record(
+        retrieved_record=colrev.record.record.Record(
+            {
+                Fields.ID: "tmp",
+                Fields.ENTRYTYPE: "article",
+                Fields.TITLE: "Title of the paper 7",
+                Fields.DOI: "10.111/7",
+            }
+        )
+    )
+    feed.save()
+    assert feed.feed_file.read_text(encoding="utf-8") == to_string(
+        records_dict=feed.feed_records
+    )
+    assert write_file.call_count == 0
+
+    # Removed records require a complete rewrite
+    del feed.feed_records["000003"]
+    feed.save()
+    assert write_file.call_count == 1
+    assert feed.feed_file.read_text(encoding="utf-8") == to_string(
+        records_dict=feed.feed_records
+    )
+
+
+@pytest.mark.slow
+def test_search_feed_benchmark(search_feed) -> None:  # type: ignore
+    """Benchmark re-running a search (synthetic feed with 50k records)"""
+
+    nr_records = 50000
+    search_feed.records = {
+        f"Rec{i}": {
+            Fields.ID: f"Rec{i}",
+            Fields.ENTRYTYPE: "article",
+            Fields.ORIGIN: [f"test.bib/{str(i).rjust(6, '0')}"],
+            Fields.TITLE: f"Title of the paper {i}",
+            Fields.DOI: f"10.111/{i}",
+            Fields.MD_PROV: {},
+            Fields.D_PROV: {},
+        }
+        for i in range(1, nr_records + 1)
+    }
+    search_feed.feed_records = {
+        str(i).rjust(6, "0"): {
+            Fields.ID: str(i).rjust(6, "0"),
+            Fields.ENTRYTYPE: "article",
+            Fields.TITLE: f"Title of the paper {i}",
+            Fields.DOI: f"10.111/{i}",
+        }
+        for i in range(1, nr_records + 1)
+    }
+    search_feed._available_ids = {
+        r[Fields.DOI]: r[Fields.ID] for r in search_feed.feed_records.values()
+    }
+    search_feed._next_incremental_id = nr_records + 1
+
+    start = time.time()
+    for i in range(1, nr_records + 1):
+        search_feed.add_update_record(
+            colrev.record.record.Record(
+                {
+                    Fields.ID: "tmp",
+                    Fields.ENTRYTYPE: "article",
+                    Fields.TITLE: f"Title of the paper {i}",
+                    Fields.DOI: f"10.111/{i}",
+                }
+            )
+        )
+    duration = time.time() - start
+    print(f"Re-run of a search with {nr_records} records: {duration:.2f}s")
+    assert search_feed._nr_changed == 0
+    assert duration < 60
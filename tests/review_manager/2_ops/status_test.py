@@ -1,9 +1,13 @@
 #!/usr/bin/env python
 """Tests of the CoLRev status operation"""
 
+import json
+import subprocess
+import sys
 from pathlib import Path
 
 import colrev.ops.check
+import colrev.ops.status
 import colrev.review_manager
 
 
@@ -68,6 +72,47 @@ def test_get_analytics(  # type: ignore
     }
 
 
+def test_get_analytics_cache(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    review_manager_helpers,
+    mocker,
+) -> None:
+    """Test that the analytics of prior commits are cached (commit SHA)"""
+
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+    (base_repo_review_manager.path / colrev.ops.status.ANALYTICS_CACHE_PATH).unlink(
+        missing_ok=True
+    )
+    status_operation = base_repo_review_manager.get_status_operation()
+    expected = status_operation.get_analytics()
+    assert (
+        base_repo_review_manager.path / colrev.ops.status.ANALYTICS_CACHE_PATH
+    ).is_file()
+
+    yaml_load = mocker.spy(colrev.ops.status.yaml, "load")
+    assert status_operation.get_analytics() == expected
+    assert yaml_load.call_count == 0
+
+    # Only new commits are parsed
+    review_manager_helpers.reset_commit(
+        base_repo_review_manager, commit="dedupe_commit"
+    )
+    analytics = status_operation.get_analytics()
+    assert yaml_load.call_count == 1
+    assert len(analytics) == len(expected) + 1
+    assert analytics[len(expected)] == expected[len(expected)]
+
+    # Commits that are no longer in the history are dropped from the cache
+    review_manager_helpers.reset_commit(base_repo_review_manager, commit="prep_commit")
+    assert status_operation.get_analytics() == expected
+    analytics_cache = json.loads(
+        (
+            base_repo_review_manager.path / colrev.ops.status.ANALYTICS_CACHE_PATH
+        ).read_text(encoding="utf-8")
+    )
+    assert len(analytics_cache) == len(expected)
+
+
 def test_status_stats(  # type: ignore
     base_repo_review_manager: colrev.review_manager.ReviewManager, helpers
 ) -> None:
@@ -96,3 +141,25 @@ def test_get_review_status_report(  # type: ignore
         source=Path("data/status_report_expected.txt")
     )
     assert ret == expected
+
+
+def test_status_lazy_imports(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test that colrev status does not import pandas (startup time)"""
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from click.testing import CliRunner; "
+            "import colrev.ui_cli.cli; "
+            "result = CliRunner().invoke(colrev.ui_cli.cli.main, ['status']); "
+            "print(result.exit_code, 'pandas' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=base_repo_review_manager.path,
+    )
+    assert result.stdout.splitlines()[-1] == "0 False"
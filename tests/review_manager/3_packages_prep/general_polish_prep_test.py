@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+"""Test the general_polish prep package"""
+
+import colrev.ops.prep
+import colrev.record.record_prep
+from colrev.constants import Fields
+from colrev.packages.general_polish.src.general_polish import GeneralPolishPrep
+
+
+def test_general_polish_protected_acronyms(
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+) -> None:
+    """Test the protected acronyms (prep settings)"""
+
+    base_repo_review_manager.settings.prep.protected_acronyms = ["AIS", "NLP"]
+    try:
+        prep_operation = base_repo_review_manager.get_prep_operation()
+        general_polish = GeneralPolishPrep(
+            prep_operation=prep_operation,
+            settings={"endpoint": "colrev.general_polish"},
+        )
+        record = colrev.record.record_prep.PrepRecord(
+            {
+                Fields.ID: "r1",
+                Fields.TITLE: "NLP FOR THE ANALYSIS OF AIS AND ERP PAPERS",
+                Fields.JOURNAL: "COMMUNICATIONS OF THE AIS",
+            }
+        )
+        general_polish.prepare(record)
+    finally:
+        base_repo_review_manager.settings.prep.protected_acronyms = []
+
+    assert record.data[Fields.TITLE] == "NLP for the analysis of AIS and ERP papers"
+    assert record.data[Fields.JOURNAL] == "Communications of the AIS"
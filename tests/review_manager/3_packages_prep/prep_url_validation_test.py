@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""Test the URL validation (local HTTP server)"""
+
+import threading
+import time
+import typing
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+import colrev.record.record_prep
+from colrev.constants import Fields
+from colrev.constants import Filepaths
+from colrev.packages.remove_urls_with_500_errors.src import url_validator
+from colrev.packages.remove_urls_with_500_errors.src.remove_urls_with_500_errors import (
+    RemoveError500URLsPrep,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Returns status codes based on the path (and tracks concurrency)."""
+
+    requests: typing.List[typing.Tuple[str, str]] = []
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def log_message(  # pylint: disable=redefined-builtin
+        self, format: str, *args: typing.Any  # noqa: A002
+    ) -> None:
+        """Do not log requests."""
+
+    def _respond(self, method: str) -> None:
+        with _Handler.lock:
+            _Handler.requests.append((method, self.path))
+            _Handler.active += 1
+            _Handler.max_active = max(_Handler.max_active, _Handler.active)
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.1)
+            if self.path.startswith("/error"):
+                self.send_response(500)
+            elif self.path.startswith("/unavailable"):
+                self.send_response(503)
+            elif self.path.startswith("/no-head") and method == "HEAD":
+                self.send_response(405)
+            elif self.path.startswith("/redirect"):
+                self.send_response(302)
+                self.send_header("Location", "/ok")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        finally:
+            with _Handler.lock:
+                _Handler.active -= 1
+
+    def do_HEAD(self) -> None:  # pylint: disable=invalid-name
+        """Handle HEAD requests."""
+        self._respond("HEAD")
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Handle GET requests."""
+        self._respond("GET")
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url(local_http_server: typing.Callable) -> str:
+    """Local HTTP server"""
+    _Handler.requests = []
+    _Handler.max_active = 0
+    return local_http_server(_Handler)
+
+
+def test_url_validator(server_url: str, tmp_path: Path) -> None:
+    """Test the status codes (HEAD, GET fallback, redirects, deduplication)"""
+
+    validator = url_validator.URLValidator(cache_path=tmp_path / Path("urls.sqlite"))
+    urls = [
+        f"{server_url}/ok",
+        f"{server_url}/error",
+        f"{server_url}/unavailable",
+        f"{server_url}/no-head",
+        f"{server_url}/redirect",
+        "http://127.0.0.1:1/unreachable",
+    ]
+    statuses = validator.validate(urls + urls)
+    assert statuses == {
+        f"{server_url}/ok": 200,
+        f"{server_url}/error": 500,
+        f"{server_url}/unavailable": 503,
+        f"{server_url}/no-head": 200,
+        f"{server_url}/redirect": 200,
+        "http://127.0.0.1:1/unreachable": url_validator.CONNECTION_ERROR,
+    }
+    # Identical URLs are requested once (HEAD, GET only as a fallback)
+    assert _Handler.requests.count(("HEAD", "/ok")) == 2  # (incl. redirect)
+    assert _Handler.requests.count(("HEAD", "/no-head")) == 1
+    assert _Handler.requests.count(("GET", "/no-head")) == 1
+    assert ("GET", "/ok") not in _Handler.requests
+
+    # Statuses are retrieved from the cache (connection errors are not cached)
+    _Handler.requests = []
+    validator = url_validator.URLValidator(cache_path=tmp_path / Path("urls.sqlite"))
+    assert validator.get_status(f"{server_url}/error") == 500
+    assert validator.get_status(f"{server_url}/no-head") == 200
+    assert not _Handler.requests
+
+    # Expired statuses are requested again
+    validator = url_validator.URLValidator(
+        cache_path=tmp_path / Path("urls.sqlite"), ttl=timedelta(seconds=0)
+    )
+    assert validator.get_status(f"{server_url}/error") == 500
+    assert _Handler.requests == [("HEAD", "/error"), ("GET", "/error")]
+
+
+def test_url_validator_per_host_limit(server_url: str, tmp_path: Path) -> None:
+    """Test that concurrent requests per host are limited"""
+
+    validator = url_validator.URLValidator(
+        cache_path=tmp_path / Path("urls.sqlite"), per_host_limit=2
+    )
+    statuses = validator.validate(f"{server_url}/slow/{i}" for i in range(8))
+    assert set(statuses.values()) == {200}
+    assert len(_Handler.requests) == 8
+    assert _Handler.max_active <= 2
+
+
+def test_remove_urls_with_500_errors(  # type: ignore
+    server_url: str, tmp_path: Path, base_repo_review_manager, monkeypatch
+) -> None:
+    """Test the prep endpoint (prefetch and prepare)"""
+
+    monkeypatch.setattr(
+        Filepaths, "URL_STATUS_CACHE_FILE", tmp_path / Path("urls.sqlite")
+    )
+    prep_operation = base_repo_review_manager.get_prep_operation()
+    endpoint = RemoveError500URLsPrep(
+        prep_operation=prep_operation,
+        settings={"endpoint": "colrev.remove_urls_with_500_errors"},
+    )
+    prep_records = [
+        colrev.record.record_prep.PrepRecord(
+            {
+                Fields.ID: "r1",
+                Fields.URL: f"{server_url}/error",
+                Fields.FULLTEXT: f"{server_url}/ok",
+            }
+        ),
+        colrev.record.record_prep.PrepRecord(
+            {Fields.ID: "r2", Fields.URL: f"{server_url}/no-head"}
+        ),
+    ]
+    endpoint.prefetch(prep_records)
+    nr_requests = len(_Handler.requests)
+    for record in prep_records:
+        endpoint.prepare(record)
+    assert len(_Handler.requests) == nr_requests
+
+    assert Fields.URL not in prep_records[0].data
+    assert prep_records[0].data[Fields.FULLTEXT] == f"{server_url}/ok"
+    assert prep_records[1].data[Fields.URL] == f"{server_url}/no-head"
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Test the files_dir search"""
+
+from pathlib import Path
+
+import colrev.ops.search_api_feed
+import colrev.review_manager
+import colrev.search_file
+from colrev.constants import ENTRYTYPES
+from colrev.constants import Fields
+from colrev.constants import SearchType
+from colrev.packages.files_dir.src.files_dir import FilesSearchSource
+
+
+def test_files_dir_search_skips_indexed_files(  # type: ignore
+    base_repo_review_manager: colrev.review_manager.ReviewManager,
+    helpers,
+    mocker,
+) -> None:
+    """Test that unchanged files are not indexed again"""
+
+    # Note : use a separate directory (other tests leave PDFs in data/pdfs)
+    for target in ["data/pdfs/files_dir/a.pdf", "data/pdfs/files_dir/sub/b.pdf"]:
+        helpers.retrieve_test_file(
+            source=Path("data/WagnerLukyanenkoParEtAl2022.pdf"),
+            target=Path(target),
+        )
+    search_file = colrev.search_file.ExtendedSearchFile(
+        platform="colrev.files_dir",
+        search_results_path=Path("data/search/pdfs.bib"),
+        search_type=SearchType.FILES,
+        search_string="",
+        search_parameters={"scope": {"path": "data/pdfs/files_dir"}},
+        comment="",
+        version="0.1.0",
+    )
+    files_dir_source = FilesSearchSource(
+        search_file=search_file, logger=base_repo_review_manager.logger
+    )
+    files_dir_source.rerun = False
+
+    def index_pdf(*, file_path: Path) -> dict:
+        return {
+            Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+            Fields.TITLE: "Artificial intelligence and the conduct of literature reviews",
+            Fields.FILE: str(file_path.relative_to(base_repo_review_manager.path)),
+        }
+
+    index_pdf_mock = mocker.patch.object(
+        FilesSearchSource, "_index_pdf", side_effect=index_pdf
+    )
+
+    for _ in range(2):
+        files_dir_feed = colrev.ops.search_api_feed.SearchAPIFeed(
+            source_identifier=Fields.FILE,
+            search_source=search_file,
+            update_only=True,
+            logger=base_repo_review_manager.logger,
+        )
+        files_dir_source._run_dir_search(
+            files_dir_feed=files_dir_feed, linked_file_paths=set()
+        )
+        # Files are only indexed in the first run
+        assert index_pdf_mock.call_count == 2
+        assert {r[Fields.FILE] for r in files_dir_feed.feed_records.values()} == {
+            "data/pdfs/files_dir/a.pdf",
+            "data/pdfs/files_dir/sub/b.pdf",
+        }
+        assert all("md_string" not in r for r in files_dir_feed.feed_records.values())
+
+    # Potential duplicates are detected based on the md_string index
+    assert files_dir_source._md_string_index == {
+        files_dir_source._get_md_string(
+            record_dict=files_dir_feed.feed_records["000001"]
+        ): {"data/pdfs/files_dir/a.pdf", "data/pdfs/files_dir/sub/b.pdf"}
+    }
@@ -54,8 +54,7 @@ class ReviewManagerHelpers:
         repo.head.reset(commit_id, index=True, working_tree=True)
 
         # To prevent prep from continuing previous operations
-        Path(".colrev/cur_temp_recs.bib").unlink(missing_ok=True)
-        Path(".colrev/temp_recs.bib").unlink(missing_ok=True)
+        Path(".colrev/prep_journal.jsonl").unlink(missing_ok=True)
         review_manager.load_settings()
 
 